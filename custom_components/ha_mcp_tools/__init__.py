@@ -61,7 +61,11 @@ from .const import (
     YAML_KEY_DENYLIST,
     YAML_KEY_POST_ACTIONS,
 )
-from .websocket_api import async_register_commands
+from .websocket_api import (
+    async_register_commands,
+    async_start_entity_index,
+    async_stop_entity_index,
+)
 from .yaml_rt import (
     apply_seq_indent,
     detect_seq_indent,
@@ -3559,6 +3563,9 @@ async def _async_setup_tools_entry(hass: HomeAssistant, entry: ConfigEntry) -> b
     # the caller-token gate above — HA core authenticates the WS connection and
     # @require_admin gates each command (see websocket_api.py).
     async_register_commands(hass)
+    # The entity index the search command reads; it keeps itself current from
+    # state / registry events and builds lazily on the first search.
+    async_start_entity_index(hass)
 
     # Entry-level finalization: pick up the #1853 rename on existing installs and
     # give the tools entry a device. Both are cosmetic to the integration's core
@@ -3619,6 +3626,7 @@ async def _async_unload_tools_entry(hass: HomeAssistant, entry: ConfigEntry) ->
     hass.services.async_remove(DOMAIN, SERVICE_SET_ALLOWED_PATHS)
     hass.services.async_remove(DOMAIN, SERVICE_LIST_LEGACY_BACKUPS)
     hass.services.async_remove(DOMAIN, SERVICE_READ_LEGACY_BACKUP)
+    async_stop_entity_index(hass)
 
     # Drop the cached token + allowlist from hass.data so a subsequent
     # setup_entry re-reads from storage (covers the reload-after-rotate path).
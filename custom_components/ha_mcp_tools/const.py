@@ -466,6 +466,12 @@ DATA_PENDING_UPDATE_NOTIFY = "pending_update_notify"
 # Unregister callback for the conversation-agent LLM API (#1745), stored by
 # the bring-up success path and invoked (idempotently) by teardown.
 DATA_LLM_API_UNSUB = "llm_api_unsub"
+# Long-lived loopback MCP session pools for the LLM API, keyed by server URL;
+# closed by the same teardown.
+DATA_LLM_API_POOLS = "llm_api_pools"
+# The event-maintained entity search index behind ha_mcp_tools/search, started
+# by the tools entry and closed by its unload.
+DATA_ENTITY_INDEX = "entity_index"
 
 # Webhook auth modes (mirrors the webhook-proxy add-on's default posture).
 WEBHOOK_AUTH_NONE = "none"  # secret webhook URL is the shared secret (default)
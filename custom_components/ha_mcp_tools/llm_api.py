@@ -37,11 +37,21 @@ loopback streamable HTTP. The ``mcp`` client SDK arrives with the
 runtime-installed ha-mcp package (a fastmcp dependency), so every SDK import
 here is lazy and the first one runs on the executor.
 
-The tool list is fetched fresh on every ``async_get_api_instance`` call (once
-per conversation turn): exposure toggles and runtime-registered custom tools
-apply on the agent's next message, and two loopback round-trips per turn are
-noise next to the LLM call itself. Tool calls likewise open a short-lived
-stateless session each — the in-process server serves ``stateless_http=True``.
+Every exchange goes through one long-lived, initialized session per server
+URL (:class:`_SessionPool`) instead of a fresh ``initialize`` handshake per
+call — for voice Assist that handshake was a fixed delay on every tool call.
+The in-process server serves ``stateless_http=True``, so the one session
+multiplexes concurrent requests (bounded per pool) over HA's shared httpx
+client. An idle session is pinged before reuse and replaced if the ping
+fails; a session that fails mid-request is dropped and reopened on next use.
+
+The tool list is cached on the session for at most
+``_TOOL_LIST_MAX_AGE_SECONDS``, and dropped early on a
+``notifications/tools/list_changed`` from the server or when the session is
+replaced — so a turn with three tool calls costs three loopback round-trips,
+and exposure toggles and runtime-registered custom tools still apply within
+seconds. The age bound is what guarantees that: the stateless server cannot
+push a notification outside a request.
 """
 
 from __future__ import annotations
@@ -49,6 +59,7 @@ from __future__ import annotations
 import asyncio
 import importlib
 import logging
+import time
 from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
@@ -62,6 +73,7 @@ from homeassistant.helpers.httpx_client import get_async_client
 from voluptuous_openapi import convert_to_voluptuous
 
 from .const import (
+    DATA_LLM_API_POOLS,
     DATA_LLM_API_UNSUB,
     DEFAULT_LLM_API_EXPOSURE,
     DOMAIN,
@@ -79,10 +91,21 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
-# Listing tools is two loopback round-trips (initialize + tools/list); a slow
-# answer means the server thread is wedged, not that the network is slow.
+# Listing tools is at most two loopback round-trips (initialize + tools/list);
+# a slow answer means the server thread is wedged, not that the network is slow.
 _LIST_TOOLS_TIMEOUT_SECONDS = 10.0
 
+# How long a fetched tool list serves later turns. Bounds how stale exposure
+# toggles can get, since the stateless server cannot push list_changed.
+_TOOL_LIST_MAX_AGE_SECONDS = 10.0
+
+# Concurrent requests one pooled session carries; further callers queue.
+_POOL_MAX_CONCURRENCY = 4
+
+# A session idle this long is pinged before reuse: the loopback listener may
+# have been restarted under it, and a tool call is not safe to retry.
+_POOL_IDLE_PING_SECONDS = 30.0
+
 # Tool calls run real work — WebSocket-verified device control, dashboard
 # screenshots, config writes that poll for completion — well beyond the 10s a
 # remote-server integration would allow. The conversation agent shows a spinner
@@ -227,6 +250,7 @@ async def async_probe_mcp_sdk(hass: HomeAssistant) -> bool:
 async def _mcp_session(
     url: str,
     http_client: Any = None,
+    message_handler: Any = None,
 ) -> AsyncIterator[tuple[ClientSession, mcp_types.InitializeResult]]:
     """Open an initialized MCP session against the loopback server.
 
@@ -241,6 +265,9 @@ async def _mcp_session(
     line). HA's shared client is built against the process-cached SSL
     context, and the SDK does not close caller-owned clients (HA core's mcp
     integration relies on the same contract).
+
+    ``message_handler`` receives the server's notifications (see
+    :meth:`_SessionPool._on_message`).
     """
     from mcp.client.session import ClientSession
 
@@ -263,14 +290,177 @@ async def _mcp_session(
 
         transport = streamablehttp_client(url=url)
 
+    session_kwargs = (
+        {"message_handler": message_handler} if message_handler is not None else {}
+    )
     async with (
         transport as (read_stream, write_stream, _),
-        ClientSession(read_stream, write_stream) as session,
+        ClientSession(read_stream, write_stream, **session_kwargs) as session,
     ):
         init_result = await session.initialize()
         yield session, init_result
 
 
+class _Connection:
+    """One pooled session, opened and held by its own runner task.
+
+    The SDK's transport lives in an anyio task group, which must be entered
+    and exited by the same task — so a dedicated runner holds the session
+    open while any task issues requests on it.
+    """
+
+    def __init__(self, ready: asyncio.Future[Any]) -> None:
+        self.ready = ready
+        self.closing = asyncio.Event()
+        self.last_used = time.monotonic()
+        self.used = False
+        self.runner: asyncio.Task[None] | None = None
+        # (fetched at, tools/list result) for this session's server.
+        self.tools: tuple[float, Any] | None = None
+
+
+class _SessionPool:
+    """The long-lived loopback MCP session for one server URL.
+
+    One session carries every request (the server is stateless, so requests
+    on it are independent POSTs), at most ``_POOL_MAX_CONCURRENCY`` tool
+    calls at a time. Listing has its own single slot: a turn's tools/list
+    must not queue behind long-running calls, and concurrent listings wait
+    for one fetch and then read the cached result. The session is opened on
+    first use and replaced after a transport failure.
+    """
+
+    def __init__(self, hass: HomeAssistant, url: str, http_client: Any) -> None:
+        """Hold the endpoint and HA's shared httpx client (see _mcp_session)."""
+        self.url = url
+        self._hass = hass
+        self._http_client = http_client
+        self._call_slots = asyncio.Semaphore(_POOL_MAX_CONCURRENCY)
+        self._list_slot = asyncio.Semaphore(1)
+        self._conn: _Connection | None = None
+
+    async def list_tools(self) -> tuple[Any, mcp_types.InitializeResult]:
+        """Return the (possibly cached) tools/list and initialize results."""
+        async with self._list_slot:
+            conn, init_result = await self._connect()
+            if (
+                conn.tools is not None
+                and time.monotonic() - conn.tools[0] < _TOOL_LIST_MAX_AGE_SECONDS
+            ):
+                return conn.tools[1], init_result
+            try:
+                list_result = await self._request(conn, "list_tools")
+            except _transport_errors() as err:
+                # Listing is safe to repeat: a reused session that went stale
+                # gets one retry on a fresh one.
+                if not (conn.used and _is_transport_failure(err)):
+                    raise
+                conn, init_result = await self._connect()
+                list_result = await self._request(conn, "list_tools")
+            conn.tools = (time.monotonic(), list_result)
+            return list_result, init_result
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        """Call a tool on the pooled session (never retried: it may write)."""
+        async with self._call_slots:
+            conn, _init = await self._connect()
+            return await self._request(conn, "call_tool", name, arguments)
+
+    def close(self) -> None:
+        """Release the session (its runner exits the SDK contexts)."""
+        if self._conn is not None:
+            self._discard(self._conn)
+
+    async def _connect(self) -> tuple[_Connection, mcp_types.InitializeResult]:
+        conn = self._conn
+        if (
+            conn is not None
+            and conn.ready.done()
+            and time.monotonic() - conn.last_used > _POOL_IDLE_PING_SECONDS
+        ):
+            try:
+                await self._request(conn, "send_ping")
+            except _transport_errors() as err:
+                if not _is_transport_failure(err):
+                    raise
+                conn = None
+        if conn is None:
+            conn = self._open()
+        # Shielded: a caller's timeout must not cancel the handshake other
+        # callers are waiting on.
+        _session, init_result = await asyncio.shield(conn.ready)
+        return conn, init_result
+
+    async def _request(self, conn: _Connection, method: str, *args: Any) -> Any:
+        session, _init = conn.ready.result()
+        try:
+            result = await getattr(session, method)(*args)
+        except _transport_errors() as err:
+            if _is_transport_failure(err):
+                self._discard(conn)
+            raise
+        conn.last_used = time.monotonic()
+        conn.used = True
+        return result
+
+    def _open(self) -> _Connection:
+        ready: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        # Nobody may be left awaiting a failed handshake (the caller timed
+        # out); retrieve its exception so asyncio does not log it as lost.
+        ready.add_done_callback(lambda f: f.cancelled() or f.exception())
+        conn = self._conn = _Connection(ready)
+        # Hass-owned so it is tracked, and cancelled on shutdown.
+        conn.runner = self._hass.async_create_background_task(
+            self._hold(conn), name="ha_mcp_llm_api_session"
+        )
+        return conn
+
+    async def _hold(self, conn: _Connection) -> None:
+        try:
+            async with _mcp_session(
+                self.url, self._http_client, self._on_message
+            ) as opened:
+                conn.ready.set_result(opened)
+                await conn.closing.wait()
+        except asyncio.CancelledError:
+            conn.ready.cancel()
+            raise
+        except Exception as err:
+            if not conn.ready.done():
+                conn.ready.set_exception(err)
+            else:
+                _LOGGER.debug("Loopback MCP session to the server ended: %s", err)
+        finally:
+            self._discard(conn)
+
+    def _discard(self, conn: _Connection) -> None:
+        conn.closing.set()
+        if self._conn is conn:
+            self._conn = None
+
+    async def _on_message(self, message: Any) -> None:
+        """Drop the cached tool list when the server says it changed."""
+        root = getattr(message, "root", None)
+        if (
+            getattr(root, "method", None) == "notifications/tools/list_changed"
+            and self._conn is not None
+        ):
+            self._conn.tools = None
+
+
+def _session_pool(hass: HomeAssistant, server_url: str) -> _SessionPool:
+    """Return the session pool for ``server_url``, creating it on first use."""
+    pools: dict[str, _SessionPool] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_LLM_API_POOLS, {}
+    )
+    pool = pools.get(server_url)
+    if pool is None:
+        pool = pools[server_url] = _SessionPool(
+            hass, server_url, get_async_client(hass)
+        )
+    return pool
+
+
 def _tool_meta_namespace(tool: Any) -> dict[str, Any] | None:
     """Return the tool's ``_meta.ha_mcp`` namespace, or None when absent."""
     meta = getattr(tool, "meta", None)
@@ -348,11 +538,8 @@ async def _forward_tool_call(
 ) -> JsonObjectType:
     """Forward one tool call over loopback and dump the result for the agent."""
     try:
-        async with (
-            asyncio.timeout(_CALL_TOOL_TIMEOUT_SECONDS),
-            _mcp_session(server_url, get_async_client(hass)) as (session, _init),
-        ):
-            result = await session.call_tool(name, arguments)
+        async with asyncio.timeout(_CALL_TOOL_TIMEOUT_SECONDS):
+            result = await _session_pool(hass, server_url).call_tool(name, arguments)
     except _transport_errors() as err:
         if not _is_transport_failure(err):
             raise
@@ -489,19 +676,16 @@ class HaMcpLlmApi(llm.API):
     ) -> llm.APIInstance:
         """Fetch the current tool list and return an API instance.
 
-        Fetched fresh each conversation turn (see the module docstring); the
-        server's own initialize ``instructions`` become the API prompt, so the
-        agent gets the same guidance every MCP client gets.
+        The list comes from the pooled session's short-lived cache (see the
+        module docstring); the server's own initialize ``instructions`` become
+        the API prompt, so the agent gets the same guidance every MCP client
+        gets.
         """
         try:
-            async with (
-                asyncio.timeout(_LIST_TOOLS_TIMEOUT_SECONDS),
-                _mcp_session(self.server_url, get_async_client(self.hass)) as (
-                    session,
-                    init_result,
-                ),
-            ):
-                list_result = await session.list_tools()
+            async with asyncio.timeout(_LIST_TOOLS_TIMEOUT_SECONDS):
+                list_result, init_result = await _session_pool(
+                    self.hass, self.server_url
+                ).list_tools()
         except _transport_errors() as err:
             if not _is_transport_failure(err):
                 raise
@@ -673,6 +857,9 @@ async def async_register_llm_api(
 
 def async_unregister_llm_api(hass: HomeAssistant) -> None:
     """Unregister the LLM API(s) if registered (idempotent, teardown-safe)."""
+    pools = hass.data.get(DOMAIN, {}).pop(DATA_LLM_API_POOLS, None) or {}
+    for pool in pools.values():
+        pool.close()
     unsubs = hass.data.get(DOMAIN, {}).pop(DATA_LLM_API_UNSUB, None)
     if not unsubs:
         return
@@ -250,10 +250,14 @@ Design notes that are load-bearing:
   secret would confirm it via ``match_in_config`` (a probe oracle). Blocked, not
   merely unemitted.
 * **Event-loop hygiene.** Every registry/state join is a pure in-memory read
-  over live data — run synchronously, no persistent index (always fresh, zero
-  cache-invalidation surface). The one blocking read — ``secrets.yaml`` for the
-  match-corpus scrub — runs in the executor via the command wrapper's async
-  pre-step (:func:`_search_prep`), never on the event loop.
+  over live data, run synchronously. The one exception to "no persistent
+  state" is the search's entity index (:class:`_EntityIndex`): pre-joined
+  records that bus events mark dirty and the next search re-joins, so a search
+  on a large install no longer joins every state on HA's loop yet still reads
+  fresh data. The one blocking read — ``secrets.yaml`` for the match-corpus
+  scrub — runs in the executor via the command wrapper's async pre-step
+  (:func:`_search_prep`), never on the event loop, as does the scoring of a
+  very large indexed entity search.
 
 Extension point — to add another command later: write ``_do_<name>(hass,
 params)``, append its capability to :data:`CAPABILITIES`, and add one row to
@@ -262,8 +266,11 @@ params)``, append its capability to :data:`CAPABILITIES`, and add one row to
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import re
+import threading
 from collections.abc import Collection, Mapping
 from dataclasses import dataclass
 from difflib import SequenceMatcher
@@ -298,6 +305,7 @@ from .const import (
     CHANNEL_STABLE,
     COMPONENT_VERSION,
     CONF_ENTRY_TYPE,
+    DATA_ENTITY_INDEX,
     DEFAULT_PIP_SPEC,
     DOMAIN,
     ENTRY_TYPE_SERVER,
@@ -434,6 +442,12 @@ SERVER_ENTRY_UPDATE_MAX_PIP_SPEC = 500
 FUZZY_THRESHOLD = 70
 HIDDEN_SCORE_PENALTY = 20
 
+# Candidate count from which an indexed entity search scores in the executor
+# instead of on HA's event loop (``None`` disables the hand-off). The fuzzy
+# tier runs a SequenceMatcher per text, so scoring tens of thousands of
+# records is the one part of a search that still costs real CPU.
+SEARCH_EXECUTOR_MIN_CANDIDATES: int | None = 5000
+
 # --- Search surfaces ---------------------------------------------------------
 SEARCH_TYPE_ENTITY = "entity"
 SEARCH_TYPE_AUTOMATION = "automation"
@@ -996,6 +1010,7 @@ def _do_search(
     params: dict[str, Any],
     *,
     secret_values: frozenset[str] = frozenset(),
+    scored_entities: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
     """Unified in-process search. Pure over ``hass`` — the WS wrapper is thin.
 
@@ -1006,6 +1021,8 @@ def _do_search(
     loop by :func:`_search_prep` and passed in (default empty — the loader is
     skipped for an entity-only search, and direct callers/tests supply it
     explicitly). It keeps this function a pure, synchronous in-memory read.
+    ``scored_entities`` is the entity scoring the prep already ran in the
+    executor for a large candidate set; ``None`` scores here.
     """
     query_lower = (params.get("query") or "").strip().lower()
     match_all = not query_lower
@@ -1044,47 +1061,29 @@ def _do_search(
     entity_total = 0
     entity_has_more = False
     if SEARCH_TYPE_ENTITY in search_types:
-        scored_entities = _search_entities(
-            hass,
-            view,
-            query_lower,
-            match_all=match_all,
-            exact=exact,
-            include_hidden=include_hidden,
-            domain_filter=domain_filter,
-            area_filter=area_filter,
-            state_filter=state_filter,
-            include_membership=membership_requested,
-        )
+        if scored_entities is None:
+            scored_entities = _search_entities(
+                hass,
+                view,
+                query_lower,
+                match_all=match_all,
+                exact=exact,
+                include_hidden=include_hidden,
+                domain_filter=domain_filter,
+                area_filter=area_filter,
+                state_filter=state_filter,
+                include_membership=membership_requested,
+            )
         # Opt-in visibility filter: a hard exclude applied BEFORE counts/pagination,
         # exactly where the legacy path drops ``visibility_hidden`` entities at the
         # top of ``_match_exact_search_entity`` (independent of ``include_hidden``,
         # which the ``_search_entities`` join already applied). See
         # :func:`_visibility_hidden_set`.
         if isinstance(visibility, Mapping) and visibility:
-            states_list = _iter_states(hass)
-            # Probe Assist availability once (only when the config asks for it) so a
-            # requested-but-unavailable Assist dimension both skips its hiding and
-            # surfaces the resolver-parity degradation warning.
-            assist_available = (
-                _assist_exposure_available(hass)
-                if visibility.get("respect_assist_exposure")
-                else True
-            )
-            hidden = _visibility_hidden_set(
-                view,
-                states_list,
-                visibility,
-                lambda eid: _assist_should_expose(hass, eid),
-                assist_available=assist_available,
-            )
-            visibility_warnings = _visibility_warnings(
-                view, states_list, visibility, assist_available=assist_available
-            )
-            if hidden:
-                scored_entities = [
-                    r for r in scored_entities if r["entity_id"] not in hidden
-                ]
+            hidden, visibility_warnings = _search_visibility(hass, view, visibility)
+            scored_entities = [
+                r for r in scored_entities if r["entity_id"] not in hidden
+            ]
         scored_entities.sort(key=lambda r: (-r["score"], r["entity_id"]))
         entity_total = len(scored_entities)
         page = scored_entities[offset : offset + limit]
@@ -1175,6 +1174,32 @@ def _do_search(
     return result
 
 
+def _search_visibility(
+    hass: HomeAssistant, view: _RegistryView, visibility: Mapping[str, Any]
+) -> tuple[set[str], list[str]]:
+    """The search's visibility-hidden set plus its degradation warnings."""
+    states_list = _iter_states(hass)
+    # Probe Assist availability once (only when the config asks for it) so a
+    # requested-but-unavailable Assist dimension both skips its hiding and
+    # surfaces the resolver-parity degradation warning.
+    assist_available = (
+        _assist_exposure_available(hass)
+        if visibility.get("respect_assist_exposure")
+        else True
+    )
+    hidden = _visibility_hidden_set(
+        view,
+        states_list,
+        visibility,
+        lambda eid: _assist_should_expose(hass, eid),
+        assist_available=assist_available,
+    )
+    warnings = _visibility_warnings(
+        view, states_list, visibility, assist_available=assist_available
+    )
+    return hidden, warnings
+
+
 def _sort_key(rec: dict[str, Any]) -> str:
     """Stable tiebreak for combined config sorting."""
     return str(rec.get("entity_id") or rec.get("id") or rec.get("name") or "")
@@ -1187,14 +1212,60 @@ async def _search_prep(hass: HomeAssistant, msg: dict[str, Any]) -> dict[str, An
     skips the ``secrets.yaml`` read entirely (perf gate). When a scrubbed surface
     is requested, the blocking ``open()`` + ``yaml.safe_load`` runs in the
     executor via :meth:`hass.async_add_executor_job` so the WS handler never
-    blocks the event loop. The loaded set is handed to :func:`_do_search`.
+    blocks the event loop. The loaded set is handed to :func:`_do_search`, as is
+    the entity scoring when :func:`_score_entities_off_loop` moved it off-loop.
     """
     search_types = msg.get("search_types") or ALL_SEARCH_TYPES
+    extra: dict[str, Any] = {"secret_values": frozenset()}
     scrub_surfaces = (*CONFIG_SEARCH_TYPES, SEARCH_TYPE_HELPER)
-    if not any(st in search_types for st in scrub_surfaces):
-        return {"secret_values": frozenset()}
-    values = await hass.async_add_executor_job(_load_secret_values, hass)
-    return {"secret_values": values}
+    if any(st in search_types for st in scrub_surfaces):
+        extra["secret_values"] = await hass.async_add_executor_job(
+            _load_secret_values, hass
+        )
+    if SEARCH_TYPE_ENTITY in search_types:
+        scored = await _score_entities_off_loop(hass, msg)
+        if scored is not None:
+            extra["scored_entities"] = scored
+    return extra
+
+
+async def _score_entities_off_loop(
+    hass: HomeAssistant, msg: dict[str, Any]
+) -> list[dict[str, Any]] | None:
+    """Score a large indexed entity search in the executor; ``None`` to stay inline.
+
+    Only the index refresh (which reads live states / registries) runs on the
+    loop; the candidate records are immutable snapshots, so
+    :func:`_score_entity_records` can filter and score them in a worker thread
+    once there are at least :data:`SEARCH_EXECUTOR_MIN_CANDIDATES` of them.
+    """
+    index = _entity_index(hass)
+    if index is None or SEARCH_EXECUTOR_MIN_CANDIDATES is None:
+        return None
+    domain_filter = msg.get("domain_filter")
+    area_filter = msg.get("area_filter")
+    candidates = index.candidates(
+        hass,
+        _resolve_registries(hass),
+        domain_filter=domain_filter,
+        area_filter=area_filter,
+    )
+    if len(candidates) < SEARCH_EXECUTOR_MIN_CANDIDATES:
+        return None
+    query_lower = (msg.get("query") or "").strip().lower()
+    score = functools.partial(
+        _score_entity_records,
+        candidates,
+        query_lower,
+        match_all=not query_lower,
+        exact=msg.get("exact", True),
+        include_hidden=msg.get("include_hidden", True),
+        domain_filter=domain_filter,
+        area_filter=area_filter,
+        state_filter=msg.get("state_filter"),
+    )
+    scored: list[dict[str, Any]] = await hass.async_add_executor_job(score)
+    return scored
 
 
 def _load_secret_scrub(hass: HomeAssistant) -> tuple[frozenset[str], bool]:
@@ -1220,10 +1291,11 @@ def _load_secret_scrub(hass: HomeAssistant) -> tuple[frozenset[str], bool]:
     there is simply nothing to scrub.
 
     Defensive by design — never raises into the WS handler. Loaded off the event loop
-    by the async preps once per call, never cached, so an edited ``secrets.yaml``
-    applies on the next call. ``secrets.yaml`` is a flat ``key: value`` mapping with
-    no custom tags, so the plain ``yaml.safe_load`` (not HA's ``!secret``/
-    ``!include`` loader) reads it correctly.
+    by the async preps, and re-parsed only when the file's stat signature (see
+    :func:`_secrets_signature`) changed since the last read, so an edited
+    ``secrets.yaml`` still applies on the next call. ``secrets.yaml`` is a flat
+    ``key: value`` mapping with no custom tags, so the plain ``yaml.safe_load`` (not
+    HA's ``!secret``/``!include`` loader) reads it correctly.
     """
     config = getattr(hass, "config", None)
     path_fn = getattr(config, "path", None)
@@ -1231,8 +1303,49 @@ def _load_secret_scrub(hass: HomeAssistant) -> tuple[frozenset[str], bool]:
         return frozenset(), False
     try:
         path = path_fn("secrets.yaml")
-        if not path:
-            return frozenset(), False
+    except Exception:  # pragma: no cover - defensive; core drift
+        # Unresolvable path: as unreadable as a broken file, so degraded.
+        _LOGGER.warning("Could not resolve secrets.yaml for the secret-scrub")
+        return frozenset(), True
+    if not path:
+        return frozenset(), False
+    path = str(path)
+    signature = _secrets_signature(path)
+    with _SECRET_SCRUB_LOCK:
+        cached = _SECRET_SCRUB_CACHE.get(path)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return cached[1]
+    scrub = _read_secret_scrub(path)
+    if signature is not None:
+        with _SECRET_SCRUB_LOCK:
+            _SECRET_SCRUB_CACHE[path] = (signature, scrub)
+    return scrub
+
+
+# Parsed secret-scrub results by ``secrets.yaml`` path, each with the stat
+# signature it was read at. The preps load from executor threads, hence the lock.
+_SECRET_SCRUB_CACHE: dict[
+    str, tuple[tuple[int, int, int, int], tuple[frozenset[str], bool]]
+] = {}
+_SECRET_SCRUB_LOCK = threading.Lock()
+
+
+def _secrets_signature(path: str) -> tuple[int, int, int, int] | None:
+    """``(mtime_ns, ctime_ns, size, inode)`` of ``path``; ``None`` if it can't be stat'd.
+
+    ctime is included so a permission change (which leaves mtime alone) retries a
+    read that failed; the inode catches an editor's atomic replace.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino
+
+
+def _read_secret_scrub(path: str) -> tuple[frozenset[str], bool]:
+    """Open and parse ``secrets.yaml`` for :func:`_load_secret_scrub`."""
+    try:
         with open(path, encoding="utf-8") as handle:
             raw = yaml.safe_load(handle)
     except FileNotFoundError:
@@ -1240,9 +1353,9 @@ def _load_secret_scrub(hass: HomeAssistant) -> tuple[frozenset[str], bool]:
         return frozenset(), False
     except Exception:
         # Present-but-unreadable / malformed / permission error: unexpected, so warn
-        # once (this runs once per call) AND report degraded so the emission callers
-        # can signal that options were NOT redacted, rather than raising into the WS
-        # handler.
+        # (once per version of the file — an unchanged file is not re-read) AND
+        # report degraded so the emission callers can signal that options were NOT
+        # redacted, rather than raising into the WS handler.
         _LOGGER.warning(
             "Could not read secrets.yaml for the secret-scrub; continuing WITHOUT "
             "redaction (emitted options may be unredacted)",
@@ -1298,15 +1411,58 @@ def _search_entities(
     state_filter: str | None,
     include_membership: bool = False,
 ) -> list[dict[str, Any]]:
-    """Score every state against the query over the joined registry view."""
+    """Score the candidate entities against the query over the joined view.
+
+    With the :class:`_EntityIndex` running (the tools entry starts it), the
+    candidates are its pre-joined records, narrowed by the domain / area
+    filter; without it, every state is joined on the spot.
+    """
+    index = _entity_index(hass)
+    records: Any
+    if index is not None:
+        records = index.candidates(
+            hass, view, domain_filter=domain_filter, area_filter=area_filter
+        )
+    else:
+        records = (
+            _entity_record(state, view, include_membership=include_membership)
+            for state in _iter_states(hass)
+        )
+    return _score_entity_records(
+        records,
+        query_lower,
+        match_all=match_all,
+        exact=exact,
+        include_hidden=include_hidden,
+        domain_filter=domain_filter,
+        area_filter=area_filter,
+        state_filter=state_filter,
+    )
+
+
+def _score_entity_records(
+    records: Any,
+    query_lower: str,
+    *,
+    match_all: bool,
+    exact: bool,
+    include_hidden: bool,
+    domain_filter: str | None,
+    area_filter: str | None,
+    state_filter: str | None,
+) -> list[dict[str, Any]]:
+    """Filter and score joined entity records; pure, so safe in the executor.
+
+    A hit is returned as a copy carrying ``score`` / ``match_type``; the input
+    records are never written to (the index shares them across searches).
+    """
     results: list[dict[str, Any]] = []
     area_filter_lower = area_filter.lower() if area_filter else None
     # Lower the state filter once; the entity state is lowered per record so the
     # compare is case-insensitive (e.g. an input_select holding "Vacation"
     # matches state_filter="vacation").
     state_filter_lower = state_filter.lower() if state_filter is not None else None
-    for state in _iter_states(hass):
-        rec = _entity_record(state, view, include_membership=include_membership)
+    for rec in records:
         if domain_filter and rec["domain"] != domain_filter:
             continue
         if rec["_hidden"] and not include_hidden:
@@ -1325,7 +1481,10 @@ def _search_entities(
             score: int | None = _apply_hidden_penalty(100, rec["_hidden"])
             match_type = "match_all"
         else:
-            tier = _text_tier(query_lower, rec["_match_texts"], fuzzy=not exact)
+            folded = rec.get("_folded")
+            if folded is None:
+                folded = _fold_texts(rec["_match_texts"], normalize=not exact)
+            tier = _folded_text_tier(query_lower, folded, fuzzy=not exact)
             if tier is None:
                 continue
             score = _apply_hidden_penalty(tier, rec["_hidden"])
@@ -1337,12 +1496,196 @@ def _search_entities(
                 rec["aliases"],
                 exact=exact,
             )
-        rec["score"] = score
-        rec["match_type"] = match_type
-        results.append(rec)
+        hit = dict(rec)
+        hit["score"] = score
+        hit["match_type"] = match_type
+        results.append(hit)
     return results
 
 
+class _EntityIndex:
+    """Pre-joined entity search records, kept current from bus events.
+
+    ``_search_entities`` used to join every state against the five registries
+    on each call, synchronously on HA's event loop; on a large install that
+    stalls automations and the UI for the length of the scan. The index holds
+    each entity's :func:`_entity_record` (membership included) plus its
+    case-folded match texts, keyed by entity_id, with domain / area buckets for
+    the search filters.
+
+    Listeners only mark work: a ``state_changed`` or entity-registry event
+    dirties one id, a device or area change dirties the ids joined to it, and
+    a floor or label change (renames that reach every member) marks the whole
+    index stale. :meth:`candidates` re-joins just the dirty ids, or rebuilds
+    once when stale, before answering, so a search still reads live data. A
+    record is replaced, never mutated, so a list of them can be scored in the
+    executor while the loop keeps applying events.
+    """
+
+    def __init__(self) -> None:
+        self._records: dict[str, dict[str, Any]] = {}
+        self._by_domain: dict[str, set[str]] = {}
+        self._by_area: dict[str, set[str]] = {}
+        self._by_device: dict[str, set[str]] = {}
+        self._device_of: dict[str, str] = {}
+        self._dirty: set[str] = set()
+        self._stale = True
+        self._unsubs: list[Any] = []
+
+    def async_listen(self, hass: HomeAssistant) -> None:
+        """Subscribe to the state and registry events that change a record."""
+        from homeassistant.const import EVENT_STATE_CHANGED
+
+        handlers = (
+            (EVENT_STATE_CHANGED, self._on_entity_event),
+            (er.EVENT_ENTITY_REGISTRY_UPDATED, self._on_entity_event),
+            (dr.EVENT_DEVICE_REGISTRY_UPDATED, self._on_device_event),
+            (ar.EVENT_AREA_REGISTRY_UPDATED, self._on_area_event),
+            (fr.EVENT_FLOOR_REGISTRY_UPDATED, self._on_registry_wide_event),
+            (lr.EVENT_LABEL_REGISTRY_UPDATED, self._on_registry_wide_event),
+        )
+        for event_type, handler in handlers:
+            # Run inline on the loop; see _register_transition_waiter for why
+            # the attribute is set rather than using ``@callback``.
+            handler.__func__._hass_callback = True  # type: ignore[attr-defined]
+            self._unsubs.append(hass.bus.async_listen(event_type, handler))
+
+    def close(self) -> None:
+        """Drop the event subscriptions (idempotent)."""
+        unsubs, self._unsubs = self._unsubs, []
+        for unsub in unsubs:
+            unsub()
+
+    def _on_entity_event(self, event: Any) -> None:
+        data = getattr(event, "data", None) or {}
+        for key in ("entity_id", "old_entity_id"):
+            entity_id = data.get(key)
+            if isinstance(entity_id, str):
+                self._dirty.add(entity_id)
+
+    def _on_device_event(self, event: Any) -> None:
+        data = getattr(event, "data", None) or {}
+        self._dirty |= self._by_device.get(data.get("device_id"), set())
+
+    def _on_area_event(self, event: Any) -> None:
+        data = getattr(event, "data", None) or {}
+        self._dirty |= self._by_area.get(data.get("area_id"), set())
+
+    def _on_registry_wide_event(self, event: Any) -> None:
+        self._stale = True
+
+    def candidates(
+        self,
+        hass: HomeAssistant,
+        view: _RegistryView,
+        *,
+        domain_filter: str | None = None,
+        area_filter: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """The current records a search with these filters needs to look at.
+
+        A superset of the matches: :func:`_score_entity_records` still applies
+        every filter, the buckets only spare it the records that cannot match.
+        """
+        self._refresh(hass, view)
+        ids: set[str] | None = None
+        if domain_filter:
+            ids = self._by_domain.get(domain_filter, set())
+        if area_filter:
+            area_ids = self._area_bucket(view, area_filter.lower())
+            ids = area_ids if ids is None else ids & area_ids
+        if ids is None:
+            return list(self._records.values())
+        return [self._records[eid] for eid in ids]
+
+    def _area_bucket(self, view: _RegistryView, area_filter_lower: str) -> set[str]:
+        ids: set[str] = set()
+        for area_id, members in self._by_area.items():
+            name = _area_name(view, area_id)
+            if area_id.lower() == area_filter_lower or (
+                name and name.lower() == area_filter_lower
+            ):
+                ids |= members
+        return ids
+
+    def _refresh(self, hass: HomeAssistant, view: _RegistryView) -> None:
+        if self._stale:
+            self._stale = False
+            self._dirty.clear()
+            for bucket in (self._by_domain, self._by_area, self._by_device):
+                bucket.clear()
+            self._records.clear()
+            self._device_of.clear()
+            for state in _iter_states(hass):
+                self._add(state, view)
+            return
+        dirty, self._dirty = self._dirty, set()
+        for entity_id in dirty:
+            self._remove(entity_id)
+            state = _state_get(hass, entity_id)
+            if state is not None:
+                self._add(state, view)
+
+    def _add(self, state: Any, view: _RegistryView) -> None:
+        rec = _entity_record(state, view, include_membership=True)
+        entity_id = rec["entity_id"]
+        rec["_folded"] = _fold_texts(rec["_match_texts"], normalize=True)
+        self._records[entity_id] = rec
+        self._by_domain.setdefault(rec["domain"], set()).add(entity_id)
+        if rec["_area_id"]:
+            self._by_area.setdefault(rec["_area_id"], set()).add(entity_id)
+        device_id = getattr(_reg_entity(view, entity_id), "device_id", None)
+        if device_id:
+            self._device_of[entity_id] = device_id
+            self._by_device.setdefault(device_id, set()).add(entity_id)
+
+    def _remove(self, entity_id: str) -> None:
+        rec = self._records.pop(entity_id, None)
+        if rec is None:
+            return
+        _discard_member(self._by_domain, rec["domain"], entity_id)
+        _discard_member(self._by_area, rec["_area_id"], entity_id)
+        _discard_member(
+            self._by_device, self._device_of.pop(entity_id, None), entity_id
+        )
+
+
+def _discard_member(buckets: dict[str, set[str]], key: Any, entity_id: str) -> None:
+    """Remove ``entity_id`` from ``buckets[key]``, dropping the emptied bucket."""
+    members = buckets.get(key) if key else None
+    if members is None:
+        return
+    members.discard(entity_id)
+    if not members:
+        del buckets[key]
+
+
+def async_start_entity_index(hass: HomeAssistant) -> None:
+    """Start the search index, replacing one left by an earlier setup."""
+    async_stop_entity_index(hass)
+    index = _EntityIndex()
+    index.async_listen(hass)
+    hass.data.setdefault(DOMAIN, {})[DATA_ENTITY_INDEX] = index
+
+
+def async_stop_entity_index(hass: HomeAssistant) -> None:
+    """Close the search index; ``search`` falls back to a full join without it."""
+    domain_data = hass.data.get(DOMAIN)
+    if isinstance(domain_data, dict):
+        index = domain_data.pop(DATA_ENTITY_INDEX, None)
+        if isinstance(index, _EntityIndex):
+            index.close()
+
+
+def _entity_index(hass: HomeAssistant) -> _EntityIndex | None:
+    domain_data = getattr(hass, "data", None)
+    if not isinstance(domain_data, dict):
+        return None
+    tools_data = domain_data.get(DOMAIN)
+    index = tools_data.get(DATA_ENTITY_INDEX) if isinstance(tools_data, dict) else None
+    return index if isinstance(index, _EntityIndex) else None
+
+
 def _entity_match_type(
     query_lower: str,
     entity_id: str,
@@ -2019,13 +2362,37 @@ def _text_tier(query_lower: str, texts: Any, *, fuzzy: bool) -> int | None:
     typos above :data:`FUZZY_THRESHOLD`. Exact mode stays raw-only for
     byte-parity with the server's exact path.
     """
-    query_norm = _sep_normalized(query_lower) if fuzzy else ""
-    best_substring: int | None = None
-    best_ratio = 0
+    return _folded_text_tier(
+        query_lower, _fold_texts(texts, normalize=fuzzy), fuzzy=fuzzy
+    )
+
+
+def _fold_texts(texts: Any, *, normalize: bool) -> list[tuple[str, str]]:
+    """``(lowered, separator-normalized)`` per non-empty text, for the tier scorer.
+
+    The normalized form is ``""`` unless ``normalize`` — exact mode never reads
+    it. The entity index stores the normalized fold so neither mode redoes it.
+    """
+    folded: list[tuple[str, str]] = []
     for text in texts:
         if not text:
             continue
-        tier, ratio = _tier_one_text(query_lower, query_norm, str(text).lower(), fuzzy)
+        text_lower = str(text).lower()
+        folded.append((text_lower, _sep_normalized(text_lower) if normalize else ""))
+    return folded
+
+
+def _folded_text_tier(
+    query_lower: str, folded: list[tuple[str, str]], *, fuzzy: bool
+) -> int | None:
+    """:func:`_text_tier` over texts already passed through :func:`_fold_texts`."""
+    query_norm = _sep_normalized(query_lower) if fuzzy else ""
+    best_substring: int | None = None
+    best_ratio = 0
+    for text_lower, text_norm in folded:
+        tier, ratio = _tier_one_text(
+            query_lower, query_norm, text_lower, text_norm if query_norm else "", fuzzy
+        )
         if tier == 100:
             return 100
         if tier == 80:
@@ -2040,17 +2407,17 @@ def _text_tier(query_lower: str, texts: Any, *, fuzzy: bool) -> int | None:
 
 
 def _tier_one_text(
-    query_lower: str, query_norm: str, text_lower: str, fuzzy: bool
+    query_lower: str, query_norm: str, text_lower: str, text_norm: str, fuzzy: bool
 ) -> tuple[int | None, int]:
     """Score one candidate text: ``(tier, ratio)``.
 
     Tier 100 = exact (raw, or separator-normalized in fuzzy mode); tier 80 =
     substring (same two forms); otherwise ``ratio`` carries the fuzzy
-    whole-string fallback (0 when not in fuzzy mode).
+    whole-string fallback (0 when not in fuzzy mode). ``text_norm`` is ``""``
+    when the normalized comparison does not apply.
     """
     if query_lower == text_lower:
         return 100, 0
-    text_norm = _sep_normalized(text_lower) if fuzzy and query_norm else ""
     if text_norm and query_norm == text_norm:
         return 100, 0
     if query_lower in text_lower:
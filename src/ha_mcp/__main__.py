@@ -21,7 +21,6 @@ truststore.inject_into_ssl()
 
 import asyncio  # noqa: E402
 import copy  # noqa: E402
-import hashlib  # noqa: E402
 import ipaddress  # noqa: E402
 import logging  # noqa: E402
 import os  # noqa: E402
@@ -42,6 +41,9 @@ from ha_mcp.browser_landing import (  # noqa: E402
 from ha_mcp.browser_landing import (  # noqa: E402
     register_healthz as _register_healthz_route,
 )
+from ha_mcp.browser_landing import (  # noqa: E402
+    register_metrics as _register_metrics_route,
+)
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
@@ -60,22 +62,26 @@ class OAuthProxyClient:
     The proxy allows us to inject different credentials per-request based on OAuth token claims.
 
     The Home Assistant URL is fixed server-side (HOMEASSISTANT_URL env var).
-    Only the access token varies per-user (from OAuth consent form).
+    Only the access token varies per-user (from OAuth consent form). Per-token
+    clients live in a bounded, idle-evicting pool that shares one connection
+    pool to Home Assistant (see ``ha_mcp.client.client_pool``).
     """
 
     def __init__(self, ha_url: str) -> None:
+        from ha_mcp.client.client_pool import HomeAssistantClientPool
+        from ha_mcp.telemetry import get_telemetry
+
         self._ha_url = ha_url.rstrip("/")
-        self._oauth_clients: dict[str, HomeAssistantClient] = {}
-        self._lock = threading.Lock()
+        self._oauth_clients = HomeAssistantClientPool(self._ha_url)
+        get_telemetry().register_collector(
+            "oauth_client_pool", self._oauth_clients.stats
+        )
 
     def _get_oauth_client(self) -> "HomeAssistantClient":
         """Get the OAuth client for the current request context."""
         from fastmcp.server.dependencies import get_access_token
 
-        from ha_mcp.client.rest_client import (
-            HomeAssistantAuthError,
-            HomeAssistantClient,
-        )
+        from ha_mcp.client.rest_client import HomeAssistantAuthError
 
         # Get the access token from the current request context
         token = get_access_token()
@@ -95,28 +101,11 @@ class OAuthProxyClient:
                 "No Home Assistant credentials in OAuth token claims"
             )
 
-        ha_token = claims["ha_token"]
-
-        # Hash token for cache key to avoid raw tokens appearing in dict keys
-        client_key = hashlib.sha256(ha_token.encode()).hexdigest()
-
-        with self._lock:
-            if client_key not in self._oauth_clients:
-                self._oauth_clients[client_key] = HomeAssistantClient(
-                    base_url=self._ha_url,
-                    token=ha_token,
-                )
-                logger.info(f"Created OAuth client for {self._ha_url}")
-
-            return self._oauth_clients[client_key]
+        return self._oauth_clients.get(claims["ha_token"])
 
     async def close(self) -> None:
-        """Close all cached OAuth clients to release httpx connection pools."""
-        with self._lock:
-            clients = list(self._oauth_clients.values())
-            self._oauth_clients.clear()
-        for client in clients:
-            await client.close()
+        """Close all pooled OAuth clients and the shared connection pool."""
+        await self._oauth_clients.aclose()
 
     def __getattr__(self, name: str) -> Any:
         """Forward all attribute access to the OAuth client."""
@@ -476,6 +465,8 @@ class ProbeAccessLogFilter(logging.Filter):
             return False  # browser favicon auto-request — pure noise
         if status == 200 and path == "/healthz":
             return False  # opt-in liveness probe (register_healthz) — pure noise
+        if status == 200 and path == "/metrics":
+            return False  # opt-in Prometheus scrape (register_metrics) — same
         # By-design probe 405 on the MCP path; the handler logs an annotated line
         # instead. This trusts that the landing route is the only GET/HEAD responder
         # on the MCP path (true today).
@@ -1170,6 +1161,12 @@ def _healthz_enabled() -> bool:
     return os.getenv("MCP_HEALTHZ", "").strip().lower() in ("1", "true", "yes", "on")
 
 
+def _metrics_enabled() -> bool:
+    """True when MCP_METRICS opts in to the unauthenticated Prometheus /metrics
+    route. Off by default for the same reason as /healthz."""
+    return os.getenv("MCP_METRICS", "").strip().lower() in ("1", "true", "yes", "on")
+
+
 def _oidc_verify_id_token_enabled() -> bool:
     """True when OIDC_VERIFY_ID_TOKEN opts in to ID-token verification.
 
@@ -1447,6 +1444,8 @@ def _run_http_server(default_port: int = 8086) -> None:
     register_browser_landing(_get_mcp(), path)
     if _healthz_enabled():
         _register_healthz_route(_get_mcp())
+    if _metrics_enabled():
+        _register_metrics_route(_get_mcp())
     if _settings_ui_disabled():
         logger.info(
             "Settings UI disabled (HA_MCP_DISABLE_SETTINGS_UI); routes not registered."
@@ -1598,6 +1597,8 @@ async def _run_oauth_server(
     register_browser_landing(mcp, path)
     if _healthz_enabled():
         _register_healthz_route(mcp)
+    if _metrics_enabled():
+        _register_metrics_route(mcp)
 
     # The settings UI must not sit at the OAuth-known MCP path (custom routes
     # bypass the OAuth auth middleware); mount it behind a dedicated secret path.
@@ -1805,6 +1806,8 @@ async def _run_oidc_server(
     _register_settings_ui_secret_path(mcp_instance, _server, host, port, path, base_url)
     if _healthz_enabled():
         _register_healthz_route(mcp_instance)
+    if _metrics_enabled():
+        _register_metrics_route(mcp_instance)
     logger.info(f"Starting OIDC-enabled MCP server at {base_url}{path}")
 
     await _run_with_shutdown(
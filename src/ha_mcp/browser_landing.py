@@ -168,3 +168,36 @@ def register_healthz(mcp_instance: CustomRouteServer) -> bool:
         return JSONResponse({"status": "ok", "server": "ha-mcp"})
 
     return True
+
+
+_registered_metrics: weakref.WeakSet[CustomRouteServer] = weakref.WeakSet()
+
+METRICS_PATH = "/metrics"
+
+# Prometheus text exposition format, version 0.0.4.
+_METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def register_metrics(mcp_instance: CustomRouteServer) -> bool:
+    """Register a GET ``/metrics`` route serving tool telemetry to Prometheus.
+
+    Exposes the per-tool call counts, latency and response-size quantiles, and
+    Home Assistant versus local time kept by :mod:`ha_mcp.telemetry`. Opt-in
+    (``MCP_METRICS`` env var, checked by the caller) for the same reason as
+    ``/healthz``: it is unauthenticated, and while it carries no entity data
+    it does reveal which tools are being used. Idempotent per instance.
+    """
+    if mcp_instance in _registered_metrics:
+        logger.warning("register_metrics: already registered, skipping")
+        return False
+    _registered_metrics.add(mcp_instance)
+
+    from .telemetry import get_telemetry
+
+    @mcp_instance.custom_route(METRICS_PATH, methods=["GET"])
+    async def _metrics(_: Request) -> PlainTextResponse:
+        return PlainTextResponse(
+            get_telemetry().render_prometheus(), media_type=_METRICS_CONTENT_TYPE
+        )
+
+    return True
@@ -0,0 +1,225 @@
+"""
+Bounded pool of per-token ``HomeAssistantClient`` instances for OAuth mode.
+
+In OAuth/OIDC mode every user brings their own Home Assistant token, and
+``OAuthProxyClient`` needs a REST client per token. Keeping one forever per
+token hash grew without bound on deployments with rotating refresh tokens, and
+each client carried its own httpx connection pool, so every user also held
+their own sockets (and TLS sessions) to the same Home Assistant.
+
+This pool:
+
+- keys clients by a SHA-256 of the token (raw tokens never become dict keys),
+- evicts the least-recently-used client past ``max_size`` and any client idle
+  for longer than ``idle_ttl``, sweeping on every lookup,
+- routes every client through ONE shared httpx transport, so all users reuse
+  a single connection pool to Home Assistant (the token rides per request in
+  the ``Authorization`` header, which the transport never looks at),
+- closes evicted clients asynchronously after a grace period, so a tool that
+  is halfway through a multi-request method on a just-evicted client is not
+  cut off — closing only retires the client object, the shared transport
+  stays open until :meth:`HomeAssistantClientPool.aclose`,
+- counts hits, misses and evictions for ``/metrics`` and the settings UI.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from .rest_client import HomeAssistantClient
+
+logger = logging.getLogger(__name__)
+
+# Mirrors the WebSocket pool bound (websocket_client.MAX_POOL_SIZE).
+MAX_OAUTH_CLIENTS = 50
+
+# A user idle this long gets their client rebuilt on the next call; cheap,
+# since the connection pool underneath is shared.
+OAUTH_CLIENT_IDLE_TTL_SECONDS = 900.0
+
+# Delay between evicting a client and closing it. Longer than any single
+# request's timeout, so an in-flight call on the evicted client finishes.
+EVICTED_CLIENT_CLOSE_GRACE_SECONDS = 120.0
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """A view of the pool's transport that a client may "close" freely.
+
+    ``httpx.AsyncClient.aclose`` closes its transport; handing each client
+    this wrapper instead keeps the real connection pool alive until the pool
+    itself is closed.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+@dataclass
+class _Entry:
+    client: HomeAssistantClient
+    last_used: float
+
+
+@dataclass
+class _PoolStats:
+    hits: int = 0
+    misses: int = 0
+    evictions_idle: int = 0
+    evictions_capacity: int = 0
+
+
+class HomeAssistantClientPool:
+    """LRU + idle-TTL pool of ``HomeAssistantClient`` keyed by token.
+
+    :meth:`get` is synchronous (``OAuthProxyClient`` resolves the client from
+    ``__getattr__``) and thread-safe; closing is async.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        max_size: int = MAX_OAUTH_CLIENTS,
+        idle_ttl: float = OAUTH_CLIENT_IDLE_TTL_SECONDS,
+        close_grace: float = EVICTED_CLIENT_CLOSE_GRACE_SECONDS,
+        verify_ssl: bool | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if verify_ssl is None:
+            from ..config import get_global_settings
+
+            verify_ssl = get_global_settings().verify_ssl
+        self._base_url = base_url.rstrip("/")
+        self._max_size = max_size
+        self._idle_ttl = idle_ttl
+        self._close_grace = close_grace
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._stats = _PoolStats()
+        self._transport = httpx.AsyncHTTPTransport(verify=verify_ssl)
+        self._shared = _SharedTransport(self._transport)
+        # Evicted clients not yet closed, and the tasks that will close them.
+        self._retiring: set[HomeAssistantClient] = set()
+        self._closers: set[asyncio.Task[None]] = set()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> HomeAssistantClient:
+        """The pooled client for ``token``, created on a miss."""
+        from .rest_client import HomeAssistantClient
+
+        key = self._key(token)
+        now = self._clock()
+        with self._lock:
+            evicted = self._evict_idle(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._stats.hits += 1
+                entry.last_used = now
+                self._entries.move_to_end(key)
+            else:
+                self._stats.misses += 1
+                entry = _Entry(
+                    HomeAssistantClient(
+                        base_url=self._base_url,
+                        token=token,
+                        transport=self._shared,
+                    ),
+                    now,
+                )
+                self._entries[key] = entry
+                logger.info(f"Created OAuth client for {self._base_url}")
+                while len(self._entries) > self._max_size:
+                    _, oldest = self._entries.popitem(last=False)
+                    self._stats.evictions_capacity += 1
+                    evicted.append(oldest.client)
+            client = entry.client
+        if evicted:
+            self._retire(evicted)
+        return client
+
+    def _evict_idle(self, now: float) -> list[HomeAssistantClient]:
+        """Pop idle entries from the LRU end. Caller holds the lock."""
+        evicted = []
+        while self._entries:
+            key, oldest = next(iter(self._entries.items()))
+            if now - oldest.last_used <= self._idle_ttl:
+                break
+            del self._entries[key]
+            self._stats.evictions_idle += 1
+            evicted.append(oldest.client)
+        return evicted
+
+    def _retire(self, clients: list[HomeAssistantClient]) -> None:
+        self._retiring.update(clients)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to schedule on: aclose() picks them up.
+            return
+        task = loop.create_task(self._close_later(clients))
+        self._closers.add(task)
+        task.add_done_callback(self._closers.discard)
+
+    async def _close_later(self, clients: list[HomeAssistantClient]) -> None:
+        await asyncio.sleep(self._close_grace)
+        for client in clients:
+            self._retiring.discard(client)
+            await _close_quietly(client)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        """Counters in Prometheus naming (``*_total`` = counter, else gauge)."""
+        with self._lock:
+            stats = self._stats
+            return {
+                "clients": len(self._entries),
+                "hits_total": stats.hits,
+                "misses_total": stats.misses,
+                "evictions_idle_total": stats.evictions_idle,
+                "evictions_capacity_total": stats.evictions_capacity,
+            }
+
+    async def aclose(self) -> None:
+        """Close every client, pooled or retiring, and the shared transport."""
+        closers = list(self._closers)
+        for task in closers:
+            task.cancel()
+        await asyncio.gather(*closers, return_exceptions=True)
+        with self._lock:
+            clients = [entry.client for entry in self._entries.values()]
+            self._entries.clear()
+        clients += self._retiring
+        self._retiring.clear()
+        for client in clients:
+            await _close_quietly(client)
+        await self._transport.aclose()
+
+
+async def _close_quietly(client: HomeAssistantClient) -> None:
+    try:
+        await client.close()
+    except (OSError, RuntimeError):
+        logger.warning("Error closing evicted OAuth client", exc_info=True)
@@ -0,0 +1,205 @@
+"""
+Event-invalidated cache of automation, script and scene config bodies.
+
+A deep ``ha_search`` scores the query against every automation, script and
+scene config. Without a cache each search re-downloads all of them — a bulk
+REST list when HA serves one, otherwise one budgeted per-id request each,
+which on large installs routinely runs out of budget and returns a
+``partial`` result. ``ConfigBodyCache`` keeps the bodies (and the search
+documents scoring builds from them) between searches, so a repeat
+search only fetches what changed since the last one.
+
+Invalidation mirrors ``registry_cache`` (both build on ``event_cache``):
+
+- On first use the cache listens for ``automation_reloaded``,
+  ``script_reloaded`` and ``scene_reloaded`` on the pooled WebSocket's event
+  bus. HA fires these after any reload, including the one its config API
+  runs after a UI edit, and each drops the whole domain.
+- Our own ``upsert_*_config`` / ``delete_*_config`` calls drop the written
+  key synchronously, so a search right after an edit never scores the old
+  body even if the reload event is still in flight.
+- A TTL bounds the damage of anything the two rules above miss.
+
+Entries are only trusted while the WebSocket carrying the subscription is
+connected; after a reconnect the cache starts over.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..utils.search_document import SearchDocument
+from .event_cache import CredentialCaches, EventInvalidatedCache
+
+# Safety-net lifetime of a cached config body. Reload events are the primary
+# invalidation; this only caps how long a missed event can go unnoticed.
+CONFIG_CACHE_TTL_SECONDS = 600.0
+
+# Bound on distinct (url, token) caches, matching the registry cache bound.
+MAX_CONFIG_CACHES = 50
+
+CONFIG_DOMAINS: tuple[str, ...] = ("automation", "script", "scene")
+
+# HA bus event -> the config domain it invalidates.
+CONFIG_RELOAD_EVENTS: dict[str, str] = {
+    "automation_reloaded": "automation",
+    "script_reloaded": "script",
+    "scene_reloaded": "scene",
+}
+
+
+@dataclass(frozen=True)
+class CachedConfig:
+    """One config body plus the search document scoring builds from it.
+
+    ``body`` is ``None`` for a known-unfetchable config — the per-id endpoint
+    answered 404 (a YAML-defined automation or script). Remembering that
+    keeps a repeat search from spending its budget re-asking.
+
+    The body is shared between searches: treat it as read-only.
+    """
+
+    body: dict[str, Any] | None
+    document: SearchDocument | None = None
+
+
+@dataclass
+class _DomainEntries:
+    entries: dict[str, CachedConfig] = field(default_factory=dict)
+    # True once a bulk fetch filled the domain: every config HA can list is
+    # present, so a key missing from ``entries`` has no fetchable config.
+    complete: bool = False
+    fetched_at: float = 0.0
+
+
+class ConfigBodyCache(EventInvalidatedCache):
+    """Per-(url, token) cache of config bodies for the deep-search domains."""
+
+    EVENTS = tuple(CONFIG_RELOAD_EVENTS)
+
+    def __init__(self, ttl: float = CONFIG_CACHE_TTL_SECONDS) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Safety-net lifetime of a domain's cached bodies in seconds.
+        """
+        super().__init__(CONFIG_DOMAINS, ttl)
+        self._domains: dict[str, _DomainEntries] = {
+            domain: _DomainEntries() for domain in CONFIG_DOMAINS
+        }
+
+    async def _handle_event(self, event: dict[str, Any]) -> None:
+        domain = CONFIG_RELOAD_EVENTS.get(event.get("event_type", ""))
+        if domain is not None:
+            self.invalidate(domain)
+
+    # ----- reads -----------------------------------------------------------
+
+    def snapshot(self, domain: str) -> tuple[dict[str, CachedConfig], bool]:
+        """Return ``(entries, complete)`` for ``domain``.
+
+        ``entries`` is a fresh dict the caller may extend; the
+        ``CachedConfig`` values themselves are shared. An untrusted or
+        expired domain reads as ``({}, False)``.
+        """
+        state = self._domains[domain]
+        if not state.entries and not state.complete:
+            self.misses += 1
+            return {}, False
+        if not self._is_live():
+            self.misses += 1
+            return {}, False
+        if time.monotonic() - state.fetched_at > self.ttl:
+            self.invalidate(domain)
+            self.misses += 1
+            return {}, False
+        self.hits += 1
+        return dict(state.entries), state.complete
+
+    def store(
+        self,
+        domain: str,
+        entries: dict[str, CachedConfig],
+        generation: int,
+        *,
+        complete: bool = False,
+    ) -> None:
+        """Cache ``entries`` fetched under ``generation``.
+
+        ``complete=True`` marks a bulk fetch: ``entries`` is the whole domain
+        and replaces what was cached. Otherwise ``entries`` is merged in.
+        Dropped when an invalidation landed while the fetch was in flight.
+        """
+        if generation != self.generation(domain) or not self._is_live():
+            return
+        state = self._domains[domain]
+        if not (complete or entries):
+            return
+        # The TTL runs from the oldest entry, so merging per-id results into
+        # a populated domain does not extend it.
+        if complete or not state.entries:
+            state.fetched_at = time.monotonic()
+        if complete:
+            state.entries = dict(entries)
+            state.complete = True
+        else:
+            state.entries.update(entries)
+
+    # ----- invalidation ----------------------------------------------------
+
+    def invalidate(self, domain: str, *keys: str) -> None:
+        """Drop ``keys`` from ``domain``, or the whole domain when none given.
+
+        Dropping individual keys also clears the domain's ``complete`` flag:
+        a write may have created a config the cached bulk listing lacks.
+        """
+        state = self._domains.get(domain)
+        if state is None:
+            return
+        self._bump_generation(domain)
+        if not keys:
+            if state.entries or state.complete:
+                self.invalidations += 1
+            self._domains[domain] = _DomainEntries()
+            return
+        state.complete = False
+        for key in keys:
+            if state.entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def invalidate_all(self) -> None:
+        """Drop every cached body."""
+        for domain in CONFIG_DOMAINS:
+            self.invalidate(domain)
+
+    def stats(self) -> dict[str, Any]:
+        """Diagnostic counters for the cache."""
+        return {
+            "cached": {
+                domain: len(state.entries) for domain, state in self._domains.items()
+            },
+            "complete": sorted(
+                domain for domain, state in self._domains.items() if state.complete
+            ),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "subscribed": self._is_live(),
+        }
+
+
+_caches: CredentialCaches[ConfigBodyCache] = CredentialCaches(
+    ConfigBodyCache, MAX_CONFIG_CACHES
+)
+
+
+def get_config_cache(url: str, token: str) -> ConfigBodyCache:
+    """Return the config-body cache for one HA instance and credential."""
+    return _caches.get(url, token)
+
+
+def reset_config_caches() -> None:
+    """Drop every config-body cache (test seam)."""
+    _caches.clear()
@@ -0,0 +1,154 @@
+"""
+The Home Assistant error log as last read, kept so the next read only adds
+what was appended.
+
+``ha_get_logs(source="error_log")`` used to download up to
+``_ERROR_LOG_LINES`` lines and hand them over whole on every call. An
+``ErrorLogTail`` holds the lines of the last read; ``HomeAssistantClient``
+updates it in one of two ways:
+
+- Container/pip installs serve ``home-assistant.log`` as a plain file, which
+  honours HTTP ``Range``. The tail remembers how many bytes it has read and
+  asks only for the rest (see ``HomeAssistantClient.read_error_log``).
+- Supervisor-backed installs serve a capped journald window with no
+  position to resume from. The new window is lined up against the end of
+  the held lines (``ANCHOR_LINES`` of them must match): lines that scrolled
+  out of the window are dropped from the front, and only the lines after
+  the anchor are new.
+
+At most ``MAX_ERROR_LOG_LINES`` lines are held: a growing log file drops
+its oldest lines from the front, as the Supervisor window does.
+
+Lines are numbered from when the tail was (re)started, so a consumer that
+derived data from lines ``[a, b)`` can tell which of them are still held
+(from ``first``) and which are new (from ``b``). ``epoch`` changes whenever
+the held lines could not be lined up and were replaced outright, which
+invalidates every position handed out before. The one line that can
+change in place is a last line read without its newline (``terminated``
+is False): the next read may complete it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from .event_cache import CredentialCaches
+
+# Lines at the end of the held log that must reappear in a fresh window for
+# it to be treated as a continuation. Log lines start with a millisecond
+# timestamp, so three in a row do not repeat by accident.
+ANCHOR_LINES = 3
+
+# Lines held per tail. Also the journald window asked of the Supervisor, so
+# every install keeps the same amount of the log.
+MAX_ERROR_LOG_LINES = 20_000
+
+# Bound on distinct (url, token) tails, as for the registry cache.
+MAX_ERROR_LOG_TAILS = 50
+
+
+class ErrorLogTail:
+    """Lines of the error log as last read, for one HA instance and credential."""
+
+    def __init__(self, max_lines: int = MAX_ERROR_LOG_LINES) -> None:
+        """Initialize with nothing read.
+
+        Args:
+            max_lines: Bound on held lines; older ones are dropped first.
+        """
+        self._max_lines = max_lines
+        self.lines: list[str] = []
+        self.first = 0
+        self.epoch = 0
+        # Bytes of the log file read so far, when the source is a plain file.
+        self.end: int | None = None
+        self.last_byte = b""
+        self._terminated = True
+        # Serializes reads: two interleaved updates would misplace lines.
+        self.lock = asyncio.Lock()
+
+    @property
+    def until(self) -> int:
+        """Number of the line after the last one held."""
+        return self.first + len(self.lines)
+
+    @property
+    def terminated(self) -> bool:
+        """False while the last line lacks its newline and may still grow."""
+        return self._terminated
+
+    def text(self) -> str:
+        """The held lines as one string."""
+        return "\n".join(self.lines)
+
+    def line(self, number: int) -> str:
+        """One held line by number."""
+        return self.lines[number - self.first]
+
+    def replace(self, text: str, end: int | None = None) -> None:
+        """Take a freshly read log, keeping the lines it shares with the held one."""
+        new_lines = text.splitlines()
+        held = self._overlap(new_lines)
+        if held is None:
+            self.epoch += 1
+            self.first = 0
+            self.lines = new_lines
+        else:
+            dropped = len(self.lines) - held
+            self.first += dropped
+            self.lines = self.lines[dropped:] + new_lines[held:]
+        self._terminated = not text or text.endswith(("\n", "\r"))
+        self._trim()
+        self._set_end(text, end)
+
+    def append(self, text: str, end: int) -> None:
+        """Add text read past ``end`` of the previous read."""
+        if text:
+            if not self._terminated and self.lines:
+                text = self.lines.pop() + text
+            self.lines.extend(text.splitlines())
+            self._terminated = text.endswith(("\n", "\r"))
+            self._trim()
+        self._set_end(text, end)
+
+    def _trim(self) -> None:
+        """Drop the oldest lines past the bound, keeping the numbering."""
+        excess = len(self.lines) - self._max_lines
+        if excess > 0:
+            del self.lines[:excess]
+            self.first += excess
+
+    def _set_end(self, text: str, end: int | None) -> None:
+        self.end = end
+        if end is not None and text:
+            self.last_byte = text.encode()[-1:]
+
+    def _overlap(self, new_lines: list[str]) -> int | None:
+        """How many leading lines of ``new_lines`` end the held lines, if any."""
+        anchor = self.lines[-ANCHOR_LINES:]
+        if len(anchor) < ANCHOR_LINES:
+            return None
+        # Search from the end: a fresh window normally adds only a few lines.
+        for start in range(len(new_lines) - ANCHOR_LINES, -1, -1):
+            if new_lines[start : start + ANCHOR_LINES] != anchor:
+                continue
+            held = start + ANCHOR_LINES
+            if held <= len(self.lines) and new_lines[0] == self.lines[-held]:
+                return held
+            return None
+        return None
+
+
+_tails: CredentialCaches[ErrorLogTail] = CredentialCaches(
+    ErrorLogTail, MAX_ERROR_LOG_TAILS
+)
+
+
+def get_error_log_tail(url: str, token: str) -> ErrorLogTail:
+    """Return the error log tail for one HA instance and credential."""
+    return _tails.get(url, token)
+
+
+def reset_error_log_tails() -> None:
+    """Drop every error log tail (test seam)."""
+    _tails.clear()
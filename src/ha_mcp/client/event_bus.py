@@ -0,0 +1,241 @@
+"""
+Shared, refcounted event subscriptions on a pooled WebSocket connection.
+
+Home Assistant pushes every event once per ``subscribe_events``
+subscription. When each waiter (``util_helpers.wait_for_*``) and the
+background listener opened its own ``state_changed`` subscription, 20
+concurrent bulk operations meant 20 copies of every state change in the
+house arriving and being JSON-decoded. ``EventBus`` holds at most one
+subscription per event type per ``HomeAssistantWebSocketClient`` and fans
+each event out in process:
+
+- ``listen()`` takes a reference on the event type's subscription,
+  subscribing on the first reference; ``release()`` drops it and
+  unsubscribes once the last listener leaves.
+- A listener registered with an ``entity_id`` is indexed by it, so an event
+  costs O(listeners for that entity) plus the wildcard listeners, not
+  O(all listeners).
+
+The bus only uses the client's public ``add_event_handler`` /
+``subscribe_events`` / ``unsubscribe_events`` surface, so any object with
+that shape (including test doubles) can sit underneath it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .rest_client import (
+    HomeAssistantCommandTimeout,
+    HomeAssistantConnectionError,
+)
+
+logger = logging.getLogger(__name__)
+
+EventCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+def event_entity_id(event: dict[str, Any]) -> str | None:
+    """Return the entity_id an event is about, or None.
+
+    HA nests ``entity_id`` under ``event["data"]`` for both ``state_changed``
+    and ``entity_registry_updated``. The top-level fallback is defensive
+    only, so schema drift degrades to a wildcard-only dispatch rather than
+    an AttributeError.
+    """
+    data = event.get("data") or {}
+    entity_id = data.get("entity_id") or event.get("entity_id")
+    return entity_id if isinstance(entity_id, str) else None
+
+
+@dataclass(eq=False)
+class EventListener:
+    """Handle for one ``listen()`` registration; pass it to ``release()``."""
+
+    event_type: str
+    callback: EventCallback
+    entity_id: str | None = None
+
+
+@dataclass(eq=False)
+class _Subscription:
+    """One HA-side subscription and the listeners multiplexed onto it."""
+
+    subscription_id: int | None = None
+    by_entity: dict[str, set[EventListener]] = field(default_factory=dict)
+    wildcard: set[EventListener] = field(default_factory=set)
+
+    def add(self, listener: EventListener) -> None:
+        if listener.entity_id is None:
+            self.wildcard.add(listener)
+        else:
+            self.by_entity.setdefault(listener.entity_id, set()).add(listener)
+
+    def discard(self, listener: EventListener) -> bool:
+        """Remove ``listener``; True when it was registered here."""
+        if listener.entity_id is None:
+            if listener not in self.wildcard:
+                return False
+            self.wildcard.discard(listener)
+            return True
+        bucket = self.by_entity.get(listener.entity_id)
+        if bucket is None or listener not in bucket:
+            return False
+        bucket.discard(listener)
+        if not bucket:
+            del self.by_entity[listener.entity_id]
+        return True
+
+    @property
+    def empty(self) -> bool:
+        return not self.wildcard and not self.by_entity
+
+    async def dispatch(self, event: dict[str, Any]) -> None:
+        """Deliver ``event`` to the wildcard and matching entity listeners."""
+        targets = list(self.wildcard)
+        entity_id = event_entity_id(event)
+        if entity_id is not None:
+            targets.extend(self.by_entity.get(entity_id, ()))
+        for listener in targets:
+            try:
+                await listener.callback(event)
+            except Exception as e:
+                # One listener's bug must not starve the others sharing the
+                # subscription; keep the traceback so it stays visible.
+                logger.error("Error in event bus listener: %s", e, exc_info=True)
+
+
+class EventBus:
+    """Refcounted event subscriptions multiplexed over one WebSocket client."""
+
+    def __init__(self, ws_client: Any) -> None:
+        """Initialize a bus with no subscriptions.
+
+        Args:
+            ws_client: The connected WebSocket client the bus subscribes on.
+        """
+        self._ws_client = ws_client
+        self._subscriptions: dict[str, _Subscription] = {}
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    def _ensure_lock(self) -> asyncio.Lock:
+        current_loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not current_loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = current_loop
+        return self._lock
+
+    async def listen(
+        self,
+        event_type: str,
+        callback: EventCallback,
+        *,
+        entity_id: str | None = None,
+    ) -> EventListener:
+        """Register ``callback`` for ``event_type`` events.
+
+        Args:
+            event_type: HA event type to receive (e.g. ``state_changed``).
+            callback: Async callable invoked with each matching event.
+            entity_id: When set, only events about this entity are delivered.
+
+        Returns:
+            A handle to pass to :meth:`release`.
+
+        Raises:
+            Whatever ``subscribe_events`` raised when this listener had to
+            open the subscription; nothing is left registered in that case.
+        """
+        listener = EventListener(event_type, callback, entity_id)
+        async with self._ensure_lock():
+            subscription = self._subscriptions.get(event_type)
+            if subscription is not None:
+                subscription.add(listener)
+                return listener
+
+            # First listener: register the dispatcher before subscribing so
+            # an event landing between HA's result and our return is not lost.
+            subscription = _Subscription()
+            subscription.add(listener)
+            self._subscriptions[event_type] = subscription
+            self._ws_client.add_event_handler(event_type, subscription.dispatch)
+            try:
+                subscription.subscription_id = await self._ws_client.subscribe_events(
+                    event_type
+                )
+            except BaseException:
+                self._subscriptions.pop(event_type, None)
+                self._ws_client.remove_event_handler(event_type, subscription.dispatch)
+                raise
+            logger.debug(
+                "Event bus subscribed to %s (subscription %s)",
+                event_type,
+                subscription.subscription_id,
+            )
+            return listener
+
+    async def release(self, listener: EventListener) -> None:
+        """Drop ``listener``; unsubscribe when it was the last one.
+
+        Safe to call twice. Transport loss or a timeout on the HA-side
+        ``unsubscribe_events`` is logged, not raised — the subscription is
+        forgotten locally either way and dies with the connection.
+        """
+        async with self._ensure_lock():
+            subscription = self._subscriptions.get(listener.event_type)
+            if subscription is None or not subscription.discard(listener):
+                return
+            if not subscription.empty:
+                return
+            del self._subscriptions[listener.event_type]
+            self._ws_client.remove_event_handler(
+                listener.event_type, subscription.dispatch
+            )
+            sub_id = subscription.subscription_id
+            if sub_id is None:
+                return
+            try:
+                await self._ws_client.unsubscribe_events(sub_id)
+            except (HomeAssistantConnectionError, OSError, TimeoutError) as e:
+                logger.warning(
+                    "unsubscribe_events(%s) cleanup failed (subscription "
+                    "may leak until WS pool reconnects): %s",
+                    sub_id,
+                    e,
+                )
+            except HomeAssistantCommandTimeout:
+                logger.warning(
+                    "unsubscribe_events(%s) cleanup timed out on WS "
+                    "round-trip; subscription may leak until WS pool "
+                    "reconnects",
+                    sub_id,
+                )
+
+    def listener_count(self, event_type: str) -> int:
+        """Number of listeners currently sharing ``event_type``'s subscription."""
+        subscription = self._subscriptions.get(event_type)
+        if subscription is None:
+            return 0
+        return len(subscription.wildcard) + sum(
+            len(bucket) for bucket in subscription.by_entity.values()
+        )
+
+
+# One bus per client object. Weak keys: the pool replaces a dropped client
+# with a fresh object, and the old bus must go with it rather than pin it.
+_buses: weakref.WeakKeyDictionary[Any, EventBus] = weakref.WeakKeyDictionary()
+
+
+def get_event_bus(ws_client: Any) -> EventBus:
+    """Return the event bus multiplexing subscriptions on ``ws_client``."""
+    bus = _buses.get(ws_client)
+    if bus is None:
+        bus = EventBus(ws_client)
+        _buses[ws_client] = bus
+    return bus
@@ -0,0 +1,223 @@
+"""
+Shared plumbing for the event-invalidated, per-credential caches.
+
+``registry_cache`` and ``config_cache`` follow one pattern, implemented once
+here:
+
+- ``EventInvalidatedCache`` listens for a fixed set of HA bus events on the
+  pooled WebSocket's :class:`~.event_bus.EventBus` the first time it is used,
+  and only trusts what it holds while that connection stays up. A reconnect
+  drops everything.
+- Each cached key carries a generation, bumped on every invalidation. A fetch
+  records the generation it started under and its result is only stored if
+  nothing invalidated the key while it was in flight.
+- ``CredentialCaches`` keeps one cache per ``(url, token)`` in a bounded LRU.
+  An evicted cache is detached: its bus listeners are released and any event
+  still in flight for it is ignored. The plain per-credential caches
+  (history, logbook, error log tail, traces) use it too; they have nothing to
+  detach.
+
+Subclasses own the storage and the TTL check, which differ per cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from .event_bus import EventBus, EventListener
+
+logger = logging.getLogger(__name__)
+
+# Release tasks of detached caches, held so they are not garbage collected
+# mid-flight.
+_releasing: set[asyncio.Task[None]] = set()
+
+
+async def _release_listeners(bus: EventBus, listeners: list[EventListener]) -> None:
+    for listener in listeners:
+        try:
+            await bus.release(listener)
+        except Exception as e:
+            logger.debug(f"Releasing a detached cache's listener failed: {e}")
+
+
+class EventInvalidatedCache(ABC):
+    """Base for a cache whose entries are dropped by Home Assistant events.
+
+    Subclasses set :attr:`EVENTS` and implement :meth:`_handle_event` and
+    :meth:`invalidate_all`.
+    """
+
+    # HA bus events the cache listens for.
+    EVENTS: ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, keys: Iterable[str], ttl: float) -> None:
+        """Initialize an empty, unsubscribed cache.
+
+        Args:
+            keys: The keys generations are tracked for.
+            ttl: Safety-net lifetime of a cached entry in seconds.
+        """
+        self.ttl = ttl
+        # Bumped on every invalidation of a key; a fetch that started under
+        # an older generation is not stored (an event landed while it was in
+        # flight, so its result may predate the change).
+        self._generations: dict[str, int] = dict.fromkeys(keys, 0)
+        self._subscribed_client: Any = None
+        self._bus: EventBus | None = None
+        self._listeners: list[EventListener] = []
+        self._subscribe_lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+        self._detached = False
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    # ----- freshness -------------------------------------------------------
+
+    def _is_live(self) -> bool:
+        client = self._subscribed_client
+        return client is not None and client.is_connected
+
+    def _ensure_subscribe_lock(self) -> asyncio.Lock:
+        current_loop = asyncio.get_running_loop()
+        if self._subscribe_lock is None or self._lock_loop is not current_loop:
+            self._subscribe_lock = asyncio.Lock()
+            self._lock_loop = current_loop
+        return self._subscribe_lock
+
+    async def ensure_subscribed(self, ws_client: Any) -> bool:
+        """Listen for :attr:`EVENTS` on ``ws_client``'s event bus once.
+
+        Returns:
+            True when invalidation events are flowing on ``ws_client``; the
+            caller must not use the cache otherwise.
+        """
+        if self._subscribed_client is ws_client and self._is_live():
+            return True
+        async with self._ensure_subscribe_lock():
+            if self._detached:
+                return False
+            if self._subscribed_client is ws_client and self._is_live():
+                return True
+            # A new connection: nothing cached under the old one is trusted.
+            # The old bus's listeners died with its connection.
+            self.invalidate_all()
+            self._subscribed_client = None
+            self._bus = None
+            self._listeners = []
+            # Local import: ``event_bus`` imports ``rest_client``, which
+            # imports the caches built on this module.
+            from .event_bus import get_event_bus
+
+            bus = get_event_bus(ws_client)
+            listeners: list[EventListener] = []
+            try:
+                for event_type in self.EVENTS:
+                    listener = await bus.listen(event_type, self._on_event)
+                    listeners.append(listener)
+            except Exception as e:
+                logger.debug(f"{type(self).__name__} subscription failed: {e}")
+                await _release_listeners(bus, listeners)
+                return False
+            self._bus = bus
+            self._listeners = listeners
+            self._subscribed_client = ws_client
+            return True
+
+    async def _on_event(self, event: dict[str, Any]) -> None:
+        if self._detached:
+            return
+        await self._handle_event(event)
+
+    @abstractmethod
+    async def _handle_event(self, event: dict[str, Any]) -> None:
+        """Drop whatever ``event`` makes stale."""
+
+    def detach(self) -> None:
+        """Stop trusting and tracking anything; release the bus listeners.
+
+        Called when the cache is evicted. Releasing is async, so it is
+        scheduled on the running loop; without one there is no live
+        connection for the listeners to hold open.
+        """
+        self._detached = True
+        self._subscribed_client = None
+        self.invalidate_all()
+        bus, listeners = self._bus, self._listeners
+        self._bus, self._listeners = None, []
+        if bus is None or not listeners:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(_release_listeners(bus, listeners))
+        _releasing.add(task)
+        task.add_done_callback(_releasing.discard)
+
+    # ----- generations -----------------------------------------------------
+
+    def generation(self, key: str) -> int:
+        """Current invalidation generation for ``key``."""
+        return self._generations.get(key, 0)
+
+    def _bump_generation(self, key: str) -> None:
+        self._generations[key] = self.generation(key) + 1
+
+    @abstractmethod
+    def invalidate_all(self) -> None:
+        """Drop everything the cache holds."""
+
+
+class CredentialCaches[CacheT]:
+    """One cache per ``(url, token)``, least recently used evicted first.
+
+    An evicted cache's ``detach()`` is called when it has one.
+    """
+
+    def __init__(self, factory: Callable[[], CacheT], max_size: int) -> None:
+        """Initialize an empty set of caches.
+
+        Args:
+            factory: Builds the cache for a credential on first use.
+            max_size: Bound on distinct credentials, so OAuth deployments
+                with many users cannot grow this without limit.
+        """
+        self._factory = factory
+        self._max_size = max_size
+        self._caches: OrderedDict[str, CacheT] = OrderedDict()
+
+    @staticmethod
+    def _key(url: str, token: str) -> str:
+        return hashlib.sha256(f"{url.rstrip('/')}:{token}".encode()).hexdigest()
+
+    def get(self, url: str, token: str) -> CacheT:
+        """Return the cache for one HA instance and credential."""
+        key = self._key(url, token)
+        cache = self._caches.get(key)
+        if cache is None:
+            cache = self._factory()
+            self._caches[key] = cache
+            while len(self._caches) > self._max_size:
+                _, evicted = self._caches.popitem(last=False)
+                detach = getattr(evicted, "detach", None)
+                if detach is not None:
+                    detach()
+        else:
+            self._caches.move_to_end(key)
+        return cache
+
+    def __len__(self) -> int:
+        return len(self._caches)
+
+    def clear(self) -> None:
+        """Forget every cache (test seam)."""
+        self._caches.clear()
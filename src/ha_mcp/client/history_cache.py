@@ -0,0 +1,192 @@
+"""
+Cache of recorder history rows for ``ha_get_history``.
+
+``history/history_during_period`` returns the whole window on every call, and
+``ha_get_history`` pages on the client, so paging through a week of a 1 Hz
+sensor used to download the week once per page. Recorded history does not
+change once written, so this cache keeps it:
+
+- One window of rows per ``(entity_id, minimal_response,
+  significant_changes_only)``, from the first start time asked for up to
+  where history has settled (``HISTORY_SETTLE_SECONDS`` before now, leaving
+  the recorder's commit interval to land). Rows past that are never cached.
+- A request that starts inside a cached window is answered from it, and only
+  the part after the window's end (the open tail) is fetched. The tail then
+  extends the window.
+- A request that starts before a cached window, or after it ends, is fetched
+  in full and replaces it.
+- Windows are evicted least recently used first once the cache holds more
+  than ``MAX_HISTORY_CACHE_ROWS`` rows in total. A window longer than that
+  on its own keeps only its first ``MAX_HISTORY_CACHE_ROWS`` rows and ends
+  where they do: the rest of it is fetched as its tail, so paging through
+  an oversized window re-downloads only the part past the bound.
+
+Rows are HA's compressed history rows (``s``/``a``/``lu``/``lc``). A window
+starting later than a cached one gets HA's start-time row rebuilt: the state
+in force at the start, stamped with the start time.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from .event_cache import CredentialCaches
+
+# History newer than this many seconds may still be on its way to the
+# database, so it is always fetched and never cached.
+HISTORY_SETTLE_SECONDS = 60.0
+
+# Bound on cached rows across every window of one cache.
+MAX_HISTORY_CACHE_ROWS = 500_000
+
+# Bound on distinct (url, token) caches, as for the registry cache.
+MAX_HISTORY_CACHES = 50
+
+HistoryKey = tuple[str, bool, bool]
+
+
+def row_time(row: dict[str, Any]) -> float | None:
+    """The ``last_updated`` epoch of a compressed history row, if it has one."""
+    value = row.get("lu")
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+@dataclass
+class _Window:
+    start: float
+    end: float
+    rows: list[dict[str, Any]]
+
+
+class HistoryCache:
+    """Per-(url, token) cache of settled history windows."""
+
+    def __init__(self, max_rows: int = MAX_HISTORY_CACHE_ROWS) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_rows: Bound on cached rows across all windows.
+        """
+        self._max_rows = max_rows
+        self._windows: OrderedDict[HistoryKey, _Window] = OrderedDict()
+        self._row_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def covered_until(self, key: HistoryKey, start: float) -> float | None:
+        """Where the cached window holding ``start`` ends, or None on a miss."""
+        window = self._windows.get(key)
+        if window is None or not window.start <= start <= window.end:
+            self.misses += 1
+            return None
+        self._windows.move_to_end(key)
+        self.hits += 1
+        return window.end
+
+    def rows(self, key: HistoryKey, start: float, end: float) -> list[dict[str, Any]]:
+        """Cached rows for ``[start, end)``, led by the state in force at ``start``.
+
+        Only valid after :meth:`covered_until` returned a window for ``start``.
+        """
+        rows = self._windows[key].rows
+        first = bisect.bisect_left(rows, start, key=_time)
+        last = bisect.bisect_left(rows, end, key=_time)
+        selected = rows[first:last]
+        if first > 0 and (first == len(rows) or _time(rows[first]) > start):
+            selected.insert(0, _restamped(rows[first - 1], start))
+        return selected
+
+    def store(
+        self,
+        key: HistoryKey,
+        start: float,
+        settled: float,
+        rows: list[dict[str, Any]],
+    ) -> None:
+        """Cache a window fetched from ``start``, up to the ``settled`` time."""
+        if settled <= start or any(row_time(row) is None for row in rows):
+            return
+        self._drop(key)
+        kept = [row for row in rows if _time(row) < settled]
+        self._add(key, _Window(start, settled, kept))
+
+    def extend(
+        self, key: HistoryKey, settled: float, tail: list[dict[str, Any]]
+    ) -> None:
+        """Append a window's fetched tail, up to the ``settled`` time."""
+        window = self._windows.get(key)
+        if window is None or settled <= window.end:
+            return
+        if any(row_time(row) is None for row in tail):
+            return
+        self._drop(key)
+        window.rows.extend(row for row in tail if window.end <= _time(row) < settled)
+        window.end = settled
+        self._add(key, window)
+
+    def _add(self, key: HistoryKey, window: _Window) -> None:
+        if len(window.rows) > self._max_rows:
+            # Keep the prefix that fits; rows sharing the first dropped row's
+            # time go too, so the window ends cleanly before it.
+            end = _time(window.rows[self._max_rows])
+            if end <= window.start:
+                return
+            window.rows = [
+                row for row in window.rows[: self._max_rows] if _time(row) < end
+            ]
+            window.end = end
+        self._windows[key] = window
+        self._row_count += len(window.rows)
+        while self._row_count > self._max_rows:
+            _, evicted = self._windows.popitem(last=False)
+            self._row_count -= len(evicted.rows)
+
+    def _drop(self, key: HistoryKey) -> None:
+        window = self._windows.pop(key, None)
+        if window is not None:
+            self._row_count -= len(window.rows)
+
+    def clear(self) -> None:
+        """Drop every cached window."""
+        self._windows.clear()
+        self._row_count = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Diagnostic counters for the cache."""
+        return {
+            "windows": len(self._windows),
+            "rows": self._row_count,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def _time(row: dict[str, Any]) -> float:
+    return row_time(row) or 0.0
+
+
+def _restamped(row: dict[str, Any], when: float) -> dict[str, Any]:
+    """``row`` as HA reports the state in force at a window's start."""
+    restamped = {key: value for key, value in row.items() if key != "lc"}
+    restamped["lu"] = when
+    return restamped
+
+
+_caches: CredentialCaches[HistoryCache] = CredentialCaches(
+    HistoryCache, MAX_HISTORY_CACHES
+)
+
+
+def get_history_cache(url: str, token: str) -> HistoryCache:
+    """Return the history cache for one HA instance and credential."""
+    return _caches.get(url, token)
+
+
+def reset_history_caches() -> None:
+    """Drop every history cache (test seam)."""
+    _caches.clear()
@@ -0,0 +1,103 @@
+"""
+Cache of logbook slices for ``ha_get_logs(source="logbook")``.
+
+``/api/logbook`` returns every entry of the requested time range, and the
+logbook tool pages through it on the client. A range that ended in the past
+(by more than ``LOGBOOK_SETTLE_SECONDS``, leaving the recorder's commit
+interval to land) no longer changes, so its entries are kept here:
+
+- One entry per fetched ``(entity filter, start, end)`` range. Repeating a
+  query over a closed range (the next ``offset`` page, or the same cursor
+  page again) is answered without a request.
+- Ranges reaching into the last ``LOGBOOK_SETTLE_SECONDS`` are never cached.
+- Ranges are evicted least recently used first once the cache holds more
+  than ``MAX_LOGBOOK_CACHE_ENTRIES`` logbook entries in total.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+from .event_cache import CredentialCaches
+
+# Logbook entries newer than this many seconds may still be on their way to
+# the database, so ranges reaching past it are never cached.
+LOGBOOK_SETTLE_SECONDS = 60.0
+
+# Bound on cached logbook entries across every range of one cache.
+MAX_LOGBOOK_CACHE_ENTRIES = 100_000
+
+# Bound on distinct (url, token) caches, as for the registry cache.
+MAX_LOGBOOK_CACHES = 50
+
+LogbookKey = tuple[str | None, float, float]
+
+
+class LogbookCache:
+    """Per-(url, token) cache of logbook entries for closed time ranges."""
+
+    def __init__(self, max_entries: int = MAX_LOGBOOK_CACHE_ENTRIES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Bound on cached logbook entries across all ranges.
+        """
+        self._max_entries = max_entries
+        self._ranges: OrderedDict[LogbookKey, list[dict[str, Any]]] = OrderedDict()
+        self._entry_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: LogbookKey) -> list[dict[str, Any]] | None:
+        """The cached entries of one range, or None on a miss."""
+        entries = self._ranges.get(key)
+        if entries is None:
+            self.misses += 1
+            return None
+        self._ranges.move_to_end(key)
+        self.hits += 1
+        return entries
+
+    def store(self, key: LogbookKey, entries: list[dict[str, Any]], now: float) -> None:
+        """Cache the entries of a range, if it ended before it could change."""
+        _entity_id, _start, end = key
+        if end > now - LOGBOOK_SETTLE_SECONDS or len(entries) > self._max_entries:
+            return
+        previous = self._ranges.pop(key, None)
+        if previous is not None:
+            self._entry_count -= len(previous)
+        self._ranges[key] = entries
+        self._entry_count += len(entries)
+        while self._entry_count > self._max_entries:
+            _, evicted = self._ranges.popitem(last=False)
+            self._entry_count -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop every cached range."""
+        self._ranges.clear()
+        self._entry_count = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Diagnostic counters for the cache."""
+        return {
+            "ranges": len(self._ranges),
+            "entries": self._entry_count,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_caches: CredentialCaches[LogbookCache] = CredentialCaches(
+    LogbookCache, MAX_LOGBOOK_CACHES
+)
+
+
+def get_logbook_cache(url: str, token: str) -> LogbookCache:
+    """Return the logbook cache for one HA instance and credential."""
+    return _caches.get(url, token)
+
+
+def reset_logbook_caches() -> None:
+    """Drop every logbook cache (test seam)."""
+    _caches.clear()
@@ -0,0 +1,260 @@
+"""
+Event-invalidated cache for Home Assistant's registry list commands.
+
+``config/entity_registry/list``, ``config/device_registry/list`` and friends
+are re-read by almost every search, overview and visibility path — often
+several times within one ``ha_search``. ``HomeAssistantClient.
+send_websocket_message`` consults this cache for those reads so a registry is
+downloaded once and then served from memory until it actually changes.
+
+Invalidation is precise rather than time-based:
+
+- On first use the cache listens for the ``*_registry_updated`` events on the
+  pooled WebSocket's shared event bus, and each event drops the registry it
+  names.
+- Writes made through our own client (registry update/remove/create commands,
+  and REST writes under ``/config/``) invalidate synchronously, so a read
+  right after our own write never sees the pre-write list — even if HA's event
+  for it has not arrived yet.
+- A TTL bounds the damage of anything the two rules above miss.
+
+A cached entry is only trusted while the WebSocket its subscription lives on
+is still connected; after a reconnect the cache starts over. The subscription
+and generation bookkeeping lives in ``event_cache``.
+
+Lookups derived from a list (``by_id``, ``entity_devices``, ``device_areas``)
+hang off the cached entry: they are built on first use and dropped with it, so
+an event only costs the next reader one rebuild, never an eager one.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .event_cache import CredentialCaches, EventInvalidatedCache
+
+# Safety-net lifetime of a cached registry list. Event invalidation is the
+# primary mechanism; this only caps how long a missed event can go unnoticed.
+REGISTRY_CACHE_TTL_SECONDS = 300.0
+
+# Bound on distinct (url, token) caches, mirroring the WebSocket pool bound
+# so OAuth deployments with many users cannot grow this without limit.
+MAX_REGISTRY_CACHES = 50
+
+# Cacheable list command -> the key each entry is identified by.
+REGISTRY_LIST_COMMANDS: dict[str, str] = {
+    "config/entity_registry/list": "entity_id",
+    "config/device_registry/list": "id",
+    "config/area_registry/list": "area_id",
+    "config/floor_registry/list": "floor_id",
+    "config/label_registry/list": "label_id",
+}
+
+# HA bus event -> list commands it invalidates. Floors are embedded in area
+# entries (``floor_id``), so a floor change drops the area list too.
+REGISTRY_EVENTS: dict[str, tuple[str, ...]] = {
+    "entity_registry_updated": ("config/entity_registry/list",),
+    "device_registry_updated": ("config/device_registry/list",),
+    "area_registry_updated": ("config/area_registry/list",),
+    "floor_registry_updated": (
+        "config/floor_registry/list",
+        "config/area_registry/list",
+    ),
+    "label_registry_updated": ("config/label_registry/list",),
+}
+
+# Registry-scoped read commands that never change anything.
+_READ_ONLY_SUFFIXES = ("/list", "/get", "/list_for_display", "/get_entries")
+
+
+def is_cacheable_read(message: dict[str, Any]) -> bool:
+    """True for a bare registry list command (no filter parameters)."""
+    return message.get("type") in REGISTRY_LIST_COMMANDS and len(message) == 1
+
+
+def invalidated_by_command(command_type: str) -> tuple[str, ...]:
+    """List commands a WebSocket write command makes stale.
+
+    A write to one registry invalidates that registry. Writes that remove
+    devices or entities as a side effect (config entries, device removal)
+    invalidate both the device and entity lists.
+    """
+    if not command_type.startswith("config"):
+        return ()
+    if command_type.endswith(_READ_ONLY_SUFFIXES):
+        return ()
+    for list_command in REGISTRY_LIST_COMMANDS:
+        prefix = list_command.rsplit("/", 1)[0] + "/"
+        if command_type.startswith(prefix):
+            if list_command == "config/device_registry/list":
+                return (list_command, "config/entity_registry/list")
+            if list_command == "config/floor_registry/list":
+                return (list_command, "config/area_registry/list")
+            return (list_command,)
+    if command_type.startswith("config_entries/"):
+        return ("config/device_registry/list", "config/entity_registry/list")
+    return ()
+
+
+def _copy_result(result: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return a caller-owned list of shallow-copied entries."""
+    return [dict(entry) for entry in result]
+
+
+@dataclass
+class _CachedRegistry:
+    result: list[dict[str, Any]]
+    fetched_at: float
+    # Lookups built from ``result``, by name; valid for this generation only.
+    derived: dict[str, Any] = field(default_factory=dict)
+
+
+class RegistryCache(EventInvalidatedCache):
+    """Per-(url, token) cache of registry lists plus their derived indexes."""
+
+    EVENTS = tuple(REGISTRY_EVENTS)
+
+    def __init__(self, ttl: float = REGISTRY_CACHE_TTL_SECONDS) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Safety-net lifetime of a cached list in seconds.
+        """
+        super().__init__(REGISTRY_LIST_COMMANDS, ttl)
+        self._entries: dict[str, _CachedRegistry] = {}
+
+    async def _handle_event(self, event: dict[str, Any]) -> None:
+        commands = REGISTRY_EVENTS.get(event.get("event_type", ""), ())
+        self.invalidate(*commands)
+
+    # ----- reads -----------------------------------------------------------
+
+    def get(self, command_type: str) -> list[dict[str, Any]] | None:
+        """Return a caller-owned copy of a cached list, or None on a miss."""
+        entry = self._fresh_entry(command_type)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return _copy_result(entry.result)
+
+    def _fresh_entry(self, command_type: str) -> _CachedRegistry | None:
+        entry = self._entries.get(command_type)
+        if entry is None or not self._is_live():
+            return None
+        if time.monotonic() - entry.fetched_at > self.ttl:
+            self.invalidate(command_type)
+            return None
+        return entry
+
+    def store(
+        self, command_type: str, response: dict[str, Any], generation: int
+    ) -> None:
+        """Cache a successful list response fetched under ``generation``."""
+        if generation != self.generation(command_type) or not self._is_live():
+            return
+        if not isinstance(response, dict):
+            return
+        result = response.get("result")
+        if not (
+            response.get("success")
+            and isinstance(result, list)
+            and all(isinstance(item, dict) for item in result)
+        ):
+            return
+        self._entries[command_type] = _CachedRegistry(
+            result=_copy_result(result), fetched_at=time.monotonic()
+        )
+
+    # ----- derived indexes -------------------------------------------------
+
+    def by_id(self, command_type: str) -> dict[str, dict[str, Any]] | None:
+        """Entries of a cached list keyed by their id field (read-only view).
+
+        ``None`` when the list is not cached.
+        """
+        key = REGISTRY_LIST_COMMANDS[command_type]
+        return self._derive(
+            command_type,
+            "by_id",
+            lambda rows: {row[key]: row for row in rows if row.get(key) is not None},
+        )
+
+    def entity_devices(self) -> dict[str, str] | None:
+        """entity_id -> device_id from the cached entity registry."""
+        return self._derive(
+            "config/entity_registry/list",
+            "entity_devices",
+            lambda rows: {
+                row["entity_id"]: row["device_id"]
+                for row in rows
+                if row.get("entity_id") and row.get("device_id")
+            },
+        )
+
+    def device_areas(self) -> dict[str, str] | None:
+        """device_id -> area_id from the cached device registry."""
+        return self._derive(
+            "config/device_registry/list",
+            "device_areas",
+            lambda rows: {
+                row["id"]: row["area_id"]
+                for row in rows
+                if row.get("id") and row.get("area_id")
+            },
+        )
+
+    def _derive[IndexT](
+        self,
+        command_type: str,
+        name: str,
+        build: Callable[[list[dict[str, Any]]], IndexT],
+    ) -> IndexT | None:
+        entry = self._fresh_entry(command_type)
+        if entry is None:
+            return None
+        if name not in entry.derived:
+            entry.derived[name] = build(entry.result)
+        index: IndexT = entry.derived[name]
+        return index
+
+    # ----- invalidation ----------------------------------------------------
+
+    def invalidate(self, *command_types: str) -> None:
+        """Drop the given lists."""
+        for command_type in command_types:
+            self._bump_generation(command_type)
+            if self._entries.pop(command_type, None) is not None:
+                self.invalidations += 1
+
+    def invalidate_all(self) -> None:
+        """Drop every cached list."""
+        self.invalidate(*REGISTRY_LIST_COMMANDS)
+
+    def stats(self) -> dict[str, Any]:
+        """Diagnostic counters for the cache."""
+        return {
+            "cached": sorted(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "subscribed": self._is_live(),
+        }
+
+
+_caches: CredentialCaches[RegistryCache] = CredentialCaches(
+    RegistryCache, MAX_REGISTRY_CACHES
+)
+
+
+def get_registry_cache(url: str, token: str) -> RegistryCache:
+    """Return the registry cache for one HA instance and credential."""
+    return _caches.get(url, token)
+
+
+def reset_registry_caches() -> None:
+    """Drop every registry cache (test seam)."""
+    _caches.clear()
@@ -16,7 +16,28 @@ import httpx
 from .._vendor.websockets.exceptions import WebSocketException
 from .._version import get_supervisor_base_url, is_running_in_addon
 from ..config import get_global_settings
+from ..telemetry import ha_round_trip
+from ..utils import json_codec
+from .config_cache import ConfigBodyCache, get_config_cache
+from .error_log_tail import MAX_ERROR_LOG_LINES, ErrorLogTail, get_error_log_tail
+from .event_cache import EventInvalidatedCache
+from .history_cache import HistoryCache, get_history_cache
+from .logbook_cache import LogbookCache, get_logbook_cache
+from .registry_cache import (
+    RegistryCache,
+    get_registry_cache,
+    invalidated_by_command,
+    is_cacheable_read,
+)
+from .single_flight import SingleFlight, is_idempotent_ws_read
+from .state_mirror import StateMirror, get_state_mirror
+from .statistics_cache import (
+    StatisticsCache,
+    get_statistics_cache,
+    invalidated_statistic_ids,
+)
 from .supervisor_client import make_supervisor_httpx_client
+from .trace_cache import TraceCache, get_trace_cache
 
 
 def _is_ssl_error(exc: BaseException) -> bool:
@@ -55,7 +76,7 @@ _MAX_REQUEST_ATTEMPTS = 3
 # Journald window requested for the Core error log on Supervisor-backed
 # installs. Both such branches of get_error_log() build their request from this
 # constant, so the window they ask for cannot drift apart.
-_ERROR_LOG_LINES = 20000
+_ERROR_LOG_LINES = MAX_ERROR_LOG_LINES
 
 
 class HomeAssistantError(Exception):
@@ -213,6 +234,23 @@ _NO_ANSWER_ERRORS = (
 )
 
 
+def _encode_json_body(kwargs: dict[str, Any]) -> None:
+    """Swap an httpx ``json=`` argument for pre-encoded ``content=``.
+
+    httpx would run the stdlib encoder; this goes through ``json_codec``.
+    """
+    if "json" not in kwargs:
+        return
+    payload = kwargs.pop("json")
+    if payload is None:
+        return
+    kwargs["content"] = json_codec.dumps_bytes(payload)
+    kwargs["headers"] = {
+        "Content-Type": "application/json",
+        **(kwargs.get("headers") or {}),
+    }
+
+
 class HomeAssistantClient:
     """Authenticated HTTP client for Home Assistant API."""
 
@@ -222,6 +260,7 @@ class HomeAssistantClient:
         token: str | None = None,
         timeout: int | None = None,
         verify_ssl: bool | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """
         Initialize Home Assistant client.
@@ -233,6 +272,9 @@ class HomeAssistantClient:
             verify_ssl: Whether to verify the HA server's TLS certificate
                 (defaults to ``settings.verify_ssl``). Pass False to allow
                 self-signed certs or hostname mismatches.
+            transport: httpx transport to send through instead of a private
+                connection pool (the OAuth client pool shares one across
+                users). TLS verification is then the transport's concern.
         """
         if base_url is None or token is None or verify_ssl is None:
             settings = get_global_settings()
@@ -265,6 +307,7 @@ class HomeAssistantClient:
             },
             timeout=httpx.Timeout(self.timeout),
             verify=self.verify_ssl,
+            transport=transport,
         )
 
         # Lazy-populated by ``_is_supervised_install``. ``None`` means
@@ -274,6 +317,12 @@ class HomeAssistantClient:
         # disable the supervised branch — subsequent calls re-probe.
         self._supervised_detected: bool | None = None
 
+        # Identical reads in flight together share one request. Bumped before
+        # and after each of our writes and part of every read's key, so a
+        # read never joins one that may predate a write it follows.
+        self._reads = SingleFlight()
+        self._write_epoch = 0
+
         logger.info(f"Initialized Home Assistant client for {self.base_url}")
 
     async def __aenter__(self) -> "HomeAssistantClient":
@@ -308,6 +357,7 @@ class HomeAssistantClient:
             message = response.reason_phrase or "<empty body>"
         return message, error_data
 
+    @ha_round_trip
     async def _raw_request(
         self, method: str, endpoint: str, **kwargs: Any
     ) -> httpx.Response:
@@ -325,11 +375,26 @@ class HomeAssistantClient:
                 response_data set from JSON body when possible).
             HomeAssistantConnectionError: Network, timeout, or transport error.
         """
+        _encode_json_body(kwargs)
         backoff = 0.5
         for attempt in range(1, _MAX_REQUEST_ATTEMPTS + 1):
             try:
                 response = await self.httpx_client.request(method, endpoint, **kwargs)
 
+                if method.upper() not in _SAFE_METHODS and endpoint.lstrip(
+                    "/"
+                ).startswith("config/"):
+                    # A config write (automation/script/scene upsert, config
+                    # entry removal) can add or drop registry entries.
+                    # Invalidate whatever the status: an error reply may
+                    # still follow a partially applied write.
+                    self._invalidate_registries(
+                        (
+                            "config/entity_registry/list",
+                            "config/device_registry/list",
+                        )
+                    )
+
                 if response.status_code == 401:
                     raise HomeAssistantAuthError("Invalid authentication token")
 
@@ -395,11 +460,37 @@ class HomeAssistantClient:
             HomeAssistantAuthError: Authentication failed
             HomeAssistantAPIError: API error
         """
+        if method.upper() not in _SAFE_METHODS:
+            self._write_epoch += 1
+            try:
+                return await self._fetch_json(method, endpoint, **kwargs)
+            finally:
+                self._write_epoch += 1
+                if endpoint.lstrip("/").startswith("services/recorder/"):
+                    # import_statistics and friends: no statistic ids to go by.
+                    self.statistics_cache.invalidate_all()
+        if set(kwargs) - {"params"}:
+            return await self._fetch_json(method, endpoint, **kwargs)
+        params = kwargs.get("params")
+        key = (
+            self._write_epoch,
+            method.upper(),
+            endpoint,
+            json_codec.dumps(params, sort_keys=True) if params else None,
+        )
+        result: dict[str, Any] = await self._reads.do(
+            key, lambda: self._fetch_json(method, endpoint, **kwargs)
+        )
+        return result
+
+    async def _fetch_json(
+        self, method: str, endpoint: str, **kwargs: Any
+    ) -> dict[str, Any]:
         response = await self._raw_request(method, endpoint, **kwargs)
         try:
-            result: dict[str, Any] = response.json()
+            result: dict[str, Any] = json_codec.loads(response.content)
             return result
-        except json.JSONDecodeError:
+        except json_codec.JSONDecodeError:
             # Some endpoints return empty responses
             return {}
 
@@ -408,8 +499,30 @@ class HomeAssistantClient:
         logger.debug("Fetching Home Assistant configuration")
         return await self._request("GET", "/config")
 
+    def _fresh_state_mirror(self) -> StateMirror | None:
+        """Return the state mirror when it may answer this client's reads.
+
+        ``None`` when the mirror is disabled, reflects other credentials, or
+        is stale. A stale mirror is asked to reseed in the background so a
+        later read can be served from memory; this read goes to REST.
+        """
+        mirror = get_state_mirror()
+        if mirror is None or not mirror.serves(self.base_url, self.token):
+            return None
+        if not mirror.is_fresh:
+            mirror.request_sync()
+            return None
+        return mirror
+
     async def get_states(self) -> list[dict[str, Any]]:
-        """Get all entity states."""
+        """Get all entity states.
+
+        Served from the in-memory state mirror when it is enabled and fresh.
+        """
+        mirror = self._fresh_state_mirror()
+        if mirror is not None:
+            logger.debug("Serving all entity states from the state mirror")
+            return mirror.get_states()
         logger.debug("Fetching all entity states")
         result = await self._request("GET", "/states")
         if isinstance(result, list):
@@ -421,12 +534,22 @@ class HomeAssistantClient:
         """
         Get specific entity state.
 
+        Served from the in-memory state mirror when it is enabled, fresh and
+        holds the entity. A mirror miss still goes to REST: an entity created
+        a moment ago may not have reached the mirror yet, and HA's 404 is the
+        authoritative "does not exist".
+
         Args:
             entity_id: Entity ID (e.g., 'light.living_room')
 
         Returns:
             Entity state data
         """
+        mirror = self._fresh_state_mirror()
+        if mirror is not None:
+            state = mirror.get_state(entity_id)
+            if state is not None:
+                return state
         logger.debug(f"Fetching state for entity: {entity_id}")
         return await self._request("GET", f"/states/{entity_id}")
 
@@ -627,6 +750,68 @@ class HomeAssistantClient:
         )
         return raw_response.text
 
+    @property
+    def error_log_tail(self) -> ErrorLogTail:
+        """The error log as last read by any client with these credentials."""
+        return get_error_log_tail(self.base_url, self.token)
+
+    async def read_error_log(self) -> ErrorLogTail:
+        """Bring :attr:`error_log_tail` up to date and return it.
+
+        Takes the same three routes as :meth:`get_error_log`. Only the plain
+        ``/api/error_log`` file can be read from a position: once read, the
+        log is fetched from its last byte onwards (that byte is asked for
+        again and compared, to notice a rotated file). The Supervisor routes
+        return their whole window, which the tail lines up against what it
+        holds.
+        """
+        tail = self.error_log_tail
+        async with tail.lock:
+            if is_running_in_addon() or await self._is_supervised_install():
+                tail.replace(await self.get_error_log())
+                return tail
+            if tail.end and await self._read_error_log_appended(tail):
+                return tail
+            logger.debug("Fetching error log via HA Core proxy (Container/pip)")
+            response = await self._raw_request(
+                "GET", "/error_log", headers={"Accept": "text/plain"}
+            )
+            # A compressed body says nothing about positions in the file.
+            tracked = "content-encoding" not in response.headers
+            tail.replace(response.text, len(response.content) if tracked else None)
+            return tail
+
+    async def _read_error_log_appended(self, tail: ErrorLogTail) -> bool:
+        """Append what was written to the log file since the tail's last read.
+
+        Returns False when the file cannot be continued (rotated, truncated,
+        or served without range support), for the caller to read it whole.
+        """
+        assert tail.end is not None
+        offset = tail.end - 1
+        try:
+            response = await self._raw_request(
+                "GET",
+                "/error_log",
+                headers={"Accept": "text/plain", "Range": f"bytes={offset}-"},
+            )
+        except HomeAssistantAPIError as e:
+            if e.status_code == 416:  # The file shrank: it was rotated.
+                return False
+            raise
+        if (
+            response.status_code != 206
+            or "content-encoding" in response.headers
+            or response.content[:1] != tail.last_byte
+        ):
+            return False
+        logger.debug(f"Read {len(response.content) - 1} new error log bytes")
+        tail.append(
+            response.content[1:].decode("utf-8", errors="replace"),
+            offset + len(response.content),
+        )
+        return True
+
     async def _is_supervised_install(self) -> bool:
         """Detect whether the target HA is a Supervised / HAOS install.
 
@@ -1101,6 +1286,9 @@ class HomeAssistantClient:
                     f"Invalid automation configuration: {str(e)}", status_code=400
                 ) from e
             raise
+        finally:
+            # Whatever the outcome: a failed reply may follow an applied write.
+            self._invalidate_config_bodies("automation", unique_id)
 
     # Upper-bound budget for the WS-driven discovery wait (and its REST
     # fallback). Preserves the 6s ceiling PR #1384 tuned for the legacy
@@ -1201,6 +1389,8 @@ class HomeAssistantClient:
                     status_code=404,
                 ) from e
             raise
+        finally:
+            self._invalidate_config_bodies("automation", unique_id)
 
     async def start_config_flow(
         self, handler: str, context: dict[str, Any] | None = None
@@ -1543,10 +1733,26 @@ class HomeAssistantClient:
                 if message.get("type") == "render_template":
                     return await self._handle_render_template(ws_client, message)
 
+                # Registry list reads are served from the event-invalidated
+                # registry cache when it can vouch for the connection.
+                if is_cacheable_read(message):
+                    return await self._cached_registry_read(ws_client, message["type"])
+
+                if is_idempotent_ws_read(message):
+                    return await self._shared_ws_read(ws_client, message)
+
                 # Extract command type and parameters for other commands
                 message_copy = message.copy()
                 command_type = message_copy.pop("type")
-                result = await ws_client.send_command(command_type, **message_copy)
+                self._write_epoch += 1
+                try:
+                    result = await ws_client.send_command(command_type, **message_copy)
+                finally:
+                    self._write_epoch += 1
+                    # Invalidate even when the write failed mid-flight: an
+                    # ambiguous failure may still have been applied by HA.
+                    self._invalidate_registries(invalidated_by_command(command_type))
+                    self._invalidate_statistics(message)
 
                 return result
 
@@ -1636,6 +1842,143 @@ class HomeAssistantClient:
         # contextless failure envelope that would read as a soft error.
         raise AssertionError("send_websocket_message loop exited without a result")
 
+    @property
+    def registry_cache(self) -> RegistryCache:
+        """The registry cache shared by every client with these credentials."""
+        return get_registry_cache(self.base_url, self.token)
+
+    def _invalidate_registries(self, commands: tuple[str, ...]) -> None:
+        """Synchronously drop registry lists a write of ours made stale."""
+        if commands:
+            self.registry_cache.invalidate(*commands)
+
+    async def _cached_registry_read(
+        self, ws_client: Any, command_type: str
+    ) -> dict[str, Any]:
+        """Serve a registry list from the cache, fetching it on a miss.
+
+        Only a real pooled client can carry the invalidation subscription;
+        anything else (a test double, a bridge) reads straight through.
+        """
+        from .websocket_client import HomeAssistantWebSocketClient
+
+        message = {"type": command_type}
+        cache = self.registry_cache
+        if not isinstance(ws_client, HomeAssistantWebSocketClient) or not (
+            await cache.ensure_subscribed(ws_client)
+        ):
+            return await self._shared_ws_read(ws_client, message)
+
+        cached = cache.get(command_type)
+        if cached is not None:
+            return {"success": True, "result": cached}
+
+        # The generation is part of the key: a read that starts after an
+        # invalidation must not share a fetch that began before it.
+        generation = cache.generation(command_type)
+        result = await self._shared_ws_read(ws_client, message, generation)
+        cache.store(command_type, result, generation)
+        return result
+
+    async def _shared_ws_read(
+        self, ws_client: Any, message: dict[str, Any], *key_extra: Any
+    ) -> dict[str, Any]:
+        """Send a read-only command, sharing it with identical ones in flight."""
+        params = dict(message)
+        command_type = params.pop("type")
+        key = (
+            self._write_epoch,
+            "ws",
+            id(ws_client),
+            json_codec.dumps(message, sort_keys=True),
+            *key_extra,
+        )
+        result: dict[str, Any] = await self._reads.do(
+            key, lambda: ws_client.send_command(command_type, **params)
+        )
+        return result
+
+    @property
+    def history_cache(self) -> HistoryCache:
+        """The recorder history cache shared by every client with these credentials."""
+        return get_history_cache(self.base_url, self.token)
+
+    @property
+    def logbook_cache(self) -> LogbookCache:
+        """The closed-range logbook cache shared by every client with these credentials."""
+        return get_logbook_cache(self.base_url, self.token)
+
+    @property
+    def trace_cache(self) -> TraceCache:
+        """The finished-trace cache shared by every client with these credentials."""
+        return get_trace_cache(self.base_url, self.token)
+
+    @property
+    def config_cache(self) -> ConfigBodyCache:
+        """The config-body cache shared by every client with these credentials."""
+        return get_config_cache(self.base_url, self.token)
+
+    async def live_config_cache(self) -> ConfigBodyCache | None:
+        """The config-body cache, or None when it cannot track invalidations.
+
+        Subscribes the cache to the reload events on this client's pooled
+        WebSocket on first use. Without a connected WebSocket nothing would
+        tell the cache about edits made outside this process, so callers
+        fetch straight through instead.
+        """
+        return await self._live_cache(self.config_cache)
+
+    @property
+    def statistics_cache(self) -> StatisticsCache:
+        """The statistics cache shared by every client with these credentials."""
+        return get_statistics_cache(self.base_url, self.token)
+
+    async def live_statistics_cache(self) -> StatisticsCache | None:
+        """The statistics cache, or None when it cannot track invalidations.
+
+        As :meth:`live_config_cache`: a reconnect may mean HA restarted and
+        is backfilling statistics, which only the subscription notices.
+        """
+        return await self._live_cache(self.statistics_cache)
+
+    async def _live_cache[CacheT: EventInvalidatedCache](
+        self, cache: CacheT
+    ) -> CacheT | None:
+        """``cache`` once subscribed on this client's pooled WebSocket, else None."""
+        from .websocket_client import (
+            HomeAssistantWebSocketClient,
+            get_websocket_client,
+        )
+
+        try:
+            ws_client = await get_websocket_client(
+                url=self.base_url,
+                token=self.token,
+                verify_ssl=self.verify_ssl,
+            )
+        except Exception as e:
+            logger.debug(f"{type(cache).__name__} unavailable (no WebSocket): {e}")
+            return None
+        if not isinstance(ws_client, HomeAssistantWebSocketClient):
+            return None
+        if not await cache.ensure_subscribed(ws_client):
+            return None
+        return cache
+
+    def _invalidate_statistics(self, message: dict[str, Any]) -> None:
+        """Synchronously drop statistics a recorder write of ours may change."""
+        statistic_ids = invalidated_statistic_ids(message)
+        if statistic_ids is None:
+            return
+        if statistic_ids:
+            self.statistics_cache.invalidate(*statistic_ids)
+        else:
+            self.statistics_cache.invalidate_all()
+
+    def _invalidate_config_bodies(self, domain: str, *keys: str | None) -> None:
+        """Synchronously drop cached config bodies a write of ours made stale."""
+        self.config_cache.invalidate(domain, *(key for key in keys if key))
+
     async def _handle_render_template(
         self, ws_client: Any, message: dict[str, Any]
     ) -> dict[str, Any]:
@@ -1807,6 +2150,11 @@ class HomeAssistantClient:
         except Exception as e:
             logger.error(f"Failed to upsert script config for {script_id}: {e}")
             raise
+        finally:
+            # Deep search keys scripts by storage id or entity slug; drop both.
+            self._invalidate_config_bodies(
+                "script", write_id, script_id.removeprefix("script.")
+            )
 
     async def delete_script_config(self, script_id: str) -> dict[str, Any]:
         """Delete Home Assistant script configuration."""
@@ -1843,6 +2191,10 @@ class HomeAssistantClient:
                     status_code=405,
                 ) from e
             raise
+        finally:
+            self._invalidate_config_bodies(
+                "script", resolved_id, script_id.removeprefix("script.")
+            )
 
     async def _resolve_scene(self, identifier: str) -> SceneResolution:
         """Resolve a scene identifier to its storage key AND registry metadata.
@@ -2070,6 +2422,11 @@ class HomeAssistantClient:
         except Exception as e:
             logger.error(f"Failed to upsert scene config for {scene_id}: {e}")
             raise
+        finally:
+            # Deep search also aliases scenes under their entity slug.
+            self._invalidate_config_bodies(
+                "scene", write_id, scene_id.removeprefix("scene.")
+            )
 
     async def delete_scene_config(
         self,
@@ -2119,3 +2476,7 @@ class HomeAssistantClient:
                     status_code=405,
                 ) from e
             raise
+        finally:
+            self._invalidate_config_bodies(
+                "scene", resolved_id, scene_id.removeprefix("scene.")
+            )
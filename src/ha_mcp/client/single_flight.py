@@ -0,0 +1,133 @@
+"""
+Coalescing of identical Home Assistant reads that are in flight together.
+
+An agent that runs ``ha_search``, ``ha_get_overview`` and ``ha_get_state`` in
+parallel makes each of them read ``/api/states``, the registries and
+``/api/services`` on its own. ``HomeAssistantClient`` routes idempotent reads
+through a :class:`SingleFlight`: the first caller for a key starts the
+request, and callers asking for the same key before it finishes await that
+request instead of sending their own.
+
+- Only the upstream request is shared, never a decoded object. When a flight
+  had more than one caller, each caller (the first included) gets its own
+  copy of the result, so nobody can mutate another's data. A flight nobody
+  joined hands its result over uncopied.
+- The request runs in its own task. A caller that is cancelled or times out
+  stops waiting; the others still get the answer.
+- Keys are built by the client and include its write epoch, so a read issued
+  after one of our own writes never joins a flight that started before it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+# WebSocket commands that only read. Registry ``get``/``list`` commands are
+# recognised by suffix (see ``is_idempotent_ws_read``).
+IDEMPOTENT_WS_READS = frozenset(
+    {
+        "get_states",
+        "get_services",
+        "get_config",
+        "config_entries/get",
+        "lovelace/config",
+        "lovelace/resources",
+        "lovelace/dashboards/list",
+        "zone/list",
+        "person/list",
+        "homeassistant/expose_entity/list",
+        "repairs/list_issues",
+        "system_log/list",
+        "trace/list",
+        "energy/get_prefs",
+        "frontend/get_themes",
+    }
+)
+
+_REGISTRY_READ_SUFFIXES = ("/list", "/get", "/get_entries", "/list_for_display")
+
+
+def is_idempotent_ws_read(message: dict[str, Any]) -> bool:
+    """True when ``message`` is a WebSocket command that changes nothing."""
+    command_type = message.get("type")
+    if not isinstance(command_type, str):
+        return False
+    if command_type in IDEMPOTENT_WS_READS:
+        return True
+    return command_type.startswith("config/") and command_type.endswith(
+        _REGISTRY_READ_SUFFIXES
+    )
+
+
+def copy_json(value: Any) -> Any:
+    """Return a caller-owned copy of a decoded JSON value.
+
+    Only containers are copied; strings and numbers are immutable already.
+    """
+    if isinstance(value, dict):
+        return {key: copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_json(item) for item in value]
+    return value
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Task[Any]
+    shared: bool = False
+
+
+class SingleFlight:
+    """At most one in-flight request per key."""
+
+    def __init__(self) -> None:
+        """Initialize with nothing in flight."""
+        self._flights: dict[Hashable, _Flight] = {}
+        self.started = 0
+        self.joined = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        copy: Callable[[Any], Any] = copy_json,
+    ) -> Any:
+        """Return ``fetch()``'s result, sharing the request with other callers.
+
+        Args:
+            key: Identifies the request; equal keys share one request.
+            fetch: Issues the request. Only the first caller's is called.
+            copy: Makes a caller-owned copy of a shared result.
+
+        Raises:
+            Whatever ``fetch`` raised, to every caller that awaited it.
+        """
+        flight = self._flights.get(key)
+        loop = asyncio.get_running_loop()
+        if flight is None or flight.task.get_loop() is not loop:
+            flight = _Flight(loop.create_task(_run(fetch)))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _task: self._forget(key, flight))
+            self.started += 1
+        else:
+            flight.shared = True
+            self.joined += 1
+        # Shielded: one caller giving up must not cancel the request for the
+        # rest. The flight leaves ``_flights`` before any caller resumes, so
+        # ``shared`` is final by the time it is read below.
+        result = await asyncio.shield(flight.task)
+        return copy(result) if flight.shared else result
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+
+async def _run(fetch: Callable[[], Awaitable[Any]]) -> Any:
+    return await fetch()
@@ -0,0 +1,268 @@
+"""
+In-memory mirror of Home Assistant's state table.
+
+Opt-in (``HAMCP_ENABLE_STATE_MIRROR``). When enabled, the background
+``WebSocketListenerService`` seeds the mirror once from ``get_states`` and
+then applies every ``state_changed`` event it already receives, so
+``HomeAssistantClient.get_states()`` / ``get_entity_state()`` can answer
+from memory instead of downloading the whole ``/api/states`` table on every
+tool call (multiple MB per call on a ~6k-entity install).
+
+Freshness is deliberately conservative: the mirror only serves reads while
+the WebSocket it was seeded over is still connected. Any disconnect makes it
+stale until the listener reconnects and reseeds, and a stale mirror falls
+back to the REST call — a read is never answered from a table that may have
+missed events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from ..config import OAUTH_MODE_TOKEN, OAUTH_MODE_URL, get_global_settings
+
+if TYPE_CHECKING:
+    from .websocket_client import HomeAssistantWebSocketClient
+
+logger = logging.getLogger(__name__)
+
+
+def _copy_state(state: dict[str, Any]) -> dict[str, Any]:
+    """Return a caller-owned copy of a mirrored state object.
+
+    The mirror never mutates a stored state in place (each event replaces
+    the whole object), so a shallow copy plus a copy of ``attributes`` —
+    the one nested dict tool code routinely edits — keeps callers from
+    corrupting each other's view without a full deepcopy per read.
+    """
+    copied = dict(state)
+    attributes = state.get("attributes")
+    if isinstance(attributes, dict):
+        copied["attributes"] = dict(attributes)
+    return copied
+
+
+def _is_stale_update(
+    current: dict[str, Any] | None, incoming: dict[str, Any] | None
+) -> bool:
+    """True when ``incoming`` is older than the state already mirrored.
+
+    HA serialises ``last_updated`` as ISO-8601 UTC with a fixed offset, so a
+    string comparison orders them correctly. Missing timestamps never count
+    as stale — an event we cannot order is applied.
+    """
+    if not current or not incoming:
+        return False
+    current_ts = current.get("last_updated")
+    incoming_ts = incoming.get("last_updated")
+    if not isinstance(current_ts, str) or not isinstance(incoming_ts, str):
+        return False
+    return incoming_ts < current_ts
+
+
+class StateMirror:
+    """Entity-id keyed copy of HA's state table, kept current by WebSocket."""
+
+    def __init__(self, url: str, token: str) -> None:
+        """Initialize an empty (stale) mirror for one HA instance.
+
+        Args:
+            url: Home Assistant base URL the mirror reflects.
+            token: Token the mirror's WebSocket authenticates with. Only
+                clients using the same credentials are served from it.
+        """
+        self.base_url = url.rstrip("/")
+        self.token = token
+        self._states: dict[str, dict[str, Any]] = {}
+        self._ws_client: HomeAssistantWebSocketClient | None = None
+        self._seeded = False
+        # Events that land while a seed is in flight. The get_states reply
+        # already reflects every event HA sent before it, but the handler
+        # may run events that arrived AFTER the reply before the seeding
+        # coroutine resumes — those are replayed onto the fresh table.
+        self._pending_events: list[dict[str, Any]] | None = None
+        self._seed_lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+        self._sync_task: asyncio.Task | None = None
+        self.seeded_at: float | None = None
+        self.events_applied = 0
+
+    def serves(self, url: str, token: str) -> bool:
+        """Whether this mirror reflects the instance/credentials given."""
+        return self.base_url == url.rstrip("/") and self.token == token
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether reads may be answered from memory right now."""
+        return (
+            self._seeded
+            and self._ws_client is not None
+            and self._ws_client.is_connected
+        )
+
+    def mark_stale(self) -> None:
+        """Stop serving reads until the next successful seed."""
+        self._seeded = False
+        self._ws_client = None
+        self._pending_events = None
+
+    def _ensure_seed_lock(self) -> asyncio.Lock:
+        """Return the seed lock, recreating it if the event loop changed."""
+        current_loop = asyncio.get_running_loop()
+        if self._seed_lock is None or self._lock_loop is not current_loop:
+            self._seed_lock = asyncio.Lock()
+            self._lock_loop = current_loop
+        return self._seed_lock
+
+    async def seed(self, ws_client: HomeAssistantWebSocketClient) -> bool:
+        """(Re)load the full state table over ``ws_client``.
+
+        Must be called after the ``state_changed`` handler is registered on
+        the same client, so no event falls between the snapshot and the
+        first incremental update.
+
+        Returns:
+            True when the mirror is fresh afterwards.
+        """
+        async with self._ensure_seed_lock():
+            self.mark_stale()
+            self._pending_events = []
+            try:
+                response = await ws_client.get_states()
+            except Exception as e:
+                self._pending_events = None
+                logger.warning(f"State mirror seed failed: {e}")
+                return False
+
+            states = response.get("result") if isinstance(response, dict) else None
+            if not isinstance(states, list):
+                self._pending_events = None
+                logger.warning("State mirror seed returned no state list")
+                return False
+
+            self._states = {
+                state["entity_id"]: state
+                for state in states
+                if isinstance(state, dict) and state.get("entity_id")
+            }
+            pending, self._pending_events = self._pending_events or [], None
+            for event_data in pending:
+                self._apply(event_data)
+
+            self._ws_client = ws_client
+            self._seeded = True
+            self.seeded_at = time.time()
+            logger.info(f"State mirror seeded with {len(self._states)} entities")
+            return True
+
+    def apply_event(self, event_data: dict[str, Any]) -> None:
+        """Apply one ``state_changed`` event's ``data`` payload."""
+        if self._pending_events is not None:
+            self._pending_events.append(event_data)
+            return
+        if not self._seeded:
+            return
+        self._apply(event_data)
+
+    def _apply(self, event_data: dict[str, Any]) -> None:
+        entity_id = event_data.get("entity_id")
+        if not entity_id:
+            return
+        new_state = event_data.get("new_state")
+        current = self._states.get(entity_id)
+        if new_state is None:
+            # Removal. Ignore it when the mirrored object is newer than the
+            # one being removed (the entity was re-added since).
+            if not _is_stale_update(current, event_data.get("old_state")):
+                self._states.pop(entity_id, None)
+                self.events_applied += 1
+            return
+        if _is_stale_update(current, new_state):
+            return
+        self._states[entity_id] = new_state
+        self.events_applied += 1
+
+    def get_states(self) -> list[dict[str, Any]]:
+        """Return a caller-owned snapshot of every mirrored state."""
+        return [_copy_state(state) for state in self._states.values()]
+
+    def get_state(self, entity_id: str) -> dict[str, Any] | None:
+        """Return a caller-owned copy of one state, or None if not mirrored."""
+        state = self._states.get(entity_id)
+        return _copy_state(state) if state is not None else None
+
+    def request_sync(self) -> None:
+        """Ask the listener to (re)seed in the background.
+
+        Called from the read path when the mirror is stale so the NEXT read
+        can be served from memory; the current read falls back to REST and
+        never waits on this.
+        """
+        if self._sync_task is not None and not self._sync_task.done():
+            return
+        try:
+            self._sync_task = asyncio.get_running_loop().create_task(
+                self._sync_via_listener()
+            )
+        except RuntimeError:
+            # No running loop (sync caller) — the listener's own reconnect
+            # monitor reseeds eventually.
+            return
+
+    async def _sync_via_listener(self) -> None:
+        # Imported lazily: the listener module imports this one.
+        from .websocket_listener import get_listener_service
+
+        try:
+            service = await get_listener_service()
+            if not service.running:
+                await service.start()
+            elif not self.is_fresh:
+                await service.resync_state_mirror()
+        except Exception as e:
+            logger.debug(f"State mirror background sync failed: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Diagnostic counters for the mirror."""
+        return {
+            "fresh": self.is_fresh,
+            "entity_count": len(self._states),
+            "seeded_at": self.seeded_at,
+            "events_applied": self.events_applied,
+        }
+
+
+# Global mirror instance (None until first requested while enabled)
+_state_mirror: StateMirror | None = None
+
+
+def get_state_mirror() -> StateMirror | None:
+    """Return the process-wide state mirror, or None when it is disabled.
+
+    Disabled when ``HAMCP_ENABLE_STATE_MIRROR`` is off, and always in OAuth
+    mode, where the global credentials are sentinels and every user reads
+    their own instance.
+    """
+    global _state_mirror
+    try:
+        settings = get_global_settings()
+    except Exception:
+        return None
+    if not settings.enable_state_mirror:
+        return None
+    url = settings.homeassistant_url
+    token = settings.homeassistant_token
+    if url == OAUTH_MODE_URL or token == OAUTH_MODE_TOKEN:
+        return None
+    if _state_mirror is None or not _state_mirror.serves(url, token):
+        _state_mirror = StateMirror(url, token)
+    return _state_mirror
+
+
+def reset_state_mirror() -> None:
+    """Drop the global mirror (test seam / settings change)."""
+    global _state_mirror
+    _state_mirror = None
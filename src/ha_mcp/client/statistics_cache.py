@@ -0,0 +1,280 @@
+"""
+Cache of long-term statistics rows and statistic metadata.
+
+Dashboard-style questions ("last 24 h", "last 7 days", "this month") ask
+``recorder/statistics_during_period`` for overlapping ranges, and each used to
+refetch every bucket. ``StatisticsCache`` keeps the rows it has seen:
+
+- Rows are kept per ``(statistic_id, period, types)`` together with the time
+  ranges they cover, merged as they grow. A request only fetches the parts
+  of its range no earlier request covered.
+- Only settled buckets are kept: the range covered stops one period plus
+  ``STATISTICS_SETTLE_SECONDS`` before now, leaving the recorder time to
+  compile the latest bucket.
+- Only the periods the recorder stores (``5minute`` and ``hour``) are
+  cached. HA builds ``day`` and longer by aggregating hourly rows inside the
+  requested window, so their first and last buckets depend on the window.
+
+Statistic metadata (``recorder/get_statistics_metadata``) is cached per
+statistic id. New statistic ids are created, and units change, when the
+recorder compiles statistics, so every ``recorder_5min_statistics_generated``
+event drops the metadata. Our own ``recorder/*`` writes drop the statistics
+they name.
+
+As with the other event-invalidated caches, nothing is trusted once the
+WebSocket carrying the subscription reconnects: a restarted HA may be
+backfilling statistics for the time it was down.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+from .event_cache import CredentialCaches, EventInvalidatedCache
+
+# Seconds after a bucket ends before it is trusted to be compiled.
+STATISTICS_SETTLE_SECONDS = 600.0
+
+# Bound on distinct (url, token) caches, matching the registry cache bound.
+MAX_STATISTICS_CACHES = 50
+
+# Bound on cached rows across every series of one cache.
+MAX_STATISTICS_CACHE_ROWS = 200_000
+
+# Periods the recorder stores as rows, and their length in seconds.
+CACHEABLE_PERIODS: dict[str, float] = {"5minute": 300.0, "hour": 3600.0}
+
+# Recorder WebSocket commands that only read statistics.
+_READ_COMMANDS = frozenset(
+    {
+        "recorder/statistics_during_period",
+        "recorder/statistic_during_period",
+        "recorder/get_statistics_metadata",
+        "recorder/list_statistic_ids",
+        "recorder/validate_statistics",
+        "recorder/info",
+    }
+)
+
+SeriesKey = tuple[str, str, tuple[str, ...] | None]
+
+
+def invalidated_statistic_ids(message: dict[str, Any]) -> list[str] | None:
+    """Statistic ids a recorder WebSocket write may change.
+
+    Returns None for anything that is not a recorder write, and an empty
+    list for a write that does not say which statistics it touches.
+    """
+    command_type = message.get("type")
+    if not isinstance(command_type, str) or not command_type.startswith("recorder/"):
+        return None
+    if command_type in _READ_COMMANDS:
+        return None
+    ids = message.get("statistic_ids")
+    if isinstance(ids, list):
+        return [str(statistic_id) for statistic_id in ids]
+    statistic_id = message.get("statistic_id") or (
+        message.get("metadata", {}).get("statistic_id")
+        if isinstance(message.get("metadata"), dict)
+        else None
+    )
+    return [str(statistic_id)] if statistic_id else []
+
+
+def _row_start(row: dict[str, Any]) -> float | None:
+    """A row's start in epoch seconds (the recorder sends milliseconds)."""
+    value = row.get("start")
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value) / 1000
+    return None
+
+
+def _merge(ranges: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    merged: list[tuple[float, float]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+@dataclass
+class _Series:
+    covered: list[tuple[float, float]] = field(default_factory=list)
+    rows: dict[float, dict[str, Any]] = field(default_factory=dict)
+
+
+class StatisticsCache(EventInvalidatedCache):
+    """Per-(url, token) cache of statistics rows and metadata."""
+
+    EVENTS = ("recorder_5min_statistics_generated",)
+
+    def __init__(self, max_rows: int = MAX_STATISTICS_CACHE_ROWS) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_rows: Bound on cached rows across all series.
+        """
+        # Settled rows never go stale; only events and our writes drop them.
+        super().__init__((), ttl=math.inf)
+        self._max_rows = max_rows
+        self._series: dict[SeriesKey, _Series] = {}
+        self._row_count = 0
+        self._metadata: dict[str, dict[str, Any]] = {}
+
+    async def _handle_event(self, event: dict[str, Any]) -> None:
+        self._metadata.clear()
+
+    def generation(self, key: str) -> int:
+        """Invalidation generation of one statistic id.
+
+        Also bumped by :meth:`invalidate_all`, which covers ids the cache
+        has not seen yet.
+        """
+        return super().generation(key) + super().generation("*")
+
+    # ----- rows ------------------------------------------------------------
+
+    def missing(
+        self, key: SeriesKey, start: float, end: float
+    ) -> list[tuple[float, float]]:
+        """The parts of ``[start, end)`` no cached range covers."""
+        series = self._series.get(key) if self._is_live() else None
+        gaps: list[tuple[float, float]] = []
+        cursor = start
+        for covered_start, covered_end in series.covered if series else ():
+            if covered_end <= cursor:
+                continue
+            if covered_start >= end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        if gaps == [(start, end)]:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return gaps
+
+    def rows(self, key: SeriesKey, start: float, end: float) -> list[dict[str, Any]]:
+        """Cached rows starting in ``[start, end)``, oldest first."""
+        series = self._series.get(key)
+        if series is None:
+            return []
+        return [
+            row
+            for row_start, row in sorted(series.rows.items())
+            if start <= row_start < end
+        ]
+
+    def store(
+        self,
+        key: SeriesKey,
+        start: float,
+        end: float,
+        rows: list[dict[str, Any]],
+        *,
+        settled: float,
+        generation: int,
+    ) -> None:
+        """Record the rows fetched for ``[start, end)`` under ``generation``.
+
+        Only the part before ``settled`` minus one period is kept.
+        """
+        statistic_id, period, _types = key
+        if generation != self.generation(statistic_id) or not self._is_live():
+            return
+        end = min(end, settled - CACHEABLE_PERIODS[period])
+        if end <= start:
+            return
+        starts = [_row_start(row) for row in rows]
+        if any(row_start is None for row_start in starts):
+            return
+        series = self._series.setdefault(key, _Series())
+        before = len(series.rows)
+        for row_start, row in zip(starts, rows, strict=True):
+            if row_start is not None and start <= row_start < end:
+                series.rows[row_start] = row
+        series.covered = _merge([*series.covered, (start, end)])
+        self._row_count += len(series.rows) - before
+        if self._row_count > self._max_rows:
+            # Rare enough (hundreds of thousands of rows) to start over.
+            self.invalidate_all()
+
+    # ----- metadata --------------------------------------------------------
+
+    def metadata(self, statistic_id: str) -> dict[str, Any] | None:
+        """Cached metadata for one statistic id, or None on a miss."""
+        if not self._is_live():
+            return None
+        return self._metadata.get(statistic_id)
+
+    def store_metadata(
+        self, entries: list[dict[str, Any]], generations: dict[str, int]
+    ) -> None:
+        """Cache ``recorder/get_statistics_metadata`` entries.
+
+        ``generations`` maps each requested id to its generation when the
+        request was sent; an id invalidated since is not stored.
+        """
+        if not self._is_live():
+            return
+        for entry in entries:
+            statistic_id = entry.get("statistic_id")
+            if (
+                isinstance(statistic_id, str)
+                and statistic_id in generations
+                and generations[statistic_id] == self.generation(statistic_id)
+            ):
+                self._metadata[statistic_id] = entry
+
+    # ----- invalidation ----------------------------------------------------
+
+    def invalidate(self, *statistic_ids: str) -> None:
+        """Drop the rows and metadata of the given statistics."""
+        for statistic_id in statistic_ids:
+            self._bump_generation(statistic_id)
+            self._metadata.pop(statistic_id, None)
+            for key in [key for key in self._series if key[0] == statistic_id]:
+                self._row_count -= len(self._series.pop(key).rows)
+                self.invalidations += 1
+
+    def invalidate_all(self) -> None:
+        """Drop everything."""
+        self._bump_generation("*")
+        self.invalidations += len(self._series)
+        self._series.clear()
+        self._metadata.clear()
+        self._row_count = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Diagnostic counters for the cache."""
+        return {
+            "series": len(self._series),
+            "rows": self._row_count,
+            "metadata": len(self._metadata),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "subscribed": self._is_live(),
+        }
+
+
+_caches: CredentialCaches[StatisticsCache] = CredentialCaches(
+    StatisticsCache, MAX_STATISTICS_CACHES
+)
+
+
+def get_statistics_cache(url: str, token: str) -> StatisticsCache:
+    """Return the statistics cache for one HA instance and credential."""
+    return _caches.get(url, token)
+
+
+def reset_statistics_caches() -> None:
+    """Drop every statistics cache (test seam)."""
+    _caches.clear()
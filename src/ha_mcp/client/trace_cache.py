@@ -0,0 +1,85 @@
+"""
+Cache of finished automation and script traces for ``ha_get_automation_traces``.
+
+``trace/get`` returns the full trace of one run: every step with its
+variables, the config it ran with and its logbook entries. Once a run has
+stopped, its trace never changes, so it is kept here:
+
+- One entry per ``(domain, item_id, run_id)``. Reading the same run again,
+  or summarising an automation whose latest runs were already read, is
+  answered without a request.
+- Traces still running (or paused by a breakpoint) are never cached.
+- Traces are evicted least recently used first once the cache holds more
+  than ``MAX_TRACE_CACHE_ENTRIES`` of them.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+from .event_cache import CredentialCaches
+
+# Bound on cached traces of one cache. A trace carries its config and the
+# variables of every step, so this is kept well below the logbook bound.
+MAX_TRACE_CACHE_ENTRIES = 500
+
+# Bound on distinct (url, token) caches, as for the registry cache.
+MAX_TRACE_CACHES = 50
+
+TraceKey = tuple[str, str, str]
+
+
+class TraceCache:
+    """Per-(url, token) LRU cache of traces of finished runs."""
+
+    def __init__(self, max_entries: int = MAX_TRACE_CACHE_ENTRIES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Bound on cached traces.
+        """
+        self._max_entries = max_entries
+        self._traces: OrderedDict[TraceKey, dict[str, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: TraceKey) -> dict[str, Any] | None:
+        """The cached trace of one run, or None on a miss."""
+        trace = self._traces.get(key)
+        if trace is None:
+            self.misses += 1
+            return None
+        self._traces.move_to_end(key)
+        self.hits += 1
+        return trace
+
+    def store(self, key: TraceKey, trace: dict[str, Any]) -> None:
+        """Cache the trace of a run, if the run has stopped."""
+        if trace.get("state") != "stopped":
+            return
+        self._traces[key] = trace
+        self._traces.move_to_end(key)
+        while len(self._traces) > self._max_entries:
+            self._traces.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached trace."""
+        self._traces.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Diagnostic counters for the cache."""
+        return {"traces": len(self._traces), "hits": self.hits, "misses": self.misses}
+
+
+_caches: CredentialCaches[TraceCache] = CredentialCaches(TraceCache, MAX_TRACE_CACHES)
+
+
+def get_trace_cache(url: str, token: str) -> TraceCache:
+    """Return the trace cache for one HA instance and credential."""
+    return _caches.get(url, token)
+
+
+def reset_trace_caches() -> None:
+    """Drop every trace cache (test seam)."""
+    _caches.clear()
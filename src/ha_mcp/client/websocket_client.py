@@ -10,7 +10,6 @@ This module handles WebSocket connections to Home Assistant for:
 import asyncio
 import concurrent.futures
 import hashlib
-import json
 import logging
 import ssl
 import time
@@ -26,6 +25,8 @@ from urllib.parse import urlparse
 # exactly the version production runs.
 from .._vendor import websockets
 from ..config import get_global_settings
+from ..telemetry import ha_round_trip
+from ..utils import json_codec
 from .rest_client import (
     HomeAssistantAuthError,
     HomeAssistantCommandError,
@@ -429,7 +430,7 @@ class HomeAssistantWebSocketClient:
         if not self.websocket:
             raise HomeAssistantConnectionError("WebSocket not connected")
         auth_message = {"type": "auth", "access_token": self.token}
-        await self.websocket.send(json.dumps(auth_message))
+        await self.websocket.send(json_codec.dumps_bytes(auth_message), text=True)
 
     async def _wait_for_auth_message(
         self, message_type: str, timeout: float = 5.0
@@ -457,10 +458,12 @@ class HomeAssistantWebSocketClient:
         try:
             async for message in self.websocket:
                 try:
-                    data = json.loads(message)
-                    logger.debug(f"WebSocket received: {data}")
+                    data = json_codec.loads(message)
+                    logger.debug(
+                        "WebSocket received: %s", json_codec.log_preview(message)
+                    )
                     await self._process_message(data)
-                except json.JSONDecodeError as e:
+                except json_codec.JSONDecodeError as e:
                     logger.error(f"Invalid JSON received: {e}")
                 except Exception as e:
                     logger.error(f"Error processing message: {e}")
@@ -588,8 +591,8 @@ class HomeAssistantWebSocketClient:
         async with self._send_lock:
             if not self.websocket:
                 raise HomeAssistantConnectionError("WebSocket not connected")
-            logger.debug(f"WebSocket sending: {message}")
-            await self.websocket.send(json.dumps(message))
+            logger.debug("WebSocket sending: %s", json_codec.log_preview(message))
+            await self.websocket.send(json_codec.dumps_bytes(message), text=True)
 
     def get_next_message_id(self) -> int:
         """Expose the next WebSocket message ID for external callers."""
@@ -615,6 +618,7 @@ class HomeAssistantWebSocketClient:
         """Cancel and drop a stored event future."""
         self._state.cancel_event_response(message_id)
 
+    @ha_round_trip
     async def send_command(self, command_type: str, **kwargs: Any) -> dict[str, Any]:
         """Send command and wait for response.
 
@@ -668,7 +672,11 @@ class HomeAssistantWebSocketClient:
         # Wait for response outside the lock.
         try:
             response = await asyncio.wait_for(future, timeout=wait_timeout)
-            logger.debug(f"WebSocket response for id {message_id}: {response}")
+            logger.debug(
+                "WebSocket response for id %s: %s",
+                message_id,
+                json_codec.log_preview(response),
+            )
 
             # Process standard Home Assistant WebSocket response
             if response.get("type") == "result":
@@ -700,6 +708,7 @@ class HomeAssistantWebSocketClient:
             self.cancel_pending_response(message_id)
             raise
 
+    @ha_round_trip
     async def send_command_with_event(
         self,
         command_type: str,
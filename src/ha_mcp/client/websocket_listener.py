@@ -10,6 +10,8 @@ import logging
 from typing import Any
 
 from ..utils.operation_manager import get_operation_manager, update_pending_operations
+from .event_bus import EventListener, get_event_bus
+from .state_mirror import StateMirror, get_state_mirror
 from .websocket_client import HomeAssistantWebSocketClient, get_websocket_client
 
 logger = logging.getLogger(__name__)
@@ -22,10 +24,16 @@ class WebSocketListenerService:
         """Initialize the WebSocket listener service."""
         self.operation_manager = get_operation_manager()
         self.websocket_client: HomeAssistantWebSocketClient | None = None
+        # Our reference on the client's shared ``state_changed``
+        # subscription (see ``event_bus``); waiters multiplex onto it.
+        self._state_listener: EventListener | None = None
         self.listener_task: asyncio.Task | None = None
         self.cleanup_task: asyncio.Task | None = None
         self.running = False
         self._event_loop: asyncio.AbstractEventLoop | None = None
+        # Opt-in in-memory state table fed by the same subscription
+        # (HAMCP_ENABLE_STATE_MIRROR); None when disabled.
+        self.state_mirror: StateMirror | None = get_state_mirror()
 
     async def start(self) -> bool:
         """Start the WebSocket listener service.
@@ -38,16 +46,16 @@ class WebSocketListenerService:
             return True
 
         try:
-            # Get WebSocket client
-            self.websocket_client = await get_websocket_client()
+            # Get WebSocket client and join its shared state_changed
+            # subscription (opened here if no waiter holds it yet)
+            ws_client = await get_websocket_client()
+            await self._attach(ws_client)
 
-            # Subscribe to state change events
-            await self.websocket_client.subscribe_events("state_changed")
-
-            # Add event handler
-            self.websocket_client.add_event_handler(
-                "state_changed", self._handle_state_change
-            )
+            # Seed after the handler is registered so no event falls
+            # between the snapshot and the first incremental update. A
+            # failed seed is not fatal: reads just stay on REST.
+            if self.state_mirror is not None:
+                await self.state_mirror.seed(ws_client)
 
             # Start background tasks
             self.listener_task = asyncio.create_task(self._connection_monitor())
@@ -87,14 +95,27 @@ class WebSocketListenerService:
                 # Expected: awaiting a cancelled task re-raises CancelledError.
                 pass
 
-        # Remove event handler if WebSocket client exists
-        if self.websocket_client:
-            self.websocket_client.remove_event_handler(
-                "state_changed", self._handle_state_change
-            )
+        if self.state_mirror is not None:
+            self.state_mirror.mark_stale()
+
+        await self._detach()
 
         logger.info("WebSocket listener service stopped")
 
+    async def _attach(self, client: HomeAssistantWebSocketClient) -> None:
+        """Listen for state changes on ``client``'s shared event bus."""
+        await self._detach()
+        self._state_listener = await get_event_bus(client).listen(
+            "state_changed", self._handle_state_change
+        )
+        self.websocket_client = client
+
+    async def _detach(self) -> None:
+        """Release our reference on the current client's subscription."""
+        listener, self._state_listener = self._state_listener, None
+        if listener is not None and self.websocket_client is not None:
+            await get_event_bus(self.websocket_client).release(listener)
+
     async def _handle_state_change(self, event: dict[str, Any]) -> None:
         """Handle state change events from Home Assistant.
 
@@ -136,6 +157,11 @@ class WebSocketListenerService:
             new_state = event_data.get("new_state")
             old_state = event_data.get("old_state")
 
+            # The mirror needs removals too (new_state is None), so feed it
+            # before the guard below drops them.
+            if self.state_mirror is not None:
+                self.state_mirror.apply_event(event_data)
+
             if not entity_id or not new_state:
                 return
 
@@ -179,15 +205,16 @@ class WebSocketListenerService:
                         logger.warning("WebSocket ping failed")
                 else:
                     logger.warning("WebSocket connection lost")
+                    if self.state_mirror is not None:
+                        self.state_mirror.mark_stale()
 
                     # Try to reconnect
                     try:
-                        self.websocket_client = await get_websocket_client()
-                        await self.websocket_client.subscribe_events("state_changed")
-                        self.websocket_client.add_event_handler(
-                            "state_changed", self._handle_state_change
-                        )
+                        ws_client = await get_websocket_client()
+                        await self._attach(ws_client)
                         logger.info("WebSocket reconnected successfully")
+                        if self.state_mirror is not None:
+                            await self.state_mirror.seed(ws_client)
                     except Exception as e:
                         logger.error(f"WebSocket reconnection failed: {e}")
 
@@ -200,6 +227,24 @@ class WebSocketListenerService:
                 logger.error(f"Connection monitor error: {e}")
                 await asyncio.sleep(30)
 
+    async def resync_state_mirror(self) -> bool:
+        """Reseed the state mirror over the current connection.
+
+        Called when a read finds the mirror stale but the listener is still
+        running (e.g. another caller reconnected the pooled WebSocket before
+        the 30s monitor noticed). Re-subscribes on a replaced connection so
+        the mirror never seeds over a socket that isn't feeding it events.
+
+        Returns:
+            True when the mirror is fresh afterwards.
+        """
+        if self.state_mirror is None:
+            return False
+        client = await get_websocket_client()
+        if client is not self.websocket_client:
+            await self._attach(client)
+        return await self.state_mirror.seed(client)
+
     async def _periodic_cleanup(self) -> None:
         """Periodic cleanup of expired operations."""
         while self.running:
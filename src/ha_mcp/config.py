@@ -102,6 +102,13 @@ class Settings(BaseSettings):
     # WebSocket configuration (essential for async operations)
     enable_websocket: bool = Field(True, alias="ENABLE_WEBSOCKET")
 
+    # In-memory state mirror (client/state_mirror.py). Off by default: when
+    # on, the WebSocket listener seeds one copy of the state table and keeps
+    # it current from state_changed events, and get_states()/
+    # get_entity_state() answer from memory instead of /api/states.
+    # Read when the listener starts, so a change requires a restart.
+    enable_state_mirror: bool = Field(False, alias="HAMCP_ENABLE_STATE_MIRROR")
+
     # Settings UI sidecar (stdio mode only, #1587). 0 (default) = pick a
     # free ephemeral port on the first spawn and reuse it afterwards
     # (persisted in ui.state, #2131) so the settings URL/origin stays
@@ -892,6 +899,13 @@ ADVANCED_SETTINGS_FIELDS: tuple[AdvancedField, ...] = (
     # Operations.
     AdvancedField("backup_hint", "BACKUP_HINT", str, "operations", True),
     AdvancedField("enable_websocket", "ENABLE_WEBSOCKET", bool, "operations", True),
+    AdvancedField(
+        "enable_state_mirror",
+        "HAMCP_ENABLE_STATE_MIRROR",
+        bool,
+        "operations",
+        True,
+    ),
     # Dashboard-screenshot engine URL (#1538): docker/.env users could set
     # HAMCP_DASHBOARD_SCREENSHOT_ENGINE_URL, but add-on users had no path to
     # it. It is resolved live per capture (resolve_engine), so unlike the
@@ -0,0 +1,78 @@
+"""Per-call serialization shared by the outbound response post-processing.
+
+Two middleware inspect every tool result on its way back to the client: the
+entity-visibility outbound scan (innermost, #2015) and
+:class:`~ha_mcp.redaction.RedactSecretsMiddleware` just outside it (#2157).
+Each used to flatten the result on its own — the scan ``json.dumps``-ed the
+structured content to regex-search it, and the scrubber rebuilt the whole
+structure string by string, whether or not a secret was anywhere in it. On a
+multi-MB overview or search result that is hundreds of milliseconds per call.
+
+:func:`outbound_payload` opens a per-call :class:`OutboundPayload` around
+``call_next``; whichever stage needs the structured content as text first
+serializes it, and the other reuses that text. The redaction stage then only
+walks the structure when the shared text actually contains a secret. The
+middleware order is unchanged: the scan still sees the raw result first.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+_UNSET: Any = object()
+
+
+def _serialize(structured: Any) -> str | None:
+    try:
+        return json.dumps(structured, default=str)
+    except (TypeError, ValueError):
+        return None
+
+
+class OutboundPayload:
+    """Memoized serialization of one call's structured content.
+
+    Keyed on object identity: a stage that replaces ``structured_content``
+    gets a fresh serialization rather than a stale one.
+    """
+
+    __slots__ = ("_structured", "_text")
+
+    def __init__(self) -> None:
+        self._structured: Any = _UNSET
+        self._text: str | None = None
+
+    def structured_text(self, structured: Any) -> str | None:
+        """``json.dumps(structured, default=str)``, or None if unserializable."""
+        if structured is not self._structured:
+            self._text = _serialize(structured)
+            self._structured = structured
+        return self._text
+
+
+_current_payload: ContextVar[OutboundPayload | None] = ContextVar(
+    "outbound_payload", default=None
+)
+
+
+@contextmanager
+def outbound_payload() -> Iterator[OutboundPayload]:
+    """Share one serialization among the stages nested inside this block."""
+    payload = OutboundPayload()
+    token = _current_payload.set(payload)
+    try:
+        yield payload
+    finally:
+        _current_payload.reset(token)
+
+
+def structured_text(structured: Any) -> str | None:
+    """Serialize ``structured`` through the open payload, if there is one."""
+    payload = _current_payload.get()
+    if payload is None:
+        return _serialize(structured)
+    return payload.structured_text(structured)
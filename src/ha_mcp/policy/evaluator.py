@@ -1,4 +1,10 @@
-"""Evaluate a tool call against a Policy. Pure functions — no I/O, no state."""
+"""Evaluate a tool call against a Policy. No I/O, no state.
+
+The module-level functions evaluate a :class:`Policy` as written. The policy
+middleware evaluates a :class:`CompiledPolicy` instead — the same semantics
+with the per-call work (rule selection, path splitting, case folding, regex
+compilation) done once per policy file rather than once per call.
+"""
 
 import logging
 import re
@@ -25,27 +31,31 @@ def iter_path_values(args: dict[str, Any], path: str) -> Iterator[Any]:
     argument, ``args.config.*`` yields every leaf of the ``config``
     sub-dict, and so on. Empty iterator = no match.
     """
+    yield from _walk(args, _split_path(path))
+
+
+def _split_path(path: str) -> tuple[str, ...]:
     parts = path.split(".")
     if parts[0] == "args":
         parts = parts[1:]
+    return tuple(parts)
 
-    def walk(cur: Any, rest: list[str]) -> Iterator[Any]:
-        if not rest:
-            yield cur
-            return
-        head, tail = rest[0], rest[1:]
-        if head == "*":
-            if isinstance(cur, dict):
-                for v in cur.values():
-                    yield from walk(v, tail)
-            elif isinstance(cur, (list, tuple)):
-                for v in cur:
-                    yield from walk(v, tail)
-            return
-        if isinstance(cur, dict) and head in cur:
-            yield from walk(cur[head], tail)
-
-    yield from walk(args, parts)
+
+def _walk(cur: Any, rest: tuple[str, ...]) -> Iterator[Any]:
+    if not rest:
+        yield cur
+        return
+    head, tail = rest[0], rest[1:]
+    if head == "*":
+        if isinstance(cur, dict):
+            for v in cur.values():
+                yield from _walk(v, tail)
+        elif isinstance(cur, (list, tuple)):
+            for v in cur:
+                yield from _walk(v, tail)
+        return
+    if isinstance(cur, dict) and head in cur:
+        yield from _walk(cur[head], tail)
 
 
 def _ci(x: Any) -> Any:
@@ -145,6 +155,17 @@ def find_matching_rule(
 def evaluate(tool_name: str, args: dict[str, Any], policy: Policy) -> Verdict:
     if find_matching_rule(tool_name, args, policy) is not None:
         return Verdict.REQUIRE_APPROVAL
+    return _ws_command_verdict(
+        tool_name,
+        args,
+        any(rule.tool_name in ("ha_call_service", "*") for rule in policy.rules),
+    )
+
+
+def _ws_command_verdict(
+    tool_name: str, args: dict[str, Any], call_service_gated: bool
+) -> Verdict:
+    """Verdict for a call no rule matched."""
     # ha_call_service exposes a raw WebSocket escape hatch (``ws_command``) that
     # carries no ``domain``/``service`` argument, so a rule keyed on
     # ``args.domain``/``args.service`` cannot match it and it would otherwise slip
@@ -157,10 +178,99 @@ def evaluate(tool_name: str, args: dict[str, Any], policy: Policy) -> Verdict:
     # especially since the write-command blocklist is a deliberately
     # non-exhaustive wrapper-bypass list that leans on this gate.
     # Operators who want finer control can add a rule keyed on ``args.ws_command``.
-    if (
-        tool_name == "ha_call_service"
-        and args.get("ws_command")
-        and any(rule.tool_name in ("ha_call_service", "*") for rule in policy.rules)
-    ):
+    if tool_name == "ha_call_service" and args.get("ws_command") and call_service_gated:
         return Verdict.REQUIRE_APPROVAL
     return Verdict.ALLOW
+
+
+_MISSING = object()
+
+
+class _CompiledPredicate:
+    """A :class:`Predicate` with its path split and its value pre-folded."""
+
+    __slots__ = ("_folded", "_op", "_parts", "_regex", "_value")
+
+    def __init__(self, predicate: Predicate) -> None:
+        self._parts = _split_path(predicate.path)
+        self._op = predicate.op
+        self._value = pv = predicate.value
+        self._regex = None
+        self._folded: Any = _ci(pv)
+        if self._op in ("in", "not_in"):
+            self._folded = tuple(_ci(x) for x in (pv or []))
+        elif self._op == "regex" and isinstance(pv, str):
+            self._regex = re.compile(pv, re.IGNORECASE)
+
+    def matches(self, args: dict[str, Any]) -> bool:
+        """Same result as :func:`match_predicate` on the source predicate."""
+        values = _walk(args, self._parts)
+        if self._op == "exists":
+            return next(values, _MISSING) is not _MISSING
+        return any(self._op_matches(v) for v in values)
+
+    def _op_matches(self, val: Any) -> bool:
+        match self._op:
+            case "eq":
+                return bool(_ci(val) == self._folded)
+            case "neq":
+                return bool(_ci(val) != self._folded)
+            case "in":
+                return _ci(val) in self._folded
+            case "not_in":
+                return _ci(val) not in self._folded
+            case "regex":
+                return (
+                    isinstance(val, str)
+                    and self._regex is not None
+                    and self._regex.search(val) is not None
+                )
+            case "contains":
+                if isinstance(val, str) and isinstance(self._folded, str):
+                    return self._folded in val.lower()
+                return isinstance(val, (list, tuple, set)) and any(
+                    self._folded == _ci(x) for x in val
+                )
+            case "gt" | "lt":
+                return _numeric_matches(val, self._op, self._value)
+        return False
+
+
+class CompiledPolicy:
+    """A :class:`Policy` prepared for evaluating many calls.
+
+    Rules are indexed by ``tool_name``, each tool's list holding its own
+    rules and the ``*`` rules in policy order, so a call only looks at the
+    rules that can apply to it. Immutable; build a new one when the policy
+    changes (see ``persistence.load_compiled_policy``).
+    """
+
+    __slots__ = ("_by_tool", "_call_service_gated", "_wildcard", "policy")
+
+    def __init__(self, policy: Policy) -> None:
+        self.policy = policy
+        compiled = [
+            (rule, tuple(_CompiledPredicate(p) for p in rule.when))
+            for rule in policy.rules
+        ]
+        self._wildcard = tuple(c for c in compiled if c[0].tool_name == "*")
+        self._by_tool = {
+            name: tuple(c for c in compiled if c[0].tool_name in ("*", name))
+            for name in {rule.tool_name for rule in policy.rules} - {"*"}
+        }
+        self._call_service_gated = any(
+            rule.tool_name in ("ha_call_service", "*") for rule in policy.rules
+        )
+
+    def find_matching_rule(self, tool_name: str, args: dict[str, Any]) -> Rule | None:
+        """Same result as :func:`find_matching_rule` on the source policy."""
+        for rule, predicates in self._by_tool.get(tool_name, self._wildcard):
+            if all(p.matches(args) for p in predicates):
+                return rule
+        return None
+
+    def evaluate(self, tool_name: str, args: dict[str, Any]) -> Verdict:
+        """Same result as :func:`evaluate` on the source policy."""
+        if self.find_matching_rule(tool_name, args) is not None:
+            return Verdict.REQUIRE_APPROVAL
+        return _ws_command_verdict(tool_name, args, self._call_service_gated)
@@ -15,7 +15,7 @@ from ..errors import ErrorCode, create_error_response
 from ..renamed_tools import current_tool_name
 from ..tools.helpers import raise_tool_error, safe_progress
 from .approval_queue import ApprovalQueue, PendingApproval, compute_args_hash
-from .evaluator import Verdict, evaluate, find_matching_rule
+from .evaluator import CompiledPolicy, Verdict
 from .model import Policy, Rule
 
 logger = logging.getLogger(__name__)
@@ -65,12 +65,17 @@ def _passes_ungated(name: str, args: dict[str, Any]) -> bool:
 
 
 class PolicyMiddleware(Middleware):
-    """Gate tool calls against a Policy, blocking with progress heartbeats."""
+    """Gate tool calls against a Policy, blocking with progress heartbeats.
+
+    ``policy_provider`` returns the current policy, preferably already
+    compiled (see ``persistence.load_compiled_policy``); a plain
+    :class:`Policy` is compiled per call.
+    """
 
     def __init__(
         self,
         *,
-        policy_provider: Callable[[], Policy],
+        policy_provider: Callable[[], Policy | CompiledPolicy],
         queue: ApprovalQueue,
         wait_seconds: int | None = None,
     ) -> None:
@@ -84,7 +89,7 @@ class PolicyMiddleware(Middleware):
         try:
             # Hoist sync file read off the event loop — a slow FS shouldn't
             # pause the fastmcp request handler's task.
-            policy = await run_in_thread(self._policy_provider)
+            provided = await run_in_thread(self._policy_provider)
         except ValueError as e:
             # Fail-closed: a corrupt or invalid tool_policy.json is a
             # security-relevant config error. Passing through would
@@ -103,6 +108,12 @@ class PolicyMiddleware(Middleware):
                     ],
                 )
             )
+        compiled = (
+            provided
+            if isinstance(provided, CompiledPolicy)
+            else CompiledPolicy(provided)
+        )
+        policy = compiled.policy
         # RenamedToolAliasMiddleware runs ahead of this one and normally
         # rewrites a retired name before it arrives. Resolving it again costs a
         # dict lookup and removes the ordering dependency, which here is the
@@ -115,10 +126,10 @@ class PolicyMiddleware(Middleware):
         if _passes_ungated(name, args):
             return await call_next(context)
 
-        if evaluate(name, args, policy) != Verdict.REQUIRE_APPROVAL:
+        if compiled.evaluate(name, args) != Verdict.REQUIRE_APPROVAL:
             return await call_next(context)
 
-        rule = find_matching_rule(name, args, policy)
+        rule = compiled.find_matching_rule(name, args)
         args_hash = compute_args_hash(args)
 
         if self._queue.is_remembered(name, args_hash):
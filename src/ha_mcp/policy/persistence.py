@@ -4,17 +4,24 @@ import json
 import logging
 import os
 import tempfile
+import threading
 from pathlib import Path
 
 from pydantic import ValidationError
 
 from ..renamed_tools import RENAMED_TOOLS, current_tool_name
+from .evaluator import CompiledPolicy
 from .model import Policy, Rule
 
 logger = logging.getLogger(__name__)
 
 POLICY_FILENAME = "tool_policy.json"
 
+# Compiled policy per policy file, with the (mtime_ns, inode, size) stamp it
+# was read at; None stamps a missing file. See load_compiled_policy.
+_compiled: dict[Path, tuple[tuple[int, int, int] | None, CompiledPolicy]] = {}
+_compiled_lock = threading.Lock()
+
 
 def load_policy(data_dir: Path) -> Policy:
     path = data_dir / POLICY_FILENAME
@@ -31,6 +38,44 @@ def load_policy(data_dir: Path) -> Policy:
     return _follow_renamed_tools(policy)
 
 
+def load_compiled_policy(data_dir: Path) -> CompiledPolicy:
+    """Return the compiled policy, re-reading the file only when it changed.
+
+    Called on every gated tool call, so a hit is one ``stat``: the file is
+    re-read and recompiled when its mtime, inode or size moves (an atomic
+    replace by another process — the stdio settings sidecar — changes the
+    inode even within one mtime tick). Writes through :func:`save_policy`
+    also invalidate directly. A file that fails to load is never cached:
+    the ValueError reaches the caller every time, as with :func:`load_policy`.
+    """
+    path = data_dir / POLICY_FILENAME
+    try:
+        st = path.stat()
+        stamp: tuple[int, int, int] | None = (st.st_mtime_ns, st.st_ino, st.st_size)
+    except FileNotFoundError:
+        stamp = None
+    with _compiled_lock:
+        cached = _compiled.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    # Stamp taken before the read: a write racing the read leaves a stamp
+    # older than the content, so the next call re-reads rather than serving
+    # stale rules.
+    compiled = CompiledPolicy(load_policy(data_dir))
+    with _compiled_lock:
+        _compiled[path] = (stamp, compiled)
+    return compiled
+
+
+def invalidate_compiled_policy(data_dir: Path | None = None) -> None:
+    """Drop the compiled policy for ``data_dir`` (every one when None)."""
+    with _compiled_lock:
+        if data_dir is None:
+            _compiled.clear()
+        else:
+            _compiled.pop(data_dir / POLICY_FILENAME, None)
+
+
 def _follow_renamed_tools(policy: Policy) -> Policy:
     """Point rules naming a retired tool at the name it answers to today.
 
@@ -171,3 +216,5 @@ def save_policy(data_dir: Path, policy: Policy) -> None:
     except Exception:
         Path(tmp_path).unlink(missing_ok=True)
         raise
+    finally:
+        invalidate_compiled_policy(data_dir)
@@ -44,6 +44,7 @@ from typing import Any
 from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
 
 from .config import get_global_settings
+from .outbound import outbound_payload
 
 logger = logging.getLogger(__name__)
 
@@ -428,38 +429,59 @@ class RedactSecretsMiddleware(Middleware):
     — never rewrites — this scrubber still sees the unmodified tool output.
     Consults the live flag per call and is a passthrough while it is off or
     no secret values are known.
+
+    Opens the call's :func:`~ha_mcp.outbound.outbound_payload`, so the
+    structured content the scan already serialized is checked for secrets
+    as one string, and only walked by ``scrub_obj`` when one is present.
     """
 
     async def on_call_tool(
         self, context: MiddlewareContext, call_next: CallNext
     ) -> Any:
-        try:
-            result = await call_next(context)
-        except Exception as exc:
-            # Not just ToolError: FastMCP forwards non-ToolError exception
-            # text to clients too (mask_error_details is not enabled), so a
-            # ValueError carrying a credential would leak through. Mutating
-            # args preserves the exception type and traceback.
-            if redaction_enabled():
-                secrets = with_serialized_variants(known_secret_values())
-                if secrets and getattr(exc, "args", None):
-                    # scrub_obj covers non-string args too (dicts/lists a
-                    # library packed into the exception); non-JSON-shaped
-                    # args pass through unchanged.
-                    exc.args = tuple(scrub_obj(arg, secrets) for arg in exc.args)
-            raise
-        if not redaction_enabled():
-            return result
-        secrets = with_serialized_variants(known_secret_values())
-        if not secrets:
+        with outbound_payload() as payload:
+            try:
+                result = await call_next(context)
+            except Exception as exc:
+                # Not just ToolError: FastMCP forwards non-ToolError exception
+                # text to clients too (mask_error_details is not enabled), so
+                # a ValueError carrying a credential would leak through.
+                # Mutating args preserves the exception type and traceback.
+                if redaction_enabled():
+                    secrets = with_serialized_variants(known_secret_values())
+                    if secrets and getattr(exc, "args", None):
+                        # scrub_obj covers non-string args too (dicts/lists a
+                        # library packed into the exception); non-JSON-shaped
+                        # args pass through unchanged.
+                        exc.args = tuple(scrub_obj(arg, secrets) for arg in exc.args)
+                raise
+            if not redaction_enabled():
+                return result
+            secrets = with_serialized_variants(known_secret_values())
+            if not secrets:
+                return result
+            for block in getattr(result, "content", None) or []:
+                text = getattr(block, "text", None)
+                if isinstance(text, str):
+                    scrubbed = scrub_text(text, secrets)
+                    if scrubbed != text:
+                        block.text = scrubbed
+            structured = getattr(result, "structured_content", None)
+            if structured is not None and _may_carry_secret(
+                payload.structured_text(structured), secrets
+            ):
+                result.structured_content = scrub_obj(structured, secrets)
             return result
-        for block in getattr(result, "content", None) or []:
-            text = getattr(block, "text", None)
-            if isinstance(text, str):
-                scrubbed = scrub_text(text, secrets)
-                if scrubbed != text:
-                    block.text = scrubbed
-        structured = getattr(result, "structured_content", None)
-        if structured is not None:
-            result.structured_content = scrub_obj(structured, secrets)
-        return result
+
+
+def _may_carry_secret(serialized: str | None, secrets: Sequence[str]) -> bool:
+    """Whether a structure whose JSON is ``serialized`` can contain a secret.
+
+    JSON escapes character by character, so a secret anywhere in the structure
+    (key or value) appears in its serialization either verbatim or in the
+    escaped form ``with_serialized_variants`` adds. A miss therefore proves
+    the walk would change nothing; a hit (or an unserializable structure)
+    takes the walk.
+    """
+    if serialized is None:
+        return True
+    return any(secret in serialized for secret in secrets)
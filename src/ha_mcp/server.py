@@ -227,8 +227,15 @@ class HomeAssistantSmartMCPServer:
         # the skill guide tool are registered so it can wrap everything)
         self._apply_tool_search()
 
+        # Per-tool latency / size telemetry and the usage log. Outermost, so
+        # the time it records is what the client waited, every middleware
+        # below included.
+        from .telemetry import TelemetryMiddleware
+
+        self.mcp.add_middleware(TelemetryMiddleware())
+
         # Keep the pre-rename tool names callable for clients that still hold
-        # an older catalog. First in the chain, so everything after it sees the
+        # an older catalog. Next in the chain, so everything after it sees the
         # current name it is keyed on.
         from .tools.renamed_tool_middleware import RenamedToolAliasMiddleware
 
@@ -1040,10 +1047,11 @@ class HomeAssistantSmartMCPServer:
         layer (``build_settings_handlers``) can discover the same queue
         via ``getattr(server, "approval_queue", None)``.
 
-        Policies are reloaded from disk on every gated call (a small
-        JSON file, typically well under a kB) so live updates via the
-        UI take effect immediately without restart and without a stale
-        in-memory cache.
+        The compiled policy is cached on the policy file's mtime/inode
+        and dropped by every save, so live updates via the UI (or the
+        stdio settings sidecar) take effect on the next call without a
+        restart, and a gated call costs one ``stat`` rather than a read
+        and parse.
         """
         # One-time ANY-match schema migration (PR #1993) runs even when
         # policies are disabled, so the file already matches the editor's
@@ -1069,9 +1077,9 @@ class HomeAssistantSmartMCPServer:
 
         try:
             from .policy.approval_queue import ApprovalQueue
+            from .policy.evaluator import CompiledPolicy
             from .policy.middleware import PolicyMiddleware
-            from .policy.model import Policy
-            from .policy.persistence import load_policy
+            from .policy.persistence import load_compiled_policy
             from .utils.data_paths import get_data_dir
         except ImportError:
             logger.exception(
@@ -1084,12 +1092,10 @@ class HomeAssistantSmartMCPServer:
         self.approval_queue = ApprovalQueue()
         data_dir = get_data_dir()
 
-        def _policy_provider() -> Policy:
-            # Re-read from disk each call so UI edits via PUT
-            # /api/policy/config take effect immediately. The file is
-            # tiny; the cost is negligible relative to the network/HA
-            # roundtrip of a gated tool call.
-            return load_policy(data_dir)
+        def _policy_provider() -> CompiledPolicy:
+            # Checked against the file on each call so UI edits via PUT
+            # /api/policy/config take effect immediately.
+            return load_compiled_policy(data_dir)
 
         try:
             self.mcp.add_middleware(
@@ -650,6 +650,8 @@ def register_settings_routes(
         ("/api/settings/info", ["GET"], "settings_info"),
         ("/api/settings/features", ["GET"], "get_feature_flags"),
         ("/api/settings/features", ["POST"], "save_feature_flags"),
+        # Per-tool latency / size percentiles (Performance tab)
+        ("/api/settings/telemetry", ["GET"], "get_telemetry"),
         # Theme / accessibility prefs (#1574 review) — server-side copy so
         # they survive a stdio sidecar origin change (stable by default
         # since #2131, but fresh on first spawn / lost ui.state / pin
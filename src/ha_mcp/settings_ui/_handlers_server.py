@@ -361,6 +361,21 @@ async def _settings_info(
     )
 
 
+# ---- Telemetry ----
+
+
+async def _get_telemetry(
+    server: HomeAssistantSmartMCPServer | None, _: Request
+) -> JSONResponse:
+    # The registry lives in the process running the tools; the stdio sidecar
+    # (server=None) is a separate process and has nothing to report.
+    if server is None:
+        return JSONResponse({"available": False, "tools": []})
+    from ..telemetry import get_telemetry
+
+    return JSONResponse({"available": True, **get_telemetry().snapshot()})
+
+
 # ---- Feature flags ----
 
 
@@ -818,7 +833,7 @@ async def _save_feature_flags(
 def build_server_handlers(
     server: HomeAssistantSmartMCPServer | None, *, is_sidecar: bool
 ) -> dict[str, Any]:
-    """Construct the restart / settings-info / feature-flag route handlers."""
+    """Construct the restart / settings-info / feature-flag / telemetry handlers."""
 
     async def restart_addon(request: Request) -> JSONResponse:
         return await _restart_addon(server, request)
@@ -832,9 +847,13 @@ def build_server_handlers(
     async def save_feature_flags(request: Request) -> JSONResponse:
         return await _save_feature_flags(server, request)
 
+    async def get_telemetry(request: Request) -> JSONResponse:
+        return await _get_telemetry(server, request)
+
     return {
         "restart_addon": restart_addon,
         "settings_info": settings_info,
         "get_feature_flags": get_feature_flags,
         "save_feature_flags": save_feature_flags,
+        "get_telemetry": get_telemetry,
     }
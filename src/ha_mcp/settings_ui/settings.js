@@ -3662,6 +3662,57 @@ setInterval(() => {
   }
 }, 3000);
 
+// ===== Performance (tool telemetry) =====
+function _telemetryBytes(n) {
+  if (n < 1024) return n + ' B';
+  if (n < 1024 * 1024) return (n / 1024).toFixed(1) + ' KiB';
+  return (n / (1024 * 1024)).toFixed(1) + ' MiB';
+}
+
+async function loadTelemetry() {
+  const body = document.getElementById('telemetryBody');
+  let data;
+  try {
+    const resp = await fetch('./api/settings/telemetry', {cache: 'no-store'});
+    data = await resp.json();
+    if (!resp.ok) throw new Error('HTTP ' + resp.status);
+  } catch (err) {
+    body.innerHTML = `<div class="backup-empty">${escapeHtml(t('performance.errors.load', {}, 'Error loading tool statistics'))}</div>`;
+    return;
+  }
+  if (!data.available) {
+    body.innerHTML = `<div class="backup-empty">${escapeHtml(t('performance.unavailable', {}, 'Tool call statistics live in the MCP server process and are not available from this settings window.'))}</div>`;
+    return;
+  }
+  const tools = data.tools || [];
+  if (!tools.length) {
+    body.innerHTML = `<div class="backup-empty">${escapeHtml(t('performance.empty', {}, 'No tool calls recorded yet.'))}</div>`;
+    return;
+  }
+  const head = [
+    ['tool', 'Tool'], ['calls', 'Calls'], ['errors', 'Errors'],
+    ['p50', 'p50 (ms)'], ['p95', 'p95 (ms)'], ['p99', 'p99 (ms)'],
+    ['ha_share', 'Home Assistant time'], ['size_p95', 'p95 response size'],
+  ].map(([key, fallback]) => `<th scope="col">${escapeHtml(t('performance.columns.' + key, {}, fallback))}</th>`).join('');
+  const rows = tools.map(row => {
+    const total = row.ha_ms_total + row.local_ms_total;
+    const share = total > 0 ? Math.round(100 * row.ha_ms_total / total) + '%' : '—';
+    const ms = v => v.toFixed(1);
+    return '<tr>' +
+      `<th scope="row"><code>${escapeHtml(row.tool)}</code></th>` +
+      `<td>${row.calls}</td><td>${row.errors}</td>` +
+      `<td>${ms(row.latency_ms.p50)}</td><td>${ms(row.latency_ms.p95)}</td><td>${ms(row.latency_ms.p99)}</td>` +
+      `<td>${share}</td><td>${_telemetryBytes(row.response_bytes.p95)}</td>` +
+      '</tr>';
+  }).join('');
+  body.innerHTML = `<table class="telemetry-table"><thead><tr>${head}</tr></thead><tbody>${rows}</tbody></table>`;
+}
+
+(function wireTelemetryRefresh() {
+  const btn = document.getElementById('telemetryRefresh');
+  if (btn) btn.addEventListener('click', loadTelemetry);
+})();
+
 // ===== Tab switching =====
 // Generic dispatcher — every .tab button names its target panel via
 // data-panel, every .panel has matching id="panel-<name>". Adding a
@@ -3684,6 +3735,7 @@ function activateTab(target, opts) {
   if (target === 'backups') { loadBackupConfig(); loadBackups(); }
   if (target === 'tool-security-policies') { policyLoadConfig(); policyLoadPending(); }
   if (target === 'entity-visibility') { visibilityLoadConfig(); }
+  if (target === 'performance') { loadTelemetry(); }
   if (target === 'tools') {
     // Refresh gated-toggle + read-only state in case the user changed
     // them from another tab while it was active.
@@ -3742,6 +3794,7 @@ const ADVANCED_FIELD_META = {
   backup_hint:         { label: "Backup-hint level",           help: "Tunes how strongly the LLM is prompted to take a full-HA snapshot before risky writes." },
   dashboard_screenshot_engine_url: { label: "Dashboard screenshot engine URL", help: "Base URL of the screenshot engine (e.g. http://puppet:10000). Leave blank to auto-discover the Puppet App (add-on) via the Supervisor (HA OS / Supervised). Only used when the Dashboard Screenshot beta feature is enabled. Takes effect without a restart." },
   enable_websocket:    { label: "Enable WebSocket",            help: "WebSocket-based state monitoring. Disabling falls back to polling; many tools degrade. Restart required." },
+  enable_state_mirror: { label: "In-memory state mirror",      help: "Keeps a live copy of every entity state over the WebSocket so tools stop downloading the full state table on each call. Speeds up search and overview on large installs. Restart required." },
   enabled_tool_modules: { label: "Enabled tool modules",       help: "Comma-separated module names, or 'all'. Restricts which tool registry modules load at startup. Restart required." },
   enable_dashboard_partial_tools: { label: "Dashboard partial-update tools", help: "Token-efficient partial dashboard tools. Disable for clients with programmatic tool use." },
   mcp_server_name:     { label: "MCP server name",             help: "Reported in MCP handshake. Restart required." },
@@ -3767,7 +3820,7 @@ const ADVANCED_FIELD_META = {
 // is per-request.
 const ADVANCED_RESTART_REQUIRED = new Set([
   "timeout", "max_retries", "verify_ssl",
-  "enabled_tool_modules", "enable_websocket",
+  "enabled_tool_modules", "enable_websocket", "enable_state_mirror",
   "log_level", "debug",
   "mcp_server_name", "mcp_server_version", "environment",
   // fuzzy_threshold is read once by SmartSearchTools at the
@@ -1353,6 +1353,13 @@ def _build_app(
             handlers["save_feature_flags"],
             methods=["POST"],
         ),
+        # The Performance tab reports "unavailable": the stats live in the
+        # MCP process, not this one.
+        Route(
+            f"{secret_prefix}/api/settings/telemetry",
+            handlers["get_telemetry"],
+            methods=["GET"],
+        ),
         # Theme / accessibility prefs (#1574 review). The sidecar is the
         # very mode these exist for: its port (= the localStorage origin)
         # is stable by default since #2131 but still changes on first
@@ -0,0 +1,478 @@
+"""Per-tool latency and response-size telemetry.
+
+:class:`TelemetryMiddleware` is the outermost middleware, so it times every
+tool call exactly as the client experiences it. Each call is folded into a
+per-tool :class:`ToolStats`: call and error counts, a latency histogram, a
+response-size histogram, and the split between time spent waiting on Home
+Assistant and time spent locally.
+
+The split comes from :func:`ha_round_trip`, which wraps the REST client's
+``_raw_request`` and the WebSocket client's command senders. While a call is
+in flight it owns a :class:`CallClock` in a context variable; each round trip
+started under it (including from tasks the tool gathers) marks the clock busy,
+and the clock accumulates the wall-clock union of those busy intervals.
+Overlapping trips therefore count once, and local time is the remainder.
+
+The histograms are log-linear in the HdrHistogram style: values below
+``2 * _SUB_BUCKETS`` get a bucket each, and every power-of-two range above
+that is split into ``_SUB_BUCKETS`` equal buckets, bounding the relative
+error of a reported percentile to 1/32 at any magnitude. Recording is an
+integer bit-length computation and a dict increment; memory grows with the
+number of distinct magnitudes seen, not with the number of calls.
+
+The registry is read by the settings UI (``/api/settings/telemetry``) and by
+the opt-in Prometheus ``/metrics`` route (see
+:func:`ha_mcp.browser_landing.register_metrics`). Components with their own
+counters (the OAuth client pool) publish them through
+:meth:`TelemetryRegistry.register_collector`. The middleware also records
+each call to :mod:`ha_mcp.utils.usage_logger`, which used to happen only for
+tools decorated with ``@log_tool_usage``.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from typing import Any
+
+from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
+
+from .renamed_tools import current_tool_name
+from .utils.usage_logger import log_tool_call
+
+_SUB_BUCKET_BITS = 5
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+
+# Quantiles exposed by the settings UI and the Prometheus summaries.
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Histogram:
+    """Log-linear histogram of non-negative integers (HdrHistogram-style)."""
+
+    __slots__ = ("_counts", "count", "max", "sum")
+
+    def __init__(self) -> None:
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.sum = 0
+        self.max = 0
+
+    @staticmethod
+    def _index(value: int) -> int:
+        if value < 2 * _SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+        return (shift + 1) * _SUB_BUCKETS + (value >> shift) - _SUB_BUCKETS
+
+    @staticmethod
+    def _upper_bound(index: int) -> int:
+        if index < 2 * _SUB_BUCKETS:
+            return index
+        shift = index // _SUB_BUCKETS - 1
+        mantissa = index % _SUB_BUCKETS + _SUB_BUCKETS
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        value = max(value, 0)
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def percentile(self, quantile: float) -> int:
+        """Smallest recorded bucket bound with ``quantile`` of values at or
+        below it (clamped to the exact maximum); 0 when empty."""
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+        return self.max
+
+    def copy(self) -> Histogram:
+        clone = Histogram()
+        clone._counts = dict(self._counts)
+        clone.count, clone.sum, clone.max = self.count, self.sum, self.max
+        return clone
+
+
+class ToolStats:
+    """Accumulated telemetry for one tool. Times are in microseconds."""
+
+    __slots__ = ("calls", "errors", "ha_requests", "ha_us", "latency_us", "size")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.ha_requests = 0
+        self.ha_us = 0
+        self.latency_us = Histogram()
+        self.size = Histogram()
+
+    @property
+    def local_us(self) -> int:
+        return self.latency_us.sum - self.ha_us
+
+    def copy(self) -> ToolStats:
+        clone = ToolStats()
+        clone.calls, clone.errors = self.calls, self.errors
+        clone.ha_requests, clone.ha_us = self.ha_requests, self.ha_us
+        clone.latency_us = self.latency_us.copy()
+        clone.size = self.size.copy()
+        return clone
+
+
+class TelemetryRegistry:
+    """Thread-safe per-tool stats (the in-process server shares it with HA)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tools: dict[str, ToolStats] = {}
+        self._collectors: dict[str, Callable[[], Mapping[str, float]]] = {}
+        self.started_at = datetime.now(UTC)
+
+    def register_collector(
+        self, name: str, collect: Callable[[], Mapping[str, float]]
+    ) -> None:
+        """Publish ``collect()``'s values alongside the tool stats.
+
+        Keys ending in ``_total`` are exported as counters, the rest as
+        gauges, each as ``ha_mcp_<name>_<key>``. Registering a name again
+        replaces the previous collector; :meth:`reset` keeps collectors.
+        """
+        with self._lock:
+            self._collectors[name] = collect
+
+    def collect(self) -> dict[str, dict[str, float]]:
+        """Every registered collector's current values, keyed by name.
+
+        The collectors are called outside the registry lock, so one that
+        takes its own lock (the OAuth client pool does) cannot deadlock
+        against :meth:`record`.
+        """
+        with self._lock:
+            collectors = list(self._collectors.items())
+        return {name: dict(collect()) for name, collect in collectors}
+
+    def record(
+        self,
+        tool_name: str,
+        *,
+        latency_us: int,
+        ha_us: int = 0,
+        ha_requests: int = 0,
+        response_bytes: int | None = None,
+        error: bool = False,
+    ) -> None:
+        with self._lock:
+            stats = self._tools.get(tool_name)
+            if stats is None:
+                stats = self._tools[tool_name] = ToolStats()
+            stats.calls += 1
+            if error:
+                stats.errors += 1
+            stats.latency_us.record(latency_us)
+            stats.ha_us += min(ha_us, latency_us)
+            stats.ha_requests += ha_requests
+            if response_bytes is not None:
+                stats.size.record(response_bytes)
+
+    def stats(self) -> dict[str, ToolStats]:
+        """A consistent copy of every tool's stats."""
+        with self._lock:
+            return {name: stats.copy() for name, stats in self._tools.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tools.clear()
+            self.started_at = datetime.now(UTC)
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-ready summary for the settings UI, busiest tool first."""
+        tools = []
+        for name, stats in sorted(
+            self.stats().items(), key=lambda item: (-item[1].calls, item[0])
+        ):
+            latency = stats.latency_us
+            tools.append(
+                {
+                    "tool": name,
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "latency_ms": {
+                        **{
+                            _quantile_key(q): latency.percentile(q) / 1000
+                            for q in QUANTILES
+                        },
+                        "max": latency.max / 1000,
+                        "mean": round(latency.sum / stats.calls / 1000, 3),
+                    },
+                    "ha_ms_total": stats.ha_us / 1000,
+                    "local_ms_total": stats.local_us / 1000,
+                    "ha_requests": stats.ha_requests,
+                    "response_bytes": {
+                        **{
+                            _quantile_key(q): stats.size.percentile(q)
+                            for q in QUANTILES
+                        },
+                        "max": stats.size.max,
+                    },
+                }
+            )
+        return {
+            "since": self.started_at.isoformat(),
+            "tools": tools,
+            "collectors": self.collect(),
+        }
+
+    def render_prometheus(self) -> str:
+        """The registry in the Prometheus text exposition format (0.0.4)."""
+        stats = sorted(self.stats().items())
+        lines: list[str] = []
+        _counter(
+            lines,
+            "ha_mcp_tool_calls_total",
+            "Tool calls handled.",
+            ((name, s.calls) for name, s in stats),
+        )
+        _counter(
+            lines,
+            "ha_mcp_tool_errors_total",
+            "Tool calls that raised.",
+            ((name, s.errors) for name, s in stats),
+        )
+        _summary(
+            lines,
+            "ha_mcp_tool_duration_seconds",
+            "Tool call latency as seen by the client.",
+            ((name, s.latency_us) for name, s in stats),
+            scale=1e-6,
+        )
+        _counter(
+            lines,
+            "ha_mcp_tool_ha_seconds_total",
+            "Wall-clock time tool calls spent waiting on Home Assistant.",
+            ((name, s.ha_us * 1e-6) for name, s in stats),
+        )
+        _counter(
+            lines,
+            "ha_mcp_tool_local_seconds_total",
+            "Wall-clock time tool calls spent outside Home Assistant round trips.",
+            ((name, s.local_us * 1e-6) for name, s in stats),
+        )
+        _counter(
+            lines,
+            "ha_mcp_tool_ha_requests_total",
+            "Home Assistant REST and WebSocket requests made by tool calls.",
+            ((name, s.ha_requests) for name, s in stats),
+        )
+        _summary(
+            lines,
+            "ha_mcp_tool_response_bytes",
+            "Size of the text returned by tool calls.",
+            ((name, s.size) for name, s in stats),
+        )
+        for collector, values in sorted(self.collect().items()):
+            for key, value in sorted(values.items()):
+                metric = f"ha_mcp_{collector}_{key}"
+                kind = "counter" if key.endswith("_total") else "gauge"
+                lines += [f"# TYPE {metric} {kind}", f"{metric} {_number(value)}"]
+        return "\n".join(lines) + "\n"
+
+
+def _quantile_key(quantile: float) -> str:
+    return f"p{round(quantile * 100)}"
+
+
+def _label(tool_name: str) -> str:
+    escaped = tool_name.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+    return f'tool="{escaped}"'
+
+
+def _number(value: float) -> str:
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _counter(
+    lines: list[str], name: str, help_text: str, rows: Iterable[tuple[str, float]]
+) -> None:
+    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    lines += [f"{name}{{{_label(tool)}}} {_number(value)}" for tool, value in rows]
+
+
+def _summary(
+    lines: list[str],
+    name: str,
+    help_text: str,
+    rows: Iterable[tuple[str, Histogram]],
+    scale: float | None = None,
+) -> None:
+    def fmt(value: int) -> str:
+        return _number(value * scale) if scale is not None else str(value)
+
+    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} summary"]
+    for tool, histogram in rows:
+        label = _label(tool)
+        for quantile in QUANTILES:
+            lines.append(
+                f'{name}{{{label},quantile="{quantile}"}} '
+                f"{fmt(histogram.percentile(quantile))}"
+            )
+        lines.append(f"{name}_sum{{{label}}} {fmt(histogram.sum)}")
+        lines.append(f"{name}_count{{{label}}} {histogram.count}")
+
+
+_registry = TelemetryRegistry()
+
+
+def get_telemetry() -> TelemetryRegistry:
+    """The process-wide telemetry registry."""
+    return _registry
+
+
+class CallClock:
+    """Home Assistant round-trip time of one in-flight tool call.
+
+    A call dispatched from inside another (the tool-search call proxies
+    re-enter the middleware chain) gets its own clock chained to the outer
+    one, and a round trip marks every clock in the chain busy.
+    """
+
+    __slots__ = ("_active", "_busy_since", "dispatched", "ha_ns", "parent", "requests")
+
+    def __init__(self, parent: CallClock | None = None) -> None:
+        self.parent = parent
+        self.ha_ns = 0
+        self.requests = 0
+        # Set when a nested tool call ran under this one.
+        self.dispatched = False
+        self._active = 0
+        self._busy_since = 0
+        if parent is not None:
+            parent.dispatched = True
+
+    def _chain(self) -> Iterable[CallClock]:
+        clock: CallClock | None = self
+        while clock is not None:
+            yield clock
+            clock = clock.parent
+
+    def begin_round_trip(self) -> None:
+        now = time.perf_counter_ns()
+        for clock in self._chain():
+            if not clock._active:
+                clock._busy_since = now
+            clock._active += 1
+            clock.requests += 1
+
+    def end_round_trip(self) -> None:
+        now = time.perf_counter_ns()
+        for clock in self._chain():
+            clock._active -= 1
+            if not clock._active:
+                clock.ha_ns += now - clock._busy_since
+
+
+_current_clock: ContextVar[CallClock | None] = ContextVar(
+    "telemetry_call_clock", default=None
+)
+
+
+def call_in_progress() -> bool:
+    """True inside a tool call timed by :class:`TelemetryMiddleware`."""
+    return _current_clock.get() is not None
+
+
+def ha_round_trip[**P, R](
+    func: Callable[P, Awaitable[R]],
+) -> Callable[P, Awaitable[R]]:
+    """Attribute the time awaiting ``func`` to Home Assistant for the
+    current tool call; a plain passthrough outside one."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        clock = _current_clock.get()
+        if clock is None:
+            return await func(*args, **kwargs)
+        clock.begin_round_trip()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            clock.end_round_trip()
+
+    return wrapper
+
+
+def _text_size(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def _response_size(result: Any) -> int | None:
+    """UTF-8 size of a tool result's text content blocks."""
+    blocks = getattr(result, "content", None)
+    if not blocks:
+        return None
+    return sum(
+        _text_size(text)
+        for block in blocks
+        if isinstance(text := getattr(block, "text", None), str)
+    )
+
+
+class TelemetryMiddleware(Middleware):
+    """Time every tool call and record it to the registry and the usage log.
+
+    Registered first, so it is outermost and its latency includes every other
+    middleware (an approval wait under a security policy included). A call
+    that dispatched another (a tool-search call proxy) is left out of the
+    usage log: the proxied call re-entered the chain under its real name and
+    was logged there.
+    """
+
+    async def on_call_tool(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> Any:
+        name = current_tool_name(context.message.name)
+        clock = CallClock(_current_clock.get())
+        token = _current_clock.set(clock)
+        start = time.perf_counter_ns()
+        result: Any = None
+        error_message: str | None = None
+        try:
+            result = await call_next(context)
+            return result
+        except BaseException as e:
+            # str() is empty on a bare CancelledError; the class name stands in.
+            error_message = str(e) or type(e).__name__
+            raise
+        finally:
+            _current_clock.reset(token)
+            latency_us = (time.perf_counter_ns() - start) // 1000
+            size = _response_size(result)
+            _registry.record(
+                name,
+                latency_us=latency_us,
+                ha_us=clock.ha_ns // 1000,
+                ha_requests=clock.requests,
+                response_bytes=size,
+                error=error_message is not None,
+            )
+            if not clock.dispatched:
+                log_tool_call(
+                    tool_name=name,
+                    parameters=context.message.arguments or {},
+                    execution_time_ms=latency_us / 1000,
+                    success=error_message is None,
+                    error_message=error_message,
+                    response_size_bytes=size,
+                )
@@ -490,10 +490,10 @@ class DeviceControlTools:
     ) -> dict[str, Any]:
         """Check status of a device operation, waiting up to ``timeout_seconds`` for completion.
 
-        Polls the in-memory operation registry (mutated by the WebSocket
-        listener as state changes arrive) while the operation is pending, at
-        0.2s intervals except for a final shorter poll that lands exactly on
-        the deadline. Returns the final structured status —
+        While the operation is pending, waits on it until the WebSocket
+        listener's state change settles it, its own timeout passes, or the
+        deadline is reached — no polling, so the call returns the moment the
+        confirming state change lands. Returns the final structured status —
         completed/failed/timeout/pending — produced by ``control_device_smart``.
         """
         operation = get_operation_from_memory(operation_id)
@@ -513,8 +513,8 @@ class DeviceControlTools:
             )
 
         # Wait up to timeout_seconds for the operation to leave the pending state.
-        # The WebSocket listener mutates operation.status as state changes arrive,
-        # so polling memory is sufficient — no need to subscribe again. Uses
+        # The WebSocket listener settles operation.status as state changes arrive
+        # and wakes waiters, so there is no need to subscribe again. Uses
         # time.monotonic() so the deadline can be cleanly patched in tests.
         if operation.status.value == "pending" and timeout_seconds > 0:
             deadline = time.monotonic() + timeout_seconds
@@ -522,13 +522,13 @@ class DeviceControlTools:
                 remaining = deadline - time.monotonic()
                 if remaining <= 0:
                     break
-                await asyncio.sleep(min(0.2, remaining))
+                await operation.wait_for_change(remaining)
                 refreshed = get_operation_from_memory(operation_id)
                 if refreshed is None:
                     raise_tool_error(
                         create_error_response(
                             ErrorCode.RESOURCE_NOT_FOUND,
-                            "Operation cleaned up during status poll",
+                            "Operation cleaned up while awaiting its status",
                             suggestions=[
                                 "Operation may have completed and been purged before "
                                 + "verification finished",
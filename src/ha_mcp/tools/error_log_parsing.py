@@ -8,15 +8,19 @@ component-grouped issues.
 
 Split out of ``tools_utility`` under AGENTS.md § Module Size: the parsing is
 self-contained and shares nothing with the tool plumbing but its input string.
+``ErrorLogIndex`` parses the lines of the client's ``ErrorLogTail`` as they
+arrive, so repeated and filtered queries do not parse the log again.
 """
 
+import bisect
 import re
+import weakref
 from typing import Any, NamedTuple
 
+from ..client.error_log_tail import ErrorLogTail
+
 # Full HA log line, e.g.
 # "2026-05-27 10:15:23.456 ERROR (MainThread) [homeassistant.components.zha] msg"
-# Distinct from `_LOG_LEVEL_RE` in `tools_utility`, which only sniffs the level
-# out of a line for the raw path's filter.
 # The thread field is matched lazily instead of as `\([^)]*\)`: since Python 3.10
 # an unnamed thread is called "Thread-1 (target_fn)", so the field itself can
 # contain parentheses, and a class that cannot cross them drops every line those
@@ -130,6 +134,232 @@ class _ExtractedLines(NamedTuple):
     window_end: str | None
 
 
+# What ``_parse_log_line`` returns for lines that are not log entries.
+_BLANK = "blank"
+_UNPARSEABLE = "unparseable"
+
+
+def _parse_log_line(line: str) -> dict[str, str] | str:
+    """One raw line as a log entry, or ``_BLANK`` / ``_UNPARSEABLE``."""
+    # Strip ANSI *before* matching: on Supervisor-backed installs the line
+    # arrives colour-wrapped. Both ends matter for separate reasons — the
+    # leading code alone already defeats the ^-anchor so the line matches
+    # nothing, and a leading-only strip would leave the trailing reset
+    # inside `message`, splitting the dedup key for one recurring error.
+    clean = _strip_ansi(line).strip()
+    if not clean:
+        return _BLANK
+    match = _HA_LOG_LINE_RE.match(clean)
+    if not match:
+        return _UNPARSEABLE
+    timestamp, log_level, logger_name, message = match.groups()
+    return {
+        "timestamp": _normalize_timestamp(timestamp),
+        "level": log_level.upper(),
+        "logger": logger_name,
+        # Kept whole: the display cap is applied at dedup time, because
+        # keying on a capped message merges two errors that differ only
+        # past the cap into one issue with a summed count.
+        "message": message,
+    }
+
+
+def _integration_of(logger_name: str) -> str | None:
+    """The integration domain a logger belongs to, if it belongs to one."""
+    parts = logger_name.split(".")
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    if parts[:2] == ["homeassistant", "components"] and len(parts) > 2:
+        return parts[2]
+    return None
+
+
+class ErrorLogIndex:
+    """Parsed lines of an ``ErrorLogTail``, indexed by level, logger and integration.
+
+    Lines are parsed once, when they first appear in the tail; a filtered
+    query then reads the matching entries off the index. Positions are the
+    tail's line numbers.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._epoch: int | None = None
+        self._reset(0)
+
+    def _reset(self, first: int) -> None:
+        self._first = first
+        self._parsed: list[dict[str, str] | str] = []
+        self._entries: list[int] = []
+        self._by_key: dict[tuple[str, str], list[int]] = {}
+        self._blank = 0
+        self._window: tuple[str | None, str | None] | None = None
+        # The last line as indexed, while the tail may still complete it.
+        self._open_line: str | None = None
+
+    @property
+    def _until(self) -> int:
+        return self._first + len(self._parsed)
+
+    def sync(self, tail: ErrorLogTail) -> None:
+        """Parse the tail's new complete lines and forget the ones it dropped."""
+        if self._epoch != tail.epoch:
+            self._epoch = tail.epoch
+            self._reset(tail.first)
+        if tail.first > self._first:
+            self._drop_before(min(tail.first, self._until))
+            self._first = tail.first
+        if self._open_line is not None and self._parsed:
+            last = self._until - 1
+            if last >= tail.until or tail.line(last) != self._open_line:
+                self._pop_last()
+        for position in range(self._until, tail.until):
+            self._add(position, _parse_log_line(tail.line(position)))
+        self._open_line = (
+            None if tail.terminated or not self._parsed else tail.line(self._until - 1)
+        )
+
+    def _add(self, position: int, parsed: dict[str, str] | str) -> None:
+        self._parsed.append(parsed)
+        if isinstance(parsed, str):
+            self._blank += parsed == _BLANK
+            return
+        self._window = None
+        self._entries.append(position)
+        keys = [("level", parsed["level"]), ("logger", parsed["logger"])]
+        integration = _integration_of(parsed["logger"])
+        if integration:
+            keys.append(("integration", integration))
+        for key in keys:
+            self._by_key.setdefault(key, []).append(position)
+
+    def _pop_last(self) -> None:
+        parsed = self._parsed.pop()
+        if isinstance(parsed, str):
+            self._blank -= parsed == _BLANK
+            return
+        position = self._entries.pop()
+        self._window = None
+        for key, positions in list(self._by_key.items()):
+            if positions[-1] == position:
+                positions.pop()
+                if not positions:
+                    del self._by_key[key]
+
+    def _drop_before(self, position: int) -> None:
+        dropped = self._parsed[: position - self._first]
+        self._blank -= sum(1 for parsed in dropped if parsed == _BLANK)
+        self._window = None
+        del self._parsed[: position - self._first]
+        del self._entries[: bisect.bisect_left(self._entries, position)]
+        for key, positions in list(self._by_key.items()):
+            del positions[: bisect.bisect_left(positions, position)]
+            if not positions:
+                del self._by_key[key]
+
+    def entry(self, position: int) -> dict[str, str]:
+        """The entry parsed from one line; only valid for entry positions."""
+        parsed = self._parsed[position - self._first]
+        assert not isinstance(parsed, str)
+        return parsed
+
+    def positions(
+        self,
+        level: str | None = None,
+        logger_name: str | None = None,
+        integration: str | None = None,
+    ) -> list[int]:
+        """Entry positions, in log order, matching every filter given."""
+        filters = [
+            self._by_key.get((name, value), [])
+            for name, value in (
+                ("level", level),
+                ("logger", logger_name),
+                ("integration", integration.lower() if integration else None),
+            )
+            if value
+        ]
+        if not filters:
+            return self._entries
+        narrowest, *others = sorted(filters, key=len)
+        if not others:
+            return narrowest
+        wanted = set.intersection(*(set(positions) for positions in others))
+        return [position for position in narrowest if position in wanted]
+
+    def block(self, position: int) -> list[int]:
+        """An entry's line and the continuation lines (tracebacks) after it."""
+        end = position + 1
+        while end < self._until and isinstance(self._parsed[end - self._first], str):
+            end += 1
+        return list(range(position, end))
+
+    def extract(
+        self,
+        search: str | None = None,
+        level: str | None = None,
+        integration: str | None = None,
+        since: str | None = None,
+    ) -> _ExtractedLines:
+        """Entries matching the filters, with the tallies of every indexed line.
+
+        ``since`` is a log timestamp (``YYYY-MM-DD HH:MM:SS``, HA local
+        time); entries logged before it are left out.
+        """
+        needle = search.lower() if search else None
+        entries: list[dict[str, str]] = []
+        for position in self.positions(level=level, integration=integration):
+            entry = self.entry(position)
+            if since and entry["timestamp"] < since:
+                continue
+            if (
+                needle
+                and needle not in entry["message"].lower()
+                and needle not in entry["logger"].lower()
+            ):
+                continue
+            entries.append(entry)
+        window_start, window_end = self._covered_window()
+        return _ExtractedLines(
+            entries=entries,
+            matched=len(self._entries),
+            unparseable=len(self._parsed) - len(self._entries) - self._blank,
+            blank=self._blank,
+            window_start=window_start,
+            window_end=window_end,
+        )
+
+    def _covered_window(self) -> tuple[str | None, str | None]:
+        """Earliest and latest timestamp of every indexed entry.
+
+        Spans every parseable line, filtered or not: it describes the log
+        slice that was read, not a summary's contents. Bounds rather than
+        first/last, as lines are not guaranteed to be in order.
+        """
+        if self._window is None:
+            timestamps = [self.entry(p)["timestamp"] for p in self._entries]
+            self._window = (
+                min(timestamps, default=None),
+                max(timestamps, default=None),
+            )
+        return self._window
+
+
+# One index per tail, dropped along with it.
+_INDEXES: weakref.WeakKeyDictionary[ErrorLogTail, ErrorLogIndex] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def index_error_log(tail: ErrorLogTail) -> ErrorLogIndex:
+    """The index of ``tail``, brought up to date with it."""
+    index = _INDEXES.get(tail)
+    if index is None:
+        index = _INDEXES[tail] = ErrorLogIndex()
+    index.sync(tail)
+    return index
+
+
 def _extract_log_entries(
     lines: list[str],
     search: str | None = None,
@@ -142,66 +372,11 @@ def _extract_log_entries(
     the HA log format at all — lines dropped by ``level``/``search`` are simply
     absent from ``entries``, never counted as unparseable.
     """
-    entries: list[dict[str, str]] = []
-    matched = 0
-    unparseable = 0
-    blank = 0
-    window_start: str | None = None
-    window_end: str | None = None
-    needle = search.lower() if search else None
-
-    for line in lines:
-        # Strip ANSI *before* matching: on Supervisor-backed installs the line
-        # arrives colour-wrapped. Both ends matter for separate reasons — the
-        # leading code alone already defeats the ^-anchor so the line matches
-        # nothing, and a leading-only strip would leave the trailing reset
-        # inside `message`, splitting the dedup key for one recurring error.
-        clean = _strip_ansi(line).strip()
-        if not clean:
-            blank += 1
-            continue
-        match = _HA_LOG_LINE_RE.match(clean)
-        if not match:
-            unparseable += 1
-            continue
-        matched += 1
-        timestamp, log_level, logger_name, message = match.groups()
-        timestamp = _normalize_timestamp(timestamp)
-        # Widen the covered window on every parseable line, filtered or not:
-        # it describes the log slice that was read, not the summary's contents.
-        if window_start is None or timestamp < window_start:
-            window_start = timestamp
-        if window_end is None or timestamp > window_end:
-            window_end = timestamp
-        log_level = log_level.upper()
-        if level and log_level != level:
-            continue
-        if (
-            needle
-            and needle not in message.lower()
-            and needle not in logger_name.lower()
-        ):
-            continue
-        entries.append(
-            {
-                "timestamp": timestamp,
-                "level": log_level,
-                "logger": logger_name,
-                # Kept whole: the display cap is applied at dedup time, because
-                # keying on a capped message merges two errors that differ only
-                # past the cap into one issue with a summed count.
-                "message": message,
-            }
-        )
-
-    return _ExtractedLines(
-        entries=entries,
-        matched=matched,
-        unparseable=unparseable,
-        blank=blank,
-        window_start=window_start,
-        window_end=window_end,
-    )
+    tail = ErrorLogTail()
+    tail.lines = lines
+    index = ErrorLogIndex()
+    index.sync(tail)
+    return index.extract(search=search, level=level)
 
 
 def _parse_error_log_structured(
@@ -235,8 +410,18 @@ def _parse_error_log_structured(
     there the window can be far shorter than the log's full history.
     """
     lines = raw_text.splitlines() if raw_text else []
-    total_raw_lines = len(lines)
     extracted = _extract_log_entries(lines, search=search, level=level)
+    return _summarise_error_log(extracted, len(lines), top_n)
+
+
+def _summarise_error_log(
+    extracted: _ExtractedLines, total_raw_lines: int, top_n: int = _DEFAULT_TOP_N
+) -> dict[str, Any]:
+    """The structured summary of already extracted entries.
+
+    Shared by ``_parse_error_log_structured`` and the tool's indexed path,
+    which extracts from an ``ErrorLogIndex`` instead of reparsing.
+    """
     parsed = extracted.entries
 
     # Dedupe on (level, logger, message), keyed on the FULL message: two errors
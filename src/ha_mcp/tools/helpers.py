@@ -31,6 +31,7 @@ from ..errors import (
     create_timeout_error,
     create_validation_error,
 )
+from ..telemetry import call_in_progress
 from ..utils.usage_logger import log_tool_call
 
 logger = logging.getLogger(__name__)
@@ -527,10 +528,15 @@ def log_tool_usage(func: Any) -> Any:
     Decorator to automatically log MCP tool usage.
 
     Tracks execution time, success/failure, and response size for all tool calls.
+    Under the MCP server every call is already timed and logged by
+    :class:`~ha_mcp.telemetry.TelemetryMiddleware`, so this only records calls
+    made without it (direct invocation).
     """
 
     @functools.wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if call_in_progress():
+            return await func(*args, **kwargs)
         start_time = time.time()
         tool_name = func.__name__
         success = True
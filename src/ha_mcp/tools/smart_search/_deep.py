@@ -50,14 +50,14 @@ async def _scrub_results_for_enforce(
     (single memoized config load) unless enforce mode is active. Lazy import so
     the visibility package is only touched at call time, not module import.
     """
-    from ...visibility.enforcement import active_hidden_regex, scrub_records
+    from ...visibility.enforcement import active_hidden_matcher, scrub_records
 
-    enforce_regex = await active_hidden_regex(client)
-    if enforce_regex is None:
+    enforce_matcher = await active_hidden_matcher(client)
+    if enforce_matcher is None:
         return
     for category, items in results.items():
         if items:
-            results[category] = scrub_records(items, enforce_regex)
+            results[category] = scrub_records(items, enforce_matcher)
 
 
 # The ``lovelace/config`` messages meaning "this dashboard has no stored
@@ -445,21 +445,19 @@ class DeepSearchMixin(SceneSearchMixin):
                 )
             )
 
-        # Phase 2: bulk fetch (REST)
-        configs = await self._bulk_fetch_configs(
+        # Phase 2: bodies cached by an earlier search, else bulk fetch (REST)
+        cache, documents, missing, generation = await self._load_config_documents(
+            "automation",
+            scored,
             "/config/automation/config",
             lambda item: item.get("id"),
             BULK_REST_TIMEOUT,
             "Automation",
         )
-        bulk_fetched = configs is not None
-        if configs is None:
-            configs = {}
 
         # Attempt C: parallel individual REST calls with time budget (LAST RESORT)
         skipped_count = 0
         failed_count = 0
-        yaml_skipped_count = 0
         timeout_count = 0
         # One representative summary — ``record_first_failure`` (which holds
         # the guard) keeps the first ``failed``-class exception, upgrading
@@ -468,10 +466,10 @@ class DeepSearchMixin(SceneSearchMixin):
         # (#1784 follow-up). The remaining failures are counted
         # (``failed_count``) but not summarized.
         failed_errors: list[str] = []
-        if not bulk_fetched:
-            uids_to_fetch = [
-                uid for _, _, uid, _ in scored if uid and uid not in configs
-            ]
+        if missing is not None:
+            # Only the uncached ones: ids an earlier search already fetched
+            # (or saw 404) are not asked again.
+            uids_to_fetch = missing
 
             async def _fetch_automation_config(
                 uid: str,
@@ -526,11 +524,12 @@ class DeepSearchMixin(SceneSearchMixin):
                     record_first_failure(failed_errors, e)
                     return (uid, None, "failed")
 
+            unfetchable: list[str] = []
             (
                 fetched_configs,
                 failed_count,
                 skipped_count,
-                yaml_skipped_count,
+                _,
                 timeout_count,
             ) = await self._individual_fetch_budgeted(
                 uids_to_fetch,
@@ -540,8 +539,20 @@ class DeepSearchMixin(SceneSearchMixin):
                 else AUTOMATION_CONFIG_TIME_BUDGET,
                 "Automation",
                 "automations",
+                unfetchable=unfetchable,
+            )
+            documents.update(
+                self._store_config_documents(
+                    cache,
+                    "automation",
+                    fetched_configs,
+                    generation,
+                    unfetchable=unfetchable,
+                )
             )
-            configs.update(fetched_configs)
+        # Known-404 automations stay unscanned whether this pass asked or an
+        # earlier one did, so they keep surfacing as yaml_skipped.
+        yaml_skipped_count = self._count_unfetchable(scored, documents)
 
         # Phase 3: Score with whatever configs we have
         matches = [
@@ -554,7 +565,7 @@ class DeepSearchMixin(SceneSearchMixin):
                 "config": m["config"] if m["config"] else None,
             }
             for m in self._score_config_entries(
-                scored, configs, query_lower, exact_match
+                scored, documents, query_lower, exact_match
             )
         ]
         return (
@@ -597,8 +608,10 @@ class DeepSearchMixin(SceneSearchMixin):
             )
             scored.append((entity_id, friendly_name, script_id, name_score))
 
-        # Phase 2: bulk fetch
-        configs = await self._bulk_fetch_configs(
+        # Phase 2: cached bodies, else bulk fetch
+        cache, documents, missing, generation = await self._load_config_documents(
+            "script",
+            scored,
             "/config/script/config",
             lambda item: (
                 item.get("id") or item.get("alias", "").lower().replace(" ", "_")
@@ -606,14 +619,10 @@ class DeepSearchMixin(SceneSearchMixin):
             INDIVIDUAL_CONFIG_TIMEOUT,
             "Script",
         )
-        bulk_fetched = configs is not None
-        if configs is None:
-            configs = {}
 
         # Attempt C: parallel individual fetch with budget (see #879)
         skipped_count = 0
         failed_count = 0
-        yaml_skipped_count = 0
         timeout_count = 0
         # One representative summary — ``record_first_failure`` (which holds
         # the guard) keeps the first ``failed``-class exception, upgrading
@@ -622,10 +631,8 @@ class DeepSearchMixin(SceneSearchMixin):
         # (#1784 follow-up). The remaining failures are counted
         # (``failed_count``) but not summarized.
         failed_errors: list[str] = []
-        if not bulk_fetched:
-            sids_to_fetch = [
-                sid for _, _, sid, _ in scored if sid and sid not in configs
-            ]
+        if missing is not None:
+            sids_to_fetch = missing
 
             async def _fetch_script_config(
                 sid: str,
@@ -671,11 +678,12 @@ class DeepSearchMixin(SceneSearchMixin):
                     record_first_failure(failed_errors, e)
                     return (sid, None, "failed")
 
+            unfetchable: list[str] = []
             (
                 fetched_configs,
                 failed_count,
                 skipped_count,
-                yaml_skipped_count,
+                _,
                 timeout_count,
             ) = await self._individual_fetch_budgeted(
                 sids_to_fetch,
@@ -685,8 +693,18 @@ class DeepSearchMixin(SceneSearchMixin):
                 else SCRIPT_CONFIG_TIME_BUDGET,
                 "Script",
                 "scripts",
+                unfetchable=unfetchable,
+            )
+            documents.update(
+                self._store_config_documents(
+                    cache,
+                    "script",
+                    fetched_configs,
+                    generation,
+                    unfetchable=unfetchable,
+                )
             )
-            configs.update(fetched_configs)
+        yaml_skipped_count = self._count_unfetchable(scored, documents)
 
         # Phase 3: Score scripts
         matches = [
@@ -700,7 +718,7 @@ class DeepSearchMixin(SceneSearchMixin):
                 "config": m["config"] if m["config"] else None,
             }
             for m in self._score_config_entries(
-                scored, configs, query_lower, exact_match
+                scored, documents, query_lower, exact_match
             )
         ]
         return (
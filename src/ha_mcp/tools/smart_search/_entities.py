@@ -5,6 +5,7 @@ import logging
 from collections.abc import Mapping
 from typing import Any
 
+from ...client.registry_cache import RegistryCache
 from ...utils.entity_membership import normalize_member_entity_ids
 from ...utils.fuzzy_search import calculate_partial_ratio, calculate_ratio
 from ...visibility.resolver import (
@@ -106,10 +107,18 @@ class EntitySearchMixin(_SearchBase):
                 prefetched_states=prefetched_states,
                 prefetched_registry=prefetched_registry,
             )
+            # The shared index is synced over every searchable entity; the
+            # domain / hidden filters only narrow the candidates it returns.
+            in_scope = self._entities_in_scope(entities, domain_filter, include_hidden)
+            scope = (
+                None
+                if len(in_scope) == len(entities)
+                else {entity["entity_id"] for entity in in_scope}
+            )
 
             # Perform fuzzy search - returns (paginated_results, total_count)
             matches, total_matches = self.fuzzy_searcher.search_entities(
-                entities, query, limit, offset
+                entities, query, limit, offset, scope=scope
             )
             results = self._format_entity_matches(matches, include_attributes)
 
@@ -128,7 +137,7 @@ class EntitySearchMixin(_SearchBase):
 
             if not matches or matches[0]["score"] < 80:
                 response["suggestions"] = self.fuzzy_searcher.get_smart_suggestions(
-                    entities, query
+                    in_scope, query
                 )
 
             return merge_visibility_warnings(response, visibility_warnings)
@@ -168,6 +177,21 @@ class EntitySearchMixin(_SearchBase):
                     registry_slim[eid] = entry
         return registry_slim
 
+    @staticmethod
+    def _entities_in_scope(
+        entities: list[dict[str, Any]],
+        domain_filter: str | None,
+        include_hidden: bool,
+    ) -> list[dict[str, Any]]:
+        """The enriched entities one search may return."""
+        domain_prefix = f"{domain_filter}." if domain_filter else ""
+        return [
+            entity
+            for entity in entities
+            if entity["entity_id"].startswith(domain_prefix)
+            and (include_hidden or entity.get("_hidden_by") is None)
+        ]
+
     @staticmethod
     def _filter_hidden_entities(
         entities: list[dict[str, Any]],
@@ -304,10 +328,14 @@ class EntitySearchMixin(_SearchBase):
 
         Fetches states + the slim entity-registry list in parallel (the slim
         view gives ``hidden_by`` and the ids needed for the alias batch fetch;
-        aliases live only in ``get_entries``), filters hidden entities, applies
-        the optional domain filter, then enriches the survivors with aliases +
-        hidden_by. The domain filter runs *before* the alias fetch so the chunked
-        alias WS calls only cover entities that survive it. states/registry may be
+        aliases live only in ``get_entries``), drops entities the visibility
+        policy hides, then enriches the rest with aliases + hidden_by. Entities
+        the query's domain / ``include_hidden`` filters leave out are kept: the
+        result feeds the shared search index, which must hold the same set on
+        every search (see ``_entities_in_scope``). Aliases are fetched only for
+        the entities in scope, so the chunked alias WS calls stay as narrow as
+        the filters; the others carry ``_aliases=None`` and keep the aliases
+        already indexed for them. states/registry may be
         pre-fetched and shared by the ha_search orchestrator (``None`` = fetch
         here); the device registry is fetched only when a visibility area/label
         dimension will consume it.
@@ -382,39 +410,30 @@ class EntitySearchMixin(_SearchBase):
             )
             entities = _redact_hidden_memberships(entities, denied_member_ids)
         survivor_ids, survivor_states = self._filter_hidden_entities(
-            entities, registry_slim, include_hidden, visibility_hidden
+            entities,
+            registry_slim,
+            include_hidden=True,
+            visibility_hidden=visibility_hidden,
         )
 
-        # Apply the domain filter before the alias fetch. The old order fetched
-        # aliases for every survivor and filtered at the very end; the final set
-        # and its order are identical (each survivor keeps its own aliases), so
-        # this only shrinks the alias WS fan-out.
-        if domain_filter:
-            domain_prefix = f"{domain_filter}."
-            kept = [
-                (eid, state)
-                for eid, state in zip(survivor_ids, survivor_states, strict=True)
-                if eid.startswith(domain_prefix)
-            ]
-            survivor_ids = [eid for eid, _ in kept]
-            survivor_states = [state for _, state in kept]
-
-        aliases_map, alias_warnings = await self._fetch_entity_aliases(survivor_ids)
+        # Enrich with hidden_by, then aliases for the entities in scope.
+        # Shallow copy + private-prefixed keys so downstream consumers that
+        # round-trip these dicts don't ship internal fields back to clients.
+        enriched: list[dict[str, Any]] = [
+            {
+                **entity,
+                "_aliases": None,
+                "_hidden_by": registry_slim.get(eid, {}).get("hidden_by"),
+            }
+            for entity, eid in zip(survivor_states, survivor_ids, strict=True)
+        ]
+        in_scope = self._entities_in_scope(enriched, domain_filter, include_hidden)
+        aliases_map, alias_warnings = await self._fetch_entity_aliases(
+            [entity["entity_id"] for entity in in_scope]
+        )
         visibility_warnings = [*visibility_warnings, *alias_warnings]
-
-        # Enrich with aliases + hidden_by for the fuzzy layer. Shallow copy +
-        # private-prefixed keys so downstream consumers that round-trip these
-        # dicts don't ship internal fields back to clients.
-        enriched: list[dict[str, Any]] = []
-        for entity, eid in zip(survivor_states, survivor_ids, strict=True):
-            slim = registry_slim.get(eid, {})
-            enriched.append(
-                {
-                    **entity,
-                    "_aliases": aliases_map.get(eid, []),
-                    "_hidden_by": slim.get("hidden_by"),
-                }
-            )
+        for entity in in_scope:
+            entity["_aliases"] = aliases_map.get(entity["entity_id"], [])
 
         return enriched, visibility_warnings
 
@@ -522,8 +541,9 @@ class EntitySearchMixin(_SearchBase):
             # nothing (#1947).
             registry_warnings: list[str] = []
             area_registry = self._parse_area_registry(results[1], registry_warnings)
-            entity_reg_map = self._parse_entity_reg_map(results[2], registry_warnings)
-            device_area_map = self._parse_device_area_map(results[3], registry_warnings)
+            entity_reg_map, device_area_map = self._area_resolution_maps(
+                results[2], results[3], registry_warnings
+            )
             # Availability is read back OUT of the parse rather than re-derived
             # from the raw payload: the parser already decides what counts as
             # usable floor data, and a second predicate here drifted from it
@@ -659,6 +679,29 @@ class EntitySearchMixin(_SearchBase):
                 device_area_map[device_id] = device.get("area_id")
         return device_area_map
 
+    def _area_resolution_maps(
+        self, entity_result: Any, device_result: Any, warnings: list[str]
+    ) -> tuple[Mapping[str, Mapping[str, Any]], Mapping[str, str | None]]:
+        """The entity registry by id and ``device_id -> area_id``.
+
+        Served from the registry cache's derived indexes when it holds both
+        lists, so repeated area searches skip re-parsing the registries; the
+        parsers cover everything else, including naming a failed read.
+        """
+        cache = getattr(self.client, "registry_cache", None)
+        if isinstance(cache, RegistryCache) and all(
+            isinstance(result, dict) and result.get("success")
+            for result in (entity_result, device_result)
+        ):
+            entity_index = cache.by_id("config/entity_registry/list")
+            device_areas = cache.device_areas()
+            if entity_index is not None and device_areas is not None:
+                return entity_index, device_areas
+        return (
+            self._parse_entity_reg_map(entity_result, warnings),
+            self._parse_device_area_map(device_result, warnings),
+        )
+
     @staticmethod
     def _match_exact_registry_ids(
         registry: dict[str, dict[str, Any]],
@@ -870,8 +913,8 @@ class EntitySearchMixin(_SearchBase):
 
     @staticmethod
     def _resolve_entity_areas(
-        entity_reg_map: dict[str, dict[str, str | None]],
-        device_area_map: dict[str, str | None],
+        entity_reg_map: Mapping[str, Mapping[str, Any]],
+        device_area_map: Mapping[str, str | None],
         include_hidden: bool,
         visibility_hidden: set[str],
     ) -> tuple[dict[str, str], set[str]]:
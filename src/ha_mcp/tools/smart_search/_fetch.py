@@ -9,7 +9,8 @@ from typing import Any
 
 import httpx
 
-from ...client.rest_client import HomeAssistantAPIError
+from ...client.config_cache import CachedConfig, ConfigBodyCache
+from ...client.rest_client import HomeAssistantAPIError, HomeAssistantClient
 from ._config import INDIVIDUAL_FETCH_BATCH_SIZE
 from ._scoring import ScoringMixin
 
@@ -204,6 +205,8 @@ class ConfigFetchMixin(ScoringMixin):
         budget: float,
         label: str,
         plural: str,
+        *,
+        unfetchable: list[str] | None = None,
     ) -> tuple[dict[str, dict[str, Any]], int, int, int, int]:
         """Fetch configs individually in parallel batches under a wall-clock budget.
 
@@ -217,7 +220,9 @@ class ConfigFetchMixin(ScoringMixin):
         exception. New batches stop launching once ``budget`` seconds
         elapse. Returns
         ``(configs, failed_count, skipped_count, yaml_skipped_count,
-        timeout_count)``.
+        timeout_count)``. When ``unfetchable`` is given, the ids of the
+        ``yaml_skipped`` class are appended to it so the caller can remember
+        them.
 
         Counting the YAML-defined class distinctly lets callers explain to
         end users that the gap is **structural** (the config exists, the
@@ -271,16 +276,114 @@ class ConfigFetchMixin(ScoringMixin):
                     fetched_count += 1
                 elif fail_kind == "yaml_skipped":
                     yaml_skipped_count += 1
+                    if unfetchable is not None:
+                        unfetchable.append(key)
                 elif fail_kind == "timeout":
                     timeout_count += 1
                 else:
                     failed_count += 1
         return configs, failed_count, skipped_count, yaml_skipped_count, timeout_count
 
-    def _score_config_entries(
+    async def _load_config_documents(
         self,
+        domain: str,
         scored: list[tuple[str, str, str | None, int]],
+        rest_endpoint: str,
+        id_of: Callable[[dict[str, Any]], str | None],
+        rest_timeout: float,
+        label: str,
+        *,
+        aliases: dict[str, str] | None = None,
+    ) -> tuple[ConfigBodyCache | None, dict[str, CachedConfig], list[str] | None, int]:
+        """Phase 2 of a deep search: cached bodies first, then the bulk fetch.
+
+        The bulk fetch only runs when some scored key is neither cached nor
+        known-unfetchable, so a repeat search costs no request at all.
+        ``aliases`` maps scored keys to the fetch keys their bodies are
+        stored under (scene entity slugs to storage ids); an aliased key
+        whose body is cached counts as present.
+
+        Returns ``(cache, documents, missing, generation)``: the live body
+        cache (``None`` when the client has none or it cannot track
+        invalidations, e.g. without a WebSocket), the documents by key,
+        the scored keys still lacking a document when the caller must fall
+        back to per-id fetches (``None`` when it must not), and the
+        generation to store those fetches under.
+        """
+        cache: ConfigBodyCache | None = None
+        if isinstance(self.client, HomeAssistantClient):
+            cache = await self.client.live_config_cache()
+        documents: dict[str, CachedConfig] = {}
+        complete = False
+        generation = 0
+        if cache is not None:
+            documents, complete = cache.snapshot(domain)
+            generation = cache.generation(domain)
+        self._alias_documents(documents, aliases)
+
+        missing = [key for _, _, key, _ in scored if key and key not in documents]
+        if complete or (documents and not missing):
+            return cache, documents, None, generation
+
+        configs = await self._bulk_fetch_configs(
+            rest_endpoint, id_of, rest_timeout, label
+        )
+        if configs is None:
+            return cache, documents, missing, generation
+        documents = self._store_config_documents(
+            cache, domain, configs, generation, complete=True
+        )
+        self._alias_documents(documents, aliases)
+        return cache, documents, None, generation
+
+    @staticmethod
+    def _alias_documents(
+        documents: dict[str, CachedConfig], aliases: dict[str, str] | None
+    ) -> None:
+        """Expose each aliased document under its alias too (in place)."""
+        for alias, key in (aliases or {}).items():
+            if key in documents and alias != key:
+                documents[alias] = documents[key]
+
+    def _store_config_documents(
+        self,
+        cache: ConfigBodyCache | None,
+        domain: str,
         configs: dict[str, dict[str, Any]],
+        generation: int,
+        *,
+        unfetchable: list[str] | tuple[str, ...] = (),
+        complete: bool = False,
+    ) -> dict[str, CachedConfig]:
+        """Build documents for freshly fetched configs and cache them.
+
+        ``unfetchable`` keys (per-id 404s) are remembered as body-less
+        documents. The documents are returned for scoring whether or not the
+        cache accepted them.
+        """
+        documents = {key: self._config_document(body) for key, body in configs.items()}
+        for key in unfetchable:
+            documents[key] = CachedConfig(body=None)
+        if cache is not None:
+            cache.store(domain, documents, generation, complete=complete)
+        return documents
+
+    @staticmethod
+    def _count_unfetchable(
+        scored: list[tuple[str, str, str | None, int]],
+        documents: dict[str, CachedConfig],
+    ) -> int:
+        """Scored entries whose config is known to 404 on the per-id endpoint."""
+        return sum(
+            1
+            for _, _, key, _ in scored
+            if key and key in documents and documents[key].body is None
+        )
+
+    def _score_config_entries(
+        self,
+        scored: list[tuple[str, str, str | None, int]],
+        documents: dict[str, CachedConfig],
         query_lower: str,
         exact_match: bool,
     ) -> list[dict[str, Any]]:
@@ -291,10 +394,16 @@ class ConfigFetchMixin(ScoringMixin):
         """
         matches: list[dict[str, Any]] = []
         for entity_id, friendly_name, key, name_score in scored:
-            config = configs.get(key, {}) if key else {}
-            config_match_score = (
-                self._search_in_dict(config, query_lower, exact_match) if config else 0
-            )
+            cached = documents.get(key) if key else None
+            config = cached.body if cached is not None else None
+            if not config:
+                config = {}
+            if cached is not None and cached.document is not None and config:
+                config_match_score = self._search_in_document(
+                    cached.document, query_lower, exact_match
+                )
+            else:
+                config_match_score = 0
             total_score, threshold, match_in_name = self._score_deep_match(
                 entity_id,
                 friendly_name,
@@ -4,6 +4,7 @@ import asyncio
 import logging
 from typing import Any
 
+from ...client.rest_client import HomeAssistantAPIError
 from ._config import (
     BULK_WEBSOCKET_TIMEOUT,
     INDIVIDUAL_CONFIG_TIMEOUT,
@@ -25,15 +26,13 @@ class SceneSearchMixin(ConfigFetchMixin):
 
     async def _walk_scene_registry(
         self,
-        configs: dict[str, dict[str, Any]],
         *,
         prefetched_registry: Any = None,
     ) -> tuple[set[str], dict[str, str], bool]:
-        """Walk the entity registry once for scene metadata (Phase 2.5).
+        """Walk the entity registry once for scene metadata (Phase 1.5).
 
-        Returns ``(homeassistant_scene_uids, slug_to_storage_id, registry_failed)``
-        and mutates ``configs`` in place, aliasing each bulk-fetched config under
-        its entity-id slug. Two outputs:
+        Returns ``(homeassistant_scene_uids, slug_to_storage_id, registry_failed)``.
+        Two outputs:
 
         1. ``homeassistant_scene_uids`` -- unique_ids backed by
            ``platform == "homeassistant"`` (HA's storage collection).
@@ -41,14 +40,17 @@ class SceneSearchMixin(ConfigFetchMixin):
            the per-id REST endpoint ``/config/scene/config/<id>`` can't fetch
            them and treating their 404s as ``failed_count`` produces a
            misleading ``partial: true`` flag (issue #1168 R3 blocker 2).
-        2. Slug-keyed aliases pointing at the bulk-fetched config. HA derives a
-           scene's entity_id from the ``name`` field via its own slugify
-           (collapsing runs of underscores, replacing all non-alnum with
-           underscores, etc.); approximating that with ``.replace()`` chains
-           produces near-misses.
+        2. ``slug_to_storage_id`` -- entity-id slug to storage key, used to
+           alias bulk-fetched and cached configs (stored under the storage
+           key) at the slug the search scores. HA derives a scene's entity_id
+           from the ``name`` field via its own slugify (collapsing runs of
+           underscores, replacing all non-alnum with underscores, etc.);
+           approximating that with ``.replace()`` chains produces near-misses.
 
-        Run unconditionally so the platform filter is available even when the
-        bulk fetch returned nothing (the common Hue-only case).
+        Run unconditionally, and before the config load, so the aliases apply
+        when deciding which scenes still need fetching and the platform filter
+        is available even when the bulk fetch returns nothing (the common
+        Hue-only case).
 
         Assumption — caveat for downstream callers: when ``registry_failed``
         is ``False``, the returned ``homeassistant_scene_uids`` set is
@@ -84,7 +86,7 @@ class SceneSearchMixin(ConfigFetchMixin):
             if isinstance(reg_resp, dict) and reg_resp.get("success"):
                 for entry in reg_resp.get("result") or []:
                     self._index_scene_registry_entry(
-                        entry, configs, homeassistant_scene_uids, slug_to_storage_id
+                        entry, homeassistant_scene_uids, slug_to_storage_id
                     )
             else:
                 # Soft-failure path: `send_websocket_message` returns
@@ -118,7 +120,6 @@ class SceneSearchMixin(ConfigFetchMixin):
     @staticmethod
     def _index_scene_registry_entry(
         entry: dict[str, Any],
-        configs: dict[str, dict[str, Any]],
         homeassistant_scene_uids: set[str],
         slug_to_storage_id: dict[str, str],
     ) -> None:
@@ -132,13 +133,11 @@ class SceneSearchMixin(ConfigFetchMixin):
         slug = ent_id.removeprefix("scene.")
         if slug:
             slug_to_storage_id[slug] = uid
-        if uid in configs and slug and slug != uid:
-            configs[slug] = configs[uid]
 
     @staticmethod
     def _select_scene_ids_to_fetch(
         scored: list[tuple[str, str, str | None, int]],
-        configs: dict[str, dict[str, Any]],
+        configs: dict[str, Any],
         homeassistant_scene_uids: set[str],
         registry_failed: bool,
     ) -> tuple[list[str], int]:
@@ -246,28 +245,29 @@ class SceneSearchMixin(ConfigFetchMixin):
             )
             scored.append((entity_id, friendly_name, scene_id, name_score))
 
-        # Phase 2: bulk fetch
-        configs = await self._bulk_fetch_configs(
+        # Phase 1.5: registry walk (runs unconditionally; its slug aliases
+        # feed Phase 2 and its homeassistant_scene_uids the Attempt C
+        # integration-skip filter).
+        (
+            homeassistant_scene_uids,
+            slug_to_storage_id,
+            registry_failed,
+        ) = await self._walk_scene_registry(prefetched_registry=prefetched_registry)
+
+        # Phase 2: cached bodies, else bulk fetch. The cache holds bodies
+        # under their fetch keys only; the slug aliases are applied on top
+        # before deciding what is missing, so an aliased scene is not
+        # refetched.
+        cache, documents, missing, generation = await self._load_config_documents(
+            "scene",
+            scored,
             "/config/scene/config",
             lambda item: (
                 item.get("id") or item.get("name", "").lower().replace(" ", "_")
             ),
             INDIVIDUAL_CONFIG_TIMEOUT,
             "Scene",
-        )
-        bulk_fetched = configs is not None
-        if configs is None:
-            configs = {}
-
-        # Phase 2.5: registry walk (runs unconditionally, mutates ``configs``,
-        # and must precede Attempt C since the integration-skip filter depends
-        # on its homeassistant_scene_uids output).
-        (
-            homeassistant_scene_uids,
-            slug_to_storage_id,
-            registry_failed,
-        ) = await self._walk_scene_registry(
-            configs, prefetched_registry=prefetched_registry
+            aliases=slug_to_storage_id,
         )
 
         failed_count = 0
@@ -284,9 +284,9 @@ class SceneSearchMixin(ConfigFetchMixin):
 
         # Attempt C: parallel per-id fetch with a wall-clock budget so a few
         # slow scenes don't tank the whole search.
-        if not bulk_fetched:
+        if missing is not None:
             sids_to_fetch, integration_skipped = self._select_scene_ids_to_fetch(
-                scored, configs, homeassistant_scene_uids, registry_failed
+                scored, documents, homeassistant_scene_uids, registry_failed
             )
 
             async def _fetch_scene_config(
@@ -298,6 +298,19 @@ class SceneSearchMixin(ConfigFetchMixin):
                         timeout=INDIVIDUAL_CONFIG_TIMEOUT,
                     )
                     return (sid, config_resp.get("config", {}), None)
+                except HomeAssistantAPIError as e:
+                    if e.status_code != 404:
+                        logger.debug(
+                            f"Scene individual config fetch ({sid}) failed: {e}"
+                        )
+                        record_first_failure(failed_errors, e)
+                        return (sid, None, "failed")
+                    # Gone, or not storage-backed after all. Remembered as
+                    # unfetchable so the next search does not ask again; it
+                    # is still counted as failed below.
+                    logger.debug(f"Scene individual config fetch ({sid}) got 404")
+                    record_first_failure(failed_errors, e)
+                    return (sid, None, "yaml_skipped")
                 except TimeoutError:
                     # Per-request timeout under batch concurrency — distinct
                     # from a real failure; see _fetch_automation_config
@@ -320,15 +333,15 @@ class SceneSearchMixin(ConfigFetchMixin):
                     record_first_failure(failed_errors, e)
                     return (sid, None, "failed")
 
+            unfetchable: list[str] = []
             (
                 fetched_configs,
                 failed_count,
                 skipped_count,
-                # Scene YAML/integration-managed pre-classification happens
-                # upstream via `_walk_scene_registry`; the 4th tuple slot
-                # from `_individual_fetch_budgeted` is therefore expected
-                # to stay at zero on this path.
-                _scene_yaml_skipped,
+                # Integration-managed scenes are pre-classified upstream via
+                # `_walk_scene_registry`; the 404s this slot counts are
+                # folded into failed_count below, cached ones included.
+                _scene_not_found,
                 timeout_count,
             ) = await self._individual_fetch_budgeted(
                 sids_to_fetch,
@@ -338,12 +351,26 @@ class SceneSearchMixin(ConfigFetchMixin):
                 else SCENE_CONFIG_TIME_BUDGET,
                 "Scene",
                 "scenes",
+                unfetchable=unfetchable,
+            )
+            documents.update(
+                self._store_config_documents(
+                    cache,
+                    "scene",
+                    fetched_configs,
+                    generation,
+                    unfetchable=unfetchable,
+                )
             )
-            configs.update(fetched_configs)
+        # A per-id 404 stays unscanned whether this pass asked or an earlier
+        # one did.
+        failed_count += self._count_unfetchable(scored, documents)
 
         # Phase 3: Score scenes, resolving each match's storage key
         scene_results: list[dict[str, Any]] = []
-        for m in self._score_config_entries(scored, configs, query_lower, exact_match):
+        for m in self._score_config_entries(
+            scored, documents, query_lower, exact_match
+        ):
             scene_config = m["config"]
             scene_results.append(
                 {
@@ -19,6 +19,19 @@ from fastmcp.exceptions import ToolError
 from fastmcp.tools import tool
 from pydantic import Field
 
+from ..client.history_cache import (
+    HISTORY_SETTLE_SECONDS,
+    HistoryCache,
+    HistoryKey,
+    row_time,
+)
+from ..client.rest_client import HomeAssistantClient
+from ..client.statistics_cache import (
+    CACHEABLE_PERIODS,
+    STATISTICS_SETTLE_SECONDS,
+    SeriesKey,
+    StatisticsCache,
+)
 from ..errors import ErrorCode, create_error_response, create_validation_error
 from .helpers import (
     exception_to_structured_error,
@@ -182,6 +195,20 @@ class HistoryTools:
                 default=True,
             ),
         ] = True,
+        downsample: Annotated[
+            int | None,
+            Field(
+                description=(
+                    "Reduce each entity's numeric history to about this many points "
+                    "(LTTB), keeping the shape of the curve. Use for trends over long "
+                    "windows. Non-numeric states are kept. Default: off (every state "
+                    'change). Ignored when source="statistics"'
+                ),
+                default=None,
+                ge=3,
+                le=1000,
+            ),
+        ] = None,
         limit: Annotated[
             int | None,
             Field(
@@ -250,7 +277,7 @@ class HistoryTools:
         - "statistics": Pre-aggregated data, permanent retention, requires state_class
 
         **Shared params:** entity_ids, start_time, end_time, limit, offset
-        **History params:** minimal_response, significant_changes_only
+        **History params:** minimal_response, significant_changes_only, downsample
         **Statistics params:** period, statistic_types
 
         **Default time range:** 24h for history, 30 days for statistics
@@ -266,7 +293,8 @@ class HistoryTools:
         - Entities must have state_class (measurement, total, total_increasing)
 
         **WARNING:** limit and offset apply per entity (not globally across all entities).
-        All data is fetched from HA before slicing; limit/offset are client-side.
+        limit/offset are client-side; history older than a minute is cached, so
+        paging re-fetches only the newest part of the window.
         With multiple entity_ids, offset must be 0 — use a single entity_id for offset > 0.
         Use has_more and next_offset from the response to paginate.
 
@@ -277,6 +305,8 @@ class HistoryTools:
         # Default order="desc" returns newest states first.
         # To paginate oldest-first, use order="asc":
         ha_get_history(entity_ids="sensor.temperature", start_time="7d", limit=100, offset=100, order="asc")
+        # A week-long trend as ~300 points instead of every reading:
+        ha_get_history(entity_ids="sensor.power", start_time="7d", downsample=300)
         ```
 
         **Example -- statistics:**
@@ -370,6 +400,7 @@ class HistoryTools:
                     _DEFAULT_HISTORY_LIMIT,
                     _MAX_HISTORY_LIMIT,
                     order=order,
+                    downsample=downsample,
                 )
             await safe_progress(
                 ctx,
@@ -527,30 +558,17 @@ def _raise_recorder_ws_failure(
     )
 
 
-async def _fetch_history(
+async def _query_history(
     client: Any,
     entity_id_list: list[str],
     start_dt: datetime,
     end_dt: datetime,
     minimal_response: bool,
     significant_changes_only: bool,
-    limit: int | None,
-    offset: int | None,
-    default_limit: int,
-    max_limit: int,
-    order: str = "desc",
-) -> dict[str, Any]:
-    """Execute the history/history_during_period WebSocket call.
-
-    *order* controls state-list ordering: ``"desc"`` (default) returns the
-    newest states first; ``"asc"`` returns the oldest first.
-
-    Returns the unwrapped history dict; the caller is responsible for projection
-    and wrapping with ``add_timezone_metadata``.
-    """
-    effective_limit = min(limit, max_limit) if limit is not None else default_limit
-    effective_offset = offset if offset is not None else 0
-
+    *,
+    include_start_time_state: bool = True,
+) -> dict[str, list[dict[str, Any]]]:
+    """Run one history/history_during_period WebSocket call."""
     command_params = {
         "start_time": start_dt.isoformat(),
         "end_time": end_dt.isoformat(),
@@ -559,6 +577,8 @@ async def _fetch_history(
         "significant_changes_only": significant_changes_only,
         "no_attributes": minimal_response,
     }
+    if not include_start_time_state:
+        command_params["include_start_time_state"] = False
 
     response = await client.send_websocket_message(
         {"type": "history/history_during_period", **command_params}
@@ -575,12 +595,229 @@ async def _fetch_history(
                 "Ensure time range is within recorder retention period (~10 days)",
             ],
         )
+    result: dict[str, list[dict[str, Any]]] = response.get("result", {})
+    return result
+
+
+async def _load_history(
+    client: Any,
+    entity_id_list: list[str],
+    start_dt: datetime,
+    end_dt: datetime,
+    minimal_response: bool,
+    significant_changes_only: bool,
+) -> dict[str, list[dict[str, Any]]]:
+    """Rows per entity for the window, from the history cache where it can.
 
-    result_data = response.get("result", {})
+    Entities without a cached window are fetched together over the whole
+    window; cached ones only fetch their tail, one call per distinct tail
+    start. Clients without a ``HistoryCache`` (test doubles) fetch directly.
+    """
+    cache = getattr(client, "history_cache", None)
+    if not isinstance(cache, HistoryCache):
+        return await _query_history(
+            client,
+            entity_id_list,
+            start_dt,
+            end_dt,
+            minimal_response,
+            significant_changes_only,
+        )
+
+    start, end = start_dt.timestamp(), end_dt.timestamp()
+    settled = min(end, datetime.now(UTC).timestamp() - HISTORY_SETTLE_SECONDS)
+    keys: dict[str, HistoryKey] = {
+        entity_id: (entity_id, minimal_response, significant_changes_only)
+        for entity_id in entity_id_list
+    }
+    missing, tails = _plan_history_fetch(cache, keys, start, end)
+
+    rows: dict[str, list[dict[str, Any]]] = {}
+    if missing:
+        fetched = await _query_history(
+            client,
+            missing,
+            start_dt,
+            end_dt,
+            minimal_response,
+            significant_changes_only,
+        )
+        for entity_id in missing:
+            rows[entity_id] = fetched.get(entity_id, [])
+            cache.store(keys[entity_id], start, settled, rows[entity_id])
+    for covered, entity_ids in tails.items():
+        tail_rows = await _load_history_tail(
+            client,
+            entity_ids,
+            covered,
+            end_dt,
+            minimal_response,
+            significant_changes_only,
+        )
+        for entity_id, tail in tail_rows.items():
+            rows[entity_id] = cache.rows(keys[entity_id], start, covered) + tail
+            cache.extend(keys[entity_id], settled, tail)
+    for entity_id, key in keys.items():
+        if entity_id not in rows:
+            rows[entity_id] = cache.rows(key, start, end)
+    return rows
+
+
+def _plan_history_fetch(
+    cache: HistoryCache, keys: dict[str, HistoryKey], start: float, end: float
+) -> tuple[list[str], dict[float, list[str]]]:
+    """Split entities into uncached ones and cached ones grouped by tail start.
+
+    Entities cached past ``end`` appear in neither: they need no fetch.
+    """
+    missing: list[str] = []
+    tails: dict[float, list[str]] = {}
+    for entity_id, key in keys.items():
+        covered = cache.covered_until(key, start)
+        if covered is None:
+            missing.append(entity_id)
+        elif covered < end:
+            tails.setdefault(covered, []).append(entity_id)
+    return missing, tails
+
+
+async def _load_history_tail(
+    client: Any,
+    entity_id_list: list[str],
+    covered: float,
+    end_dt: datetime,
+    minimal_response: bool,
+    significant_changes_only: bool,
+) -> dict[str, list[dict[str, Any]]]:
+    """Rows per entity recorded from ``covered`` (inclusive) to ``end_dt``."""
+    # HA's window start is exclusive: start a hair early and drop the
+    # overlap, so a row stamped exactly at ``covered`` is not lost.
+    fetched = await _query_history(
+        client,
+        entity_id_list,
+        datetime.fromtimestamp(covered - 0.001, tz=UTC),
+        end_dt,
+        minimal_response,
+        significant_changes_only,
+        include_start_time_state=False,
+    )
+    return {
+        entity_id: [
+            row
+            for row in fetched.get(entity_id, [])
+            if (row_time(row) or 0.0) >= covered
+        ]
+        for entity_id in entity_id_list
+    }
+
+
+def _lttb_indices(xs: list[float], ys: list[float], threshold: int) -> list[int]:
+    """Indices of the points Largest-Triangle-Three-Buckets keeps.
+
+    Keeps the first and last point and, from each of ``threshold - 2``
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the next bucket's average.
+    """
+    count = len(xs)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+    bucket = (count - 2) / (threshold - 2)
+    kept = [0]
+    anchor = 0
+    for i in range(threshold - 2):
+        lo = int(i * bucket) + 1
+        hi = int((i + 1) * bucket) + 1
+        next_hi = min(int((i + 2) * bucket) + 1, count)
+        avg_x = sum(xs[hi:next_hi]) / (next_hi - hi)
+        avg_y = sum(ys[hi:next_hi]) / (next_hi - hi)
+        ax, ay = xs[anchor], ys[anchor]
+        anchor = max(
+            range(lo, hi),
+            key=lambda j: abs(
+                (ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay)
+            ),
+        )
+        kept.append(anchor)
+    kept.append(count - 1)
+    return kept
+
+
+def _downsample_states(
+    states: list[dict[str, Any]], threshold: int
+) -> list[dict[str, Any]]:
+    """Reduce numeric states to about ``threshold`` points with LTTB.
+
+    Non-numeric states (``unavailable``, ``unknown``, text) are all kept, so
+    gaps in the curve stay visible. States without a timestamp are left
+    alone, as is a series already short enough.
+    """
+    numeric: list[int] = []
+    xs: list[float] = []
+    ys: list[float] = []
+    for index, state in enumerate(states):
+        when = row_time(state)
+        raw = state.get("s", state.get("state"))
+        try:
+            value = float(raw) if isinstance(raw, str | int | float) else None
+        except ValueError:
+            value = None
+        if value is None:
+            continue
+        if when is None:
+            return states
+        numeric.append(index)
+        xs.append(when)
+        ys.append(value)
+    if len(numeric) <= threshold:
+        return states
+    dropped = set(numeric) - {numeric[i] for i in _lttb_indices(xs, ys, threshold)}
+    return [state for index, state in enumerate(states) if index not in dropped]
+
+
+async def _fetch_history(
+    client: Any,
+    entity_id_list: list[str],
+    start_dt: datetime,
+    end_dt: datetime,
+    minimal_response: bool,
+    significant_changes_only: bool,
+    limit: int | None,
+    offset: int | None,
+    default_limit: int,
+    max_limit: int,
+    order: str = "desc",
+    downsample: int | None = None,
+) -> dict[str, Any]:
+    """Fetch history for the window and page it per entity.
+
+    *order* controls state-list ordering: ``"desc"`` (default) returns the
+    newest states first; ``"asc"`` returns the oldest first. *downsample*
+    reduces each entity's numeric states to about that many points before
+    paging, and becomes the default page size.
+
+    Returns the unwrapped history dict; the caller is responsible for projection
+    and wrapping with ``add_timezone_metadata``.
+    """
+    if limit is None:
+        limit = downsample
+    effective_limit = min(limit, max_limit) if limit is not None else default_limit
+    effective_offset = offset if offset is not None else 0
+
+    result_data = await _load_history(
+        client,
+        entity_id_list,
+        start_dt,
+        end_dt,
+        minimal_response,
+        significant_changes_only,
+    )
     entities_history = []
 
     for entity_id in entity_id_list:
         entity_states = result_data.get(entity_id, [])
+        source_count = len(entity_states)
+        if downsample is not None:
+            entity_states = _downsample_states(entity_states, downsample)
         if order == "desc":
             entity_states = list(reversed(entity_states))
         paged_states = entity_states[
@@ -609,17 +846,18 @@ async def _fetch_history(
             limit=effective_limit,
             count=len(formatted_states),
         )
-        entities_history.append(
-            {
-                "entity_id": entity_id,
-                "period": {
-                    "start": start_dt.isoformat(),
-                    "end": end_dt.isoformat(),
-                },
-                "states": formatted_states,
-                **pagination,
-            }
-        )
+        entity_history = {
+            "entity_id": entity_id,
+            "period": {
+                "start": start_dt.isoformat(),
+                "end": end_dt.isoformat(),
+            },
+            "states": formatted_states,
+            **pagination,
+        }
+        if len(entity_states) < source_count:
+            entity_history["downsampled_from"] = source_count
+        entities_history.append(entity_history)
 
     history_data = {
         "success": True,
@@ -635,6 +873,7 @@ async def _fetch_history(
             "limit": effective_limit,
             "offset": effective_offset,
             "order": order,
+            "downsample": downsample,
         },
     }
 
@@ -734,6 +973,165 @@ def _format_entity_statistics(
     return entities_statistics
 
 
+_STATISTICS_SUGGESTIONS = [
+    "Verify entities have state_class attribute (measurement, total, total_increasing)",
+    "Use ha_search() to check entity attributes",
+    "Statistics are only available for entities that track numeric values",
+]
+
+
+async def _query_statistics(
+    client: Any,
+    entity_id_list: list[str],
+    start_dt: datetime,
+    end_dt: datetime,
+    period: str,
+    stat_types_list: list[str] | None,
+) -> dict[str, list[dict[str, Any]]]:
+    """One ``recorder/statistics_during_period`` call: rows per statistic id."""
+    command_params: dict[str, Any] = {
+        "start_time": start_dt.isoformat(),
+        "end_time": end_dt.isoformat(),
+        "statistic_ids": entity_id_list,
+        "period": period,
+    }
+    if stat_types_list is not None:
+        command_params["types"] = stat_types_list
+
+    response = await client.send_websocket_message(
+        {"type": "recorder/statistics_during_period", **command_params}
+    )
+
+    if not response.get("success"):
+        _raise_recorder_ws_failure(
+            "statistics",
+            response.get("error", "Unknown error"),
+            entity_id_list,
+            suggestions=_STATISTICS_SUGGESTIONS,
+        )
+    result: dict[str, list[dict[str, Any]]] = response.get("result", {})
+    return result
+
+
+async def _live_statistics_cache(client: Any) -> StatisticsCache | None:
+    """The client's statistics cache while it tracks invalidations, else None.
+
+    Other clients (test doubles) always fetch directly.
+    """
+    if isinstance(client, HomeAssistantClient):
+        return await client.live_statistics_cache()
+    return None
+
+
+async def _load_statistics(
+    client: Any,
+    cache: StatisticsCache | None,
+    entity_id_list: list[str],
+    start_dt: datetime,
+    end_dt: datetime,
+    period: str,
+    stat_types_list: list[str] | None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Rows per statistic id for the window, from the statistics cache where it can.
+
+    Each id only fetches the parts of the window its cached ranges miss; ids
+    missing the same parts share one call per part.
+    """
+    if cache is None or period not in CACHEABLE_PERIODS:
+        return await _query_statistics(
+            client, entity_id_list, start_dt, end_dt, period, stat_types_list
+        )
+
+    start, end = start_dt.timestamp(), end_dt.timestamp()
+    settled = datetime.now(UTC).timestamp() - STATISTICS_SETTLE_SECONDS
+    types_key = tuple(sorted(stat_types_list)) if stat_types_list else None
+    keys: dict[str, SeriesKey] = {
+        statistic_id: (statistic_id, period, types_key)
+        for statistic_id in entity_id_list
+    }
+    generations = {
+        statistic_id: cache.generation(statistic_id) for statistic_id in keys
+    }
+    by_gaps: dict[tuple[tuple[float, float], ...], list[str]] = {}
+    for statistic_id, key in keys.items():
+        gaps = tuple(cache.missing(key, start, end))
+        by_gaps.setdefault(gaps, []).append(statistic_id)
+
+    rows: dict[str, dict[Any, dict[str, Any]]] = {
+        statistic_id: {row.get("start"): row for row in cache.rows(key, start, end)}
+        for statistic_id, key in keys.items()
+    }
+    for gaps, statistic_ids in by_gaps.items():
+        for gap_start, gap_end in gaps:
+            fetched = await _query_statistics(
+                client,
+                statistic_ids,
+                datetime.fromtimestamp(gap_start, tz=UTC),
+                datetime.fromtimestamp(gap_end, tz=UTC),
+                period,
+                stat_types_list,
+            )
+            for statistic_id in statistic_ids:
+                gap_rows = fetched.get(statistic_id, [])
+                cache.store(
+                    keys[statistic_id],
+                    gap_start,
+                    gap_end,
+                    gap_rows,
+                    settled=settled,
+                    generation=generations[statistic_id],
+                )
+                rows[statistic_id].update((row.get("start"), row) for row in gap_rows)
+    return {
+        statistic_id: [
+            row for _, row in sorted(by_start.items(), key=lambda item: item[0] or 0)
+        ]
+        for statistic_id, by_start in rows.items()
+        if by_start
+    }
+
+
+async def _statistics_units(
+    client: Any, cache: StatisticsCache | None, entity_id_list: list[str]
+) -> dict[str, str | None]:
+    """Units per statistic id from ``recorder/get_statistics_metadata``.
+
+    Only looked up while the cache is live, for ids whose rows carried no
+    unit, and best effort: a failed lookup fails nothing.
+    """
+    if cache is None:
+        return {}
+    metadata = {
+        statistic_id: entry
+        for statistic_id in entity_id_list
+        if (entry := cache.metadata(statistic_id)) is not None
+    }
+    uncached = [sid for sid in entity_id_list if sid not in metadata]
+    if uncached:
+        generations = {
+            statistic_id: cache.generation(statistic_id) for statistic_id in uncached
+        }
+        try:
+            response = await client.send_websocket_message(
+                {"type": "recorder/get_statistics_metadata", "statistic_ids": uncached}
+            )
+        except Exception as e:
+            logger.debug(f"Statistic metadata lookup failed: {e}")
+            response = {}
+        entries = response.get("result") if response.get("success") else None
+        if isinstance(entries, list):
+            cache.store_metadata(entries, generations)
+            metadata.update(
+                (entry["statistic_id"], entry)
+                for entry in entries
+                if isinstance(entry, dict) and entry.get("statistic_id") in uncached
+            )
+    return {
+        statistic_id: entry.get("statistics_unit_of_measurement")
+        for statistic_id, entry in metadata.items()
+    }
+
+
 async def _fetch_statistics(
     client: Any,
     entity_id_list: list[str],
@@ -766,32 +1164,10 @@ async def _fetch_statistics(
 
     stat_types_list = _parse_statistic_types(statistic_types)
 
-    command_params: dict[str, Any] = {
-        "start_time": start_dt.isoformat(),
-        "end_time": end_dt.isoformat(),
-        "statistic_ids": entity_id_list,
-        "period": period,
-    }
-    if stat_types_list is not None:
-        command_params["types"] = stat_types_list
-
-    response = await client.send_websocket_message(
-        {"type": "recorder/statistics_during_period", **command_params}
+    cache = await _live_statistics_cache(client)
+    result_data = await _load_statistics(
+        client, cache, entity_id_list, start_dt, end_dt, period, stat_types_list
     )
-
-    if not response.get("success"):
-        _raise_recorder_ws_failure(
-            "statistics",
-            response.get("error", "Unknown error"),
-            entity_id_list,
-            suggestions=[
-                "Verify entities have state_class attribute (measurement, total, total_increasing)",
-                "Use ha_search() to check entity attributes",
-                "Statistics are only available for entities that track numeric values",
-            ],
-        )
-
-    result_data = response.get("result", {})
     all_stat_types = stat_types_list or ["mean", "min", "max", "sum", "state", "change"]
     entities_statistics = _format_entity_statistics(
         result_data,
@@ -801,6 +1177,16 @@ async def _fetch_statistics(
         effective_offset,
         effective_limit,
     )
+    # Metadata is only worth a round trip for ids whose rows carry no unit.
+    unitless = [
+        entry for entry in entities_statistics if entry["unit_of_measurement"] is None
+    ]
+    if unitless:
+        units = await _statistics_units(
+            client, cache, [str(entry["entity_id"]) for entry in unitless]
+        )
+        for entry in unitless:
+            entry["unit_of_measurement"] = units.get(entry["entity_id"])
 
     empty_entities: list[str] = [
         str(e["entity_id"]) for e in entities_statistics if e["count"] == 0
@@ -14,6 +14,7 @@ from fastmcp.exceptions import ToolError
 from fastmcp.tools import tool
 from pydantic import Field
 
+from ..client.registry_cache import RegistryCache
 from ..client.rest_client import HomeAssistantAPIError, HomeAssistantConnectionError
 from ..errors import ErrorCode, create_error_response
 from .auto_backup import with_auto_backup
@@ -247,8 +248,14 @@ async def _fetch_device_rows(client: Any) -> list[dict[str, Any]]:
     Routes through ``ha_mcp_tools/device_list`` when the component serves it (the
     raw ``DeviceEntry`` shape, byte-identical to ``config/device_registry/list``),
     else the legacy WS list. Used for LIST mode, where the whole registry is the
-    intended payload.
+    intended payload. A device list the registry cache already holds is served
+    from its id index without either read.
     """
+    cache = getattr(client, "registry_cache", None)
+    if isinstance(cache, RegistryCache):
+        devices = cache.by_id("config/device_registry/list")
+        if devices is not None:
+            return [dict(device) for device in devices.values()]
     result = await fetch_device_list_via_component(client)
     if result is not None:
         return list(result.get("devices", []))
@@ -272,9 +279,14 @@ async def _resolve_device_id_via_legacy(client: Any, entity_id: str) -> str:
     when the read succeeds and the entity is absent or carries no device (the same
     contract).
     """
-    entity_to_device, _ = _build_entity_maps(
-        await _strict_entity_rows(client), need_full=False
+    cache = getattr(client, "registry_cache", None)
+    entity_to_device = (
+        cache.entity_devices() if isinstance(cache, RegistryCache) else None
     )
+    if entity_to_device is None:
+        entity_to_device, _ = _build_entity_maps(
+            await _strict_entity_rows(client), need_full=False
+        )
     device_id = entity_to_device.get(entity_id)
     if device_id:
         return device_id
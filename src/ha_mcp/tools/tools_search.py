@@ -26,7 +26,11 @@ from ..config import get_global_settings
 from ..errors import create_validation_error
 from ..transforms.categorized_search import DEFAULT_PINNED_TOOLS
 from ..utils.entity_membership import normalize_member_entity_ids
-from ..utils.fuzzy_search import apply_hidden_penalty
+from ..utils.fuzzy_search import (
+    FuzzyEntitySearcher,
+    apply_hidden_penalty,
+    create_fuzzy_searcher,
+)
 from ..visibility.resolver import (
     device_registry_needed_for_visibility,
     load_hidden_set,
@@ -1094,16 +1098,16 @@ async def _scrub_component_config_buckets(
     count — the component's corpus-side match count cannot be recomputed
     server-side. No-op unless enforce mode is active.
     """
-    from ..visibility.enforcement import active_hidden_regex, scrub_records
+    from ..visibility.enforcement import active_hidden_matcher, scrub_records
 
-    regex = await active_hidden_regex(client)
-    if regex is None:
+    matcher = await active_hidden_matcher(client)
+    if matcher is None:
         return
     dropped = 0
     for bucket in _CONFIG_BUCKETS:
         records = response.get(bucket)
         if records:
-            kept = scrub_records(records, regex)
+            kept = scrub_records(records, matcher)
             dropped += len(records) - len(kept)
             response[bucket] = kept
     if not dropped:
@@ -2866,10 +2870,6 @@ class SearchTools:
             for eid, entry in (entries_map or {}).items()
         }
 
-        from ..utils.fuzzy_search import create_fuzzy_searcher
-
-        fuzzy_searcher = create_fuzzy_searcher(threshold=80)
-
         entities_for_search = [
             {
                 "entity_id": entity.get("entity_id", ""),
@@ -2881,8 +2881,14 @@ class SearchTools:
             for entity in all_area_entities
         ]
 
+        # The shared searcher, so its index is reused: the area's entities are
+        # refreshed in it (not swapped in for everything else) and results come
+        # from them alone, at this branch's stricter threshold.
+        fuzzy_searcher = getattr(self._smart_tools, "fuzzy_searcher", None)
+        if not isinstance(fuzzy_searcher, FuzzyEntitySearcher):
+            fuzzy_searcher = create_fuzzy_searcher()
         matches, total_matches = fuzzy_searcher.search_entities(
-            entities_for_search, query, limit, offset
+            entities_for_search, query, limit, offset, complete=False, threshold=80
         )
 
         # Top-level `area_filter` already carries this context for the caller;
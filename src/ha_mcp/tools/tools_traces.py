@@ -5,8 +5,11 @@ This module provides tools for retrieving execution traces from Home Assistant
 to help debug automation and script issues.
 """
 
+import asyncio
 import json
 import logging
+from collections import Counter
+from datetime import datetime
 from typing import Annotated, Any, Literal
 
 from fastmcp import Context
@@ -14,6 +17,7 @@ from fastmcp.exceptions import ToolError
 from fastmcp.tools import tool
 from pydantic import Field
 
+from ..client.trace_cache import TraceCache
 from ..errors import ErrorCode, create_error_response
 from .helpers import (
     exception_to_structured_error,
@@ -27,6 +31,16 @@ from .util_helpers import is_connection_error_message
 
 logger = logging.getLogger(__name__)
 
+# Requests in flight at once in analyze mode, across every automation.
+_ANALYZE_CONCURRENCY = 8
+
+# Steps reported per automation in analyze mode.
+_SLOWEST_STEPS = 3
+
+# ``script_execution`` values of a run that ended in an error rather than
+# finishing, stopping on a condition or being cancelled by its run mode.
+_FAILED_EXECUTIONS = frozenset({"error", "aborted"})
+
 
 class TraceTools:
     """Trace retrieval tools for Home Assistant."""
@@ -63,7 +77,7 @@ class TraceTools:
         limit: Annotated[
             int,
             Field(
-                description="Maximum number of traces to return when listing (default: 10, max: 50).",
+                description="Maximum number of traces to return when listing, or latest runs to summarise per automation with analyze=True (default: 10, max: 50).",
                 default=10,
                 ge=1,
                 le=50,
@@ -109,6 +123,17 @@ class TraceTools:
                 default="newest",
             ),
         ] = "newest",
+        analyze: Annotated[
+            bool,
+            Field(
+                description=(
+                    "Summarise the latest `limit` runs of each automation instead of "
+                    "listing them: failure rate, slowest steps and most common error. "
+                    "`automation_id` may name several comma-separated entity_ids."
+                ),
+                default=False,
+            ),
+        ] = False,
         ctx: Context | None = None,
     ) -> dict[str, Any]:
         """
@@ -145,6 +170,11 @@ class TraceTools:
            ha_get_automation_traces("automation.motion_light", run_id="1705312800.123456", deduplicate=False)
            Returns the formatted trace with full variables at every action step.
 
+        5. Compare how several automations have been running (analyze=True):
+           ha_get_automation_traces("automation.motion_light,automation.porch", analyze=True)
+           Returns, per automation, the failure rate of its latest `limit` runs, the
+           slowest steps (time until the next step started) and the most common error.
+
         DEBUGGING EXAMPLES:
 
         Automation not triggering:
@@ -170,20 +200,10 @@ class TraceTools:
         - The 'state' field shows: 'stopped' (completed), 'running', or error state
         """
         try:
-            # Determine domain from entity_id
-            if automation_id.startswith("automation."):
-                domain = "automation"
-            elif automation_id.startswith("script."):
-                domain = "script"
-            else:
-                raise_tool_error(
-                    create_error_response(
-                        ErrorCode.VALIDATION_INVALID_PARAMETER,
-                        f"Invalid entity_id format: {automation_id}",
-                        details="Entity ID must start with 'automation.' or 'script.'",
-                        context={"automation_id": automation_id},
-                    )
-                )
+            if analyze:
+                return await self._analyze_traces(automation_id, limit, ctx)
+
+            domain = _trace_domain(automation_id)
 
             # Extract the object_id (part after the domain) as fallback
             object_id = automation_id.split(".", 1)[1]
@@ -272,6 +292,29 @@ class TraceTools:
         ctx: Context | None,
     ) -> dict[str, Any]:
         """Retrieve and format a single trace by run_id."""
+        trace_data = await self._get_trace(domain, item_id, automation_id, run_id)
+        await safe_progress(ctx, progress=3, total=3, message="formatting trace")
+        return _format_detailed_trace(
+            automation_id,
+            run_id,
+            trace_data,
+            deduplicate=deduplicate,
+            detailed=detailed,
+            sections=sections,
+        )
+
+    async def _get_trace(
+        self, domain: str, item_id: str, automation_id: str, run_id: str
+    ) -> dict[str, Any]:
+        """The trace of one run, from the trace cache once the run has stopped.
+
+        A test double or proxy without a ``TraceCache`` reads through every time.
+        """
+        cache = getattr(self._client, "trace_cache", None)
+        key = (domain, item_id, run_id)
+        if isinstance(cache, TraceCache) and (cached := cache.get(key)) is not None:
+            return cached
+
         result = await self._client.send_websocket_message(
             {
                 "type": "trace/get",
@@ -287,15 +330,77 @@ class TraceTools:
                 {"automation_id": automation_id, "run_id": run_id},
             )
 
-        trace_data = result.get("result", {})
-        await safe_progress(ctx, progress=3, total=3, message="formatting trace")
-        return _format_detailed_trace(
+        trace: dict[str, Any] = result.get("result", {})
+        if isinstance(cache, TraceCache):
+            cache.store(key, trace)
+        return trace
+
+    async def _analyze_traces(
+        self, automation_ids: str, limit: int, ctx: Context | None
+    ) -> dict[str, Any]:
+        """Summarise the latest runs of several automations, fetched concurrently."""
+        ids = list(dict.fromkeys(a.strip() for a in automation_ids.split(",")))
+        ids = [a for a in ids if a]
+        for automation_id in ids:
+            _trace_domain(automation_id)
+
+        await safe_info(
+            ctx, f"ha_get_automation_traces analyzing {len(ids)} automations"
+        )
+        # One bound across every automation: each list and each trace/get
+        # holds a slot only while its own request is in flight.
+        semaphore = asyncio.Semaphore(_ANALYZE_CONCURRENCY)
+        summaries = await asyncio.gather(
+            *(self._summarise_automation(a, limit, semaphore) for a in ids)
+        )
+        return {
+            "success": True,
+            "mode": "analyze",
+            "runs_per_automation": limit,
+            "automation_count": len(summaries),
+            "automations": summaries,
+            "hint": "Use run_id from the slowest steps to get the detailed trace",
+        }
+
+    async def _summarise_automation(
+        self, automation_id: str, limit: int, semaphore: asyncio.Semaphore
+    ) -> dict[str, Any]:
+        """Failure rate, slowest steps and most common error of one automation."""
+        domain = _trace_domain(automation_id)
+        try:
+            async with semaphore:
+                item_id = await _resolve_trace_item_id(
+                    self._client, automation_id, automation_id.split(".", 1)[1]
+                )
+                listed = await self._client.send_websocket_message(
+                    {"type": "trace/list", "domain": domain, "item_id": item_id}
+                )
+        except Exception as e:
+            logger.debug(f"Could not list traces of {automation_id}: {e}")
+            return {"automation_id": automation_id, "error": str(e)}
+        if not listed.get("success"):
+            return {
+                "automation_id": automation_id,
+                "error": str(listed.get("error", "Failed to list traces")),
+            }
+
+        # trace/list is oldest-first.
+        runs = (listed.get("result") or [])[-limit:]
+
+        async def fetch(run_id: str) -> dict[str, Any] | None:
+            try:
+                async with semaphore:
+                    return await self._get_trace(domain, item_id, automation_id, run_id)
+            except Exception as e:
+                logger.debug(f"Could not get trace {run_id} of {automation_id}: {e}")
+                return None
+
+        run_ids = [run["run_id"] for run in runs if run.get("run_id")]
+        traces = await asyncio.gather(*(fetch(run_id) for run_id in run_ids))
+        return _summarise_runs(
             automation_id,
-            run_id,
-            trace_data,
-            deduplicate=deduplicate,
-            detailed=detailed,
-            sections=sections,
+            runs,
+            [(r, t) for r, t in zip(run_ids, traces, strict=True) if t is not None],
         )
 
     async def _fetch_trace_list(
@@ -366,6 +471,22 @@ def register_trace_tools(mcp: Any, client: Any, **kwargs: Any) -> None:
     register_tool_methods(mcp, TraceTools(client))
 
 
+def _trace_domain(automation_id: str) -> str:
+    """The trace domain of an automation or script entity_id."""
+    if automation_id.startswith("automation."):
+        return "automation"
+    if automation_id.startswith("script."):
+        return "script"
+    raise_tool_error(
+        create_error_response(
+            ErrorCode.VALIDATION_INVALID_PARAMETER,
+            f"Invalid entity_id format: {automation_id}",
+            details="Entity ID must start with 'automation.' or 'script.'",
+            context={"automation_id": automation_id},
+        )
+    )
+
+
 def _raise_trace_ws_failure(error_msg: Any, context: dict[str, Any]) -> None:
     """Raise the structured error for a failed trace WS command.
 
@@ -634,6 +755,97 @@ def _format_trace_list(
     return result
 
 
+def _summarise_runs(
+    automation_id: str,
+    runs: list[dict[str, Any]],
+    traces: list[tuple[str, dict[str, Any]]],
+) -> dict[str, Any]:
+    """Compact analyze-mode summary of one automation's latest runs.
+
+    Args:
+        automation_id: The automation or script entity_id
+        runs: The ``trace/list`` entries of the runs summarised
+        traces: ``(run_id, trace)`` for each of those runs whose trace was read
+    """
+    finished = [run for run in runs if run.get("state") == "stopped"]
+    failed = [run for run in finished if _run_failed(run)]
+    errors = Counter(
+        str(run.get("error") or f"script_execution: {run.get('script_execution')}")
+        for run in failed
+    )
+    summary: dict[str, Any] = {
+        "automation_id": automation_id,
+        "runs": len(runs),
+        "finished": len(finished),
+        "failures": len(failed),
+        "failure_rate": round(len(failed) / len(finished), 3) if finished else None,
+        "slowest_steps": _slowest_steps(traces),
+    }
+    if errors:
+        error, count = errors.most_common(1)[0]
+        summary["most_common_error"] = {"error": error, "count": count}
+    return summary
+
+
+def _run_failed(run: dict[str, Any]) -> bool:
+    """Whether a stopped run ended in an error."""
+    return bool(run.get("error")) or run.get("script_execution") in _FAILED_EXECUTIONS
+
+
+def _slowest_steps(traces: list[tuple[str, dict[str, Any]]]) -> list[dict[str, Any]]:
+    """The steps that took longest in any of the traces, slowest first."""
+    slowest: dict[str, dict[str, Any]] = {}
+    for run_id, trace in traces:
+        for path, seconds in _step_durations(trace):
+            known = slowest.get(path)
+            if known is None or seconds > known["seconds"]:
+                slowest[path] = {"path": path, "seconds": seconds, "run_id": run_id}
+    ranked = sorted(slowest.values(), key=lambda step: step["seconds"], reverse=True)
+    return [
+        {**step, "seconds": round(step["seconds"], 3)}
+        for step in ranked[:_SLOWEST_STEPS]
+    ]
+
+
+def _step_durations(trace: dict[str, Any]) -> list[tuple[str, float]]:
+    """``(path, seconds)`` of each step of a trace.
+
+    Steps carry only their start time, so a step lasts until the next step
+    starts, and the last one until the run finished. A step that runs others
+    (``choose``, ``repeat``) is therefore timed up to its first child.
+    """
+    starts = sorted(
+        (started, path)
+        for path, steps in (trace.get("trace") or {}).items()
+        if isinstance(steps, list)
+        for step in steps
+        if isinstance(step, dict)
+        and (started := _parse_trace_time(step.get("timestamp"))) is not None
+    )
+    timestamp = trace.get("timestamp")
+    finish = (
+        _parse_trace_time(timestamp.get("finish"))
+        if isinstance(timestamp, dict)
+        else None
+    )
+    ends = [started for started, _path in starts[1:]] + [finish]
+    return [
+        (path, (end - started).total_seconds())
+        for (started, path), end in zip(starts, ends, strict=False)
+        if end is not None
+    ]
+
+
+def _parse_trace_time(value: Any) -> datetime | None:
+    """Parse a trace timestamp, or None when absent or malformed."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 def _format_detailed_trace(
     automation_id: str,
     run_id: str,
@@ -5,8 +5,9 @@ This module provides general-purpose utility tools including log access,
 template evaluation, and domain documentation retrieval.
 """
 
+import base64
+import json
 import logging
-import re
 import time
 from datetime import UTC, datetime, timedelta
 from typing import Annotated, Any, Literal, NoReturn
@@ -15,6 +16,8 @@ from fastmcp.exceptions import ToolError
 from pydantic import Field
 
 from .._version import is_running_in_addon
+from ..client.error_log_tail import ErrorLogTail
+from ..client.logbook_cache import LogbookCache
 from ..client.rest_client import (
     HomeAssistantAPIError,
     HomeAssistantAuthError,
@@ -24,7 +27,9 @@ from ..errors import ErrorCode, create_error_response
 from .error_log_parsing import (
     _DEFAULT_TOP_N,
     _EMPTY_FETCH_WARNING,
-    _parse_error_log_structured,
+    ErrorLogIndex,
+    _summarise_error_log,
+    index_error_log,
 )
 from .helpers import exception_to_structured_error, log_tool_usage, raise_tool_error
 from .util_helpers import (
@@ -65,13 +70,13 @@ DEFAULT_LOG_LIMIT = 100
 SUPERVISOR_SEARCH_WINDOW_LINES = 2000
 MAX_LIMIT = 500
 
-# Regex to match log level at the start of a log line
-_LOG_LEVEL_RE = re.compile(
-    r"(?:^|\s)(DEBUG|INFO|WARNING|ERROR|CRITICAL)(?:\s|:|\])", re.IGNORECASE
-)
-
 VALID_LOG_LEVELS = ("ERROR", "WARNING", "INFO", "DEBUG", "CRITICAL")
 
+# Seconds of logbook a cursor page asks HA for when nothing better is known.
+# Each page widens the slice until it is full, and hands the density it saw
+# on to the next page through the cursor.
+_LOGBOOK_CURSOR_SPAN = 3600.0
+
 
 def _compact_logbook_entries(entries: list[Any]) -> list[dict[str, Any]]:
     """Strip logbook entries to essential fields only.
@@ -86,6 +91,87 @@ def _compact_logbook_entries(entries: list[Any]) -> list[dict[str, Any]]:
     ]
 
 
+def _logbook_when(entry: Any) -> float | None:
+    """A logbook entry's ``when`` as an epoch (REST sends ISO, WS a number)."""
+    when = entry.get("when") if isinstance(entry, dict) else None
+    if isinstance(when, int | float) and not isinstance(when, bool):
+        return float(when)
+    if isinstance(when, str):
+        try:
+            parsed = datetime.fromisoformat(when.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=UTC)
+        return parsed.timestamp()
+    return None
+
+
+def _encode_logbook_cursor(state: dict[str, Any]) -> str:
+    """Opaque, URL-safe form of a logbook cursor."""
+    raw = json.dumps(state, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_logbook_cursor(cursor: str) -> dict[str, Any]:
+    """Inverse of ``_encode_logbook_cursor``; raises a tool error if malformed."""
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(state, dict) or state.get("v") != 1:
+            raise ValueError("unknown cursor version")
+        for field in ("s", "e", "at", "p"):
+            float(state[field])
+        int(state["k"])
+        if state["o"] not in ("newest", "oldest"):
+            raise ValueError("bad order")
+        if not all(isinstance(state.get(field), str | None) for field in ("i", "q")):
+            raise ValueError("bad filter")
+    except (ValueError, TypeError, KeyError) as e:
+        raise_tool_error(
+            create_error_response(
+                ErrorCode.VALIDATION_INVALID_PARAMETER,
+                f"Invalid logbook cursor: {e}",
+                suggestions=[
+                    "Pass next_cursor exactly as returned by the previous page",
+                    "Omit cursor to start again from the first page",
+                ],
+            )
+        )
+    return state
+
+
+def _logbook_cursor_state(
+    ordered: list[Any],
+    returned: int,
+    start: float,
+    end: float,
+    span: float,
+    order: Literal["newest", "oldest"],
+    entity_id: str | None,
+    search: str | None,
+) -> dict[str, Any] | None:
+    """Cursor after the first ``returned`` entries of ``ordered`` (page order).
+
+    The position is the last returned entry's ``when``; ``k`` counts the
+    returned entries sharing it, so the next page can skip exactly those.
+    """
+    when = _logbook_when(ordered[returned - 1]) if returned else None
+    if when is None:
+        return None
+    seen = sum(1 for entry in ordered[:returned] if _logbook_when(entry) == when)
+    return {
+        "v": 1,
+        "s": start,
+        "e": end,
+        "at": when,
+        "k": seen,
+        "p": max(span, 1.0),
+        "o": order,
+        "i": entity_id,
+        "q": search,
+    }
+
+
 class UtilityTools:
     def __init__(self, client: Any) -> None:
         self._client = client
@@ -221,6 +307,9 @@ class UtilityTools:
         order: Literal["newest", "oldest"],
         structured: bool = False,
         top_n: int | None = None,
+        cursor: str | None = None,
+        integration: str | None = None,
+        since: str | None = None,
     ) -> dict[str, Any]:
         if source == "logbook":
             return await self._get_logbook(
@@ -232,6 +321,7 @@ class UtilityTools:
                 search=search,
                 compact=compact,
                 order=order,
+                cursor=cursor,
             )
         if source == "system":
             return await self._get_system_log(
@@ -245,6 +335,8 @@ class UtilityTools:
                 order=order,
                 structured=structured,
                 top_n=top_n,
+                integration=integration,
+                since=since,
             )
         if source == "logger":
             # logger reports per-integration levels, not time-ordered events;
@@ -275,6 +367,9 @@ class UtilityTools:
         order: Literal["newest", "oldest"] = "newest",
         structured: bool = False,
         top_n: int | None = None,
+        cursor: str | None = None,
+        integration: str | None = None,
+        since: str | None = None,
     ) -> dict[str, Any]:
         level = self._validate_log_level(level)
         warnings = self._collect_log_warnings(
@@ -299,6 +394,14 @@ class UtilityTools:
                 "Parameter 'top_n' only applies to source='error_log' with "
                 f"structured=True; {reason}"
             )
+        warnings += self._source_only_warnings(
+            source,
+            (
+                ("cursor", "logbook", cursor),
+                ("integration", "error_log", integration),
+                ("since", "error_log", since),
+            ),
+        )
         self._validate_log_slug(source, slug)
         result = await self._fetch_log_source(
             source,
@@ -314,6 +417,9 @@ class UtilityTools:
             order,
             structured=structured_error_log,
             top_n=top_n,
+            cursor=cursor,
+            integration=integration,
+            since=since,
         )
         if warnings:
             # Prepend, don't overwrite: the structured error_log path emits its
@@ -322,6 +428,18 @@ class UtilityTools:
             result["warnings"] = warnings + result.get("warnings", [])
         return result
 
+    @staticmethod
+    def _source_only_warnings(
+        source: str, params: tuple[tuple[str, str, str | None], ...]
+    ) -> list[str]:
+        """Warn about ``(name, only_source, value)`` params given to another source."""
+        return [
+            f"Parameter '{name}' only applies to source='{only_source}'; "
+            f"ignored for source='{source}'"
+            for name, only_source, value in params
+            if value is not None and source != only_source
+        ]
+
     @staticmethod
     def _coerce_logbook_params(
         hours_back: int,
@@ -454,8 +572,18 @@ class UtilityTools:
         search: str | None = None,
         compact: bool = True,
         order: Literal["newest", "oldest"] = "newest",
+        cursor: str | None = None,
     ) -> dict[str, Any]:
-        """Fetch logbook entries with search and pagination."""
+        """Fetch logbook entries with search and pagination.
+
+        Offset pages fetch the whole window. A ``cursor`` (``next_cursor`` of
+        the previous page) resumes after the last entry returned and fetches
+        only the slices of the window the next page needs.
+        """
+        if cursor is not None:
+            return await self._get_logbook_after_cursor(
+                _decode_logbook_cursor(cursor), limit, compact
+            )
         hours_back_int, effective_limit, offset_int = self._coerce_logbook_params(
             hours_back, limit, offset
         )
@@ -469,8 +597,8 @@ class UtilityTools:
         start_timestamp = start_dt.isoformat()
 
         try:
-            response = await self._client.get_logbook(
-                entity_id=entity_id, start_time=start_timestamp, end_time=end_time
+            response = await self._fetch_logbook(
+                entity_id, start_dt, end_dt, end_time=end_time
             )
 
             response, filters_applied = self._filter_logbook_by_search(response, search)
@@ -504,6 +632,22 @@ class UtilityTools:
             }
             if filters_applied:
                 logbook_data["filters_applied"] = filters_applied
+            if has_more and isinstance(response, list):
+                ordered = response[::-1] if order == "newest" else response
+                state = _logbook_cursor_state(
+                    ordered,
+                    offset_int + len(paginated_entries),
+                    start_dt.timestamp(),
+                    end_dt.timestamp(),
+                    (end_dt - start_dt).total_seconds()
+                    * effective_limit
+                    / max(total_entries, 1),
+                    order,
+                    entity_id,
+                    search,
+                )
+                if state is not None:
+                    logbook_data["next_cursor"] = _encode_logbook_cursor(state)
             if has_more:
                 logbook_data["pagination_hint"] = self._build_pagination_hint(
                     offset_int,
@@ -532,6 +676,161 @@ class UtilityTools:
             )
             raise  # unreachable: exception_to_structured_error always raises
 
+    async def _fetch_logbook(
+        self,
+        entity_id: str | None,
+        start_dt: datetime,
+        end_dt: datetime,
+        end_time: str | None,
+    ) -> Any:
+        """``/api/logbook`` for one range, from the logbook cache when closed.
+
+        ``end_time`` is what is sent to HA; without one HA reads up to now,
+        which is never cached.
+        """
+        cache = getattr(self._client, "logbook_cache", None)
+        key = (entity_id, start_dt.timestamp(), end_dt.timestamp())
+        if end_time is not None and isinstance(cache, LogbookCache):
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        response = await self._client.get_logbook(
+            entity_id=entity_id, start_time=start_dt.isoformat(), end_time=end_time
+        )
+        if (
+            end_time is not None
+            and isinstance(cache, LogbookCache)
+            and isinstance(response, list)
+        ):
+            cache.store(key, response, time.time())
+        return response
+
+    async def _read_logbook_slice(
+        self, state: dict[str, Any], lo: float, hi: float, first: bool
+    ) -> list[dict[str, Any]]:
+        """Entries of one cursor slice, filtered and in page order.
+
+        Slices share their boundary timestamp. The first slice keeps the
+        cursor's own timestamp (minus the entries already returned there);
+        later slices leave the boundary to the slice before them.
+        """
+        # HA's range bounds are not documented as inclusive: ask for a
+        # millisecond either side and cut exactly here.
+        response = await self._fetch_logbook(
+            state["i"],
+            datetime.fromtimestamp(lo - 0.001, tz=UTC),
+            datetime.fromtimestamp(hi + 0.001, tz=UTC),
+            end_time=datetime.fromtimestamp(hi + 0.001, tz=UTC).isoformat(),
+        )
+        entries, _ = self._filter_logbook_by_search(
+            response if isinstance(response, list) else [], state["q"]
+        )
+        newest = state["o"] == "newest"
+        selected = []
+        for entry in reversed(entries) if newest else entries:
+            when = _logbook_when(entry)
+            if when is None or not lo <= when <= hi:
+                continue
+            if not first and when == (hi if newest else lo):
+                continue
+            selected.append(entry)
+        if first:
+            at_cursor = [e for e in selected if _logbook_when(e) == state["at"]]
+            skipped = {id(e) for e in at_cursor[: int(state["k"])]}
+            selected = [e for e in selected if id(e) not in skipped]
+        return selected
+
+    async def _read_logbook_after_cursor(
+        self, state: dict[str, Any], limit: int
+    ) -> tuple[list[dict[str, Any]], bool, float]:
+        """Up to ``limit`` entries after the cursor, slice by slice.
+
+        Returns the entries (one past ``limit`` when there are more), whether
+        the window is exhausted, and the time span that was read.
+        """
+        start, end, at = float(state["s"]), float(state["e"]), float(state["at"])
+        newest = state["o"] == "newest"
+        span = float(state["p"])
+        edge = at
+        collected: list[dict[str, Any]] = []
+        while True:
+            lo, hi = (
+                (max(start, edge - span), edge)
+                if newest
+                else (
+                    edge,
+                    min(end, edge + span),
+                )
+            )
+            collected += await self._read_logbook_slice(state, lo, hi, edge == at)
+            edge = lo if newest else hi
+            exhausted = edge <= start if newest else edge >= end
+            if exhausted or len(collected) > limit:
+                return collected, exhausted, abs(at - edge)
+            span *= 2
+
+    async def _get_logbook_after_cursor(
+        self, state: dict[str, Any], limit: int | None, compact: bool
+    ) -> dict[str, Any]:
+        """Next logbook page after a cursor (see ``_get_logbook``)."""
+        effective_limit = self._coerce_limit(limit)
+        start_dt = datetime.fromtimestamp(float(state["s"]), tz=UTC)
+        end_dt = datetime.fromtimestamp(float(state["e"]), tz=UTC)
+        try:
+            collected, exhausted, read = await self._read_logbook_after_cursor(
+                state, effective_limit
+            )
+        except ToolError:
+            raise
+        except Exception as e:
+            exception_to_structured_error(
+                e,
+                context={"cursor_position": state["at"]},
+                suggestions=self._logbook_error_suggestions(str(e)),
+            )
+            raise  # unreachable: exception_to_structured_error always raises
+
+        page = collected[:effective_limit]
+        has_more = len(collected) > effective_limit or not exhausted
+        logbook_data: dict[str, Any] = {
+            "success": True,
+            "source": "logbook",
+            "entries": _compact_logbook_entries(page) if compact else page,
+            "start_time": start_dt.isoformat(),
+            "end_time": end_dt.isoformat(),
+            "entity_filter": state["i"],
+            "returned_entries": len(page),
+            "limit": effective_limit,
+            "order": state["o"],
+            "has_more": has_more,
+        }
+        if state["q"]:
+            logbook_data["filters_applied"] = {"search": state["q"]}
+        next_state = (
+            _logbook_cursor_state(
+                page,
+                len(page),
+                float(state["s"]),
+                float(state["e"]),
+                read * effective_limit / max(len(collected), 1),
+                state["o"],
+                state["i"],
+                state["q"],
+            )
+            if has_more
+            else None
+        )
+        if next_state is not None:
+            if next_state["at"] == state["at"]:
+                next_state["k"] += int(state["k"])
+            next_cursor = _encode_logbook_cursor(next_state)
+            logbook_data["next_cursor"] = next_cursor
+            logbook_data["pagination_hint"] = (
+                f"Showing {len(page)} entries. To get the next page, use: "
+                f"ha_get_logs(cursor='{next_cursor}', limit={effective_limit})"
+            )
+        return await add_timezone_metadata(self._client, logbook_data)
+
     @staticmethod
     def _system_log_sort_key(entry: Any) -> float:
         """Total-order-safe sort key for system_log entries.
@@ -642,30 +941,41 @@ class UtilityTools:
 
     def _build_structured_error_log(
         self,
-        raw_log: str,
+        index: ErrorLogIndex,
         search: str | None,
         level: str | None,
         top_n: int | None,
         limit: int | None,
         order: Literal["newest", "oldest"],
+        integration: str | None = None,
+        since: str | None = None,
     ) -> dict[str, Any]:
-        """Summarise the raw error log and annotate what shaped the result."""
+        """Summarise the indexed error log and annotate what shaped the result."""
         effective_top_n = self._coerce_limit(
             top_n,
             default=_DEFAULT_TOP_N,
             suggestion_example="20",
             param_name="top_n",
         )
-        result = _parse_error_log_structured(
-            raw_log,
-            search=search,
-            level=level,
+        extracted = index.extract(
+            search=search, level=level, integration=integration, since=since
+        )
+        result = _summarise_error_log(
+            extracted,
+            extracted.blank + extracted.unparseable + extracted.matched,
             top_n=effective_top_n,
         )
         # Report the filters that shaped the summary, matching the raw path —
         # otherwise an empty summary is indistinguishable from a quiet log.
         structured_filters = {
-            k: v for k, v in (("level", level), ("search", search)) if v
+            k: v
+            for k, v in (
+                ("level", level),
+                ("search", search),
+                ("integration", integration),
+                ("since", since),
+            )
+            if v
         }
         if structured_filters:
             result["filters_applied"] = structured_filters
@@ -694,30 +1004,25 @@ class UtilityTools:
         self,
         raw_log: str,
         search: str | None,
-        level: str | None,
         limit: int | None,
         order: Literal["newest", "oldest"],
+        selected: list[str] | None = None,
     ) -> dict[str, Any]:
-        """Return the most recent log window, and say when nothing arrived."""
+        """Return the most recent log window, and say when nothing arrived.
+
+        ``selected`` replaces the lines of ``raw_log`` when the caller already
+        narrowed them down (by level, integration or time, from the index).
+        """
         # Coerced here rather than before the structured branch: the summary
         # covers the whole fetched window, so `limit` has no meaning there and
         # validating it would reject limit=0 for a parameter with no effect.
         effective_limit = self._coerce_limit(
             limit, default=DEFAULT_LOG_LIMIT, suggestion_example="100"
         )
-        lines = raw_log.splitlines()
+        lines = raw_log.splitlines() if selected is None else selected
 
         filters_applied: dict[str, str] = {}
 
-        if level:
-
-            def _line_has_level(ln: str, target: str) -> bool:
-                m = _LOG_LEVEL_RE.search(ln)
-                return m is not None and m.group(1).upper() == target
-
-            lines = [ln for ln in lines if _line_has_level(ln, level)]
-            filters_applied["level"] = level
-
         if search:
             search_lower = search.lower()
             lines = [ln for ln in lines if search_lower in ln.lower()]
@@ -762,11 +1067,17 @@ class UtilityTools:
         order: Literal["newest", "oldest"] = "newest",
         structured: bool = False,
         top_n: int | None = None,
+        integration: str | None = None,
+        since: str | None = None,
     ) -> dict[str, Any]:
         """Fetch raw error log text (home-assistant.log, or journald).
 
         Container/pip installs read the plain ``home-assistant.log`` file;
         Supervisor-backed installs read HA Core's journald stream instead.
+        The client keeps what it read, and each line is parsed once into an
+        ``ErrorLogIndex``: later calls only fetch and parse what was
+        appended, and ``level``/``integration``/``since`` are answered from
+        the index.
 
         With ``structured=True`` the raw text is collapsed into a counted,
         component-grouped summary instead (see ``_parse_error_log_structured``);
@@ -774,26 +1085,53 @@ class UtilityTools:
         whole fetched window by occurrence count rather than returning a
         positional slice of it), and ``top_n`` bounds it instead.
         """
+        since_key = self._error_log_since(since)
         try:
-            raw_log = await self._client.get_error_log()
+            tail = await self._read_error_log()
+            index = index_error_log(tail)
 
             if structured:
                 return self._build_structured_error_log(
-                    raw_log or "",
+                    index,
                     search=search,
                     level=level,
                     top_n=top_n,
                     limit=limit,
                     order=order,
+                    integration=integration,
+                    since=since_key,
                 )
 
-            return self._build_raw_error_log(
-                raw_log or "",
+            selected = None
+            if level or integration or since_key:
+                selected = [
+                    tail.line(line)
+                    for position in index.positions(
+                        level=level, integration=integration
+                    )
+                    if not since_key or index.entry(position)["timestamp"] >= since_key
+                    for line in index.block(position)
+                ]
+            data = self._build_raw_error_log(
+                tail.text(),
                 search=search,
-                level=level,
                 limit=limit,
                 order=order,
+                selected=selected,
             )
+            if selected is not None:
+                data.setdefault("filters_applied", {}).update(
+                    {
+                        k: v
+                        for k, v in (
+                            ("level", level),
+                            ("integration", integration),
+                            ("since", since_key),
+                        )
+                        if v
+                    }
+                )
+            return data
 
         except ToolError:
             raise
@@ -824,6 +1162,45 @@ class UtilityTools:
             )
             raise  # unreachable: exception_to_structured_error always raises
 
+    async def _read_error_log(self) -> ErrorLogTail:
+        """The error log, read incrementally when the client keeps a tail."""
+        if isinstance(getattr(self._client, "error_log_tail", None), ErrorLogTail):
+            tail: ErrorLogTail = await self._client.read_error_log()
+            return tail
+        tail = ErrorLogTail()
+        tail.replace(await self._client.get_error_log() or "")
+        return tail
+
+    @staticmethod
+    def _error_log_since(since: str | None) -> str | None:
+        """``since`` as a log timestamp, or a tool error when it is not one.
+
+        Log lines carry HA's local time without an offset, so ``since`` is
+        taken in the same form; one with an offset cannot be lined up.
+        """
+        if since is None:
+            return None
+        try:
+            parsed = datetime.fromisoformat(since.strip())
+        except ValueError:
+            parsed = None
+        if parsed is None or parsed.tzinfo is not None:
+            raise_tool_error(
+                create_error_response(
+                    ErrorCode.VALIDATION_INVALID_PARAMETER,
+                    f"Invalid since '{since}': expected a timestamp in Home "
+                    "Assistant's local time without an offset, as the log prints it",
+                    suggestions=[
+                        "Use since='2026-05-27 10:15:00'",
+                        "Pass the window_end of a previous structured call to see "
+                        "only what was logged after it",
+                    ],
+                )
+            )
+        return parsed.isoformat(
+            sep=" ", timespec="milliseconds" if parsed.microsecond else "seconds"
+        )
+
     @staticmethod
     def _parse_logger_entry(entry: Any) -> dict[str, Any] | None:
         if not isinstance(entry, dict):
@@ -1356,6 +1733,18 @@ def register_utility_tools(mcp: Any, client: Any, **kwargs: Any) -> None:
         end_time: str | None = None,
         offset: Annotated[int, Field(ge=0)] = 0,
         compact: bool = True,
+        cursor: Annotated[
+            str | None,
+            Field(
+                description=(
+                    "source='logbook' only. The next_cursor of a previous "
+                    "logbook page: resumes right after its last entry and "
+                    "fetches only the part of the window the next page needs. "
+                    "The window, entity_id, search and order come from the "
+                    "cursor; hours_back, end_time and offset are ignored."
+                )
+            ),
+        ] = None,
         # System/error_log-specific
         level: str | None = None,
         # error_log-specific: structured summary instead of raw text
@@ -1382,6 +1771,27 @@ def register_utility_tools(mcp: Any, client: Any, **kwargs: Any) -> None:
                 ),
             ),
         ] = None,
+        integration: Annotated[
+            str | None,
+            Field(
+                description=(
+                    "source='error_log' only. Keep only entries logged by this "
+                    "integration (e.g. 'zha'), core or custom_components. In raw "
+                    "mode each entry keeps its traceback lines."
+                )
+            ),
+        ] = None,
+        since: Annotated[
+            str | None,
+            Field(
+                description=(
+                    "source='error_log' only. Keep only entries logged at or after "
+                    "this time, given as the log prints it: HA's local time, no "
+                    "offset (e.g. '2026-05-27 10:15:00'). Pass a structured "
+                    "summary's window_end to see only what is new since."
+                )
+            ),
+        ] = None,
         # Supervisor + system_service-specific (different namespaces)
         slug: str | None = None,
     ) -> dict[str, Any]:
@@ -1410,9 +1820,11 @@ def register_utility_tools(mcp: Any, client: Any, **kwargs: Any) -> None:
 
         **Shared params:** limit, search (keyword filter on entries/lines; matches integration domain for source='logger')
         **Order:** order='newest' (default) returns most-recent first; order='oldest' returns chronological-first. Applies to all time-ordered sources (logbook, system, error_log, supervisor, system_service); ignored for source='logger' and for error_log with structured=True. For raw-text sources (error_log, supervisor, system_service) it sets the read direction of the most-recent window.
-        **Logbook params:** hours_back, entity_id, end_time, offset, compact (default True — strips attribute dicts to save context)
+        **Logbook params:** hours_back, entity_id, end_time, offset, compact (default True — strips attribute dicts to save context), cursor (pass a page's next_cursor to page on cheaply; preferred over offset for long windows)
         **System/error_log params:** level (ERROR, WARNING, INFO, DEBUG, CRITICAL)
-        **error_log params:** structured, top_n. In structured mode `search`
+        **error_log params:** structured, top_n, integration, since. Repeat
+            calls only fetch and parse what was appended to the log since the
+            last one, so polling with `since` is cheap. In structured mode `search`
             matches the message and logger name only, whereas on the raw path it
             matches the whole line; `limit`/`order` do not apply, and issues are
             ranked by count, then severity, then recency.
@@ -1436,6 +1848,9 @@ def register_utility_tools(mcp: Any, client: Any, **kwargs: Any) -> None:
             order=order,
             structured=structured,
             top_n=top_n,
+            cursor=cursor,
+            integration=integration,
+            since=since,
         )
 
     @mcp.tool(
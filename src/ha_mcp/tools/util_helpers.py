@@ -18,11 +18,11 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from fastmcp.exceptions import ToolError
 from pydantic import BeforeValidator, ValidationError
 
+from ..client.event_bus import EventCallback, EventListener, get_event_bus
 from ..client.rest_client import (
     HomeAssistantAPIError,
     HomeAssistantAuthError,
     HomeAssistantCommandError,
-    HomeAssistantCommandTimeout,
     HomeAssistantConnectionError,
 )
 from .component_api import get_component_caps
@@ -943,23 +943,24 @@ async def _get_waiter_ws_client(client: Any) -> Any:
 async def _ws_subscribe_all(
     ws_client: Any,
     event_types: tuple[str, ...],
-    handler: Any,
-    attached_handlers: list[str],
-    sub_ids: list[int],
+    handler: EventCallback,
+    listeners: list[EventListener],
     description: str,
     identifier: str,
+    entity_id: str | None = None,
 ) -> bool:
-    """Attach event handler and subscribe to all event_types.
+    """Register ``handler`` on the client's shared event bus for all event_types.
 
-    Populates attached_handlers and sub_ids in-place.
+    The bus refcounts one HA subscription per event type across every
+    concurrent waiter, so this only subscribes when no other waiter already
+    holds that event type. ``entity_id`` indexes the handler so it only sees
+    events about that entity. Populates ``listeners`` in-place.
     Returns True on success, False if a non-auth error triggers REST fallback.
     """
-    for et in event_types:
-        ws_client.add_event_handler(et, handler)
-        attached_handlers.append(et)
+    bus = get_event_bus(ws_client)
     for et in event_types:
         try:
-            sub_ids.append(await ws_client.subscribe_events(et))
+            listeners.append(await bus.listen(et, handler, entity_id=entity_id))
         except HomeAssistantAuthError:
             raise
         except (
@@ -1078,31 +1079,10 @@ async def _ws_run_wait_loop(
     return None
 
 
-async def _ws_cleanup(
-    ws_client: Any,
-    attached_handlers: list[str],
-    sub_ids: list[int],
-    handler: Callable[[dict[str, Any]], Awaitable[None]],
-) -> None:
-    for et in attached_handlers:
-        ws_client.remove_event_handler(et, handler)
-    for sub_id in sub_ids:
-        try:
-            await ws_client.unsubscribe_events(sub_id)
-        except (HomeAssistantConnectionError, OSError, TimeoutError) as e:
-            logger.warning(
-                "unsubscribe_events(%s) cleanup failed (subscription "
-                "may leak until WS pool reconnects): %s",
-                sub_id,
-                e,
-            )
-        except HomeAssistantCommandTimeout:
-            logger.warning(
-                "unsubscribe_events(%s) cleanup timed out on WS "
-                "round-trip; subscription may leak until WS pool "
-                "reconnects",
-                sub_id,
-            )
+async def _ws_cleanup(ws_client: Any, listeners: list[EventListener]) -> None:
+    bus = get_event_bus(ws_client)
+    for listener in listeners:
+        await bus.release(listener)
 
 
 async def _ws_wait_for_condition(
@@ -1135,12 +1115,13 @@ async def _ws_wait_for_condition(
     ``identifier`` is used only for log lines — usually an entity_id but
     may be a descriptor like ``automation[unique_id=...]`` for discovery
     waits (#1395) that don't know the entity_id up front. When
-    ``event_filter`` is None the default predicate matches events whose
-    ``data["entity_id"]`` equals ``identifier`` — i.e. the standard
+    ``event_filter`` is None the waiter is indexed on the shared event bus
+    under ``identifier`` as an entity_id, so only events whose
+    ``data["entity_id"]`` equals it reach the handler — the standard
     "watch this entity_id" shape used by ``wait_for_entity_*`` /
     ``wait_for_state_change``. Callers that need a different match shape
     (e.g. "any automation with attributes.id == unique_id") pass a custom
-    ``event_filter``.
+    ``event_filter`` and receive every event of ``event_types``.
 
     Returns ``sample``'s truthy return value, or ``None`` on timeout.
     """
@@ -1156,34 +1137,23 @@ async def _ws_wait_for_condition(
 
     nudge = asyncio.Event()
 
-    def _default_filter(event: dict[str, Any]) -> bool:
-        # HA nests ``entity_id`` under ``event["data"]`` for both
-        # state_changed and entity_registry_updated. The top-level fallback
-        # is defensive only — it lets a future schema drift degrade to a
-        # missed nudge rather than an AttributeError.
-        data = event.get("data") or {}
-        evt_entity = data.get("entity_id") or event.get("entity_id")
-        return bool(evt_entity == identifier)
-
-    filter_fn = event_filter if event_filter is not None else _default_filter
-
     async def handler(event: dict[str, Any]) -> None:
-        if filter_fn(event):
+        if event_filter is None or event_filter(event):
             nudge.set()
 
-    # Track which handlers / subscriptions we actually attached so cleanup
-    # is exact even if subscribe_events raises partway through.
-    attached_handlers: list[str] = []
-    sub_ids: list[int] = []
+    # Track which listeners we actually registered so cleanup is exact even
+    # if a subscribe raises partway through. Without a custom filter the
+    # bus's entity index already restricts delivery to ``identifier``.
+    listeners: list[EventListener] = []
     try:
         if not await _ws_subscribe_all(
             ws_client,
             event_types,
             handler,
-            attached_handlers,
-            sub_ids,
+            listeners,
             description,
             identifier,
+            entity_id=identifier if event_filter is None else None,
         ):
             return await _legacy_poll_until(
                 identifier,
@@ -1213,7 +1183,7 @@ async def _ws_wait_for_condition(
             identifier,
         )
     finally:
-        await _ws_cleanup(ws_client, attached_handlers, sub_ids, handler)
+        await _ws_cleanup(ws_client, listeners)
 
 
 async def wait_for_entity_registered(
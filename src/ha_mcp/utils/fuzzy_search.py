@@ -13,7 +13,10 @@ See issue #851 for background on the BM25 migration.
 import logging
 import math
 import re
-from collections.abc import Iterable
+import threading
+from collections import Counter
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass
 from difflib import SequenceMatcher
 from typing import Any
 
@@ -62,6 +65,14 @@ def _strip_separators(text: str) -> str:
     return _SPLIT_RE.sub("", text.lower())
 
 
+def _term_frequencies(tokens: list[str]) -> dict[str, int]:
+    """Count occurrences of each token in a document."""
+    tf: dict[str, int] = {}
+    for t in tokens:
+        tf[t] = tf.get(t, 0) + 1
+    return tf
+
+
 # ---------------------------------------------------------------------------
 # BM25 scorer – lightweight, zero-dependency
 # ---------------------------------------------------------------------------
@@ -81,6 +92,7 @@ class BM25Scorer:
         # Populated by fit()
         self._idf: dict[str, float] = {}
         self._doc_tokens: list[list[str]] = []
+        self._doc_tfs: list[dict[str, int]] = []
         self._doc_lens: list[int] = []
         self._avgdl: float = 0.0
 
@@ -94,6 +106,8 @@ class BM25Scorer:
             return
 
         self._doc_lens = [len(doc) for doc in corpus]
+        # Term frequencies once per fit, not once per scored document.
+        self._doc_tfs = [_term_frequencies(doc) for doc in corpus]
         self._avgdl = sum(self._doc_lens) / n
         # Guard against all-empty corpora: avoids nan from 0/0 in length normalization
         if self._avgdl == 0.0:
@@ -118,14 +132,9 @@ class BM25Scorer:
 
     def score(self, query_tokens: list[str], doc_index: int) -> float:
         """Return the BM25 score for *query_tokens* against document at *doc_index*."""
-        doc = self._doc_tokens[doc_index]
+        tf = self._doc_tfs[doc_index]
         dl = self._doc_lens[doc_index]
 
-        # term frequency in this document
-        tf: dict[str, int] = {}
-        for t in doc:
-            tf[t] = tf.get(t, 0) + 1
-
         total = 0.0
         for qt in query_tokens:
             idf = self._idf.get(qt, 0.0)
@@ -158,17 +167,361 @@ class BM25Scorer:
         return sum(self._idf.get(t, max_idf) for t in query_tokens)
 
 
+# ---------------------------------------------------------------------------
+# EntitySearchIndex – persistent inverted index behind FuzzyEntitySearcher
+# ---------------------------------------------------------------------------
+
+# Minimum SequenceMatcher ratio (0-100) for the tier-3 typo fallback.
+_TYPO_MIN_RATIO = 75
+
+
+def _collect_alias_tokens(
+    aliases: Any, id_name_tokens: set[str]
+) -> tuple[list[str], set[str]]:
+    """Tokenize entity registry aliases for the BM25 document.
+
+    Aliases (entity registry). Each alias contributes both its
+    tokenized form and its separator-stripped concat. We track
+    only the alias tokens that *aren't* already in id+name —
+    otherwise a query like `bed` would mislabel a friendly_name
+    match as `alias_match` whenever the entity also has a
+    `bed`-containing alias.
+
+    Returns:
+        Tuple of (tokens to add to the document, alias-only tokens
+        used to label a hit as ``alias_match``).
+    """
+    extra_tokens: list[str] = []
+    entity_alias_tokens: set[str] = set()
+    for alias in aliases or []:
+        if not isinstance(alias, str):
+            continue
+        a_tokens = tokenize(alias)
+        extra_tokens.extend(a_tokens)
+        for t in a_tokens:
+            if t not in id_name_tokens:
+                entity_alias_tokens.add(t)
+        a_concat = _strip_separators(alias)
+        if a_concat:
+            extra_tokens.append(a_concat)
+            if a_concat not in id_name_tokens:
+                entity_alias_tokens.add(a_concat)
+    return extra_tokens, entity_alias_tokens
+
+
+def _entity_document(
+    entity_id: str, friendly_name: str, aliases: Any
+) -> tuple[list[str], set[str]]:
+    """Build one entity's BM25 document.
+
+    Tokens from entity_id + friendly_name + entity registry aliases (when
+    callers enrich entities with the ``_aliases`` key — see
+    smart_search.smart_entity_search).
+
+    Returns:
+        Tuple of (document tokens, alias-only tokens for
+        ``match_type="alias_match"``).
+    """
+    id_tokens = tokenize(entity_id)
+    name_tokens = tokenize(friendly_name)
+    tokens = list(id_tokens + name_tokens)
+
+    # Separator-stripped forms (concat tokens) so queries that
+    # elide separators match — e.g. `bedlight` finds `light.bed_light`.
+    tail = entity_id.split(".", 1)[1] if "." in entity_id else entity_id
+    tail_concat = _strip_separators(tail)
+    if tail_concat:
+        tokens.append(tail_concat)
+    name_concat = _strip_separators(friendly_name)
+    if name_concat and name_concat != tail_concat:
+        tokens.append(name_concat)
+
+    id_name_tokens = set(id_tokens) | set(name_tokens)
+    id_name_tokens.add(tail_concat)
+    id_name_tokens.add(name_concat)
+    alias_tokens, entity_alias_tokens = _collect_alias_tokens(aliases, id_name_tokens)
+    tokens.extend(alias_tokens)
+    return tokens, entity_alias_tokens
+
+
+@dataclass
+class _IndexedEntity:
+    """One entity's document in an :class:`EntitySearchIndex`."""
+
+    # (friendly_name, aliases) the document was tokenized from; a change
+    # means the entity was renamed or re-aliased and must be re-indexed.
+    signature: tuple[Any, tuple[Any, ...]]
+    tf: dict[str, int]
+    length: int
+    alias_hit: set[str]
+    # Latest state object seen for this entity (state, attributes and
+    # ``_hidden_by`` change freely without touching the postings).
+    entity: dict[str, Any]
+
+
+class EntitySearchIndex:
+    """Inverted BM25 index over entity documents, maintained incrementally.
+
+    Keyed by entity_id. :meth:`sync` diffs the caller's entity list against
+    the index and re-tokenizes only entities that were added, renamed or
+    re-aliased; removed entities drop out of the postings. Scoring walks
+    only the postings of the query tokens, and the typo tier compares query
+    tokens against the distinct vocabulary, pruned by length and shared
+    characters, instead of every token of every document.
+
+    Scores are identical to fitting :class:`BM25Scorer` on the same entity
+    list: IDF and average document length are derived from the live
+    postings at query time.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.5) -> None:
+        self.k1 = k1
+        self.b = b
+        self._docs: dict[str, _IndexedEntity] = {}
+        # token -> {entity_id: term frequency}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._total_len = 0
+        # Typo-tier vocabulary: token length -> tokens, plus each token's
+        # character counts for the shared-character bound.
+        self._vocab_by_len: dict[int, set[str]] = {}
+        self._vocab_chars: dict[str, Counter[str]] = {}
+        self._min_df: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self._docs
+
+    # -- maintenance --------------------------------------------------------
+
+    def sync(self, entities: Iterable[dict[str, Any]], *, prune: bool = True) -> None:
+        """Make the index hold exactly ``entities``.
+
+        Unchanged entities only have their state object refreshed; new,
+        renamed or re-aliased ones are (re-)tokenized and entities missing
+        from ``entities`` are removed, unless ``prune`` is False (the caller
+        passes a subset and the rest of the index stays as it was).
+
+        An entity whose ``_aliases`` is None had its aliases left unfetched
+        by the caller and keeps the ones already indexed.
+        """
+        seen: set[str] = set()
+        for entity in entities:
+            entity_id = entity.get("entity_id", "")
+            seen.add(entity_id)
+            doc = self._docs.get(entity_id)
+            signature = self._signature(entity, doc)
+            if doc is not None and doc.signature == signature:
+                doc.entity = entity
+            else:
+                self._index(entity, signature)
+        if not prune:
+            return
+        for entity_id in self._docs.keys() - seen:
+            self.remove(entity_id)
+
+    @staticmethod
+    def _signature(
+        entity: dict[str, Any], doc: _IndexedEntity | None = None
+    ) -> tuple[Any, tuple[Any, ...]]:
+        entity_id = entity.get("entity_id", "")
+        friendly_name = entity.get("attributes", {}).get("friendly_name", entity_id)
+        aliases = entity.get("_aliases")
+        if aliases is None and doc is not None:
+            return friendly_name, doc.signature[1]
+        return friendly_name, tuple(aliases or ())
+
+    def upsert(self, entity: dict[str, Any]) -> None:
+        """Add ``entity`` or re-index it after a rename / alias change."""
+        self._index(entity, self._signature(entity))
+
+    def _index(
+        self, entity: dict[str, Any], signature: tuple[Any, tuple[Any, ...]]
+    ) -> None:
+        entity_id = entity.get("entity_id", "")
+        self.remove(entity_id)
+        tokens, alias_hit = _entity_document(entity_id, signature[0], signature[1])
+        tf = _term_frequencies(tokens)
+        self._docs[entity_id] = _IndexedEntity(
+            signature=signature,
+            tf=tf,
+            length=len(tokens),
+            alias_hit=alias_hit,
+            entity=entity,
+        )
+        self._total_len += len(tokens)
+        for token, freq in tf.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = {}
+                self._vocab_by_len.setdefault(len(token), set()).add(token)
+                self._vocab_chars[token] = Counter(token)
+            posting[entity_id] = freq
+        self._min_df = None
+
+    def remove(self, entity_id: str) -> None:
+        """Drop ``entity_id`` from the index (no-op when absent)."""
+        doc = self._docs.pop(entity_id, None)
+        if doc is None:
+            return
+        self._total_len -= doc.length
+        for token in doc.tf:
+            posting = self._postings[token]
+            del posting[entity_id]
+            if not posting:
+                del self._postings[token]
+                del self._vocab_chars[token]
+                bucket = self._vocab_by_len[len(token)]
+                bucket.discard(token)
+                if not bucket:
+                    del self._vocab_by_len[len(token)]
+        self._min_df = None
+
+    # -- lookups ------------------------------------------------------------
+
+    def entity(self, entity_id: str) -> dict[str, Any]:
+        """Latest state object synced for ``entity_id``."""
+        return self._docs[entity_id].entity
+
+    def alias_hit(self, entity_id: str) -> set[str]:
+        """Tokens that matched ``entity_id`` only through an alias."""
+        return self._docs[entity_id].alias_hit
+
+    # -- BM25 ---------------------------------------------------------------
+
+    def _idf(self, df: int) -> float:
+        n = len(self._docs)
+        # IDF with smoothing (Robertson variant), as in BM25Scorer.fit
+        return math.log((n - df + 0.5) / (df + 0.5) + 1.0)
+
+    def bm25_scores(self, query_tokens: list[str]) -> dict[str, float]:
+        """Raw BM25 score per entity sharing at least one query token."""
+        n = len(self._docs)
+        if n == 0:
+            return {}
+        avgdl = self._total_len / n
+        # Guard against all-empty corpora: avoids nan from 0/0 in length normalization
+        if avgdl == 0.0:
+            avgdl = 1.0
+
+        idf: dict[str, float] = {}
+        candidates: set[str] = set()
+        for qt in query_tokens:
+            posting = self._postings.get(qt)
+            if posting and qt not in idf:
+                idf[qt] = self._idf(len(posting))
+                candidates.update(posting)
+
+        scores: dict[str, float] = {}
+        for entity_id in candidates:
+            doc = self._docs[entity_id]
+            norm = self.k1 * (1 - self.b + self.b * doc.length / avgdl)
+            total = 0.0
+            for qt in query_tokens:
+                f = doc.tf.get(qt, 0)
+                if f == 0:
+                    continue
+                total += idf[qt] * (f * (self.k1 + 1)) / (f + norm)
+            scores[entity_id] = total
+        return scores
+
+    def max_possible_score(self, query_tokens: list[str]) -> float:
+        """Theoretical maximum BM25 score; see BM25Scorer.max_possible_score."""
+        if not self._postings:
+            return 0.0
+        if self._min_df is None:
+            self._min_df = min(len(posting) for posting in self._postings.values())
+        # IDF falls as document frequency rises, so the rarest token has the max.
+        max_idf = self._idf(self._min_df)
+        total = 0.0
+        for t in query_tokens:
+            posting = self._postings.get(t)
+            total += self._idf(len(posting)) if posting else max_idf
+        return total
+
+    # -- typo tier ----------------------------------------------------------
+
+    def close_tokens(self, query_token: str) -> dict[str, int]:
+        """Vocabulary tokens within the typo threshold of ``query_token``.
+
+        SequenceMatcher's ratio is ``2*M / (len(a) + len(b))`` where ``M``
+        (matched characters) can exceed neither the shorter length nor the
+        shared-character count. Both bounds are checked before running the
+        matcher, so the result equals a full-vocabulary scan.
+        """
+        qlen = len(query_token)
+        q_chars = Counter(query_token)
+        close: dict[str, int] = {}
+        for length, tokens in self._vocab_by_len.items():
+            if 200 * min(qlen, length) < _TYPO_MIN_RATIO * (qlen + length):
+                continue
+            for token in tokens:
+                shared = sum((q_chars & self._vocab_chars[token]).values())
+                if 200 * shared < _TYPO_MIN_RATIO * (qlen + length):
+                    continue
+                ratio = calculate_ratio(query_token, token)
+                if ratio >= _TYPO_MIN_RATIO:
+                    close[token] = ratio
+        return close
+
+    def typo_scores(self, query_tokens: list[str]) -> dict[str, int]:
+        """Best typo-tier ratio per entity passing the coverage gate.
+
+        For multi-token queries, additionally requires coverage:
+        at least half of the distinct query tokens must each have *some*
+        doc token they ratio-match. Without this, a single-token
+        accidental hit (e.g. ``garbage`` ≈ ``garage``) is enough to
+        surface unrelated entities at score 92 from a 3-token query
+        whose other two tokens have no doc relationship.
+        """
+        distinct_query_tokens = list(dict.fromkeys(query_tokens))
+        n_distinct = len(distinct_query_tokens)
+        best: dict[str, int] = {}
+        covered: dict[str, int] = {}
+        for qt in distinct_query_tokens:
+            hit: set[str] = set()
+            for token, ratio in self.close_tokens(qt).items():
+                for entity_id in self._postings[token]:
+                    if ratio > best.get(entity_id, 0):
+                        best[entity_id] = ratio
+                    hit.add(entity_id)
+            for entity_id in hit:
+                covered[entity_id] = covered.get(entity_id, 0) + 1
+        if n_distinct > 1:
+            # < 50% coverage is rejected
+            return {
+                entity_id: score
+                for entity_id, score in best.items()
+                if covered[entity_id] * 2 >= n_distinct
+            }
+        return best
+
+
 # ---------------------------------------------------------------------------
 # FuzzyEntitySearcher – now BM25-primary with SequenceMatcher fallback
 # ---------------------------------------------------------------------------
 
 
+def _match_fields(entity: dict[str, Any]) -> tuple[str, str, str, dict[str, Any], str]:
+    """(entity_id, friendly_name, domain, attributes, state) for a result."""
+    entity_id = entity.get("entity_id", "")
+    attributes = entity.get("attributes", {})
+    friendly_name = attributes.get("friendly_name", entity_id)
+    domain = entity_id.split(".")[0] if "." in entity_id else ""
+    return entity_id, friendly_name, domain, attributes, entity.get("state", "unknown")
+
+
 class FuzzyEntitySearcher:
     """Entity search with BM25 keyword scoring and SequenceMatcher fallback."""
 
     def __init__(self, threshold: int = 60):
         """Initialize with fuzzy matching threshold."""
         self.threshold = threshold
+        # Persistent across searches so each query only re-tokenizes the
+        # entities that changed since the previous one.
+        self._index = EntitySearchIndex()
+        self._index_lock = threading.Lock()
 
     def search_entities(
         self,
@@ -176,14 +529,34 @@ class FuzzyEntitySearcher:
         query: str,
         limit: int = 10,
         offset: int = 0,
+        *,
+        scope: Collection[str] | None = None,
+        complete: bool = True,
+        threshold: int | None = None,
     ) -> tuple[list[dict[str, Any]], int]:
         """Search entities using BM25 scoring with SequenceMatcher typo fallback.
 
+        ``entities`` is the whole searchable set, so one persistent index
+        serves every caller: per-query filters (a domain, hiding hidden
+        entities) go in ``scope``, the entity_ids results may be drawn from,
+        instead of narrowing ``entities`` — a narrowed list would drop the
+        rest of the index and the next unfiltered search would re-tokenize it.
+        A caller holding only a subset (area search) passes
+        ``complete=False``: its entities are added or refreshed without
+        dropping the others, and results are drawn from them alone.
+        ``threshold`` overrides the searcher's own for this call.
+
         Strategy:
-          1. Tokenize every entity (entity_id + friendly_name) into a BM25 corpus.
-          2. Score all documents with BM25.  Keep results above a positive threshold.
+          1. Sync the persistent index to ``entities`` (entity_id +
+             friendly_name + aliases are tokenized only when they change).
+          2. Score the documents in the query tokens' postings with BM25.
+             Keep results above a positive threshold.
           3. If BM25 returns nothing, fall back to token-level SequenceMatcher on
-             query tokens vs document tokens (catches single-character typos).
+             query tokens vs the index vocabulary (catches single-character typos).
+
+        Callers enrich entities with ``_aliases`` and ``_hidden_by`` (see
+        smart_search.smart_entity_search); hidden entities are penalised
+        rather than filtered.
 
         Returns:
             Tuple of (paginated results list, total match count)
@@ -196,36 +569,38 @@ class FuzzyEntitySearcher:
         if not query_tokens:
             return [], 0
 
-        docs, meta, alias_hit, hidden_flags = self._build_entity_documents(entities)
-
-        # Fit BM25
-        scorer = BM25Scorer()
-        scorer.fit(docs)
-        raw_scores = scorer.score_all(query_tokens)
-
-        # Normalise against theoretical max (sum of IDFs) to produce absolute
-        # scores in the 0-100 range. Empirical-max normalization would always
-        # inflate the best match to 100 regardless of actual relevance, which
-        # defeats the purpose of a threshold-based quality gate.
-        theoretical_max = scorer.max_possible_score(query_tokens)
-        matches = self._score_bm25_candidates(
-            raw_scores,
-            theoretical_max,
-            query_tokens,
-            query_lower,
-            meta,
-            alias_hit,
-            hidden_flags,
-        )
+        if scope is None and not complete:
+            scope = {entity.get("entity_id", "") for entity in entities}
+        threshold = self.threshold if threshold is None else threshold
+
+        with self._index_lock:
+            index = self._index
+            index.sync(entities, prune=complete)
+            raw_scores = index.bm25_scores(query_tokens)
+            if scope is not None:
+                raw_scores = {
+                    entity_id: raw
+                    for entity_id, raw in raw_scores.items()
+                    if entity_id in scope
+                }
 
-        # Tier-3 fallback: token-level SequenceMatcher only if BM25 scored
-        # every document at zero. Firing the fallback when BM25 found valid
-        # partial matches (just below threshold) would allow a character-level
-        # match on the same token to inflate the score to 100, re-introducing
-        # exactly the noise floor the new absolute normalization is fixing.
-        bm25_found_any = any(raw > 0 for raw in raw_scores)
-        if not matches and not bm25_found_any:
-            matches = self._typo_fallback(query_tokens, docs, meta, hidden_flags)
+            # Normalise against theoretical max (sum of IDFs) to produce absolute
+            # scores in the 0-100 range. Empirical-max normalization would always
+            # inflate the best match to 100 regardless of actual relevance, which
+            # defeats the purpose of a threshold-based quality gate.
+            theoretical_max = index.max_possible_score(query_tokens)
+            matches = self._score_bm25_candidates(
+                raw_scores, theoretical_max, query_tokens, query_lower, threshold
+            )
+
+            # Tier-3 fallback: token-level SequenceMatcher only if BM25 scored
+            # every document at zero. Firing the fallback when BM25 found valid
+            # partial matches (just below threshold) would allow a character-level
+            # match on the same token to inflate the score to 100, re-introducing
+            # exactly the noise floor the new absolute normalization is fixing.
+            bm25_found_any = any(raw > 0 for raw in raw_scores.values())
+            if not matches and not bm25_found_any:
+                matches = self._typo_fallback(query_tokens, scope)
 
         # Tie-break on entity_id so paginated requests return stable
         # ordering when several entities share a score (common with the
@@ -236,115 +611,13 @@ class FuzzyEntitySearcher:
 
     # -- private helpers -----------------------------------------------------
 
-    @staticmethod
-    def _collect_alias_tokens(
-        aliases: Any, id_name_tokens: set[str]
-    ) -> tuple[list[str], set[str]]:
-        """Tokenize entity registry aliases for the BM25 document.
-
-        Aliases (entity registry). Each alias contributes both its
-        tokenized form and its separator-stripped concat. We track
-        only the alias tokens that *aren't* already in id+name —
-        otherwise a query like `bed` would mislabel a friendly_name
-        match as `alias_match` whenever the entity also has a
-        `bed`-containing alias.
-
-        Returns:
-            Tuple of (tokens to add to the document, alias-only tokens
-            used to label a hit as ``alias_match``).
-        """
-        extra_tokens: list[str] = []
-        entity_alias_tokens: set[str] = set()
-        for alias in aliases or []:
-            if not isinstance(alias, str):
-                continue
-            a_tokens = tokenize(alias)
-            extra_tokens.extend(a_tokens)
-            for t in a_tokens:
-                if t not in id_name_tokens:
-                    entity_alias_tokens.add(t)
-            a_concat = _strip_separators(alias)
-            if a_concat:
-                extra_tokens.append(a_concat)
-                if a_concat not in id_name_tokens:
-                    entity_alias_tokens.add(a_concat)
-        return extra_tokens, entity_alias_tokens
-
-    def _build_entity_documents(
-        self, entities: list[dict[str, Any]]
-    ) -> tuple[
-        list[list[str]],
-        list[tuple[str, str, str, dict[str, Any], str]],
-        list[set[str]],
-        list[Any],
-    ]:
-        """Build the BM25 corpus and parallel per-entity metadata.
-
-        Build per-entity document: tokens from entity_id + friendly_name
-        + entity registry aliases (when callers enrich entities with the
-        ``_aliases`` key — see smart_search.smart_entity_search).
-
-        Returns:
-            Tuple of (docs, meta, alias_hit, hidden_flags):
-              - docs: tokenized document per entity, for BM25 fitting.
-              - meta: (eid, name, domain, attrs, state) per entity.
-              - alias_hit: per-entity set of tokens that matched only on
-                alias (for `match_type="alias_match"`).
-              - hidden_flags: per-entity ``hidden_by`` value so the
-                score-penalty pass can depress hidden hits without
-                filtering them. Callers enrich via the ``_hidden_by``
-                key — see smart_search.smart_entity_search.
-        """
-        docs: list[list[str]] = []
-        meta: list[tuple[str, str, str, dict[str, Any], str]] = []
-        alias_hit: list[set[str]] = []
-        hidden_flags: list[Any] = []
-
-        for entity in entities:
-            entity_id = entity.get("entity_id", "")
-            attributes = entity.get("attributes", {})
-            friendly_name = attributes.get("friendly_name", entity_id)
-            domain = entity_id.split(".")[0] if "." in entity_id else ""
-            state = entity.get("state", "unknown")
-
-            id_tokens = tokenize(entity_id)
-            name_tokens = tokenize(friendly_name)
-            tokens = list(id_tokens + name_tokens)
-
-            # Separator-stripped forms (concat tokens) so queries that
-            # elide separators match — e.g. `bedlight` finds `light.bed_light`.
-            tail = entity_id.split(".", 1)[1] if "." in entity_id else entity_id
-            tail_concat = _strip_separators(tail)
-            if tail_concat:
-                tokens.append(tail_concat)
-            name_concat = _strip_separators(friendly_name)
-            if name_concat and name_concat != tail_concat:
-                tokens.append(name_concat)
-
-            id_name_tokens = set(id_tokens) | set(name_tokens)
-            id_name_tokens.add(tail_concat)
-            id_name_tokens.add(name_concat)
-            alias_tokens, entity_alias_tokens = self._collect_alias_tokens(
-                entity.get("_aliases", []), id_name_tokens
-            )
-            tokens.extend(alias_tokens)
-
-            docs.append(tokens)
-            meta.append((entity_id, friendly_name, domain, attributes, state))
-            alias_hit.append(entity_alias_tokens)
-            hidden_flags.append(entity.get("_hidden_by"))
-
-        return docs, meta, alias_hit, hidden_flags
-
     def _score_bm25_candidates(
         self,
-        raw_scores: list[float],
+        raw_scores: dict[str, float],
         theoretical_max: float,
         query_tokens: list[str],
         query_lower: str,
-        meta: list[tuple[str, str, str, dict[str, Any], str]],
-        alias_hit: list[set[str]],
-        hidden_flags: list[Any],
+        threshold: int,
     ) -> list[dict[str, Any]]:
         """Convert raw BM25 scores into threshold-gated, penalty-applied match dicts.
 
@@ -358,19 +631,20 @@ class FuzzyEntitySearcher:
             return matches
 
         query_token_set = set(query_tokens)
-        for i, raw in enumerate(raw_scores):
+        for entity_id, raw in raw_scores.items():
             if raw <= 0:
                 continue
             raw_score = min(100, round(raw / theoretical_max * 100))
-            if raw_score < self.threshold:
+            if raw_score < threshold:
                 continue
-            score = apply_hidden_penalty(raw_score, hidden_flags[i])
-            eid, fname, domain, attrs, state = meta[i]
+            entity = self._index.entity(entity_id)
+            score = apply_hidden_penalty(raw_score, entity.get("_hidden_by"))
+            eid, fname, domain, attrs, state = _match_fields(entity)
             # If any query token matched only on the alias haystack,
             # surface that to the caller via match_type — useful both
             # for telemetry and for the agent to know the friendly_name
             # alone wouldn't have led it here.
-            hit_alias_tokens = query_token_set & alias_hit[i]
+            hit_alias_tokens = query_token_set & self._index.alias_hit(entity_id)
             if hit_alias_tokens:
                 match_type = "alias_match"
             else:
@@ -389,63 +663,35 @@ class FuzzyEntitySearcher:
         return matches
 
     def _typo_fallback(
-        self,
-        query_tokens: list[str],
-        docs: list[list[str]],
-        meta: list[tuple[str, str, str, dict[str, Any], str]],
-        hidden_flags: list[Any] | None = None,
+        self, query_tokens: list[str], scope: Collection[str] | None
     ) -> list[dict[str, Any]]:
         """Token-level SequenceMatcher fallback for typo correction.
 
-        For multi-token queries, additionally requires coverage:
-        at least half of the distinct query tokens must each have *some*
-        doc token they ratio-match. Without this, a single-token
-        accidental hit (e.g. ``garbage`` ≈ ``garage``) is enough to
-        surface unrelated entities at score 92 from a 3-token query
-        whose other two tokens have no doc relationship.
+        See :meth:`EntitySearchIndex.typo_scores` for the multi-token
+        coverage gate.
         """
         results: list[dict[str, Any]] = []
-        distinct_query_tokens = list(dict.fromkeys(query_tokens))
-        n_distinct = len(distinct_query_tokens)
         # Single-token min-length gate: short queries like ``lit`` (3
         # chars) match too generously via partial overlap (every
         # ``*_lite*`` entity surfaces at score 85). The multi-token
-        # coverage gate above doesn't help here (n_distinct == 1).
+        # coverage gate doesn't help here (one distinct token).
         # Suppress the fallback entirely for short single-token
         # queries — they almost never represent a typo, and the BM25
         # path above already serves substring intent at a higher
         # score floor.
-        if n_distinct == 1 and len(query_tokens[0]) < 4:
+        if len(set(query_tokens)) == 1 and len(query_tokens[0]) < 4:
             return results
-        for i, doc_tokens in enumerate(docs):
-            best_token_score = 0
-            for qt in query_tokens:
-                for dt in doc_tokens:
-                    ratio = calculate_ratio(qt, dt)
-                    best_token_score = max(best_token_score, ratio)
-
-            if best_token_score < 75:  # stricter threshold for typo fallback
+        for entity_id, best_token_score in self._index.typo_scores(
+            query_tokens
+        ).items():
+            if scope is not None and entity_id not in scope:
                 continue
-
-            # Multi-token coverage gate: how many distinct query tokens
-            # have any doc token within the typo-fallback threshold?
-            # A 3-token nonsense query that only one token explains
-            # (coverage 1/3) is rejected; a single-token query is always
-            # fully covered so unaffected.
-            if n_distinct > 1:
-                covered = 0
-                for qt in distinct_query_tokens:
-                    if any(calculate_ratio(qt, dt) >= 75 for dt in doc_tokens):
-                        covered += 1
-                if covered * 2 < n_distinct:  # < 50% coverage
-                    continue
-
-            eid, fname, domain, attrs, state = meta[i]
-            entity_hidden = hidden_flags[i] if hidden_flags is not None else None
+            entity = self._index.entity(entity_id)
+            eid, fname, domain, attrs, state = _match_fields(entity)
             # Apply the hidden penalty after the threshold gate above
             # so borderline hidden matches still surface; the penalty
             # only re-ranks them.
-            score = apply_hidden_penalty(best_token_score, entity_hidden)
+            score = apply_hidden_penalty(best_token_score, entity.get("_hidden_by"))
             results.append(
                 {
                     "entity_id": eid,
@@ -0,0 +1,108 @@
+"""JSON encode/decode for the Home Assistant transports.
+
+Uses ``orjson`` when it is importable and the stdlib ``json`` module
+otherwise. ``orjson`` is not a dependency: Home Assistant itself depends on
+it, so the embedded and add-on installs get it for free, and anyone else can
+``pip install orjson`` next to ha-mcp. ``HA_MCP_JSON_CODEC=stdlib`` forces
+the fallback (for A/B benchmarking, or if the C extension misbehaves).
+
+The two backends are interchangeable for everything Home Assistant sends —
+HA serializes with ``orjson`` on its side. Where they disagree (integers
+beyond 64 bits, ``NaN`` literals, non-``str`` dict keys, types ``orjson``
+has no encoder for) the call is retried on the stdlib, so the fast path
+never rejects a payload the stdlib accepts.
+
+Both backends encode compactly and without ASCII escaping, but corner cases
+(float formatting, for one) can still differ, so the output is for the wire
+only. Anything persisted or compared across processes (``config_hash``)
+keeps its own fixed stdlib encoding.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+JSONDecodeError = json.JSONDecodeError
+
+# Debug logging of a frame keeps at most this many characters of it.
+LOG_PREVIEW_CHARS = 2048
+
+try:
+    if os.environ.get("HA_MCP_JSON_CODEC", "").strip().lower() == "stdlib":
+        raise ImportError("stdlib codec requested")
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment,unused-ignore]
+
+BACKEND = "stdlib" if orjson is None else "orjson"
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """Decode a JSON document.
+
+    Raises:
+        JSONDecodeError: ``data`` is not valid JSON (``orjson``'s own
+            decode error subclasses it).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Out-of-range integers and NaN/Infinity literals are valid to
+            # the stdlib; let it decide (it raises the same error type).
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            encoded: bytes = orjson.dumps(obj, option=option)
+            return encoded
+        except TypeError:
+            pass
+    return json.dumps(
+        obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def dumps(obj: Any, *, sort_keys: bool = False) -> str:
+    """Encode ``obj`` as a compact JSON string."""
+    return dumps_bytes(obj, sort_keys=sort_keys).decode()
+
+
+class log_preview:
+    """Deferred, size-capped rendering of a payload for ``logger.debug``.
+
+    Pass it as a ``%s`` argument: nothing is encoded unless a handler
+    actually formats the record, and then only the first
+    :data:`LOG_PREVIEW_CHARS` characters are kept.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: Any) -> None:
+        self._value = value
+
+    def __str__(self) -> str:
+        value = self._value
+        if isinstance(value, bytes | bytearray | memoryview):
+            text = bytes(value).decode(errors="replace")
+        elif isinstance(value, str):
+            text = value
+        else:
+            try:
+                text = dumps(value)
+            except (TypeError, ValueError):
+                text = repr(value)
+        if len(text) <= LOG_PREVIEW_CHARS:
+            return text
+        return f"{text[:LOG_PREVIEW_CHARS]}… ({len(text)} chars)"
@@ -6,9 +6,13 @@ through WebSocket state changes, providing a clean interface for storing and
 retrieving operation status.
 """
 
+import asyncio
+import contextlib
+import heapq
 import logging
 import time
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -25,6 +29,15 @@ class OperationStatus(Enum):
     TIMEOUT = "timeout"
 
 
+# How long a settled operation stays queryable, in milliseconds from its
+# completion_time.
+_TERMINAL_TTL_MS = {
+    OperationStatus.COMPLETED: 300_000,
+    OperationStatus.FAILED: 60_000,
+    OperationStatus.TIMEOUT: 60_000,
+}
+
+
 @dataclass
 class DeviceOperation:
     """Represents a device operation awaiting completion."""
@@ -42,6 +55,23 @@ class DeviceOperation:
     result_state: dict[str, Any] | None = None
     error_message: str | None = None
     timeout_ms: float = 10000  # 10 second default timeout
+    # Status readers blocked in ``wait_for_change``; resolved by
+    # ``notify_waiters`` when the status changes or the operation is dropped.
+    _waiters: list[asyncio.Future[None]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Set by the tracking manager; called whenever ``status`` or
+    # ``completion_time`` changes, so its removal deadlines follow them.
+    _on_settled: "Callable[[DeviceOperation], None] | None" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ("status", "completion_time"):
+            on_settled = self.__dict__.get("_on_settled")
+            if on_settled is not None:
+                on_settled(self)
 
     @property
     def elapsed_ms(self) -> float:
@@ -53,6 +83,14 @@ class DeviceOperation:
         """Check if operation has timed out."""
         return self.elapsed_ms > self.timeout_ms
 
+    @property
+    def removal_deadline(self) -> float | None:
+        """Epoch ms after which a settled operation is dropped; None while pending."""
+        ttl_ms = _TERMINAL_TTL_MS.get(self.status)
+        if ttl_ms is None:
+            return None
+        return (self.completion_time or self.start_time) + ttl_ms
+
     @property
     def duration_ms(self) -> float | None:
         """Get operation duration in milliseconds."""
@@ -60,9 +98,67 @@ class DeviceOperation:
             return self.completion_time - self.start_time
         return None
 
+    async def wait_for_change(self, timeout: float) -> None:
+        """Wait up to ``timeout`` seconds for this pending operation to settle.
+
+        Returns as soon as the state change that completes or fails the
+        operation is processed, when the operation is dropped, or when its own
+        timeout passes (the caller's re-read then marks it TIMEOUT) —
+        whichever comes first. Returns immediately if it is not pending.
+        """
+        if self.status != OperationStatus.PENDING or timeout <= 0:
+            return
+        # A millisecond past expiry, so the re-read sees ``is_expired``.
+        until_expired = (self.timeout_ms - self.elapsed_ms) / 1000 + 0.001
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(waiter, max(0.0, min(timeout, until_expired)))
+        finally:
+            with contextlib.suppress(ValueError):
+                self._waiters.remove(waiter)
+
+    def notify_waiters(self) -> None:
+        """Wake every reader blocked in ``wait_for_change``."""
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            _resolve_waiter(waiter)
+
+
+def _resolve_waiter(waiter: asyncio.Future[None]) -> None:
+    """Resolve ``waiter`` from any thread.
+
+    State changes are processed on the WebSocket listener's loop; a reader
+    on another loop is woken through that loop's thread-safe queue.
+    """
+    if waiter.done():
+        return
+    loop = waiter.get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if loop is running:
+        waiter.set_result(None)
+        return
+    with contextlib.suppress(RuntimeError):  # the reader's loop is closed
+        loop.call_soon_threadsafe(_resolve_waiter, waiter)
+
 
 class OperationManager:
-    """Manages in-memory storage of device operations."""
+    """Manages in-memory storage of device operations.
+
+    Every ``state_changed`` event in the house is offered to
+    :meth:`process_state_change`, almost always for an entity with nothing
+    pending. Pending operations are therefore indexed by entity (so an
+    untracked entity costs one dict lookup) and their deadlines kept in a
+    min-heap (so the expiry sweep only pops what has expired). Settled
+    operations get a second heap of removal deadlines, pushed whenever their
+    status or completion time changes, so the TTL pass only pops what is due.
+    ``operations`` stays the source of truth: index entries whose operation
+    was settled, rescheduled or dropped since are skipped when popped.
+    """
 
     def __init__(self, max_operations: int = 1000, cleanup_interval: int = 300):
         """Initialize operation manager.
@@ -75,6 +171,53 @@ class OperationManager:
         self.max_operations = max_operations
         self.cleanup_interval = cleanup_interval
         self.last_cleanup = time.time()
+        # entity_id -> pending operations on it, in creation order.
+        self._pending_by_entity: dict[str, dict[str, DeviceOperation]] = {}
+        # (deadline in epoch ms, operation_id) for every tracked pending op.
+        self._deadlines: list[tuple[float, str]] = []
+        # (removal deadline in epoch ms, operation_id) for settled ops.
+        self._removals: list[tuple[float, str]] = []
+
+    def track_operation(self, operation: DeviceOperation) -> None:
+        """Store ``operation`` and, while it is pending, index it."""
+        self.operations[operation.operation_id] = operation
+        operation._on_settled = self._schedule_removal
+        self._schedule_removal(operation)
+        if operation.status == OperationStatus.PENDING:
+            self._pending_by_entity.setdefault(operation.entity_id, {})[
+                operation.operation_id
+            ] = operation
+            heapq.heappush(
+                self._deadlines,
+                (operation.start_time + operation.timeout_ms, operation.operation_id),
+            )
+
+    def _unindex(self, operation: DeviceOperation) -> None:
+        """Drop ``operation`` from the pending index once it is settled."""
+        entity_ops = self._pending_by_entity.get(operation.entity_id)
+        if entity_ops is None:
+            return
+        entity_ops.pop(operation.operation_id, None)
+        if not entity_ops:
+            del self._pending_by_entity[operation.entity_id]
+
+    def _mark_timed_out(self, operation: DeviceOperation, now_ms: float) -> None:
+        operation.status = OperationStatus.TIMEOUT
+        operation.completion_time = now_ms
+        operation.error_message = f"Operation timed out after {operation.timeout_ms}ms"
+        self._unindex(operation)
+        operation.notify_waiters()
+
+    def _schedule_removal(self, operation: DeviceOperation) -> None:
+        deadline = operation.removal_deadline
+        if deadline is not None:
+            heapq.heappush(self._removals, (deadline, operation.operation_id))
+
+    def _drop(self, operation_id: str) -> None:
+        operation = self.operations.pop(operation_id)
+        operation._on_settled = None
+        self._unindex(operation)
+        operation.notify_waiters()
 
     def create_operation(
         self,
@@ -113,7 +256,7 @@ class OperationManager:
             timeout_ms=timeout_ms,
         )
 
-        self.operations[operation_id] = operation
+        self.track_operation(operation)
         self._maybe_cleanup()
 
         logger.info(f"Created operation {operation_id} for {entity_id}: {action}")
@@ -136,11 +279,7 @@ class OperationManager:
             and operation.status == OperationStatus.PENDING
             and operation.is_expired
         ):
-            operation.status = OperationStatus.TIMEOUT
-            operation.completion_time = time.time() * 1000
-            operation.error_message = (
-                f"Operation timed out after {operation.timeout_ms}ms"
-            )
+            self._mark_timed_out(operation, time.time() * 1000)
             logger.warning(f"Operation {operation_id} timed out")
 
         return operation
@@ -174,6 +313,9 @@ class OperationManager:
             operation.result_state = result_state
         if error_message:
             operation.error_message = error_message
+        if status != OperationStatus.PENDING:
+            self._unindex(operation)
+        operation.notify_waiters()
 
         logger.info(f"Updated operation {operation_id} status to {status.value}")
         return True
@@ -189,15 +331,19 @@ class OperationManager:
         Returns:
             List of pending operations for the entity
         """
-        pending_ops = [
-            operation
-            for operation in self.operations.values()
+        entity_ops = self._pending_by_entity.get(entity_id)
+        if not entity_ops:
+            return []
+
+        pending_ops = []
+        for op_id, operation in list(entity_ops.items()):
             if (
-                operation.entity_id == entity_id
-                and operation.status == OperationStatus.PENDING
-                and not operation.is_expired
-            )
-        ]
+                self.operations.get(op_id) is not operation
+                or operation.status != OperationStatus.PENDING
+            ):
+                self._unindex(operation)
+            elif not operation.is_expired:
+                pending_ops.append(operation)
 
         return pending_ops
 
@@ -213,6 +359,9 @@ class OperationManager:
         Returns:
             List of operation IDs that were updated
         """
+        if entity_id not in self._pending_by_entity:
+            return []
+
         updated_operations = []
         pending_ops = self.get_pending_operations_for_entity(entity_id)
 
@@ -272,6 +421,48 @@ class OperationManager:
 
         return True
 
+    def _expire_pending(self, now_ms: float) -> None:
+        """Mark every pending operation whose deadline has passed TIMEOUT.
+
+        Each one is KEPT for the terminal minute — same treatment as a
+        read-path timeout, so a poll shortly after expiry reports "timeout"
+        rather than not_found regardless of which path noticed first. The
+        TTL pass in :meth:`cleanup_expired_operations` reclaims it once
+        completion_time is a minute old.
+        """
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] < now_ms:
+            _, op_id = heapq.heappop(deadlines)
+            operation = self.operations.get(op_id)
+            if operation is None or operation.status != OperationStatus.PENDING:
+                continue
+            deadline = operation.start_time + operation.timeout_ms
+            if deadline < now_ms:
+                self._mark_timed_out(operation, now_ms)
+            else:  # its timeout was extended after it was tracked
+                heapq.heappush(deadlines, (deadline, op_id))
+
+    def _remove_settled(self, now_ms: float) -> None:
+        """Drop every settled operation whose terminal TTL has passed.
+
+        Completed operations go 5 minutes after completion, failed and
+        timed-out ones after 1 minute (TIMEOUT can be set outside this pass:
+        get_operation() marks an expired PENDING op in place on the read path
+        — anchoring the TTL on completion_time keeps such an op queryable for
+        its full terminal minute even when it timed out long after
+        start_time). An entry whose operation has a later deadline by now is
+        stale: the change that moved it pushed its own entry.
+        """
+        removals = self._removals
+        while removals and removals[0][0] < now_ms:
+            _, op_id = heapq.heappop(removals)
+            operation = self.operations.get(op_id)
+            if operation is None:
+                continue
+            deadline = operation.removal_deadline
+            if deadline is not None and deadline < now_ms:
+                self._drop(op_id)
+
     def cleanup_expired_operations(self, force: bool = False) -> None:
         """Clean up expired and completed operations.
 
@@ -284,39 +475,11 @@ class OperationManager:
             return
 
         initial_count = len(self.operations)
+        now_ms = current_time * 1000
 
-        # Remove completed operations 5 minutes after completion
-        # Remove failed/timed-out operations 1 minute after completion
-        # (TIMEOUT can be set outside this pass: get_operation() marks an
-        # expired PENDING op in place on the read path — anchoring the TTL
-        # on completion_time keeps such an op queryable for its full
-        # terminal minute even when it timed out long after start_time)
-        # Remove expired pending operations
-        to_remove = []
+        self._expire_pending(now_ms)
 
-        for op_id, operation in self.operations.items():
-            terminal_anchor = operation.completion_time or operation.start_time
-            age_seconds = (current_time * 1000 - terminal_anchor) / 1000
-
-            if (
-                operation.status == OperationStatus.COMPLETED and age_seconds > 300
-            ) or (
-                operation.status in (OperationStatus.FAILED, OperationStatus.TIMEOUT)
-                and age_seconds > 60
-            ):
-                to_remove.append(op_id)
-            elif operation.status == OperationStatus.PENDING and operation.is_expired:
-                # Mark as timeout and KEEP it for the terminal minute — same
-                # treatment as a read-path timeout, so a poll shortly after
-                # expiry reports "timeout" rather than not_found regardless
-                # of which path noticed first. The TTL branch above reclaims
-                # it once completion_time is a minute old.
-                operation.status = OperationStatus.TIMEOUT
-                operation.completion_time = current_time * 1000
-
-        # Remove operations
-        for op_id in to_remove:
-            del self.operations[op_id]
+        self._remove_settled(now_ms)
 
         # If still over limit, remove oldest terminal operations (never
         # in-flight PENDING ones — those expire on their own timeout).
@@ -330,7 +493,7 @@ class OperationManager:
 
             excess = len(self.operations) - self.max_operations
             for op_id, _ in terminal_ops[:excess]:
-                del self.operations[op_id]
+                self._drop(op_id)
 
         removed_count = initial_count - len(self.operations)
         if removed_count > 0:
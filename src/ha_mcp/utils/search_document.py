@@ -0,0 +1,218 @@
+"""Compact, cached search documents for config bodies.
+
+Deep search scores a query against whole automation/script/scene/dashboard
+configs. Walking a nested config, tokenizing every leaf and fitting a
+throwaway one-document BM25 scorer per (config, query) pair dominated a
+deep ``ha_search``; doing it again for the exact-match path doubled it.
+
+A ``SearchDocument`` is that walk done once: the lowercased string leaves
+flattened into one text (for substring matching) and the token multiset (for
+BM25). Documents are cached by ``compute_config_hash``, so an unchanged
+config is never walked again — only re-hashed, which ``json.dumps`` does in C.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from .config_hash import compute_config_hash
+from .fuzzy_search import calculate_ratio, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Joins leaves in ``SearchDocument.text``. A NUL never occurs in a config
+# leaf or a typed query, so a substring match cannot straddle two leaves.
+LEAF_SEPARATOR = "\x00"
+
+# Documents kept per process. A document costs about as much as its config,
+# and a large install has a few thousand automations/scripts/scenes.
+MAX_CACHED_DOCUMENTS = 4096
+
+# BM25 parameters, matching ``BM25Scorer``'s defaults.
+_K1 = 1.2
+_B = 0.5
+
+# IDF of any token in a one-document corpus (df == n == 1), Robertson variant
+# exactly as ``BM25Scorer.fit`` computes it.
+_SINGLE_DOC_IDF = math.log((1 - 1 + 0.5) / (1 + 0.5) + 1.0)
+
+# Minimum SequenceMatcher ratio (0-100) for the typo fallback.
+_TYPO_MIN_RATIO = 70
+
+
+@functools.lru_cache(maxsize=65536)
+def _typo_ratio(query_token: str, token: str) -> int:
+    """``calculate_ratio`` for the typo fallback, 0 when below the minimum.
+
+    Configs share most of their vocabulary (``light``, ``turn``, ``entity``),
+    so the same pairs recur across every document a query is scored against.
+    Pairs whose lengths alone cap the ratio below the minimum (the
+    ``real_quick_ratio`` bound) skip SequenceMatcher entirely.
+    """
+    total = len(query_token) + len(token)
+    if 200 * min(len(query_token), len(token)) < _TYPO_MIN_RATIO * total:
+        return 0
+    ratio = calculate_ratio(query_token, token)
+    return ratio if ratio >= _TYPO_MIN_RATIO else 0
+
+
+def collect_string_leaves(data: Any, out: list[str]) -> None:
+    """Recursively collect all string representations from nested data.
+
+    Dict keys count as leaves; non-string scalars are stringified and
+    ``None`` is skipped.
+    """
+    if isinstance(data, dict):
+        for key, value in data.items():
+            out.append(str(key))
+            collect_string_leaves(value, out)
+    elif isinstance(data, list):
+        for item in data:
+            collect_string_leaves(item, out)
+    elif isinstance(data, str):
+        out.append(data)
+    elif data is not None:
+        out.append(str(data))
+
+
+@dataclass(frozen=True, slots=True)
+class SearchDocument:
+    """One config flattened for scoring."""
+
+    config_hash: str | None
+    # Lowercased leaves joined by ``LEAF_SEPARATOR``.
+    text: str
+    leaf_count: int
+    # Token -> occurrences across all leaves.
+    term_counts: dict[str, int]
+    length: int
+
+    @classmethod
+    def build(cls, data: Any, config_hash: str | None = None) -> SearchDocument:
+        """Walk ``data`` once and build its document."""
+        leaves: list[str] = []
+        collect_string_leaves(data, leaves)
+        term_counts: dict[str, int] = {}
+        length = 0
+        for leaf in leaves:
+            for token in tokenize(leaf):
+                term_counts[token] = term_counts.get(token, 0) + 1
+                length += 1
+        return cls(
+            config_hash=config_hash,
+            text=LEAF_SEPARATOR.join(leaf.lower() for leaf in leaves),
+            leaf_count=len(leaves),
+            term_counts=term_counts,
+            length=length,
+        )
+
+    def contains(self, query: str) -> bool:
+        """True when ``query`` is a substring of any lowercased leaf."""
+        if not self.leaf_count:
+            return False
+        if LEAF_SEPARATOR in query:
+            return any(query in leaf for leaf in self.text.split(LEAF_SEPARATOR))
+        return query in self.text
+
+    def fuzzy_score(self, query: str) -> int:
+        """0-100 relevance of ``query`` to this document.
+
+        The score of a one-document BM25 corpus normalized by its theoretical
+        maximum — the same arithmetic ``BM25Scorer`` performs, without fitting
+        one — falling back to token-level SequenceMatcher ratios for typos.
+        """
+        if not self.length:
+            return 0
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return 0
+
+        # dl == avgdl in a one-document corpus.
+        denom_norm = _K1 * (1 - _B + _B * self.length / self.length)
+        raw = 0.0
+        for qt in query_tokens:
+            f = self.term_counts.get(qt, 0)
+            if f == 0:
+                continue
+            raw += _SINGLE_DOC_IDF * (f * (_K1 + 1)) / (f + denom_norm)
+
+        if raw > 0:
+            max_possible = sum(_SINGLE_DOC_IDF for _ in query_tokens)
+            return min(100, round(raw / max_possible * 100))
+
+        logger.debug(
+            "BM25 returned 0 for query_tokens=%s; "
+            "falling back to SequenceMatcher typo scoring over %d unique tokens",
+            query_tokens,
+            len(self.term_counts),
+        )
+        best = 0
+        for qt in query_tokens:
+            for dt in self.term_counts:
+                best = max(best, _typo_ratio(qt, dt))
+                if best == 100:
+                    return best
+        return best
+
+
+class SearchDocumentCache:
+    """LRU of ``SearchDocument`` keyed by ``compute_config_hash``."""
+
+    def __init__(self, max_size: int = MAX_CACHED_DOCUMENTS) -> None:
+        self.max_size = max_size
+        self._documents: OrderedDict[str, SearchDocument] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, data: Any) -> SearchDocument:
+        """Return the document for ``data``, building it on a miss.
+
+        Data that cannot be hashed (not JSON-serializable) gets a fresh,
+        uncached document.
+        """
+        try:
+            config_hash = compute_config_hash(data)
+        except (TypeError, ValueError):
+            return SearchDocument.build(data)
+        with self._lock:
+            document = self._documents.get(config_hash)
+            if document is not None:
+                self._documents.move_to_end(config_hash)
+                self.hits += 1
+                return document
+        # Build outside the lock; a racing builder produces an equal value.
+        document = SearchDocument.build(data, config_hash)
+        with self._lock:
+            self.misses += 1
+            self._documents[config_hash] = document
+            while len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+        return document
+
+    def clear(self) -> None:
+        """Drop every cached document."""
+        with self._lock:
+            self._documents.clear()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+
+_cache = SearchDocumentCache()
+
+
+def get_search_document(data: Any) -> SearchDocument:
+    """Return the (cached) search document for a config body."""
+    return _cache.get(data)
+
+
+def search_document_cache() -> SearchDocumentCache:
+    """The process-wide document cache (diagnostics and test seam)."""
+    return _cache
@@ -12,7 +12,7 @@ from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from queue import Queue
+from queue import Empty, Queue
 from typing import Any
 
 from .data_paths import get_data_dir
@@ -26,6 +26,14 @@ DEFAULT_RING_BUFFER_SIZE = 200
 # This includes the tool itself plus any associated operations
 AVG_LOG_ENTRIES_PER_TOOL = 3
 
+# mcp_usage.jsonl rotates to mcp_usage.jsonl.1 once it reaches this size,
+# keeping LOG_BACKUP_COUNT older files.
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Upper bound on entries appended per file open by the writer thread
+LOG_WRITE_BATCH_SIZE = 500
+
 # Startup log collection duration in seconds
 STARTUP_LOG_DURATION_SECONDS = 60
 
@@ -211,6 +219,8 @@ class UsageLogger:
         self,
         log_file_path: str | None = None,
         ring_buffer_size: int = DEFAULT_RING_BUFFER_SIZE,
+        max_bytes: int = LOG_MAX_BYTES,
+        backup_count: int = LOG_BACKUP_COUNT,
     ):
         self._enabled = True
 
@@ -245,9 +255,10 @@ class UsageLogger:
         self._buffer_lock = threading.Lock()
 
         # Thread-safe queue for disk writes
-        self._log_queue: Queue[ToolUsageLog] = Queue()
+        self._log_queue: Queue[ToolUsageLog | None] = Queue()
         self._logger_thread: threading.Thread | None = None
-        self._stop_event = threading.Event()
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
         if self._enabled:
             self._start_logger_thread()
 
@@ -259,30 +270,68 @@ class UsageLogger:
         self._logger_thread.start()
 
     def _log_writer_worker(self) -> None:
-        """Background thread worker for writing logs to disk."""
-        while not self._stop_event.is_set():
+        """Background thread worker for writing logs to disk.
+
+        Blocks on the queue instead of polling it, then drains whatever else
+        has queued up meanwhile so a burst of tool calls costs one file open.
+        A ``None`` entry (queued by :meth:`shutdown`) flushes and exits.
+        """
+        while True:
             try:
-                # Wait for log entry with timeout to check stop event
-                if not self._log_queue.empty():
-                    log_entry = self._log_queue.get(timeout=1.0)
-                    self._write_log_entry(log_entry)
-                else:
-                    # Sleep briefly to avoid busy waiting
-                    threading.Event().wait(0.1)
+                entry = self._log_queue.get()
+                batch: list[ToolUsageLog] = []
+                stopping = entry is None
+                if entry is not None:
+                    batch.append(entry)
+                while not stopping and len(batch) < LOG_WRITE_BATCH_SIZE:
+                    try:
+                        entry = self._log_queue.get_nowait()
+                    except Empty:
+                        break
+                    if entry is None:
+                        stopping = True
+                    else:
+                        batch.append(entry)
+                if batch:
+                    self._write_log_entries(batch)
+                if stopping:
+                    return
             except Exception as e:
                 # Silent error handling to avoid disrupting MCP server
                 print(f"Usage logger error: {e}")
 
-    def _write_log_entry(self, log_entry: ToolUsageLog) -> None:
-        """Write single log entry to disk."""
+    def _write_log_entries(self, entries: list[ToolUsageLog]) -> None:
+        """Append a batch of entries to disk, rotating the file first if full."""
+        lines = "".join(
+            json.dumps(asdict(entry), ensure_ascii=False) + "\n" for entry in entries
+        )
         try:
+            self._rotate_if_needed()
             with open(self.log_file_path, "a", encoding="utf-8") as f:
-                json.dump(asdict(log_entry), f, ensure_ascii=False)
-                f.write("\n")
+                f.write(lines)
         except Exception:
             # Silent error handling
             pass
 
+    def _rotate_if_needed(self) -> None:
+        """Shift ``mcp_usage.jsonl`` to ``.1`` (``.1`` to ``.2``, ...) once it
+        reaches ``LOG_MAX_BYTES``, dropping the oldest past ``LOG_BACKUP_COUNT``."""
+        try:
+            size = self.log_file_path.stat().st_size
+        except OSError:
+            return
+        if size < self._max_bytes:
+            return
+        path = self.log_file_path
+        for index in range(self._backup_count - 1, 0, -1):
+            older = path.with_name(f"{path.name}.{index}")
+            if older.exists():
+                older.replace(path.with_name(f"{path.name}.{index + 1}"))
+        if self._backup_count > 0:
+            path.replace(path.with_name(f"{path.name}.1"))
+        else:
+            path.unlink()
+
     def log_tool_usage(
         self,
         tool_name: str,
@@ -339,9 +388,9 @@ class UsageLogger:
             return list(reversed(buffer_list[-count:]))
 
     def shutdown(self) -> None:
-        """Gracefully shutdown logger."""
-        self._stop_event.set()
+        """Gracefully shutdown logger, flushing entries still queued."""
         if self._logger_thread and self._logger_thread.is_alive():
+            self._log_queue.put(None)
             self._logger_thread.join(timeout=2.0)
 
 
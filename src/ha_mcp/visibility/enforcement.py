@@ -46,7 +46,6 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-import re
 import time
 from collections.abc import Callable
 from contextvars import ContextVar
@@ -56,10 +55,12 @@ from fastmcp.exceptions import ToolError
 from fastmcp.server.middleware.middleware import CallNext, Middleware, MiddlewareContext
 
 from ..errors import ErrorCode, create_entity_not_found_error, create_error_response
+from ..outbound import structured_text
 from ..policy.middleware import CALL_PROXY_META_TOOLS
 from ..renamed_tools import current_tool_name
 from ..tools.helpers import raise_tool_error
 from . import resolver
+from .matcher import HiddenIdMatcher
 from .model import VisibilityConfig
 from .resolver import (
     VisibilityDataUnavailable,
@@ -180,12 +181,12 @@ def _iter_strings(value: Any) -> Any:
 
 
 def _scan_value(
-    value: Any, hidden: set[str], regex: re.Pattern[str] | None
+    value: Any, hidden: set[str], matcher: HiddenIdMatcher | None
 ) -> tuple[str | None, bool]:
     """Return ``(first_exact_hidden_id, any_embedded_hidden_id)`` over nested strings.
 
     A string that equals a hidden id exactly drives concealment; a string that
-    merely embeds one (boundary regex) drives the generic refusal. An exact match
+    merely embeds one (boundary match) drives the generic refusal. An exact match
     takes priority, so an exact hit never also counts as embedded.
     """
     exact: str | None = None
@@ -194,22 +195,26 @@ def _scan_value(
         if text in hidden:
             if exact is None:
                 exact = text
-        elif regex is not None and regex.search(text):
+        elif matcher is not None and matcher.search(text):
             embedded = True
     return exact, embedded
 
 
-def _build_hidden_regex(hidden: set[str]) -> re.Pattern[str] | None:
-    """Compile one boundary-aware alternation over the hidden set, or None if empty.
+def _build_hidden_matcher(
+    hidden: set[str], previous: HiddenIdMatcher | None = None
+) -> HiddenIdMatcher | None:
+    """Boundary-aware matcher over the hidden set, or None if it is empty.
 
-    The ``(?<![a-z0-9_]) ... (?![a-z0-9_])`` guards (case-insensitive) make
-    ``sensor.foo`` match ``states.sensor.foo`` and a bare ``sensor.foo`` in a
-    template, but NOT ``sensor.foo2`` or ``my_sensor.foo``.
+    The boundary rule (see ``visibility.matcher``) makes ``sensor.foo`` match
+    ``states.sensor.foo`` and a bare ``sensor.foo`` in a template, but NOT
+    ``sensor.foo2`` or ``my_sensor.foo``. ``previous`` is reused when the set
+    did not change.
     """
     if not hidden:
         return None
-    alternation = "|".join(re.escape(eid) for eid in sorted(hidden))
-    return re.compile(rf"(?<![a-z0-9_])(?:{alternation})(?![a-z0-9_])", re.IGNORECASE)
+    if previous is not None:
+        return previous.update(hidden)
+    return HiddenIdMatcher(hidden)
 
 
 def _serialize_result(result: ToolResult) -> str:
@@ -221,10 +226,10 @@ def _serialize_result(result: ToolResult) -> str:
             parts.append(text)
     structured = getattr(result, "structured_content", None)
     if structured is not None:
-        try:
-            parts.append(json.dumps(structured, default=str))
-        except (TypeError, ValueError):
-            parts.append(str(structured))
+        # Shared with the secret scrub just outside this stage, so a large
+        # result is serialized once per call.
+        text = structured_text(structured)
+        parts.append(text if text is not None else str(structured))
     return "\n".join(parts)
 
 
@@ -339,9 +344,7 @@ class _VisibilityEnforcementBase(Middleware):
     async def _load_config(self) -> VisibilityConfig:
         # Through the resolver module attribute so a test that redirects
         # ``resolver.get_data_dir`` steers this and ``load_hidden_set`` together.
-        return await asyncio.to_thread(
-            resolver.load_visibility_config, resolver.get_data_dir()
-        )
+        return await resolver.current_visibility_config()
 
     async def _active_config(
         self,
@@ -416,10 +419,10 @@ class _VisibilityEnforcementBase(Middleware):
             return None
         return config
 
-    async def _hidden_and_regex(
+    async def _hidden_and_matcher(
         self, config: VisibilityConfig
-    ) -> tuple[set[str], re.Pattern[str] | None]:
-        """Resolve the hidden set + regex through the module-shared cache."""
+    ) -> tuple[set[str], HiddenIdMatcher | None]:
+        """Resolve the hidden set + matcher through the module-shared cache."""
         return await _hidden_cache.get(config, self._get_client())
 
 
@@ -462,11 +465,11 @@ class VisibilityInboundEnforcement(_VisibilityEnforcementBase):
             _raise_enforced(effective_name, reason)
 
         try:
-            hidden, regex = await self._hidden_and_regex(config)
+            hidden, matcher = await self._hidden_and_matcher(config)
         except VisibilityDataUnavailable:
             _raise_enforced(effective_name, _FAIL_CLOSED_REASON)
 
-        self._scan_inbound(effective_name, name, args, hidden, regex)
+        self._scan_inbound(effective_name, name, args, hidden, matcher)
         return await call_next(context)
 
     def _scan_inbound(
@@ -475,7 +478,7 @@ class VisibilityInboundEnforcement(_VisibilityEnforcementBase):
         outer_name: str,
         args: dict[str, Any],
         hidden: set[str],
-        regex: re.Pattern[str] | None,
+        matcher: HiddenIdMatcher | None,
     ) -> None:
         """Conceal on an exact hidden-id argument; refuse on an embedded one."""
         exact: str | None = None
@@ -483,8 +486,8 @@ class VisibilityInboundEnforcement(_VisibilityEnforcementBase):
         if current_tool_name(outer_name) in CALL_PROXY_META_TOOLS:
             inner = _unwrap_proxy_call(args)
             if inner is not None:
-                exact, embedded = _scan_value(inner[1], hidden, regex)
-        raw_exact, raw_embedded = _scan_value(args, hidden, regex)
+                exact, embedded = _scan_value(inner[1], hidden, matcher)
+        raw_exact, raw_embedded = _scan_value(args, hidden, matcher)
         exact = exact or raw_exact
         embedded = embedded or raw_embedded
         if exact is not None:
@@ -512,11 +515,11 @@ class VisibilityOutboundEnforcement(_VisibilityEnforcementBase):
         if config is None:
             return await call_next(context)
         try:
-            _hidden, regex = await self._hidden_and_regex(config)
+            _hidden, matcher = await self._hidden_and_matcher(config)
         except VisibilityDataUnavailable:
             _raise_enforced(effective_name, _FAIL_CLOSED_REASON)
         return await self._call_and_scan_outbound(
-            effective_name, context, call_next, regex
+            effective_name, context, call_next, matcher
         )
 
     async def _call_and_scan_outbound(
@@ -524,17 +527,17 @@ class VisibilityOutboundEnforcement(_VisibilityEnforcementBase):
         name: str,
         context: MiddlewareContext,
         call_next: CallNext,
-        regex: re.Pattern[str] | None,
+        matcher: HiddenIdMatcher | None,
     ) -> Any:
         """Run the tool; refuse if its output (or a tool error) names a hidden id."""
         try:
             result = await call_next(context)
         except ToolError as exc:
-            if regex is not None and regex.search(_tool_error_text(exc)):
+            if matcher is not None and matcher.search(_tool_error_text(exc)):
                 logger.info("visibility enforce: refused tool error from %s", name)
                 _raise_enforced(name, _outbound_reason(name))
             raise
-        if regex is not None and regex.search(_serialize_result(result)):
+        if matcher is not None and matcher.search(_serialize_result(result)):
             logger.info("visibility enforce: refused result from %s", name)
             _raise_enforced(name, _outbound_reason(name))
         return result
@@ -602,18 +605,18 @@ class _HiddenSetCache:
     def __init__(self) -> None:
         self._lock = asyncio.Lock()
         self._hidden: set[str] | None = None
-        self._regex: re.Pattern[str] | None = None
+        self._matcher: HiddenIdMatcher | None = None
         self._key: str | None = None
         self._expiry = 0.0
 
     async def get(
         self, config: VisibilityConfig, client: Any
-    ) -> tuple[set[str], re.Pattern[str] | None]:
+    ) -> tuple[set[str], HiddenIdMatcher | None]:
         key = _config_cache_key(config)
         now = time.monotonic()
         async with self._lock:
             if self._hidden is not None and self._key == key and now < self._expiry:
-                return self._hidden, self._regex
+                return self._hidden, self._matcher
             try:
                 hidden = await _refresh_hidden_set(config, client)
             except Exception:
@@ -623,26 +626,27 @@ class _HiddenSetCache:
                         "last-known-good set",
                         exc_info=True,
                     )
-                    return self._hidden, self._regex
+                    return self._hidden, self._matcher
                 logger.warning(
                     "visibility enforce: hidden-set refresh failed with no "
                     "last-known-good for this config; failing closed",
                     exc_info=True,
                 )
                 raise VisibilityDataUnavailable("hidden set unavailable") from None
-            regex = _build_hidden_regex(hidden)
+            # A TTL refresh usually resolves the same set; reuse its matcher.
+            matcher = _build_hidden_matcher(hidden, self._matcher)
             self._hidden = hidden
-            self._regex = regex
+            self._matcher = matcher
             self._key = key
             self._expiry = now + _CACHE_TTL_SECONDS
-            return hidden, regex
+            return hidden, matcher
 
 
 _hidden_cache = _HiddenSetCache()
 
 
-async def active_hidden_regex(client: Any) -> re.Pattern[str] | None:
-    """Return the hidden-set regex while enforce mode is active, else ``None``.
+async def active_hidden_matcher(client: Any) -> HiddenIdMatcher | None:
+    """Return the hidden-set matcher while enforce mode is active, else ``None``.
 
     Collection-read surfaces (the ha_search config-body branches, legacy and
     component) call this to OMIT records referencing a hidden entity before the
@@ -655,23 +659,21 @@ async def active_hidden_regex(client: Any) -> re.Pattern[str] | None:
     owned by the middleware's call gates, not by this best-effort scrub seam.
     """
     try:
-        config = await asyncio.to_thread(
-            resolver.load_visibility_config, resolver.get_data_dir()
-        )
+        config = await resolver.current_visibility_config()
         if not (
             config.enabled
             and config.enforce
             and config_has_active_hide_dimensions(config)
         ):
             return None
-        _hidden, regex = await _hidden_cache.get(config, client)
+        _hidden, matcher = await _hidden_cache.get(config, client)
     except Exception:
         return None
-    return regex
+    return matcher
 
 
 def scrub_records(
-    records: list[dict[str, Any]], regex: re.Pattern[str]
+    records: list[dict[str, Any]], matcher: HiddenIdMatcher
 ) -> list[dict[str, Any]]:
     """Drop records whose serialized form references a hidden entity.
 
@@ -685,6 +687,6 @@ def scrub_records(
             blob = json.dumps(record, default=str)
         except (TypeError, ValueError):
             blob = str(record)
-        if not regex.search(blob):
+        if not matcher.search(blob):
             kept.append(record)
     return kept
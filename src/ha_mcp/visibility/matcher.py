@@ -0,0 +1,101 @@
+"""Boundary-aware matcher over the enforced hidden-entity set (#2015).
+
+Enforce mode refuses any text that names a hidden entity_id, where "names"
+means the id appears with no ``[a-z0-9_]`` character (case-insensitive)
+directly on either side: ``states.sensor.foo`` and ``'sensor.foo'`` match,
+``sensor.foo2`` and ``binary_sensor.foo`` do not.
+
+This used to be one ``|``-alternation regex over every hidden id. Hiding a
+whole integration puts thousands of ids in that alternation; it took seconds
+to compile after every hidden-set refresh, and ``re`` tries each alternative
+at each position, so scanning a multi-MB result took minutes.
+
+The boundary rule makes the search a set lookup instead. An entity id is
+``domain.object_id`` with both halves drawn from ``[a-z0-9_]``, so any match
+lies inside a maximal run of ``[a-z0-9_.]`` characters and spans exactly two
+adjacent dot-separated segments of it. :meth:`HiddenIdMatcher.search` finds
+the dotted runs with one small compiled regex and looks each adjacent pair up
+in a frozenset: linear in the text, independent of the number of hidden ids,
+and with nothing to compile when the set changes. The rare hidden id that is
+not shaped like an entity id keeps a (small) boundary regex of its own.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+# Characters that may not touch a match on either side.
+_WORD = "a-z0-9_"
+
+# A maximal run of id characters that contains at least one dot. The
+# lookbehind pins the start to the run's start; the greedy tail runs to its end.
+_DOTTED_RUN = re.compile(rf"(?<![{_WORD}.])[{_WORD}]*\.[{_WORD}.]*", re.IGNORECASE)
+
+_ENTITY_ID = re.compile(rf"[{_WORD}]+\.[{_WORD}]+")
+
+# Case folding exactly as ``re.IGNORECASE`` matches ``[a-z0-9_]``: ASCII
+# uppercase plus the four non-ASCII code points that fold onto an ASCII
+# letter. ``str.lower`` would turn U+0130 into two characters.
+_FOLD = str.maketrans(
+    {
+        **{chr(c): chr(c + 32) for c in range(ord("A"), ord("Z") + 1)},
+        "İ": "i",
+        "ı": "i",
+        "ſ": "s",
+        "K": "k",
+    }
+)
+
+
+def _boundary_regex(ids: Iterable[str]) -> re.Pattern[str] | None:
+    alternation = "|".join(re.escape(eid) for eid in sorted(ids))
+    if not alternation:
+        return None
+    return re.compile(rf"(?<![{_WORD}])(?:{alternation})(?![{_WORD}])", re.IGNORECASE)
+
+
+class HiddenIdMatcher:
+    """Finds a hidden entity_id in text under the enforce-mode boundary rule.
+
+    Immutable: a refreshed hidden set gets a new matcher (see :meth:`update`),
+    so a scan in flight never sees a half-applied change.
+    """
+
+    __slots__ = ("_ids", "_irregular", "hidden")
+
+    def __init__(self, hidden: Iterable[str]) -> None:
+        self.hidden: frozenset[str] = frozenset(hidden)
+        ids: set[str] = set()
+        irregular: list[str] = []
+        for eid in self.hidden:
+            folded = eid.translate(_FOLD)
+            if _ENTITY_ID.fullmatch(folded):
+                ids.add(folded)
+            else:
+                irregular.append(eid)
+        self._ids = frozenset(ids)
+        self._irregular = _boundary_regex(irregular)
+
+    def update(self, hidden: Iterable[str]) -> HiddenIdMatcher:
+        """Matcher for a refreshed hidden set; ``self`` when it is unchanged."""
+        hidden = frozenset(hidden)
+        if hidden == self.hidden:
+            return self
+        return HiddenIdMatcher(hidden)
+
+    def search(self, text: str) -> str | None:
+        """The first hidden id (case-folded) that ``text`` names, or None."""
+        ids = self._ids
+        if ids:
+            for run in _DOTTED_RUN.finditer(text):
+                segments = run.group().translate(_FOLD).split(".")
+                for i in range(len(segments) - 1):
+                    candidate = f"{segments[i]}.{segments[i + 1]}"
+                    if candidate in ids:
+                        return candidate
+        if self._irregular is not None:
+            match = self._irregular.search(text)
+            if match is not None:
+                return match.group()
+        return None
@@ -16,7 +16,9 @@ class VisibilityConfig(BaseModel):
     # trade-off is that a typo'd key (e.g. "exclude_area") is silently ignored;
     # exclude_categories values are separately validated with a surfaced warning,
     # and this is the pydantic default made explicit so the choice is documented.
-    model_config = ConfigDict(extra="ignore")
+    # Frozen: one parsed instance is shared by every caller until the file
+    # changes (see persistence._CONFIG_MEMO); edits go through model_copy.
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     version: int = 1
     enabled: bool = False
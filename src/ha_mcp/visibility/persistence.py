@@ -14,27 +14,50 @@ from .model import VisibilityConfig
 VISIBILITY_FILENAME = "entity_visibility.json"
 
 # Parsed-config memo keyed by resolved path, invalidated whenever the file's
-# ``(mtime_ns, size)`` changes. ``ha_search`` loads this config up to 3x per
-# call (visibility_filter_active / device_registry_needed_for_visibility /
-# load_hidden_set); the memo turns the repeat reads into one stat() each. A
+# ``(mtime_ns, size)`` changes; a ``None`` signature records a missing file.
+# Every tool call consults this config from several places (both enforcement
+# middleware halves, the search gates, load_hidden_set); the memo turns the
+# repeat reads into one stat() each, and :func:`peek_visibility_config` lets
+# async callers skip the thread hop entirely while the file is unchanged. A
 # concurrent double-parse across ``asyncio.to_thread`` workers is benign (both
 # compute the same value; last write wins).
-_CONFIG_MEMO: dict[str, tuple[tuple[int, int], VisibilityConfig]] = {}
+_CONFIG_MEMO: dict[str, tuple[tuple[int, int] | None, VisibilityConfig]] = {}
 
 
-def load_visibility_config(data_dir: Path) -> VisibilityConfig:
-    path = data_dir / VISIBILITY_FILENAME
-    key = str(path)
+def _signature(path: Path) -> tuple[int, int] | None:
     try:
         stat = path.stat()
     except OSError:
-        # Missing file → disabled default (not an error). Drop any stale memo.
-        _CONFIG_MEMO.pop(key, None)
-        return VisibilityConfig()
-    signature = (stat.st_mtime_ns, stat.st_size)
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def peek_visibility_config(data_dir: Path) -> VisibilityConfig | None:
+    """Return the memoized config if the file is unchanged since it was parsed.
+
+    One ``stat()``, no read or validation — cheap enough to run on the event
+    loop. ``None`` means the file changed (or was never loaded): call
+    :func:`load_visibility_config`, off-loop.
+    """
+    path = data_dir / VISIBILITY_FILENAME
+    cached = _CONFIG_MEMO.get(str(path))
+    if cached is not None and cached[0] == _signature(path):
+        return cached[1]
+    return None
+
+
+def load_visibility_config(data_dir: Path) -> VisibilityConfig:
+    path = data_dir / VISIBILITY_FILENAME
+    key = str(path)
+    signature = _signature(path)
     cached = _CONFIG_MEMO.get(key)
     if cached is not None and cached[0] == signature:
         return cached[1]
+    if signature is None:
+        # Missing file → disabled default (not an error).
+        config = VisibilityConfig()
+        _CONFIG_MEMO[key] = (None, config)
+        return config
     try:
         raw = json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as e:
@@ -15,7 +15,7 @@ from typing import Any
 
 from ..utils.data_paths import get_data_dir
 from .model import VisibilityConfig
-from .persistence import load_visibility_config
+from .persistence import load_visibility_config, peek_visibility_config
 
 logger = logging.getLogger(__name__)
 
@@ -643,6 +643,24 @@ def config_has_active_hide_dimensions(config: VisibilityConfig) -> bool:
     )
 
 
+async def current_visibility_config() -> VisibilityConfig:
+    """Return the live visibility config, off-loop only when the file changed.
+
+    The one entry point every per-call consumer (enforcement middleware, search
+    gates, ``load_hidden_set``) goes through: while ``entity_visibility.json`` is
+    unchanged this is one ``stat()`` on the loop and hands back the shared,
+    frozen snapshot; a changed or never-loaded file is parsed on a worker
+    thread. Raises what ``load_visibility_config`` raises. Resolves both
+    ``get_data_dir`` and ``load_visibility_config`` through this module, so a
+    test redirecting either steers every consumer.
+    """
+    data_dir = get_data_dir()
+    config = peek_visibility_config(data_dir)
+    if config is None:
+        config = await asyncio.to_thread(load_visibility_config, data_dir)
+    return config
+
+
 async def visibility_filter_active() -> bool:
     """Load the visibility config off-loop; report whether the filter can hide.
 
@@ -650,8 +668,8 @@ async def visibility_filter_active() -> bool:
     must NOT route through the ha_mcp_tools component while the filter is active,
     because the component does not apply the server's opt-in visibility filter
     and would leak entities the legacy path hides. Reuses the same loader the
-    legacy filter uses (``load_visibility_config`` over ``get_data_dir()``), so a
-    test that redirects ``resolver.get_data_dir`` steers both.
+    legacy filter uses (:func:`current_visibility_config`), so a test that
+    redirects ``resolver.get_data_dir`` steers both.
 
     Fails **closed** to ``True`` (keep the legacy, filter-applying path) on a load
     error: a missing config file returns a disabled default (not an error, → the
@@ -660,7 +678,7 @@ async def visibility_filter_active() -> bool:
     where ``load_hidden_set`` surfaces the load-failure warning.
     """
     try:
-        config = await asyncio.to_thread(load_visibility_config, get_data_dir())
+        config = await current_visibility_config()
     except Exception:
         return True
     return config_has_active_hide_dimensions(config)
@@ -681,7 +699,7 @@ async def load_visibility_wire() -> dict[str, Any] | None:
     too.
     """
     try:
-        config = await asyncio.to_thread(load_visibility_config, get_data_dir())
+        config = await current_visibility_config()
     except Exception:
         return None
     return config.to_wire()
@@ -699,7 +717,7 @@ async def visibility_state_and_wire() -> tuple[bool, dict[str, Any] | None]:
     policy: keep the legacy path, and there is no config to serialize.
     """
     try:
-        config = await asyncio.to_thread(load_visibility_config, get_data_dir())
+        config = await current_visibility_config()
     except Exception:
         return True, None
     return config_has_active_hide_dimensions(config), config.to_wire()
@@ -715,7 +733,7 @@ async def device_registry_needed_for_visibility() -> bool:
     that runs right after — this gate only decides whether to spend the fetch.
     """
     try:
-        config = await asyncio.to_thread(load_visibility_config, get_data_dir())
+        config = await current_visibility_config()
     except Exception:
         return False
     return config_needs_device_registry(config)
@@ -749,7 +767,7 @@ async def load_hidden_set(
     and keep the fail-open behavior unchanged.
     """
     try:
-        config = await asyncio.to_thread(load_visibility_config, get_data_dir())
+        config = await current_visibility_config()
     except Exception as exc:
         if strict:
             raise VisibilityDataUnavailable(
@@ -0,0 +1,6 @@
+"""Offline benchmarks: ha-mcp against a synthetic Home Assistant stand-in.
+
+Run ``python -m tests.src.benchmark --help``. Nothing here is collected by
+pytest; ``tests/src/unit/test_benchmark_harness.py`` smoke-tests the harness
+at a toy size.
+"""
@@ -0,0 +1,126 @@
+"""Command-line entry point for the offline benchmarks.
+
+Examples::
+
+    # Full run at the default sizes, written where CI can archive it
+    python -m tests.src.benchmark run --out bench.json
+
+    # Quick local check
+    python -m tests.src.benchmark run --sizes 1000 --iterations 3
+
+    # Diff two runs; exits 1 when any scenario regressed past the threshold
+    python -m tests.src.benchmark compare base.json head.json --threshold 0.15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+from .harness import DEFAULT_SIZES, SCENARIOS, VARIANTS, compare, run_benchmarks
+
+
+def _print_report(report: dict) -> None:
+    for size, run in report["sizes"].items():
+        print(f"\n== {size} requested entities ({run['entities']} total) ==")
+        print(
+            f"{'scenario':<34}{'p50 ms':>10}{'p95 ms':>10}{'HA KiB':>10}{'resp KiB':>10}{'RSS KiB':>10}"
+        )
+        for key, row in run["scenarios"].items():
+            rss = row["peak_rss_delta_kib"]
+            print(
+                f"{key:<34}"
+                f"{row['latency_ms']['p50']:>10.1f}"
+                f"{row['latency_ms']['p95']:>10.1f}"
+                f"{row['ha_bytes_per_call'] / 1024:>10.1f}"
+                f"{row['response_bytes'] / 1024:>10.1f}"
+                f"{'-' if rss is None else rss:>10}"
+                + ("  ERRORS" if row["errors"] else "")
+            )
+        if run["unhandled"]:
+            print(f"unhandled by the fake: {run['unhandled']}")
+
+
+def _run(args: argparse.Namespace) -> int:
+    scenarios = tuple(
+        s for s in SCENARIOS if not args.scenario or s.name in args.scenario
+    )
+    report = asyncio.run(
+        run_benchmarks(
+            tuple(args.sizes),
+            iterations=args.iterations,
+            warmup=args.warmup,
+            scenarios=scenarios,
+            variants=tuple(args.variant or VARIANTS),
+            seed=args.seed,
+        )
+    )
+    _print_report(report)
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nwrote {args.out}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    base = json.loads(args.base.read_text())
+    head = json.loads(args.head.read_text())
+    rows = compare(base, head, threshold=args.threshold)
+    print(
+        f"{'size':>7}  {'scenario':<34}{'p50 base':>10}{'p50 head':>10}{'ratio':>8}{'HA bytes':>10}"
+    )
+    for row in rows:
+        before, after = row["p50_ms"]
+        print(
+            f"{row['size']:>7}  {row['scenario']:<34}{before:>10.1f}{after:>10.1f}"
+            f"{row['p50_ratio']:>8.2f}{row['ha_bytes_ratio']:>10.2f}"
+            + ("  REGRESSION" if row["regression"] else "")
+        )
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.src.benchmark")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="benchmark against synthetic installs")
+    run.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run.add_argument("--iterations", type=int, default=10)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument(
+        "--scenario",
+        action="append",
+        choices=[s.name for s in SCENARIOS],
+        help="limit to this scenario (repeatable)",
+    )
+    run.add_argument(
+        "--variant",
+        action="append",
+        choices=VARIANTS,
+        help="limit to this variant (repeatable)",
+    )
+    run.add_argument("--out", type=Path, help="write the JSON report here")
+    run.set_defaults(handler=_run)
+
+    diff = sub.add_parser("compare", help="diff two JSON reports")
+    diff.add_argument("base", type=Path)
+    diff.add_argument("head", type=Path)
+    diff.add_argument("--threshold", type=float, default=0.10)
+    diff.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    # fastmcp installs its own DEBUG-level handler; per-call logging would
+    # dominate both the output and the timings.
+    for name in ("fastmcp", "fastmcp.server.context.to_client", "mcp", "ha_mcp"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
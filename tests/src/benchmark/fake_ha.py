@@ -0,0 +1,503 @@
+"""A local Home Assistant stand-in serving a :class:`SyntheticInstall`.
+
+:class:`FakeHomeAssistant` speaks enough of the REST API and the WebSocket API
+for the benchmarked tools to run unmodified against it: the auth handshake,
+the registry list commands, states, service calls (which mutate state and
+fan ``state_changed`` out to subscribers, so ``ha_bulk_control`` can confirm
+its operations), automation / script / scene configs, dashboards and history.
+
+It is deliberately not a mock: nothing is asserted here. Anything the server
+is asked for but does not implement is answered the way a real install
+without that integration would (``404`` / ``unknown_command``) and recorded in
+:attr:`FakeHomeAssistant.unhandled`, so a benchmark run can flag a scenario
+that silently degraded to its fallback path.
+
+Bytes are counted on both transports so a run can report how much traffic a
+tool call costs, not only how long it takes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+from .synthetic import EPOCH, FAKE_VERSION, SyntheticInstall
+
+logger = logging.getLogger(__name__)
+
+TOKEN = "benchmark-token"
+
+_TOGGLE_STATES = {
+    "turn_on": "on",
+    "turn_off": "off",
+    "lock": "locked",
+    "unlock": "unlocked",
+    "open_cover": "open",
+    "close_cover": "closed",
+}
+
+_INPUT_HELPERS = (
+    "input_boolean",
+    "input_number",
+    "input_select",
+    "input_text",
+    "input_datetime",
+    "input_button",
+)
+
+# Integrations the synthetic install does not have. Their commands get the
+# ``unknown_command`` a real install without them answers, and are not
+# reported as gaps in the fake.
+ABSENT_INTEGRATIONS = frozenset({"ha_mcp_tools", "hacs", "supervisor", "backup"})
+
+
+@dataclass
+class Traffic:
+    """Bytes and messages exchanged with the fake, per transport."""
+
+    rest_requests: int = 0
+    rest_bytes_in: int = 0
+    rest_bytes_out: int = 0
+    ws_messages: int = 0
+    ws_bytes_in: int = 0
+    ws_bytes_out: int = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return (
+            self.rest_bytes_in
+            + self.rest_bytes_out
+            + self.ws_bytes_in
+            + self.ws_bytes_out
+        )
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "rest_requests": self.rest_requests,
+            "rest_bytes_in": self.rest_bytes_in,
+            "rest_bytes_out": self.rest_bytes_out,
+            "ws_messages": self.ws_messages,
+            "ws_bytes_in": self.ws_bytes_in,
+            "ws_bytes_out": self.ws_bytes_out,
+            "total_bytes": self.total_bytes,
+        }
+
+
+def _parse_time(raw: str | None, default: datetime) -> datetime:
+    if not raw:
+        return default
+    try:
+        return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return default
+
+
+class FakeHomeAssistant:
+    """Serve ``install`` on ``127.0.0.1`` until :meth:`stop`.
+
+    Use as an async context manager; :attr:`url` is valid once entered.
+    """
+
+    def __init__(self, install: SyntheticInstall) -> None:
+        self.install = install
+        self.traffic = Traffic()
+        self.unhandled: Counter[str] = Counter()
+        self.url = ""
+        self._runner: web.AppRunner | None = None
+        self._registry_index = {
+            entry["entity_id"]: entry for entry in install.entity_registry
+        }
+        # Each open socket maps subscription id -> event_type filter (None = all).
+        self._subscribers: dict[web.WebSocketResponse, dict[int, str | None]] = {}
+        self._ws_handlers = {
+            "get_states": lambda msg: list(self.install.states.values()),
+            "get_config": lambda msg: self.install.config(),
+            "call_service": self._ws_call_service,
+            "subscribe_events": None,
+            "unsubscribe_events": self._ws_unsubscribe,
+            "render_template": None,
+            "config/entity_registry/list": lambda msg: self.install.entity_registry,
+            "config/entity_registry/list_for_display": self._ws_registry_display,
+            "config/entity_registry/get": self._ws_registry_get,
+            "config/entity_registry/get_entries": self._ws_registry_get_entries,
+            "config/device_registry/list": lambda msg: self.install.devices,
+            "config/area_registry/list": lambda msg: self.install.areas,
+            "config/floor_registry/list": lambda msg: self.install.floors,
+            "config/label_registry/list": lambda msg: self.install.labels,
+            "config/category_registry/list": lambda msg: [],
+            "config_entries/get": lambda msg: [],
+            "homeassistant/expose_entity/list": lambda msg: {"exposed_entities": {}},
+            "lovelace/config": self._ws_lovelace_config,
+            "lovelace/dashboards/list": lambda msg: self.install.dashboards,
+            "lovelace/resources": lambda msg: [],
+            "repairs/list_issues": lambda msg: {"issues": []},
+            "system_log/list": lambda msg: [],
+            "zone/list": lambda msg: [],
+            "person/list": lambda msg: {"storage": [], "config": []},
+            "history/history_during_period": self._ws_history,
+            "persistent_notification/get": lambda msg: [],
+            **{f"{domain}/list": (lambda msg: []) for domain in _INPUT_HELPERS},
+        }
+
+    # -- lifecycle -----------------------------------------------------------
+
+    async def __aenter__(self) -> FakeHomeAssistant:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        app = web.Application(middlewares=[self._rest_middleware])
+        app.router.add_get("/api/websocket", self._websocket)
+        app.router.add_get("/api/", self._api_root)
+        app.router.add_get("/api/config", self._config)
+        app.router.add_get("/api/states", self._states)
+        app.router.add_get("/api/states/{entity_id}", self._state)
+        app.router.add_get("/api/services", self._services)
+        app.router.add_post("/api/services/{domain}/{service}", self._call_service)
+        app.router.add_get("/api/config/automation/config", self._automation_list)
+        app.router.add_get("/api/config/script/config", self._script_list)
+        app.router.add_get("/api/config/scene/config", self._scene_list)
+        app.router.add_get("/api/config/config_entries/entry", self._empty_list)
+        app.router.add_get(
+            "/api/config/automation/config/{config_id}", self._automation_config
+        )
+        app.router.add_get("/api/config/script/config/{config_id}", self._script_config)
+        app.router.add_get("/api/config/scene/config/{config_id}", self._scene_config)
+        app.router.add_get("/api/history/period", self._history)
+        app.router.add_get("/api/history/period/{start}", self._history)
+        app.router.add_get("/api/logbook", self._empty_list)
+        app.router.add_get("/api/logbook/{start}", self._empty_list)
+        app.router.add_get("/api/error_log", self._error_log)
+        app.router.add_post("/api/template", self._template)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        sockets = site._server.sockets if site._server else ()  # type: ignore[union-attr]
+        port = sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        for ws in list(self._subscribers):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def reset_counters(self) -> None:
+        self.traffic = Traffic()
+
+    # -- REST ----------------------------------------------------------------
+
+    @web.middleware
+    async def _rest_middleware(self, request: web.Request, handler: Any) -> Any:
+        if request.path == "/api/websocket":
+            return await handler(request)
+        if request.headers.get("Authorization") != f"Bearer {TOKEN}":
+            return web.json_response({"message": "Unauthorized"}, status=401)
+        body = await request.read()
+        self.traffic.rest_requests += 1
+        self.traffic.rest_bytes_in += len(body)
+        try:
+            response = await handler(request)
+        except web.HTTPNotFound:
+            self.unhandled[f"{request.method} {request.path}"] += 1
+            response = web.json_response({"message": "Not found"}, status=404)
+        if isinstance(response, web.Response) and response.body is not None:
+            self.traffic.rest_bytes_out += len(response.body)  # type: ignore[arg-type]
+        return response
+
+    @staticmethod
+    def _json(payload: Any, status: int = 200) -> web.Response:
+        return web.Response(
+            body=json.dumps(payload).encode(),
+            status=status,
+            content_type="application/json",
+        )
+
+    async def _api_root(self, request: web.Request) -> web.Response:
+        return self._json({"message": "API running."})
+
+    async def _config(self, request: web.Request) -> web.Response:
+        return self._json(self.install.config())
+
+    async def _states(self, request: web.Request) -> web.Response:
+        return self._json(list(self.install.states.values()))
+
+    async def _state(self, request: web.Request) -> web.Response:
+        state = self.install.states.get(request.match_info["entity_id"])
+        if state is None:
+            return self._json({"message": "Entity not found."}, status=404)
+        return self._json(state)
+
+    async def _services(self, request: web.Request) -> web.Response:
+        domains = sorted({eid.split(".", 1)[0] for eid in self.install.states})
+        return self._json(
+            [
+                {
+                    "domain": domain,
+                    "services": {
+                        name: {"name": name, "description": "", "fields": {}}
+                        for name in ("turn_on", "turn_off", "toggle", "reload")
+                    },
+                }
+                for domain in domains
+            ]
+        )
+
+    async def _call_service(self, request: web.Request) -> web.Response:
+        data = await request.json() if request.can_read_body else {}
+        changed = await self._apply_service(
+            request.match_info["domain"], request.match_info["service"], data or {}
+        )
+        return self._json(changed)
+
+    async def _automation_list(self, request: web.Request) -> web.Response:
+        return self._json(list(self.install.automations.values()))
+
+    async def _script_list(self, request: web.Request) -> web.Response:
+        return self._json(
+            [{"id": key, **config} for key, config in self.install.scripts.items()]
+        )
+
+    async def _scene_list(self, request: web.Request) -> web.Response:
+        return self._json(list(self.install.scenes.values()))
+
+    async def _automation_config(self, request: web.Request) -> web.Response:
+        config = self.install.automations.get(request.match_info["config_id"])
+        if config is None:
+            return self._json({"message": "Resource not found"}, status=404)
+        return self._json(config)
+
+    async def _script_config(self, request: web.Request) -> web.Response:
+        config = self.install.scripts.get(request.match_info["config_id"])
+        if config is None:
+            return self._json({"message": "Resource not found"}, status=404)
+        return self._json(config)
+
+    async def _scene_config(self, request: web.Request) -> web.Response:
+        config = self.install.scenes.get(request.match_info["config_id"])
+        if config is None:
+            return self._json({"message": "Resource not found"}, status=404)
+        return self._json(config)
+
+    async def _history(self, request: web.Request) -> web.Response:
+        end = _parse_time(request.query.get("end_time"), EPOCH)
+        start = _parse_time(request.match_info.get("start"), end - timedelta(days=1))
+        wanted = request.query.get("filter_entity_id", "")
+        entity_ids = [eid for eid in wanted.split(",") if eid]
+        return self._json(self.install.history(entity_ids, start, end))
+
+    async def _empty_list(self, request: web.Request) -> web.Response:
+        return self._json([])
+
+    async def _error_log(self, request: web.Request) -> web.Response:
+        body = "\n".join(
+            f"2026-01-01 00:00:{i % 60:02d}.000 INFO (MainThread) [synthetic] line {i}"
+            for i in range(200)
+        )
+        return web.Response(text=body, content_type="text/plain")
+
+    async def _template(self, request: web.Request) -> web.Response:
+        return web.Response(text="", content_type="text/plain")
+
+    # -- services ------------------------------------------------------------
+
+    async def _apply_service(
+        self, domain: str, service: str, data: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        target = data.get("target") or {}
+        raw = data.get("entity_id", target.get("entity_id", []))
+        entity_ids = [raw] if isinstance(raw, str) else list(raw)
+        changed = []
+        for entity_id in entity_ids:
+            state = self.install.states.get(entity_id)
+            if state is None:
+                continue
+            if service == "toggle":
+                new_value = "off" if state["state"] == "on" else "on"
+            else:
+                new_value = _TOGGLE_STATES.get(service, state["state"])
+            old = dict(state)
+            state["state"] = new_value
+            state["last_changed"] = state["last_updated"] = datetime.now(
+                EPOCH.tzinfo
+            ).isoformat()
+            changed.append(state)
+            await self._fire(
+                "state_changed",
+                {"entity_id": entity_id, "old_state": old, "new_state": dict(state)},
+            )
+        return changed
+
+    async def _fire(self, event_type: str, data: dict[str, Any]) -> None:
+        event = {
+            "event_type": event_type,
+            "data": data,
+            "origin": "LOCAL",
+            "time_fired": datetime.now(EPOCH.tzinfo).isoformat(),
+            "context": {"id": "synthetic", "parent_id": None, "user_id": None},
+        }
+        for ws, subscriptions in list(self._subscribers.items()):
+            for sub_id, wanted in subscriptions.items():
+                if wanted is None or wanted == event_type:
+                    await self._send(
+                        ws, {"id": sub_id, "type": "event", "event": event}
+                    )
+
+    # -- WebSocket -----------------------------------------------------------
+
+    async def _send(self, ws: web.WebSocketResponse, payload: dict[str, Any]) -> None:
+        if ws.closed:
+            return
+        text = json.dumps(payload)
+        self.traffic.ws_bytes_out += len(text.encode())
+        await ws.send_str(text)
+
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        await self._send(ws, {"type": "auth_required", "ha_version": FAKE_VERSION})
+        authed = False
+        self._subscribers[ws] = {}
+        try:
+            async for frame in ws:
+                if frame.type != WSMsgType.TEXT:
+                    continue
+                self.traffic.ws_bytes_in += len(frame.data.encode())
+                msg = json.loads(frame.data)
+                if not authed:
+                    if msg.get("access_token") == TOKEN:
+                        authed = True
+                        await self._send(
+                            ws, {"type": "auth_ok", "ha_version": FAKE_VERSION}
+                        )
+                    else:
+                        await self._send(
+                            ws, {"type": "auth_invalid", "message": "Invalid token"}
+                        )
+                        break
+                    continue
+                self.traffic.ws_messages += 1
+                await self._dispatch(ws, msg)
+        finally:
+            self._subscribers.pop(ws, None)
+        return ws
+
+    async def _dispatch(self, ws: web.WebSocketResponse, msg: dict[str, Any]) -> None:
+        msg_id, command = msg.get("id"), msg.get("type", "")
+        if command == "ping":
+            await self._send(ws, {"id": msg_id, "type": "pong"})
+            return
+        if command not in self._ws_handlers:
+            if command.split("/", 1)[0] not in ABSENT_INTEGRATIONS:
+                self.unhandled[f"ws {command}"] += 1
+            await self._send(
+                ws,
+                {
+                    "id": msg_id,
+                    "type": "result",
+                    "success": False,
+                    "error": {"code": "unknown_command", "message": "Unknown command."},
+                },
+            )
+            return
+        if command == "subscribe_events":
+            self._subscribers[ws][msg_id] = msg.get("event_type")
+            result: Any = None
+        elif command == "render_template":
+            # Ack first, then deliver the rendered value as the event HA sends.
+            await self._send(
+                ws, {"id": msg_id, "type": "result", "success": True, "result": None}
+            )
+            await self._send(
+                ws,
+                {
+                    "id": msg_id,
+                    "type": "event",
+                    "event": {"result": "", "listeners": {}},
+                },
+            )
+            return
+        else:
+            handler = self._ws_handlers[command]
+            result = None if handler is None else handler(msg)
+            if hasattr(result, "__await__"):
+                result = await result
+        if isinstance(result, _WSError):
+            await self._send(
+                ws,
+                {
+                    "id": msg_id,
+                    "type": "result",
+                    "success": False,
+                    "error": {"code": result.code, "message": result.message},
+                },
+            )
+            return
+        await self._send(
+            ws, {"id": msg_id, "type": "result", "success": True, "result": result}
+        )
+
+    async def _ws_call_service(self, msg: dict[str, Any]) -> dict[str, Any]:
+        data = dict(msg.get("service_data") or {})
+        if msg.get("target"):
+            data["target"] = msg["target"]
+        await self._apply_service(msg["domain"], msg["service"], data)
+        return {"context": {"id": "synthetic", "parent_id": None, "user_id": None}}
+
+    def _ws_unsubscribe(self, msg: dict[str, Any]) -> None:
+        for subscriptions in self._subscribers.values():
+            subscriptions.pop(msg.get("subscription"), None)  # type: ignore[arg-type]
+
+    def _ws_registry_get(self, msg: dict[str, Any]) -> Any:
+        entry = self._registry_index.get(msg.get("entity_id", ""))
+        if entry is None:
+            return _WSError("not_found", "Entity not found")
+        return {**entry, "aliases": [], "capabilities": None, "device_class": None}
+
+    def _ws_registry_get_entries(self, msg: dict[str, Any]) -> dict[str, Any]:
+        return {eid: self._registry_index.get(eid) for eid in msg.get("entity_ids", [])}
+
+    def _ws_registry_display(self, msg: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "entity_categories": {"0": "config", "1": "diagnostic"},
+            "entities": [
+                {"ei": entry["entity_id"], "pl": entry["platform"]}
+                for entry in self.install.entity_registry
+            ],
+        }
+
+    def _ws_lovelace_config(self, msg: dict[str, Any]) -> Any:
+        config = self.install.dashboard_configs.get(msg.get("url_path"))
+        if config is None:
+            return _WSError("config_not_found", "No config found.")
+        return config
+
+    def _ws_history(self, msg: dict[str, Any]) -> dict[str, Any]:
+        end = _parse_time(msg.get("end_time"), EPOCH)
+        start = _parse_time(msg.get("start_time"), end - timedelta(days=1))
+        rows = self.install.history(list(msg.get("entity_ids", [])), start, end)
+        return {
+            series[0]["entity_id"]: [
+                {"s": point["state"], "a": point["attributes"], "lu": 0.0}
+                for point in series
+            ]
+            for series in rows
+            if series
+        }
+
+
+@dataclass
+class _WSError:
+    code: str
+    message: str
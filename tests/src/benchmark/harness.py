@@ -0,0 +1,412 @@
+"""Drive ``HomeAssistantSmartMCPServer`` in-process against :mod:`.fake_ha`.
+
+One :func:`run_benchmarks` call generates an install per requested size,
+starts a :class:`~.fake_ha.FakeHomeAssistant` on a loopback port, points a
+freshly built server at it and times every scenario through a
+``fastmcp.Client`` — the same path an MCP client takes, so every middleware
+(telemetry, visibility, redaction, ...) is on the measured path.
+
+Each scenario runs under three variants:
+
+- ``baseline``  — visibility off, ``redact_secrets`` off.
+- ``visibility`` — enforce-mode visibility hiding one area and every
+  ``deny_entity_ids`` match, so both halves of the enforcement middleware do
+  real work.
+- ``redaction`` — ``redact_secrets`` on with a set of known secret values
+  registered, so every response goes through the scrub.
+
+Per scenario the report carries latency percentiles, the bytes the fake
+exchanged with the server, the MCP response size and the process's peak RSS
+delta. Reports are plain JSON; :func:`compare` diffs two of them.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .fake_ha import TOKEN, FakeHomeAssistant
+from .synthetic import SyntheticInstall, generate
+
+SCHEMA_VERSION = 1
+DEFAULT_SIZES = (1_000, 10_000, 50_000)
+VARIANTS = ("baseline", "visibility", "redaction")
+
+# Registered for the redaction variant. Two of them occur in every state
+# payload, so the scrub always has something to replace.
+_SECRETS = ("synthetic-api-key-0001", "Synthetic 1", "ctx0000000000")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A named tool call. ``arguments`` receives the install so scenarios can
+    pick real entity ids."""
+
+    name: str
+    tool: str
+    arguments: Callable[[SyntheticInstall], dict[str, Any]]
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario(
+        "search_entity",
+        "ha_search",
+        lambda _: {"query": "kitchen temperature", "limit": 50},
+    ),
+    Scenario(
+        "search_deep",
+        "ha_search",
+        lambda _: {
+            "query": "light",
+            "search_types": ["automation", "script", "scene"],
+            "limit": 50,
+        },
+    ),
+    Scenario(
+        "overview_minimal", "ha_get_overview", lambda _: {"detail_level": "minimal"}
+    ),
+    Scenario(
+        "overview_standard", "ha_get_overview", lambda _: {"detail_level": "standard"}
+    ),
+    Scenario(
+        "get_state_bulk",
+        "ha_get_state",
+        lambda install: {"entity_id": install.entity_ids("sensor")[:100]},
+    ),
+    Scenario(
+        "bulk_control",
+        "ha_bulk_control",
+        lambda install: {
+            "operations": [
+                {"entity_id": eid, "action": "toggle"}
+                for eid in install.entity_ids("light")[:20]
+            ],
+        },
+    ),
+)
+
+
+# -- process measurements -----------------------------------------------------
+
+
+def _status_kib(field: str) -> int | None:
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's high-water mark so the next peak is per-scenario.
+
+    Linux-only; elsewhere the peak is process-lifetime and deltas are
+    reported as ``None``.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as refs:
+            refs.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def _peak_rss_kib() -> int:
+    peak = _status_kib("VmHWM")
+    if peak is not None:
+        return peak
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, KiB on Linux.
+    return usage // 1024 if sys.platform == "darwin" else usage
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(q * (len(ordered) - 1))))
+    return ordered[rank]
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# -- environment ---------------------------------------------------------------
+
+
+@contextmanager
+def _server_environment(url: str, data_dir: Path) -> Iterator[None]:
+    """Point the settings singleton, data dir and WebSocket pool at the fake."""
+    from ha_mcp import config
+    from ha_mcp.client.websocket_client import websocket_manager
+    from ha_mcp.utils.data_paths import get_data_dir
+    from ha_mcp.utils.usage_logger import shutdown_usage_logger
+
+    overrides = {
+        "HOMEASSISTANT_URL": url,
+        "HOMEASSISTANT_TOKEN": TOKEN,
+        "HA_MCP_CONFIG_DIR": str(data_dir),
+    }
+    saved = {key: os.environ.get(key) for key in overrides}
+    os.environ.update(overrides)
+
+    def _reset() -> None:
+        # The usage log lives in the data dir, so it follows it.
+        shutdown_usage_logger()
+        config._settings = None
+        get_data_dir.cache_clear()
+        websocket_manager._clients.clear()
+        websocket_manager._last_used.clear()
+        websocket_manager._current_loop = None
+
+    _reset()
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        _reset()
+
+
+def _apply_variant(variant: str, install: SyntheticInstall, data_dir: Path) -> None:
+    from ha_mcp import redaction
+    from ha_mcp.config import get_global_settings
+    from ha_mcp.visibility.persistence import VISIBILITY_FILENAME
+
+    visibility_file = data_dir / VISIBILITY_FILENAME
+    if variant == "visibility":
+        # Hide entities no scenario names directly (binary sensors via their
+        # label and the default diagnostic-category rule, sensors past the
+        # bulk read's first 100), so every call still succeeds and the cost
+        # measured is filtering, not refusal.
+        visibility_file.write_text(
+            json.dumps(
+                {
+                    "enabled": True,
+                    "enforce": True,
+                    "exclude_labels": ["security"],
+                    "deny_entity_ids": install.entity_ids("sensor")[100::10],
+                }
+            )
+        )
+    else:
+        visibility_file.unlink(missing_ok=True)
+
+    settings = get_global_settings()
+    settings.redact_secrets = variant == "redaction"
+    redaction._clear_known_secret_values()
+    if variant == "redaction":
+        redaction.register_known_secret_values(_SECRETS)
+
+
+# -- running -------------------------------------------------------------------
+
+
+async def _drop_log(message: Any) -> None:
+    """Swallow the tools' MCP log notifications instead of printing them."""
+
+
+def _response_bytes(result: Any) -> int:
+    return sum(
+        len(block.text.encode())
+        for block in getattr(result, "content", None) or []
+        if isinstance(getattr(block, "text", None), str)
+    )
+
+
+async def _measure(
+    call: Callable[[], Awaitable[Any]],
+    fake: FakeHomeAssistant,
+    iterations: int,
+    warmup: int,
+) -> dict[str, Any]:
+    for _ in range(warmup):
+        await call()
+    gc.collect()
+    fake.reset_counters()
+    rss_before = _status_kib("VmRSS")
+    peak_resettable = _reset_peak_rss()
+    latencies: list[float] = []
+    errors = 0
+    size = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = await call()
+        latencies.append((time.perf_counter() - start) * 1000)
+        errors += bool(getattr(result, "is_error", False))
+        size = _response_bytes(result)
+    peak = _peak_rss_kib()
+    traffic = fake.traffic.as_dict()
+    return {
+        "iterations": iterations,
+        "errors": errors,
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 0.5), 3),
+            "p95": round(_percentile(latencies, 0.95), 3),
+            "max": round(max(latencies), 3),
+            "mean": round(statistics.fmean(latencies), 3),
+        },
+        "response_bytes": size,
+        "ha_bytes_per_call": traffic["total_bytes"] // iterations,
+        "ha_requests_per_call": round(
+            (traffic["rest_requests"] + traffic["ws_messages"]) / iterations, 2
+        ),
+        "peak_rss_delta_kib": (
+            peak - rss_before if peak_resettable and rss_before is not None else None
+        ),
+    }
+
+
+async def run_size(
+    entities: int,
+    *,
+    iterations: int,
+    warmup: int = 1,
+    scenarios: tuple[Scenario, ...] = SCENARIOS,
+    variants: tuple[str, ...] = VARIANTS,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Benchmark every scenario and variant against one generated install."""
+    from fastmcp import Client
+
+    from ha_mcp.client.rest_client import HomeAssistantClient
+    from ha_mcp.server import HomeAssistantSmartMCPServer
+
+    started = time.perf_counter()
+    install = generate(entities, seed=seed)
+    generate_s = time.perf_counter() - started
+    results: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(prefix="ha-mcp-bench-") as tmp:
+        data_dir = Path(tmp)
+        async with FakeHomeAssistant(install) as fake:
+            with _server_environment(fake.url, data_dir):
+                ha_client = HomeAssistantClient(base_url=fake.url, token=TOKEN)
+                server = HomeAssistantSmartMCPServer(client=ha_client)
+                try:
+                    async with Client(server.mcp, log_handler=_drop_log) as client:
+                        for variant in variants:
+                            _apply_variant(variant, install, data_dir)
+                            for scenario in scenarios:
+                                arguments = scenario.arguments(install)
+
+                                async def call(
+                                    tool: str = scenario.tool,
+                                    arguments: dict[str, Any] = arguments,
+                                ) -> Any:
+                                    return await client.call_tool(
+                                        tool, arguments, raise_on_error=False
+                                    )
+
+                                key = f"{scenario.name}/{variant}"
+                                results[key] = await _measure(
+                                    call, fake, iterations, warmup
+                                )
+                finally:
+                    _apply_variant("baseline", install, data_dir)
+                    await ha_client.close()
+            unhandled = dict(fake.unhandled)
+    return {
+        "entities": len(install.states),
+        "generate_s": round(generate_s, 3),
+        "scenarios": results,
+        "unhandled": unhandled,
+    }
+
+
+async def run_benchmarks(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    *,
+    iterations: int = 10,
+    warmup: int = 1,
+    scenarios: tuple[Scenario, ...] = SCENARIOS,
+    variants: tuple[str, ...] = VARIANTS,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Run every size and return the JSON-ready report."""
+    report: dict[str, Any] = {
+        "schema": SCHEMA_VERSION,
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": iterations,
+        "seed": seed,
+        "sizes": {},
+    }
+    for size in sizes:
+        report["sizes"][str(size)] = await run_size(
+            size,
+            iterations=iterations,
+            warmup=warmup,
+            scenarios=scenarios,
+            variants=variants,
+            seed=seed,
+        )
+    return report
+
+
+# -- comparing -----------------------------------------------------------------
+
+
+def compare(
+    base: dict[str, Any], head: dict[str, Any], *, threshold: float = 0.10
+) -> list[dict[str, Any]]:
+    """Pair up scenarios present in both reports.
+
+    Each row carries the p50 latency and HA-bytes ratios (head / base);
+    ``regression`` is set when either grew by more than ``threshold``.
+    """
+    rows = []
+    for size, base_run in base.get("sizes", {}).items():
+        head_run = head.get("sizes", {}).get(size)
+        if head_run is None:
+            continue
+        for key, before in base_run["scenarios"].items():
+            after = head_run["scenarios"].get(key)
+            if after is None:
+                continue
+            latency = _ratio(after["latency_ms"]["p50"], before["latency_ms"]["p50"])
+            traffic = _ratio(after["ha_bytes_per_call"], before["ha_bytes_per_call"])
+            rows.append(
+                {
+                    "size": int(size),
+                    "scenario": key,
+                    "p50_ms": [before["latency_ms"]["p50"], after["latency_ms"]["p50"]],
+                    "p50_ratio": latency,
+                    "ha_bytes_ratio": traffic,
+                    "regression": max(latency, traffic) > 1 + threshold,
+                }
+            )
+    return rows
+
+
+def _ratio(after: float, before: float) -> float:
+    if before <= 0:
+        return 1.0 if after <= 0 else float("inf")
+    return round(after / before, 3)
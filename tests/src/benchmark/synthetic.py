@@ -0,0 +1,510 @@
+"""Deterministic synthetic Home Assistant installs for the offline benchmarks.
+
+:func:`generate` builds everything the fake server in :mod:`.fake_ha` serves
+from a single ``(entities, seed)`` pair: states, the entity / device / area /
+floor / label registries, automation, script and scene configs, dashboards,
+and recorder history. The same pair always yields the same install, so two
+benchmark runs on different commits measure the same workload.
+
+Proportions are loosely modelled on real installs: sensors dominate, roughly
+one device per four entities, one automation per 50 entities, one script and
+one scene per 100.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+# (domain, weight) — the share of generated entities per domain.
+_DOMAINS: tuple[tuple[str, int], ...] = (
+    ("sensor", 45),
+    ("binary_sensor", 15),
+    ("light", 10),
+    ("switch", 10),
+    ("climate", 3),
+    ("cover", 4),
+    ("media_player", 3),
+    ("fan", 2),
+    ("lock", 2),
+    ("input_boolean", 3),
+    ("input_number", 3),
+)
+
+_ROOMS = (
+    "kitchen",
+    "living_room",
+    "bedroom",
+    "office",
+    "garage",
+    "hallway",
+    "bathroom",
+    "basement",
+    "attic",
+    "garden",
+    "laundry",
+    "dining_room",
+)
+
+_SENSOR_KINDS = (
+    ("temperature", "°C", "temperature"),
+    ("humidity", "%", "humidity"),
+    ("power", "W", "power"),
+    ("energy", "kWh", "energy"),
+    ("illuminance", "lx", "illuminance"),
+    ("battery", "%", "battery"),
+)
+
+_BINARY_KINDS = ("motion", "door", "window", "occupancy", "moisture")
+
+_MANUFACTURERS = ("Aqara", "Philips", "IKEA", "Shelly", "Sonoff", "Tuya", "Eve")
+
+# Reference instant for every timestamp, so output is byte-stable across runs.
+EPOCH = datetime(2026, 1, 1, tzinfo=UTC)
+
+FAKE_VERSION = "2026.9.0"
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat()
+
+
+@dataclass
+class SyntheticInstall:
+    """A generated install. Every collection is plain HA wire-format JSON."""
+
+    entity_count: int
+    seed: int
+    states: dict[str, dict[str, Any]] = field(default_factory=dict)
+    entity_registry: list[dict[str, Any]] = field(default_factory=list)
+    devices: list[dict[str, Any]] = field(default_factory=list)
+    areas: list[dict[str, Any]] = field(default_factory=list)
+    floors: list[dict[str, Any]] = field(default_factory=list)
+    labels: list[dict[str, Any]] = field(default_factory=list)
+    automations: dict[str, dict[str, Any]] = field(default_factory=dict)
+    scripts: dict[str, dict[str, Any]] = field(default_factory=dict)
+    scenes: dict[str, dict[str, Any]] = field(default_factory=dict)
+    dashboards: list[dict[str, Any]] = field(default_factory=list)
+    dashboard_configs: dict[str | None, dict[str, Any]] = field(default_factory=dict)
+    history_points: int = 24
+
+    def entity_ids(self, domain: str | None = None) -> list[str]:
+        return [
+            eid
+            for eid in self.states
+            if domain is None or eid.split(".", 1)[0] == domain
+        ]
+
+    def config(self) -> dict[str, Any]:
+        """The ``/api/config`` / ``get_config`` payload."""
+        domains = sorted({eid.split(".", 1)[0] for eid in self.states})
+        return {
+            "location_name": f"Synthetic {self.entity_count}",
+            "latitude": 52.37,
+            "longitude": 4.89,
+            "elevation": 0,
+            "unit_system": {
+                "length": "km",
+                "mass": "g",
+                "temperature": "°C",
+                "volume": "L",
+                "pressure": "Pa",
+                "wind_speed": "m/s",
+                "accumulated_precipitation": "mm",
+            },
+            "time_zone": "UTC",
+            "components": [*domains, "api", "config", "frontend", "history"],
+            "config_dir": "/config",
+            "allowlist_external_dirs": [],
+            "allowlist_external_urls": [],
+            "version": FAKE_VERSION,
+            "config_source": "storage",
+            "recovery_mode": False,
+            "safe_mode": False,
+            "state": "RUNNING",
+            "external_url": None,
+            "internal_url": None,
+            "currency": "EUR",
+            "country": "NL",
+            "language": "en",
+        }
+
+    def history(
+        self, entity_ids: list[str], start: datetime, end: datetime
+    ) -> list[list[dict[str, Any]]]:
+        """``/api/history/period`` rows: ``history_points`` changes per entity,
+        evenly spread over the window."""
+        span = max((end - start).total_seconds(), 1.0)
+        step = span / self.history_points
+        rows = []
+        for eid in entity_ids:
+            current = self.states.get(eid)
+            if current is None:
+                continue
+            numeric = eid.startswith("sensor.")
+            series = []
+            for i in range(self.history_points):
+                moment = _iso(start + timedelta(seconds=i * step))
+                value = f"{20 + (i % 7) * 0.5:.1f}" if numeric else ("on", "off")[i % 2]
+                series.append(
+                    {
+                        "entity_id": eid,
+                        "state": value,
+                        "attributes": current["attributes"] if i == 0 else {},
+                        "last_changed": moment,
+                        "last_updated": moment,
+                    }
+                )
+            rows.append(series)
+        return rows
+
+
+def _state(
+    entity_id: str, value: str, attributes: dict[str, Any], stamp: str
+) -> dict[str, Any]:
+    return {
+        "entity_id": entity_id,
+        "state": value,
+        "attributes": attributes,
+        "last_changed": stamp,
+        "last_reported": stamp,
+        "last_updated": stamp,
+        "context": {
+            "id": f"ctx{abs(hash(entity_id)) % 10**12:012d}",
+            "parent_id": None,
+            "user_id": None,
+        },
+    }
+
+
+def _entity(
+    rng: random.Random, domain: str, index: int, room: str
+) -> tuple[str, str, dict[str, Any]]:
+    """(object_id, state, attributes) for one generated entity."""
+    pretty_room = room.replace("_", " ").title()
+    if domain == "sensor":
+        kind, unit, device_class = rng.choice(_SENSOR_KINDS)
+        value = f"{rng.uniform(0, 100):.1f}"
+        return (
+            f"{room}_{kind}_{index}",
+            value,
+            {
+                "state_class": "measurement",
+                "unit_of_measurement": unit,
+                "device_class": device_class,
+                "friendly_name": f"{pretty_room} {kind.title()} {index}",
+            },
+        )
+    if domain == "binary_sensor":
+        kind = rng.choice(_BINARY_KINDS)
+        return (
+            f"{room}_{kind}_{index}",
+            rng.choice(("on", "off")),
+            {
+                "device_class": kind,
+                "friendly_name": f"{pretty_room} {kind.title()} {index}",
+            },
+        )
+    if domain == "light":
+        on = rng.random() < 0.4
+        attributes: dict[str, Any] = {
+            "supported_color_modes": ["color_temp", "hs"],
+            "color_mode": "color_temp" if on else None,
+            "brightness": rng.randint(1, 255) if on else None,
+            "min_color_temp_kelvin": 2000,
+            "max_color_temp_kelvin": 6535,
+            "friendly_name": f"{pretty_room} Light {index}",
+            "supported_features": 44,
+        }
+        return f"{room}_light_{index}", "on" if on else "off", attributes
+    if domain == "climate":
+        return (
+            f"{room}_thermostat_{index}",
+            rng.choice(("heat", "off", "auto")),
+            {
+                "hvac_modes": ["off", "heat", "auto"],
+                "current_temperature": round(rng.uniform(16, 24), 1),
+                "temperature": 21,
+                "friendly_name": f"{pretty_room} Thermostat {index}",
+                "supported_features": 385,
+            },
+        )
+    if domain == "cover":
+        return (
+            f"{room}_blind_{index}",
+            rng.choice(("open", "closed")),
+            {
+                "current_position": rng.randint(0, 100),
+                "device_class": "blind",
+                "friendly_name": f"{pretty_room} Blind {index}",
+                "supported_features": 15,
+            },
+        )
+    if domain == "media_player":
+        return (
+            f"{room}_speaker_{index}",
+            rng.choice(("playing", "idle", "off")),
+            {
+                "volume_level": round(rng.random(), 2),
+                "friendly_name": f"{pretty_room} Speaker {index}",
+                "supported_features": 152463,
+            },
+        )
+    if domain == "input_number":
+        return (
+            f"{room}_setpoint_{index}",
+            f"{rng.randint(0, 100)}.0",
+            {
+                "min": 0,
+                "max": 100,
+                "step": 1,
+                "mode": "slider",
+                "friendly_name": f"{pretty_room} Setpoint {index}",
+            },
+        )
+    label = domain.replace("_", " ").title()
+    return (
+        f"{room}_{domain}_{index}",
+        rng.choice(("on", "off"))
+        if domain != "lock"
+        else rng.choice(("locked", "unlocked")),
+        {"friendly_name": f"{pretty_room} {label} {index}"},
+    )
+
+
+def _labels(domain: str, index: int) -> list[str]:
+    if domain == "sensor" and index % 4 == 0:
+        return ["energy"]
+    if domain == "binary_sensor" and index % 2 == 0:
+        return ["security"]
+    return []
+
+
+def _automation(rng: random.Random, index: int, pool: list[str]) -> dict[str, Any]:
+    trigger, target = rng.sample(pool, 2)
+    return {
+        "id": f"{1700000000000 + index}",
+        "alias": f"Automation {index}: follow {trigger}",
+        "description": f"Generated automation {index}",
+        "mode": "single",
+        "triggers": [{"trigger": "state", "entity_id": trigger, "to": "on"}],
+        "conditions": [
+            {"condition": "time", "after": "06:00:00", "before": "23:00:00"}
+        ],
+        "actions": [
+            {
+                "action": f"{target.split('.', 1)[0]}.turn_on",
+                "target": {"entity_id": target},
+            },
+            {"delay": {"seconds": rng.randint(1, 60)}},
+            {
+                "action": f"{target.split('.', 1)[0]}.turn_off",
+                "target": {"entity_id": target},
+            },
+        ],
+    }
+
+
+def _script(rng: random.Random, index: int, pool: list[str]) -> dict[str, Any]:
+    targets = rng.sample(pool, 3)
+    return {
+        "alias": f"Script {index}",
+        "mode": "single",
+        "sequence": [
+            {
+                "action": f"{eid.split('.', 1)[0]}.toggle",
+                "target": {"entity_id": eid},
+            }
+            for eid in targets
+        ],
+    }
+
+
+def _scene(rng: random.Random, index: int, pool: list[str]) -> dict[str, Any]:
+    return {
+        "id": f"{1800000000000 + index}",
+        "name": f"Scene {index}",
+        "entities": {eid: {"state": "on"} for eid in rng.sample(pool, 4)},
+    }
+
+
+def _dashboard(rng: random.Random, views: int, pool: list[str]) -> dict[str, Any]:
+    return {
+        "title": "Home",
+        "views": [
+            {
+                "title": f"View {v}",
+                "path": f"view-{v}",
+                "cards": [
+                    {
+                        "type": "entities",
+                        "entities": rng.sample(pool, min(8, len(pool))),
+                    },
+                    {"type": "tile", "entity": rng.choice(pool)},
+                ],
+            }
+            for v in range(views)
+        ],
+    }
+
+
+def generate(entities: int, seed: int = 0) -> SyntheticInstall:
+    """Generate an install with ``entities`` state-machine entities (plus the
+    automation / script / scene entities their configs imply)."""
+    rng = random.Random(seed)
+    install = SyntheticInstall(entity_count=entities, seed=seed)
+    stamp = _iso(EPOCH)
+
+    install.floors = [
+        {
+            "floor_id": f"floor_{i}",
+            "name": f"Floor {i}",
+            "level": i,
+            "aliases": [],
+            "icon": None,
+        }
+        for i in range(3)
+    ]
+    area_count = min(max(len(_ROOMS), entities // 200), 300)
+    area_ids = []
+    for i in range(area_count):
+        base = _ROOMS[i % len(_ROOMS)]
+        area_id = base if i < len(_ROOMS) else f"{base}_{i // len(_ROOMS)}"
+        area_ids.append(area_id)
+        install.areas.append(
+            {
+                "area_id": area_id,
+                "name": area_id.replace("_", " ").title(),
+                "floor_id": f"floor_{i % 3}",
+                "aliases": [],
+                "labels": [],
+                "icon": None,
+                "picture": None,
+            }
+        )
+    install.labels = [
+        {
+            "label_id": name,
+            "name": name.title(),
+            "color": None,
+            "icon": None,
+            "description": None,
+        }
+        for name in ("energy", "security", "comfort", "outdoor", "critical")
+    ]
+
+    device_count = max(1, entities // 4)
+    for d in range(device_count):
+        install.devices.append(
+            {
+                "id": f"dev{d:06d}",
+                "name": f"Device {d}",
+                "name_by_user": None,
+                "manufacturer": rng.choice(_MANUFACTURERS),
+                "model": f"Model {rng.randint(1, 40)}",
+                "area_id": area_ids[d % area_count],
+                "labels": [],
+                "config_entries": [f"entry{d % 50:04d}"],
+                "disabled_by": None,
+                "entry_type": None,
+                "identifiers": [["synthetic", f"dev{d:06d}"]],
+                "connections": [],
+                "sw_version": "1.0",
+                "hw_version": None,
+                "via_device_id": None,
+                "serial_number": None,
+                "configuration_url": None,
+            }
+        )
+
+    domains = [name for name, _ in _DOMAINS]
+    weights = [weight for _, weight in _DOMAINS]
+    for i in range(entities):
+        domain = rng.choices(domains, weights)[0]
+        device = install.devices[i % device_count]
+        room = device["area_id"]
+        object_id, value, attributes = _entity(rng, domain, i, room)
+        entity_id = f"{domain}.{object_id}"
+        install.states[entity_id] = _state(entity_id, value, attributes, stamp)
+        install.entity_registry.append(
+            {
+                "entity_id": entity_id,
+                "id": f"reg{i:07d}",
+                "unique_id": f"uid{i:07d}",
+                "platform": "synthetic",
+                "config_entry_id": device["config_entries"][0],
+                "device_id": device["id"],
+                "area_id": None if i % 3 else room,
+                "labels": _labels(domain, i),
+                "categories": {},
+                "disabled_by": None,
+                "hidden_by": "user" if i % 97 == 0 else None,
+                "entity_category": (
+                    "diagnostic" if domain == "binary_sensor" and i % 3 == 0 else None
+                ),
+                "has_entity_name": True,
+                "name": None,
+                "original_name": attributes.get("friendly_name"),
+                "icon": None,
+                "options": {},
+                "translation_key": None,
+                "created_at": 0.0,
+                "modified_at": 0.0,
+            }
+        )
+
+    controllable = [
+        eid
+        for eid in install.states
+        if eid.split(".", 1)[0] in ("light", "switch", "fan", "input_boolean")
+    ] or list(install.states)
+    pool = list(install.states)
+
+    for a in range(max(1, entities // 50)):
+        config = _automation(rng, a, controllable)
+        object_id = f"automation_{a}"
+        install.automations[config["id"]] = config
+        install.states[f"automation.{object_id}"] = _state(
+            f"automation.{object_id}",
+            "on",
+            {
+                "id": config["id"],
+                "friendly_name": config["alias"],
+                "last_triggered": None,
+            },
+            stamp,
+        )
+    for s in range(max(1, entities // 100)):
+        object_id = f"script_{s}"
+        install.scripts[object_id] = _script(rng, s, controllable)
+        install.states[f"script.{object_id}"] = _state(
+            f"script.{object_id}", "off", {"friendly_name": f"Script {s}"}, stamp
+        )
+    for s in range(max(1, entities // 100)):
+        config = _scene(rng, s, controllable)
+        install.scenes[config["id"]] = config
+        install.states[f"scene.scene_{s}"] = _state(
+            f"scene.scene_{s}",
+            "unknown",
+            {"id": config["id"], "friendly_name": config["name"]},
+            stamp,
+        )
+
+    install.dashboard_configs[None] = _dashboard(rng, 4, pool)
+    for d in range(1 + entities // 5000):
+        url_path = f"dashboard-{d}"
+        install.dashboards.append(
+            {
+                "id": url_path,
+                "url_path": url_path,
+                "title": f"Dashboard {d}",
+                "icon": "mdi:view-dashboard",
+                "mode": "storage",
+                "require_admin": False,
+                "show_in_sidebar": True,
+            }
+        )
+        install.dashboard_configs[url_path] = _dashboard(rng, 3, pool)
+    return install
@@ -1,6 +1,9 @@
+import random
+
 import pytest
 
 from ha_mcp.policy.evaluator import (
+    CompiledPolicy,
     Verdict,
     evaluate,
     find_matching_rule,
@@ -401,3 +404,74 @@ class TestWsCommandEscapeHatch:
             evaluate("ha_call_service", {"ws_command": "repairs/ignore_issue"}, p)
             == Verdict.REQUIRE_APPROVAL
         )
+
+
+# --- CompiledPolicy ---
+_PREDICATES = [
+    Predicate(path="args.domain", op="eq", value="Lock"),
+    Predicate(path="args.domain", op="neq", value="light"),
+    Predicate(path="args.domain", op="in", value=["LOCK", "alarm", 1]),
+    Predicate(path="args.domain", op="not_in", value=["lock"]),
+    Predicate(path="args.*", op="regex", value=r"^lock\."),
+    Predicate(path="args.entity_id", op="contains", value="Front"),
+    Predicate(path="args.data.*", op="contains", value="x"),
+    Predicate(path="args.data.level", op="gt", value=5),
+    Predicate(path="args.data.level", op="lt", value=5),
+    Predicate(path="args.data", op="exists"),
+    Predicate(path="args.items.*", op="eq", value="A"),
+]
+_ARGS = [
+    {},
+    {"domain": "lock"},
+    {"domain": "LIGHT", "entity_id": "lock.front_door"},
+    {"domain": 1, "data": {"level": 10, "mode": "X"}},
+    {"domain": "alarm", "data": {"level": "high"}, "items": ["a", "b"]},
+    {"data": None, "items": ("A",), "entity_id": ["Front", "back"]},
+    {"ws_command": {"type": "config/x"}, "domain": "lock"},
+]
+_TOOLS = ["ha_call_service", "ha_get_state", "ha_restart"]
+
+
+class TestCompiledPolicy:
+    """The compiled form must answer exactly what the plain evaluator does."""
+
+    def _random_policy(self, rng: random.Random) -> Policy:
+        return Policy(
+            rules=[
+                Rule(
+                    tool_name=rng.choice([*_TOOLS, "*"]),
+                    when=rng.sample(_PREDICATES, rng.randint(0, 2)),
+                )
+                for _ in range(rng.randint(0, 5))
+            ]
+        )
+
+    def test_matches_plain_evaluator(self):
+        rng = random.Random(966)
+        for _ in range(300):
+            policy = self._random_policy(rng)
+            compiled = CompiledPolicy(policy)
+            for tool in [*_TOOLS, "ha_unlisted"]:
+                for args in _ARGS:
+                    assert compiled.find_matching_rule(tool, args) is (
+                        find_matching_rule(tool, args, policy)
+                    ), (policy, tool, args)
+                    assert compiled.evaluate(tool, args) == evaluate(
+                        tool, args, policy
+                    ), (policy, tool, args)
+
+    def test_only_rules_for_the_tool_and_wildcards_are_checked(self):
+        other = Rule(
+            tool_name="ha_restart",
+            when=[Predicate(path="args.x", op="exists")],
+        )
+        wildcard = Rule(
+            tool_name="*",
+            when=[Predicate(path="args.y", op="exists")],
+        )
+        own = Rule(tool_name="ha_get_state")
+        compiled = CompiledPolicy(Policy(rules=[other, wildcard, own]))
+
+        assert compiled.find_matching_rule("ha_get_state", {"y": 1}) is wildcard
+        assert compiled.find_matching_rule("ha_get_state", {"x": 1}) is own
+        assert compiled.find_matching_rule("ha_unlisted", {"x": 1}) is None
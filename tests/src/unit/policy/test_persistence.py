@@ -3,8 +3,15 @@ from pathlib import Path
 
 import pytest
 
+from ha_mcp.policy import persistence
 from ha_mcp.policy.model import Policy, Predicate, Rule
-from ha_mcp.policy.persistence import POLICY_FILENAME, load_policy, save_policy
+from ha_mcp.policy.persistence import (
+    POLICY_FILENAME,
+    invalidate_compiled_policy,
+    load_compiled_policy,
+    load_policy,
+    save_policy,
+)
 
 
 def test_load_missing_file_returns_default(tmp_path: Path):
@@ -86,3 +93,64 @@ def test_serialized_shape_is_stable(tmp_path: Path):
         # ANY-match schema marker (PR #1993) — see migrate_policy_any_semantics.
         "schema_version",
     }
+
+
+class TestLoadCompiledPolicy:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        invalidate_compiled_policy()
+        yield
+        invalidate_compiled_policy()
+
+    @staticmethod
+    def _gate(tool: str) -> Policy:
+        return Policy(rules=[Rule(tool_name=tool)])
+
+    def test_unchanged_file_is_not_reread(self, tmp_path: Path, monkeypatch):
+        save_policy(tmp_path, self._gate("ha_restart"))
+        first = load_compiled_policy(tmp_path)
+
+        def _no_read(data_dir):
+            raise AssertionError("policy file re-read")
+
+        monkeypatch.setattr(persistence, "load_policy", _no_read)
+        assert load_compiled_policy(tmp_path) is first
+
+    def test_save_invalidates(self, tmp_path: Path):
+        save_policy(tmp_path, self._gate("ha_restart"))
+        assert load_compiled_policy(tmp_path).evaluate("ha_restart", {}) == (
+            "require_approval"
+        )
+
+        save_policy(tmp_path, Policy())
+
+        assert load_compiled_policy(tmp_path).evaluate("ha_restart", {}) == "allow"
+
+    def test_external_replace_is_picked_up(self, tmp_path: Path):
+        # Another process (the stdio settings sidecar) writes the file by
+        # atomic replace, bypassing this process's save_policy.
+        save_policy(tmp_path, Policy())
+        assert load_compiled_policy(tmp_path).evaluate("ha_restart", {}) == "allow"
+
+        replacement = tmp_path / "replacement.json"
+        replacement.write_text(
+            json.dumps(self._gate("ha_restart").model_dump(mode="json"))
+        )
+        replacement.replace(tmp_path / POLICY_FILENAME)
+
+        assert load_compiled_policy(tmp_path).evaluate("ha_restart", {}) == (
+            "require_approval"
+        )
+
+    def test_missing_file_then_created(self, tmp_path: Path):
+        assert load_compiled_policy(tmp_path).policy == Policy()
+        save_policy(tmp_path, self._gate("ha_restart"))
+        assert load_compiled_policy(tmp_path).policy.rules[0].tool_name == (
+            "ha_restart"
+        )
+
+    def test_corrupt_file_is_never_cached(self, tmp_path: Path):
+        (tmp_path / POLICY_FILENAME).write_text("{not json")
+        for _ in range(2):
+            with pytest.raises(ValueError, match="not valid JSON"):
+                load_compiled_policy(tmp_path)
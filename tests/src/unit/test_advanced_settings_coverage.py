@@ -212,6 +212,8 @@ ENV_ONLY: dict[str, str] = {
     "MCP_SECRET_PATH": "Secret URL path component for the MCP endpoint (secret)",
     "MCP_SETTINGS_SECRET_PATH": "Dedicated secret URL path for the settings UI in OAuth/OIDC modes; read at startup before the server is up (secret/bind config)",
     "MCP_HEALTHZ": "Opt-in /healthz liveness route — bind/deployment config",
+    "MCP_METRICS": "Opt-in Prometheus /metrics route — bind/deployment config",
+    "HA_MCP_JSON_CODEC": "Force the stdlib JSON backend; read once at import (benchmarking / escape hatch)",
     "FASTMCP_PORT": "FastMCP transport bind port",
     "FASTMCP_TRANSPORT": "FastMCP transport selection — bootstrap",
     "OIDC_CONFIG_URL": "OIDC provider discovery URL — OIDC auth mode bootstrap (pre-Settings)",
@@ -0,0 +1,58 @@
+"""Smoke tests for the offline benchmark harness (tests/src/benchmark).
+
+The harness is only useful if every scenario actually exercises the tool it
+names, so these run it end to end at a toy size and fail when a scenario
+errors or hits an endpoint the fake Home Assistant does not serve.
+"""
+
+from __future__ import annotations
+
+import json
+
+from ..benchmark import harness
+from ..benchmark.synthetic import generate
+
+
+class TestSyntheticInstall:
+    def test_generation_is_deterministic(self):
+        first, second = generate(300, seed=4), generate(300, seed=4)
+        assert first.states == second.states
+        assert first.automations == second.automations
+        assert generate(300, seed=5).states != first.states
+
+    def test_proportions(self):
+        install = generate(1000)
+        assert len(install.entity_registry) == 1000
+        assert len(install.automations) == 20
+        assert len(install.scripts) == len(install.scenes) == 10
+        # automation / script / scene entities come on top of the requested count
+        assert len(install.states) == 1040
+        devices = {d["id"] for d in install.devices}
+        assert all(e["device_id"] in devices for e in install.entity_registry)
+
+
+async def test_every_scenario_runs_cleanly():
+    result = await harness.run_size(60, iterations=1, warmup=0)
+
+    assert result["unhandled"] == {}
+    expected = {f"{s.name}/{v}" for s in harness.SCENARIOS for v in harness.VARIANTS}
+    assert set(result["scenarios"]) == expected
+    for key, row in result["scenarios"].items():
+        assert row["errors"] == 0, key
+        assert row["response_bytes"] > 0, key
+    assert result["scenarios"]["get_state_bulk/baseline"]["ha_bytes_per_call"] > 0
+    json.dumps(result)
+
+
+def test_compare_flags_regressions():
+    def report(p50, ha_bytes):
+        row = {"latency_ms": {"p50": p50}, "ha_bytes_per_call": ha_bytes}
+        return {"sizes": {"1000": {"scenarios": {"search_entity/baseline": row}}}}
+
+    (row,) = harness.compare(report(10.0, 100), report(10.5, 100))
+    assert row["p50_ratio"] == 1.05
+    assert not row["regression"]
+
+    (row,) = harness.compare(report(10.0, 100), report(10.0, 150))
+    assert row["regression"]
+    assert harness.compare(report(10.0, 100), {"sizes": {}}) == []
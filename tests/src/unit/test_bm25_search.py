@@ -1,7 +1,8 @@
 """Unit tests for BM25-based fuzzy search (issue #851).
 
 Tests the BM25Scorer class, tokenizer, FuzzyEntitySearcher BM25 integration,
-and the BM25 path in SmartSearchTools._search_in_dict.
+the incremental EntitySearchIndex, and the BM25 path in
+SmartSearchTools._search_in_dict.
 """
 
 import pytest
@@ -9,6 +10,7 @@ import pytest
 from ha_mcp.utils.fuzzy_search import (
     HIDDEN_SCORE_PENALTY,
     BM25Scorer,
+    EntitySearchIndex,
     FuzzyEntitySearcher,
     apply_hidden_penalty,
     tokenize,
@@ -102,6 +104,137 @@ class TestBM25Scorer:
         assert scores[0] > 0
 
 
+# ---------------------------------------------------------------------------
+# EntitySearchIndex
+# ---------------------------------------------------------------------------
+
+
+def _entity(entity_id, name, aliases=None):
+    entity = {"entity_id": entity_id, "attributes": {"friendly_name": name}}
+    if aliases is not None:
+        entity["_aliases"] = aliases
+    return entity
+
+
+class TestEntitySearchIndex:
+    @pytest.fixture
+    def corpus(self):
+        return [
+            _entity("light.kitchen_ceiling", "Kitchen Ceiling Light"),
+            _entity("light.living_room", "Living Room Light"),
+            _entity("sensor.kitchen_temperature", "Kitchen Temperature"),
+            _entity("light.bedroom", "Bedroom Light", ["Nightstand"]),
+        ]
+
+    def test_scores_match_a_fresh_bm25_fit(self, corpus):
+        from ha_mcp.utils.fuzzy_search import _entity_document
+
+        index = EntitySearchIndex()
+        index.sync(corpus)
+        docs = [
+            _entity_document(
+                e["entity_id"], e["attributes"]["friendly_name"], e.get("_aliases")
+            )[0]
+            for e in corpus
+        ]
+        scorer = BM25Scorer()
+        scorer.fit(docs)
+
+        query = ["kitchen", "light", "nightstand"]
+        scores = index.bm25_scores(query)
+        for i, entity in enumerate(corpus):
+            assert scores.get(entity["entity_id"], 0.0) == scorer.score(query, i)
+        assert index.max_possible_score(query) == scorer.max_possible_score(query)
+
+    def test_only_postings_of_query_tokens_are_scored(self, corpus):
+        index = EntitySearchIndex()
+        index.sync(corpus)
+        assert set(index.bm25_scores(["temperature"])) == {"sensor.kitchen_temperature"}
+        assert index.bm25_scores(["nonexistent"]) == {}
+
+    def test_rename_realias_and_remove_update_postings(self, corpus):
+        index = EntitySearchIndex()
+        index.sync(corpus)
+
+        corpus[1]["attributes"]["friendly_name"] = "Lounge Lamp"
+        corpus[3]["_aliases"] = ["Reading lamp"]
+        index.sync([e for e in corpus if e["entity_id"] != "light.kitchen_ceiling"])
+
+        assert "light.kitchen_ceiling" not in index
+        assert set(index.bm25_scores(["lounge"])) == {"light.living_room"}
+        assert index.bm25_scores(["nightstand"]) == {}
+        assert set(index.bm25_scores(["lamp"])) == {
+            "light.living_room",
+            "light.bedroom",
+        }
+        assert index.alias_hit("light.bedroom") == {"reading", "readinglamp", "lamp"}
+        assert set(index.bm25_scores(["ceiling"])) == set()
+
+    def test_unchanged_entities_are_not_retokenized(self, corpus, monkeypatch):
+        from ha_mcp.utils import fuzzy_search
+
+        index = EntitySearchIndex()
+        index.sync(corpus)
+        calls = []
+        original = fuzzy_search._entity_document
+
+        def _counting(*args):
+            calls.append(args[0])
+            return original(*args)
+
+        monkeypatch.setattr(fuzzy_search, "_entity_document", _counting)
+        refreshed = [dict(e, state="on") for e in corpus]
+        refreshed[0] = _entity("light.kitchen_ceiling", "Kitchen Pendant")
+        index.sync(refreshed)
+
+        assert calls == ["light.kitchen_ceiling"]
+        # State-only changes are still visible through the index.
+        assert index.entity("light.living_room")["state"] == "on"
+
+    def test_scoped_and_partial_searches_keep_the_index(self, corpus, monkeypatch):
+        from ha_mcp.utils import fuzzy_search
+
+        searcher = FuzzyEntitySearcher(threshold=10)
+        searcher.search_entities(corpus, "light")
+        calls = []
+        original = fuzzy_search._entity_document
+
+        def _counting(*args):
+            calls.append(args[0])
+            return original(*args)
+
+        monkeypatch.setattr(fuzzy_search, "_entity_document", _counting)
+        # Aliases left unfetched (None) keep the indexed ones.
+        unfetched = [dict(e, _aliases=None) for e in corpus]
+        scoped, _ = searcher.search_entities(
+            unfetched, "kitchen", scope={"sensor.kitchen_temperature"}
+        )
+        area, _ = searcher.search_entities(corpus[:2], "light", complete=False)
+        again, _ = searcher.search_entities(corpus, "nightstand")
+
+        assert calls == []
+        assert [m["entity_id"] for m in scoped] == ["sensor.kitchen_temperature"]
+        assert {m["entity_id"] for m in area} == {
+            "light.kitchen_ceiling",
+            "light.living_room",
+        }
+        assert [m["entity_id"] for m in again] == ["light.bedroom"]
+
+    def test_close_tokens_equals_full_vocabulary_scan(self, corpus):
+        from ha_mcp.utils.fuzzy_search import calculate_ratio
+
+        index = EntitySearchIndex()
+        index.sync(corpus)
+        vocab = {t for e in index._docs.values() for t in e.tf}
+        for query_token in ("kitchn", "ligth", "temprature", "bedrom"):
+            expected = {
+                t: calculate_ratio(query_token, t)
+                for t in vocab
+                if calculate_ratio(query_token, t) >= 75
+            }
+            assert index.close_tokens(query_token) == expected
+
+
 # ---------------------------------------------------------------------------
 # FuzzyEntitySearcher with BM25
 # ---------------------------------------------------------------------------
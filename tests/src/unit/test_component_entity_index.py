@@ -0,0 +1,204 @@
+"""Unit tests for the ha_mcp_tools search entity index (websocket_api._EntityIndex).
+
+The index replaces the per-search join of every state against the registries
+with pre-joined records that bus events mark dirty. These tests pin that an
+indexed search answers exactly like the full join, that an event re-joins only
+the entities it touches, and that a large candidate set is scored through the
+executor rather than inline.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from .test_component_ws_search import (
+    FakeArea,
+    FakeDevice,
+    FakeHass,
+    FakeLabel,
+    FakeRegEntry,
+    FakeState,
+    FakeStates,
+    make_view,
+    wsapi,
+)
+
+
+class FakeBus:
+    def __init__(self):
+        self.listeners: dict[object, list] = {}
+
+    def async_listen(self, event_type, handler):
+        self.listeners.setdefault(event_type, []).append(handler)
+        return lambda: self.listeners[event_type].remove(handler)
+
+    def fire(self, event_type, **data):
+        for handler in list(self.listeners.get(event_type, [])):
+            handler(SimpleNamespace(data=data))
+
+
+def _state_changed():
+    # Whatever ``homeassistant.const`` stub is live (see the conftest fixture).
+    return sys.modules["homeassistant.const"].EVENT_STATE_CHANGED
+
+
+def _corpus(seed=0, size=300):
+    rng = random.Random(seed)
+    domains = ["light", "sensor", "switch", "binary_sensor"]
+    rooms = ["kitchen", "office", "garage", None]
+    states, entries = [], {}
+    for i in range(size):
+        domain = rng.choice(domains)
+        eid = f"{domain}.{rng.choice(['ceiling', 'desk', 'door', 'temp'])}_{i}"
+        states.append(
+            FakeState(eid, rng.choice(["on", "off", "21.5"]), f"Thing {i} {domain}")
+        )
+        entries[eid] = FakeRegEntry(
+            eid,
+            aliases=[f"alias {i}"] if i % 7 == 0 else (),
+            area_id=rng.choice(rooms),
+            device_id=f"dev{i % 20}",
+            labels=["energy"] if i % 5 == 0 else (),
+            hidden_by="user" if i % 11 == 0 else None,
+        )
+    devices = [
+        FakeDevice(f"dev{d}", name=f"Hub {d}", area_id=rooms[d % 3]) for d in range(20)
+    ]
+    view = make_view(
+        entity=entries,
+        areas=[FakeArea(r, r.title()) for r in rooms if r],
+        labels=[FakeLabel("energy", "Energy")],
+        devices=devices,
+    )
+    return states, view
+
+
+@pytest.fixture
+def indexed(monkeypatch):
+    states, view = _corpus()
+    hass = FakeHass(states=states)
+    hass.bus = FakeBus()
+    monkeypatch.setattr(wsapi, "_resolve_registries", lambda h: view)
+    wsapi.async_start_entity_index(hass)
+    yield hass
+    wsapi.async_stop_entity_index(hass)
+
+
+def _search(hass, **params):
+    return wsapi._do_search(hass, {"search_types": ["entity"], "limit": 500, **params})
+
+
+_PARAMS = [
+    {"query": "desk"},
+    {"query": "kitchen", "exact": False},
+    {"query": "thing 1"},
+    {"query": "energy"},
+    {"query": "hub 3"},
+    {"query": "alias", "include_hidden": False},
+    {"query": "", "domain_filter": "light"},
+    {"query": "", "area_filter": "Office"},
+    {"query": "temp", "area_filter": "garage", "domain_filter": "sensor"},
+    {"query": "", "state_filter": "ON"},
+    {"query": "kitchne", "exact": False},
+]
+
+
+class TestParity:
+    @pytest.mark.parametrize("params", _PARAMS)
+    def test_indexed_search_matches_full_join(self, indexed, params):
+        with_index = _search(indexed, **params)
+        wsapi.async_stop_entity_index(indexed)
+        assert wsapi._entity_index(indexed) is None
+        assert with_index == _search(indexed, **params)
+        assert with_index["entity_total_matches"] > 0
+
+
+class TestIncrementalUpdates:
+    def _count_joins(self, monkeypatch):
+        joined: list[str] = []
+        real = wsapi._entity_record
+
+        def _counting(state, view, **kwargs):
+            joined.append(state.entity_id)
+            return real(state, view, **kwargs)
+
+        monkeypatch.setattr(wsapi, "_entity_record", _counting)
+        return joined
+
+    def test_state_change_rejoins_only_that_entity(self, indexed, monkeypatch):
+        joined = self._count_joins(monkeypatch)
+        _search(indexed, query="desk")
+        assert len(joined) == 300
+        joined.clear()
+        _search(indexed, query="desk")
+        assert joined == []
+
+        target = indexed.states.async_all()[0]
+        renamed = FakeState(target.entity_id, "on", "Zebra lamp")
+        indexed.states = FakeStates([renamed, *indexed.states.async_all()[1:]])
+        indexed.bus.fire(_state_changed(), entity_id=target.entity_id)
+        result = _search(indexed, query="zebra")
+        assert joined == [target.entity_id]
+        assert [e["entity_id"] for e in result["entities"]] == [target.entity_id]
+
+    def test_removed_entity_leaves_the_index(self, indexed):
+        target = indexed.states.async_all()[0].entity_id
+        assert _search(indexed, query=target)["entity_total_matches"] == 1
+        indexed.states = FakeStates(indexed.states.async_all()[1:])
+        indexed.bus.fire(_state_changed(), entity_id=target)
+        assert _search(indexed, query=target)["entity_total_matches"] == 0
+
+    def test_device_event_rejoins_its_entities(self, indexed, monkeypatch):
+        joined = self._count_joins(monkeypatch)
+        _search(indexed, query="x")
+        joined.clear()
+        view = wsapi._resolve_registries(indexed)
+        view.device._devices["dev3"].name = "Renamed hub"
+        indexed.bus.fire(wsapi.dr.EVENT_DEVICE_REGISTRY_UPDATED, device_id="dev3")
+        result = _search(indexed, query="renamed hub")
+        assert len(joined) == 15  # 300 entities spread over 20 devices
+        assert result["entity_total_matches"] == 15
+
+    def test_label_rename_rebuilds_on_next_search(self, indexed, monkeypatch):
+        joined = self._count_joins(monkeypatch)
+        _search(indexed, query="x")
+        joined.clear()
+        view = wsapi._resolve_registries(indexed)
+        view.label._labels["energy"].name = "Power"
+        indexed.bus.fire(wsapi.lr.EVENT_LABEL_REGISTRY_UPDATED, label_id="energy")
+        assert _search(indexed, query="power")["entity_total_matches"] == 60
+        assert len(joined) == 300
+
+    def test_stop_unsubscribes(self, indexed):
+        wsapi.async_stop_entity_index(indexed)
+        assert all(not handlers for handlers in indexed.bus.listeners.values())
+
+
+class TestExecutorScoring:
+    async def test_large_candidate_set_scores_in_the_executor(
+        self, indexed, monkeypatch
+    ):
+        offloaded = []
+        inline = indexed.async_add_executor_job
+
+        async def _recording(func, *args):
+            offloaded.append(func)
+            return await inline(func, *args)
+
+        indexed.async_add_executor_job = _recording
+        params = {"type": "x", "search_types": ["entity"], "query": "desk"}
+        monkeypatch.setattr(wsapi, "SEARCH_EXECUTOR_MIN_CANDIDATES", 100)
+        extra = await wsapi._search_prep(indexed, params)
+        assert len(offloaded) == 1
+        assert wsapi._do_search(indexed, params, **extra) == _search(
+            indexed, query="desk", limit=10
+        )
+
+        monkeypatch.setattr(wsapi, "SEARCH_EXECUTOR_MIN_CANDIDATES", 1000)
+        extra = await wsapi._search_prep(indexed, params)
+        assert "scored_entities" not in extra
+        assert len(offloaded) == 1
@@ -1483,6 +1483,39 @@ class TestSecretLoader:
         # A hass without a callable config.path degrades to an empty set, no raise.
         assert wsapi._load_secret_values(FakeHass()) == frozenset()
 
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, monkeypatch):
+        secrets = tmp_path / "secrets.yaml"
+        secrets.write_text(f"api_password: {self._SECRET}\n", encoding="utf-8")
+        parses = []
+        real_load = wsapi.yaml.safe_load
+
+        def _counting(stream):
+            parses.append(stream)
+            return real_load(stream)
+
+        monkeypatch.setattr(wsapi.yaml, "safe_load", _counting)
+        hass = self._hass(tmp_path)
+        for _ in range(3):
+            assert wsapi._load_secret_values(hass) == frozenset({self._SECRET})
+        assert len(parses) == 1
+
+        # An edit (new size and mtime) is picked up on the next call.
+        secrets.write_text("api_password: rotated-value\n", encoding="utf-8")
+        assert wsapi._load_secret_values(hass) == frozenset({"rotated-value"})
+        assert len(parses) == 2
+
+    def test_malformed_file_warns_once_per_version(self, tmp_path, caplog):
+        secrets = tmp_path / "secrets.yaml"
+        secrets.write_text("{not: valid: yaml: [", encoding="utf-8")
+        hass = self._hass(tmp_path)
+        with caplog.at_level(logging.WARNING, logger=self._LOGGER_NAME):
+            for _ in range(3):
+                assert wsapi._load_secret_scrub(hass) == (frozenset(), True)
+        assert len([r for r in caplog.records if r.levelno == logging.WARNING]) == 1
+
+        secrets.write_text(f"fixed: {self._SECRET}\n", encoding="utf-8")
+        assert wsapi._load_secret_scrub(hass) == (frozenset({self._SECRET}), False)
+
 
 # =============================================================================
 # search prep — off-loop secret load, skipped for entity-only searches
@@ -0,0 +1,296 @@
+"""Unit tests for the deep-search config-body cache (client/config_cache.py).
+
+Pins the contract deep ``ha_search`` relies on: the first search fetches and
+caches every automation body (including remembering per-id 404s), a repeat
+search scores from memory without touching Home Assistant, and a reload
+event, a write of our own, TTL expiry or a reconnect sends the next search
+back to Home Assistant.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ha_mcp.client import event_cache
+from ha_mcp.client.config_cache import (
+    CONFIG_RELOAD_EVENTS,
+    CachedConfig,
+    ConfigBodyCache,
+    reset_config_caches,
+)
+from ha_mcp.client.event_bus import get_event_bus
+from ha_mcp.client.event_cache import CredentialCaches, EventInvalidatedCache
+from ha_mcp.client.rest_client import HomeAssistantAPIError, HomeAssistantClient
+from ha_mcp.client.websocket_client import HomeAssistantWebSocketClient
+from ha_mcp.tools.smart_search import SmartSearchTools
+
+URL = "http://ha.local:8123"
+TOKEN = "tok"
+
+AUTOMATIONS = [
+    {
+        "entity_id": f"automation.auto_{i}",
+        "state": "on",
+        "attributes": {"friendly_name": f"Automation {i}", "id": f"uid_{i}"},
+    }
+    for i in range(3)
+]
+
+BODIES = {
+    "uid_0": {"id": "uid_0", "alias": "Hall", "action": [{"service": "siren.on"}]},
+    "uid_1": {"id": "uid_1", "alias": "Porch", "action": [{"service": "light.on"}]},
+}
+
+
+def _ws_client() -> HomeAssistantWebSocketClient:
+    ws = HomeAssistantWebSocketClient(URL, TOKEN, verify_ssl=True)
+    ws._state.mark_connected()
+    ws._state.mark_authenticated()
+    ws.subscribe_events = AsyncMock(return_value=1)  # type: ignore[method-assign]
+    ws.unsubscribe_events = AsyncMock()  # type: ignore[method-assign]
+    return ws
+
+
+async def _request(method: str, endpoint: str, **_kwargs):
+    if endpoint == "/config/automation/config":
+        # No bulk listing: force the budgeted per-id path.
+        raise HomeAssistantAPIError("API error: 404 - Not Found", status_code=404)
+    uid = endpoint.rsplit("/", 1)[-1]
+    if method == "GET" and uid in BODIES:
+        return dict(BODIES[uid])
+    if method == "GET":
+        # uid_2 is YAML-defined: the per-id endpoint cannot serve it.
+        raise HomeAssistantAPIError("API error: 404 - Not Found", status_code=404)
+    return {"result": "ok"}
+
+
+@pytest.fixture
+async def search_env():
+    reset_config_caches()
+    ws = _ws_client()
+    client = HomeAssistantClient(base_url=URL, token=TOKEN, verify_ssl=True)
+    with (
+        patch(
+            "ha_mcp.client.websocket_client.get_websocket_client",
+            AsyncMock(return_value=ws),
+        ),
+        patch.object(client, "_request", AsyncMock(side_effect=_request)),
+        patch("ha_mcp.tools.smart_search.get_global_settings") as settings,
+    ):
+        settings.return_value.fuzzy_threshold = 60
+        yield SmartSearchTools(client=client), client, ws
+    await client.close()
+    reset_config_caches()
+
+
+def _per_id_fetches(client) -> int:
+    return sum(
+        1
+        for c in client._request.await_args_list
+        if c.args[0] == "GET" and c.args[1].startswith("/config/automation/config/")
+    )
+
+
+async def _search(tools):
+    uid_map = tools._build_automation_uid_map(AUTOMATIONS)
+    return await tools._deep_search_automations(AUTOMATIONS, uid_map, "siren", False)
+
+
+async def _fire(ws, event_type: str) -> None:
+    for handler in ws._state.get_event_handlers(event_type):
+        await handler({"event_type": event_type, "data": {}})
+
+
+@pytest.mark.asyncio
+async def test_repeat_search_is_served_from_cache(search_env):
+    tools, client, ws = search_env
+
+    first = await _search(tools)
+    second = await _search(tools)
+
+    assert _per_id_fetches(client) == 3
+    in_config = [m["entity_id"] for m in first[0] if m["match_in_config"]]
+    assert in_config == ["automation.auto_0"]
+    assert first[0] == second[0]
+    # (matches, skipped, failed, yaml_skipped, timeout, sample): the known
+    # 404 still reports as unscanned; nothing else is partial.
+    assert first[1:] == second[1:] == (0, 0, 1, 0, None)
+    subscribed = {c.args[0] for c in ws.subscribe_events.await_args_list}
+    assert subscribed == set(CONFIG_RELOAD_EVENTS)
+
+
+@pytest.mark.asyncio
+async def test_reload_event_drops_the_domain(search_env):
+    tools, client, ws = search_env
+    await _search(tools)
+
+    await _fire(ws, "script_reloaded")
+    await _search(tools)
+    assert _per_id_fetches(client) == 3
+
+    await _fire(ws, "automation_reloaded")
+    await _search(tools)
+    assert _per_id_fetches(client) == 6
+
+
+@pytest.mark.asyncio
+async def test_own_write_refetches_only_that_key(search_env):
+    tools, client, _ws = search_env
+    await _search(tools)
+
+    await client.upsert_automation_config(
+        {"alias": "Porch", "action": []}, "uid_1", _resolved=True
+    )
+    await _search(tools)
+    assert _per_id_fetches(client) == 4
+
+
+@pytest.mark.asyncio
+async def test_disconnect_and_ttl_bypass_cache(search_env):
+    tools, client, ws = search_env
+    await _search(tools)
+
+    client.config_cache.ttl = 0.0
+    await _search(tools)
+    assert _per_id_fetches(client) == 6
+
+    client.config_cache.ttl = 600.0
+    ws._state.connected = False
+    assert client.config_cache.snapshot("automation") == ({}, False)
+
+
+def _scene(slug: str) -> dict:
+    name = slug.replace("_", " ").title()
+    return {"entity_id": f"scene.{slug}", "attributes": {"friendly_name": name}}
+
+
+def _scene_registry(*pairs: tuple[str, str]) -> dict:
+    return {
+        "success": True,
+        "result": [
+            {
+                "entity_id": f"scene.{slug}",
+                "unique_id": uid,
+                "platform": "homeassistant",
+            }
+            for slug, uid in pairs
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_aliased_scene_is_not_refetched(search_env):
+    tools, client, _ws = search_env
+    client._request.side_effect = None
+    client._request.return_value = [
+        {"id": "ee04b1a2", "name": "Movie Night", "entities": {}}
+    ]
+    scenes = [_scene("movie_night")]
+    registry = _scene_registry(("movie_night", "ee04b1a2"))
+
+    await tools._deep_search_scenes(
+        scenes, "movie", False, prefetched_registry=registry
+    )
+    # Another scene's write drops the domain's completeness, not this body.
+    client._invalidate_config_bodies("scene", "some_other_scene")
+    results, *_ = await tools._deep_search_scenes(
+        scenes, "movie", False, prefetched_registry=registry
+    )
+
+    assert client._request.await_count == 1
+    assert results[0]["config"]["id"] == "ee04b1a2"
+
+
+@pytest.mark.asyncio
+async def test_scene_404_is_remembered(search_env):
+    tools, client, _ws = search_env
+    client._request.side_effect = HomeAssistantAPIError(
+        "API error: 404 - Not Found", status_code=404
+    )
+    client.get_scene_config = AsyncMock(  # type: ignore[method-assign]
+        side_effect=HomeAssistantAPIError("API error: 404 - Not Found", status_code=404)
+    )
+    scenes = [_scene("gone")]
+    registry = _scene_registry(("gone", "gone"))
+
+    first = await tools._deep_search_scenes(
+        scenes, "gone", False, prefetched_registry=registry
+    )
+    second = await tools._deep_search_scenes(
+        scenes, "gone", False, prefetched_registry=registry
+    )
+
+    assert client.get_scene_config.await_count == 1
+    # Still reported as unscanned: (failed, skipped, integration, registry).
+    assert first[1:5] == second[1:5] == (1, 0, 0, False)
+
+
+def test_fetch_started_before_invalidation_is_not_stored():
+    cache = ConfigBodyCache()
+    cache._subscribed_client = _ws_client()
+    generation = cache.generation("script")
+    cache.invalidate("script")
+    cache.store("script", {"s": CachedConfig(body={})}, generation, complete=True)
+    assert cache.snapshot("script") == ({}, False)
+
+
+@pytest.mark.asyncio
+async def test_evicted_cache_releases_its_listeners():
+    ws = _ws_client()
+    caches = CredentialCaches(ConfigBodyCache, max_size=1)
+    evicted = caches.get(URL, "first")
+    assert await evicted.ensure_subscribed(ws)
+    bus = get_event_bus(ws)
+    assert bus.listener_count("automation_reloaded") == 1
+
+    caches.get(URL, "second")
+    await asyncio.gather(*event_cache._releasing)
+
+    assert len(caches) == 1
+    assert all(bus.listener_count(event) == 0 for event in CONFIG_RELOAD_EVENTS)
+    assert ws.unsubscribe_events.await_count == len(CONFIG_RELOAD_EVENTS)
+    assert not await evicted.ensure_subscribed(ws)
+
+
+def test_event_cache_requires_its_handlers():
+    class Partial(EventInvalidatedCache):
+        async def _handle_event(self, event):
+            pass
+
+    with pytest.raises(TypeError, match="invalidate_all"):
+        Partial((), ttl=1.0)  # type: ignore[abstract]
+
+
+def test_key_invalidation_clears_complete():
+    cache = ConfigBodyCache()
+    cache._subscribed_client = _ws_client()
+    cache.store(
+        "scene",
+        {"a": CachedConfig(body={}), "b": CachedConfig(body={})},
+        cache.generation("scene"),
+        complete=True,
+    )
+    assert cache.snapshot("scene")[1] is True
+
+    cache.invalidate("scene", "a")
+    entries, complete = cache.snapshot("scene")
+    assert set(entries) == {"b"}
+    assert complete is False
+
+
+def test_document_scores_like_the_body():
+    with patch("ha_mcp.tools.smart_search.get_global_settings") as settings:
+        settings.return_value.fuzzy_threshold = 60
+        tools = SmartSearchTools(client=None)
+    body = {"alias": "Hall", "trigger": [{"for": 30}], "enabled": True}
+    cached = tools._config_document(body)
+    assert cached.body is body
+    assert cached.document is not None
+    for query in ("hall", "30", "true", "trigger", "hal", "porch"):
+        for exact in (False, True):
+            assert tools._search_in_document(
+                cached.document, query, exact
+            ) == tools._search_in_dict(body, query, exact)
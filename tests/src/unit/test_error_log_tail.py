@@ -0,0 +1,203 @@
+"""Unit tests for incremental error log reads and the parsed error log index."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from ha_mcp.client.error_log_tail import ErrorLogTail, reset_error_log_tails
+from ha_mcp.client.rest_client import HomeAssistantAPIError, HomeAssistantClient
+from ha_mcp.tools import error_log_parsing
+from ha_mcp.tools.error_log_parsing import index_error_log
+from ha_mcp.tools.tools_utility import UtilityTools
+
+
+def _line(second: int, level: str = "ERROR", logger: str = "homeassistant.core"):
+    return (
+        f"2026-05-27 10:00:{second:02d}.000 {level} (MainThread) [{logger}] m{second}"
+    )
+
+
+LOG = "\n".join(
+    [
+        _line(1, logger="homeassistant.components.zha.core.gateway"),
+        "Traceback (most recent call last):",
+        '  File "x.py", line 1, in <module>',
+        _line(2, "WARNING", "custom_components.hacs.base"),
+        _line(3, "INFO"),
+        "",
+        _line(4, logger="homeassistant.components.zha"),
+    ]
+)
+
+
+class TestErrorLogTail:
+    def test_sliding_window_keeps_shared_lines(self):
+        tail = ErrorLogTail()
+        tail.replace("a\nb\nc\nd\n")
+        tail.replace("b\nc\nd\ne\nf\n")
+        assert (tail.first, tail.lines, tail.epoch) == (1, ["b", "c", "d", "e", "f"], 1)
+
+    def test_unrelated_window_restarts_the_numbering(self):
+        tail = ErrorLogTail()
+        tail.replace("a\nb\nc\n")
+        tail.replace("x\ny\nz\n")
+        assert (tail.first, tail.lines, tail.epoch) == (0, ["x", "y", "z"], 2)
+
+    def test_append_completes_a_partial_last_line(self):
+        tail = ErrorLogTail()
+        tail.replace("a\nb", end=3)
+        assert not tail.terminated
+        tail.append("c\nd\n", end=7)
+        assert tail.lines == ["a", "bc", "d"]
+        assert tail.terminated
+
+    def test_appending_past_the_cap_drops_the_oldest_lines(self):
+        tail = ErrorLogTail(max_lines=4)
+        lines = [_line(s) for s in range(10)]
+        tail.replace("\n".join(lines[:3]) + "\n", end=1)
+        index_error_log(tail)
+        tail.append("\n".join(lines[3:]) + "\n", end=2)
+
+        assert (tail.first, tail.until) == (6, 10)
+        assert tail.lines == lines[6:]
+        extracted = index_error_log(tail).extract()
+        assert [e["message"] for e in extracted.entries] == ["m6", "m7", "m8", "m9"]
+
+
+class TestErrorLogIndex:
+    def test_lines_are_parsed_once(self):
+        tail = ErrorLogTail()
+        tail.replace(LOG + "\n")
+        parse = error_log_parsing._parse_log_line
+        with patch.object(
+            error_log_parsing, "_parse_log_line", side_effect=parse
+        ) as spy:
+            index_error_log(tail)
+            tail.replace(LOG + "\n" + _line(5) + "\n")
+            index_error_log(tail)
+        assert spy.call_count == 8
+
+    def test_completed_last_line_is_parsed_again(self):
+        tail = ErrorLogTail()
+        tail.replace(_line(1)[:30], end=30)
+        assert index_error_log(tail).extract().matched == 0
+        tail.append(_line(1)[30:] + "\n", end=len(_line(1)) + 1)
+        assert [e["message"] for e in index_error_log(tail).extract().entries] == ["m1"]
+
+    def test_filters_are_answered_from_the_index(self):
+        tail = ErrorLogTail()
+        tail.replace(LOG)
+        index = index_error_log(tail)
+
+        zha = index.extract(integration="zha")
+        assert [e["message"] for e in zha.entries] == ["m1", "m4"]
+        assert [e["message"] for e in index.extract(integration="hacs").entries] == [
+            "m2"
+        ]
+        recent = index.extract(level="ERROR", since="2026-05-27 10:00:03")
+        assert [e["message"] for e in recent.entries] == ["m4"]
+        assert (zha.matched, zha.unparseable, zha.blank) == (4, 2, 1)
+        assert index.block(0) == [0, 1, 2]
+
+    def test_dropped_lines_leave_the_index(self):
+        tail = ErrorLogTail()
+        lines = [_line(s) for s in range(10)]
+        tail.replace("\n".join(lines) + "\n")
+        index_error_log(tail)
+        tail.replace("\n".join(lines[5:] + [_line(10)]) + "\n")
+        extracted = index_error_log(tail).extract()
+        assert [e["message"] for e in extracted.entries] == [
+            f"m{s}" for s in range(5, 11)
+        ]
+        assert extracted.window_start == "2026-05-27 10:00:05.000"
+
+
+@pytest.fixture
+async def client():
+    reset_error_log_tails()
+    c = HomeAssistantClient(base_url="http://ha.local:8123", token="t", verify_ssl=True)
+    c._supervised_detected = False
+    yield c
+    await c.close()
+    reset_error_log_tails()
+
+
+class TestReadErrorLog:
+    async def test_container_log_is_read_from_the_last_byte(self, client):
+        client._raw_request = AsyncMock(
+            side_effect=[
+                httpx.Response(200, content=b"one\ntwo\n"),
+                httpx.Response(206, content=b"\nthree\n"),
+            ]
+        )
+        with patch("ha_mcp.client.rest_client.is_running_in_addon", return_value=False):
+            await client.read_error_log()
+            tail = await client.read_error_log()
+
+        assert tail.lines == ["one", "two", "three"]
+        assert tail.end == 14
+        headers = client._raw_request.await_args_list[1].kwargs["headers"]
+        assert headers["Range"] == "bytes=7-"
+
+    async def test_rotated_log_is_read_again_in_full(self, client):
+        client._raw_request = AsyncMock(
+            side_effect=[
+                httpx.Response(200, content=b"one\ntwo\n"),
+                HomeAssistantAPIError("range", status_code=416),
+                httpx.Response(200, content=b"new\n"),
+            ]
+        )
+        with patch("ha_mcp.client.rest_client.is_running_in_addon", return_value=False):
+            await client.read_error_log()
+            tail = await client.read_error_log()
+
+        assert tail.lines == ["new"]
+        assert "Range" not in client._raw_request.await_args_list[2].kwargs["headers"]
+
+
+class TestErrorLogTool:
+    @staticmethod
+    def _tools():
+        tail = ErrorLogTail()
+        tail.replace(LOG)
+        client = AsyncMock()
+        client.error_log_tail = tail
+        client.read_error_log = AsyncMock(return_value=tail)
+        return UtilityTools(client)
+
+    async def test_raw_integration_filter_keeps_tracebacks(self):
+        result = await self._tools()._get_error_log(integration="zha", order="oldest")
+        assert result["log"].splitlines() == [
+            _line(1, logger="homeassistant.components.zha.core.gateway"),
+            "Traceback (most recent call last):",
+            '  File "x.py", line 1, in <module>',
+            _line(4, logger="homeassistant.components.zha"),
+        ]
+        assert result["filters_applied"] == {"integration": "zha"}
+
+    async def test_structured_since_filter(self):
+        result = await self._tools()._get_error_log(
+            structured=True, since="2026-05-27T10:00:02"
+        )
+        assert result["summary"]["parsed_entries"] == 3
+        assert result["filters_applied"] == {"since": "2026-05-27 10:00:02"}
+
+    async def test_since_with_an_offset_is_rejected(self):
+        with pytest.raises(Exception, match="Invalid since"):
+            await self._tools()._get_error_log(since="2026-05-27T10:00:02Z")
+
+    async def test_raw_level_filter_is_answered_from_the_index(self):
+        tools = self._tools()
+        index_error_log(tools._client.error_log_tail)
+        with patch.object(
+            error_log_parsing, "_parse_log_line", side_effect=AssertionError
+        ):
+            result = await tools._get_error_log(level="ERROR", order="oldest")
+        assert result["log"].splitlines() == [
+            _line(1, logger="homeassistant.components.zha.core.gateway"),
+            "Traceback (most recent call last):",
+            '  File "x.py", line 1, in <module>',
+            _line(4, logger="homeassistant.components.zha"),
+        ]
+        assert result["filters_applied"] == {"level": "ERROR"}
@@ -0,0 +1,145 @@
+"""Unit tests for the shared WebSocket event bus (client/event_bus.py).
+
+Pins the multiplexing contract: concurrent listeners share one HA-side
+subscription per event type, entity-indexed listeners only see their own
+entity's events, and the subscription is torn down when the last listener
+leaves.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ha_mcp.client.event_bus import get_event_bus
+from ha_mcp.client.rest_client import HomeAssistantConnectionError
+from ha_mcp.tools import util_helpers
+
+
+class FakeWS:
+    """Records subscribe/unsubscribe calls and dispatches fired events."""
+
+    def __init__(self) -> None:
+        self.is_connected = True
+        self.handlers: dict[str, list] = {}
+        self.subscribe_events = AsyncMock(side_effect=self._subscribe)
+        self.unsubscribe_events = AsyncMock()
+        self._next_sub = 0
+
+    async def _subscribe(self, event_type: str) -> int:
+        self._next_sub += 1
+        return self._next_sub
+
+    def add_event_handler(self, event_type: str, handler) -> None:
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def remove_event_handler(self, event_type: str, handler) -> None:
+        self.handlers[event_type].remove(handler)
+
+    async def fire(self, event_type: str, entity_id: str) -> None:
+        event = {"event_type": event_type, "data": {"entity_id": entity_id}}
+        for handler in list(self.handlers.get(event_type, [])):
+            await handler(event)
+
+
+@pytest.mark.asyncio
+async def test_listeners_share_one_subscription_and_tear_down_at_zero():
+    ws = FakeWS()
+    bus = get_event_bus(ws)
+    first = await bus.listen("state_changed", AsyncMock())
+    second = await bus.listen("state_changed", AsyncMock(), entity_id="light.a")
+
+    assert ws.subscribe_events.await_count == 1
+    assert len(ws.handlers["state_changed"]) == 1
+    assert bus.listener_count("state_changed") == 2
+
+    await bus.release(first)
+    ws.unsubscribe_events.assert_not_awaited()
+    await bus.release(second)
+    ws.unsubscribe_events.assert_awaited_once_with(1)
+    assert ws.handlers["state_changed"] == []
+
+    # Releasing twice is a no-op.
+    await bus.release(second)
+    assert ws.unsubscribe_events.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatch_is_indexed_by_entity():
+    ws = FakeWS()
+    bus = get_event_bus(ws)
+    wildcard, light_a, light_b = AsyncMock(), AsyncMock(), AsyncMock()
+    await bus.listen("state_changed", wildcard)
+    await bus.listen("state_changed", light_a, entity_id="light.a")
+    await bus.listen("state_changed", light_b, entity_id="light.b")
+
+    await ws.fire("state_changed", "light.a")
+
+    assert wildcard.await_count == 1
+    assert light_a.await_count == 1
+    light_b.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failing_listener_does_not_starve_others():
+    ws = FakeWS()
+    bus = get_event_bus(ws)
+    good = AsyncMock()
+    await bus.listen("state_changed", AsyncMock(side_effect=KeyError("boom")))
+    await bus.listen("state_changed", good)
+
+    await ws.fire("state_changed", "light.a")
+    assert good.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_subscribe_failure_leaves_nothing_registered():
+    ws = FakeWS()
+    ws.subscribe_events.side_effect = HomeAssistantConnectionError("down")
+    bus = get_event_bus(ws)
+
+    with pytest.raises(HomeAssistantConnectionError):
+        await bus.listen("state_changed", AsyncMock())
+
+    assert ws.handlers["state_changed"] == []
+    assert bus.listener_count("state_changed") == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_open_a_single_subscription(monkeypatch):
+    ws = FakeWS()
+
+    async def _ws(_client):
+        return ws
+
+    monkeypatch.setattr(util_helpers, "_get_waiter_ws_client", _ws)
+    client = MagicMock()
+    client.get_entity_state = AsyncMock(
+        side_effect=lambda entity_id: {"entity_id": entity_id, "state": "off"}
+    )
+
+    waits = [
+        asyncio.create_task(
+            util_helpers.wait_for_state_change(
+                client, f"light.l{i}", expected_state="on", timeout=2.0
+            )
+        )
+        for i in range(20)
+    ]
+    await asyncio.sleep(0.05)
+
+    assert ws.subscribe_events.await_count == 1
+    assert get_event_bus(ws).listener_count("state_changed") == 20
+
+    client.get_entity_state.side_effect = lambda entity_id: {
+        "entity_id": entity_id,
+        "state": "on",
+    }
+    for i in range(20):
+        await ws.fire("state_changed", f"light.l{i}")
+    results = await asyncio.gather(*waits)
+
+    assert all(r["state"] == "on" for r in results)
+    ws.unsubscribe_events.assert_awaited_once_with(1)
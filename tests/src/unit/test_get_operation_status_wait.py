@@ -1,14 +1,15 @@
-"""Unit tests for ``get_device_operation_status`` polling behavior.
+"""Unit tests for ``get_device_operation_status`` wait behavior.
 
-Verifies the contract that the function polls in-memory state every 0.2s while
-the operation is PENDING, returning as soon as the status flips (completed,
-failed, timeout) or once ``timeout_seconds`` elapses.
+Verifies the contract that, while the operation is PENDING, the function waits
+on the operation itself and returns as soon as the status flips (completed,
+failed, timeout) — woken by the state change, not by a polling interval — or
+once ``timeout_seconds`` elapses.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -16,7 +17,11 @@ from fastmcp.exceptions import ToolError
 from fastmcp.exceptions import ValidationError as FastMCPValidationError
 
 from ha_mcp.tools.device_control import DeviceControlTools
-from ha_mcp.utils.operation_manager import DeviceOperation, OperationStatus
+from ha_mcp.utils.operation_manager import (
+    DeviceOperation,
+    OperationManager,
+    OperationStatus,
+)
 
 
 def _make_operation(
@@ -78,95 +83,105 @@ async def test_timeout_zero_skips_polling() -> None:
     assert mock_get.call_count == 1
 
 
-@pytest.mark.asyncio
-async def test_polls_until_completion_within_timeout() -> None:
-    """Pending → completed transition is observed within timeout_seconds."""
-    pending = _make_operation(OperationStatus.PENDING)
-    completed = _make_operation(OperationStatus.COMPLETED)
-    completed.completion_time = completed.start_time + 100
-
-    # Initial fetch (i=0) + 1st poll (i=1) see PENDING; 2nd poll (i=2) sees COMPLETED.
-    sequence = [pending, pending, completed]
-    call_index = {"i": 0}
+def _manager_with_pending() -> tuple[OperationManager, str]:
+    manager = OperationManager()
+    op_id = manager.create_operation(
+        entity_id="light.a",
+        action="on",
+        service_domain="light",
+        service_name="turn_on",
+        service_data={},
+        expected_state={"state": "on"},
+    )
+    return manager, op_id
 
-    def fake_get(_op_id: str) -> Any:
-        i = call_index["i"]
-        call_index["i"] = min(i + 1, len(sequence) - 1)
-        return sequence[i]
 
+@pytest.mark.asyncio
+async def test_wakes_on_state_change_without_polling() -> None:
+    """The confirming state change releases the waiter immediately."""
+    manager, op_id = _manager_with_pending()
     tools = DeviceControlTools(client=_client())
 
-    # Patch sleep to a no-op so we don't wait the real 0.2s × 2 = 400ms.
-    async def fast_sleep(_secs: float) -> None:
-        return None
+    async def confirm_soon() -> None:
+        await asyncio.sleep(0.05)
+        manager.process_state_change("light.a", {"state": "on"})
 
-    with (
-        patch(
-            "ha_mcp.tools.device_control.get_operation_from_memory",
-            side_effect=fake_get,
-        ),
-        patch.object(asyncio, "sleep", new=fast_sleep),
-    ):
-        result = await tools.get_device_operation_status("op-1", timeout_seconds=2)
+    with patch(
+        "ha_mcp.tools.device_control.get_operation_from_memory",
+        side_effect=manager.get_operation,
+    ) as mock_get:
+        start = time.perf_counter()
+        confirmer = asyncio.create_task(confirm_soon())
+        result = await tools.get_device_operation_status(op_id, timeout_seconds=5)
+        elapsed = time.perf_counter() - start
+        await confirmer
 
     assert result["status"] == "completed"
-    # Initial fetch (1) + 2 poll fetches = 3 calls; index is min-capped at 2.
-    assert call_index["i"] == 2
+    # Woken by the state change itself: no 0.2s polling interval to wait out.
+    assert elapsed < 1.0
+    # Initial read + one re-read after the wake-up.
+    assert mock_get.call_count == 2
 
 
 @pytest.mark.asyncio
-async def test_returns_pending_when_timeout_expires() -> None:
-    """If the operation never leaves PENDING, return the pending payload after timeout.
-
-    Uses a fake monotonic clock that advances past the deadline on the second
-    poll so the loop exits cleanly without burning real wall time.
-    """
-    pending = _make_operation(OperationStatus.PENDING)
+async def test_concurrent_waiters_all_wake() -> None:
+    """Every status call waiting on the operation observes the completion."""
+    manager, op_id = _manager_with_pending()
     tools = DeviceControlTools(client=_client())
 
-    fake_sleep_calls = {"n": 0}
+    with patch(
+        "ha_mcp.tools.device_control.get_operation_from_memory",
+        side_effect=manager.get_operation,
+    ):
+        waiters = [
+            asyncio.create_task(
+                tools.get_device_operation_status(op_id, timeout_seconds=5)
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        manager.process_state_change("light.a", {"state": "on"})
+        results = await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
 
-    # Synthetic monotonic clock: deadline math + first-iter check pass; second
-    # iter check trips the break after the patched sleep advances the clock.
-    clock = {"t": 0.0}
+    assert [r["status"] for r in results] == ["completed"] * 3
+    assert manager.operations[op_id]._waiters == []
 
-    def fake_monotonic() -> float:
-        return clock["t"]
 
-    async def advance_then_sleep(_secs: float) -> None:
-        fake_sleep_calls["n"] += 1
-        clock["t"] += 0.6  # bigger than timeout, so the next deadline check exits
+@pytest.mark.asyncio
+async def test_returns_pending_when_timeout_expires() -> None:
+    """If the operation never leaves PENDING, return the pending payload after timeout."""
+    manager, op_id = _manager_with_pending()
+    tools = DeviceControlTools(client=_client())
 
-    with (
-        patch(
-            "ha_mcp.tools.device_control.get_operation_from_memory",
-            return_value=pending,
-        ),
-        patch("ha_mcp.tools.device_control.time.monotonic", new=fake_monotonic),
-        patch.object(asyncio, "sleep", new=advance_then_sleep),
+    with patch(
+        "ha_mcp.tools.device_control.get_operation_from_memory",
+        side_effect=manager.get_operation,
     ):
-        result = await tools.get_device_operation_status("op-1", timeout_seconds=0.5)
+        start = time.perf_counter()
+        result = await tools.get_device_operation_status(op_id, timeout_seconds=0.05)
+        elapsed = time.perf_counter() - start
 
     assert result["status"] == "pending"
     assert "time_remaining_ms" in result
-    # At least one poll cycle ran before the deadline check exited.
-    assert fake_sleep_calls["n"] >= 1
+    assert 0.04 <= elapsed < 1.0
+    # The timed-out wait deregistered itself.
+    assert manager.operations[op_id]._waiters == []
 
 
 @pytest.mark.asyncio
-async def test_fractional_timeout_bounds_polling_sleep() -> None:
-    """A polling sleep never exceeds the remaining timeout window."""
+async def test_wait_is_bounded_by_remaining_window() -> None:
+    """Each wait is bounded by the time left before the deadline."""
     pending = _make_operation(OperationStatus.PENDING)
     tools = DeviceControlTools(client=_client())
     clock = {"t": 0.0}
-    sleep_calls: list[float] = []
+    wait_calls: list[float] = []
 
     def fake_monotonic() -> float:
         return clock["t"]
 
-    async def advance_clock(seconds: float) -> None:
-        sleep_calls.append(seconds)
-        clock["t"] += seconds
+    async def advance_clock(self: DeviceOperation, timeout: float) -> None:
+        wait_calls.append(timeout)
+        clock["t"] += timeout
 
     with (
         patch(
@@ -174,12 +189,35 @@ async def test_fractional_timeout_bounds_polling_sleep() -> None:
             return_value=pending,
         ),
         patch("ha_mcp.tools.device_control.time.monotonic", new=fake_monotonic),
-        patch.object(asyncio, "sleep", new=advance_clock),
+        patch.object(DeviceOperation, "wait_for_change", new=advance_clock),
     ):
         result = await tools.get_device_operation_status("op-1", timeout_seconds=0.05)
 
     assert result["status"] == "pending"
-    assert sleep_calls == [pytest.approx(0.05)]
+    assert wait_calls == [pytest.approx(0.05)]
+
+
+@pytest.mark.asyncio
+async def test_operation_expiry_ends_the_wait() -> None:
+    """An operation whose own timeout passes is reported as timed out."""
+    manager, op_id = _manager_with_pending()
+    manager.operations[op_id].timeout_ms = 50
+    tools = DeviceControlTools(client=_client())
+
+    with (
+        patch(
+            "ha_mcp.tools.device_control.get_operation_from_memory",
+            side_effect=manager.get_operation,
+        ),
+        pytest.raises(ToolError) as exc_info,
+    ):
+        start = time.perf_counter()
+        await tools.get_device_operation_status(op_id, timeout_seconds=5)
+    elapsed = time.perf_counter() - start
+
+    assert "TIMEOUT" in str(exc_info.value).upper()
+    # Woke at the operation's expiry, well before the 5s window.
+    assert elapsed < 1.0
 
 
 @pytest.mark.asyncio
@@ -202,36 +240,33 @@ async def test_initial_not_found_raises_resource_not_found() -> None:
 
 
 @pytest.mark.asyncio
-async def test_cleanup_mid_poll_raises_resource_not_found() -> None:
-    """If the operation is GC'd between polls, raise RESOURCE_NOT_FOUND.
+async def test_cleanup_mid_wait_raises_resource_not_found() -> None:
+    """If the operation is GC'd while awaited, raise RESOURCE_NOT_FOUND.
 
     Returning the stale "pending" payload would mislead the caller into
     thinking the op is still in flight when it has actually been purged.
     """
-    pending = _make_operation(OperationStatus.PENDING)
-    # Initial fetch returns pending; first poll sees None (cleaned up).
-    sequence: list[DeviceOperation | None] = [pending, None]
-    call_index = {"i": 0}
-
-    def fake_get(_op_id: str) -> Any:
-        i = call_index["i"]
-        call_index["i"] = min(i + 1, len(sequence) - 1)
-        return sequence[i]
-
-    async def fast_sleep(_secs: float) -> None:
-        return None
-
+    manager, op_id = _manager_with_pending()
     tools = DeviceControlTools(client=_client())
 
+    async def purge_soon() -> None:
+        await asyncio.sleep(0.01)
+        # Settled long enough ago for the retention window to have passed.
+        operation = manager.operations[op_id]
+        operation.status = OperationStatus.COMPLETED
+        operation.completion_time = operation.start_time - 600_000
+        manager.cleanup_expired_operations(force=True)
+
     with (
         patch(
             "ha_mcp.tools.device_control.get_operation_from_memory",
-            side_effect=fake_get,
+            side_effect=manager.operations.get,
         ),
-        patch.object(asyncio, "sleep", new=fast_sleep),
         pytest.raises(ToolError) as exc_info,
     ):
-        await tools.get_device_operation_status("op-1", timeout_seconds=2)
+        purger = asyncio.create_task(purge_soon())
+        await tools.get_device_operation_status(op_id, timeout_seconds=5)
+    await purger
 
     err_text = str(exc_info.value)
     assert "RESOURCE_NOT_FOUND" in err_text
@@ -239,35 +274,27 @@ async def test_cleanup_mid_poll_raises_resource_not_found() -> None:
 
 
 @pytest.mark.asyncio
-async def test_failed_mid_poll_raises_service_call_failed() -> None:
-    """If status flips to FAILED mid-poll, raise SERVICE_CALL_FAILED with the error message."""
-    pending = _make_operation(OperationStatus.PENDING)
-    failed = _make_operation(OperationStatus.FAILED)
-    failed.error_message = "device unreachable"
-    failed.completion_time = failed.start_time + 200
-
-    sequence = [pending, failed]
-    call_index = {"i": 0}
-
-    def fake_get(_op_id: str) -> Any:
-        i = call_index["i"]
-        call_index["i"] = min(i + 1, len(sequence) - 1)
-        return sequence[i]
-
-    async def fast_sleep(_secs: float) -> None:
-        return None
-
+async def test_failed_mid_wait_raises_service_call_failed() -> None:
+    """If status flips to FAILED mid-wait, raise SERVICE_CALL_FAILED with the error message."""
+    manager, op_id = _manager_with_pending()
     tools = DeviceControlTools(client=_client())
 
+    async def fail_soon() -> None:
+        await asyncio.sleep(0.01)
+        manager.update_operation_status(
+            op_id, OperationStatus.FAILED, error_message="device unreachable"
+        )
+
     with (
         patch(
             "ha_mcp.tools.device_control.get_operation_from_memory",
-            side_effect=fake_get,
+            side_effect=manager.get_operation,
         ),
-        patch.object(asyncio, "sleep", new=fast_sleep),
         pytest.raises(ToolError) as exc_info,
     ):
-        await tools.get_device_operation_status("op-1", timeout_seconds=2)
+        failer = asyncio.create_task(fail_soon())
+        await tools.get_device_operation_status(op_id, timeout_seconds=5)
+    await failer
 
     err_text = str(exc_info.value)
     assert "SERVICE_CALL_FAILED" in err_text
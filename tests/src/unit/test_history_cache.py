@@ -0,0 +1,194 @@
+"""Unit tests for the history window cache and downsampling of ha_get_history."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+from ha_mcp.client.history_cache import MAX_HISTORY_CACHE_ROWS, HistoryCache
+from ha_mcp.tools.tools_history import (
+    _downsample_states,
+    _fetch_history,
+    _lttb_indices,
+)
+
+
+def _clock() -> tuple[datetime, float]:
+    """Now, and two hours ago as an epoch (where the fake history starts)."""
+    now = datetime.now(UTC).replace(microsecond=0)
+    return now, (now - timedelta(hours=2)).timestamp()
+
+
+class _Recorder:
+    """Fake ``history/history_during_period`` over one second-resolution sensor."""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.windows: list[tuple[float, float, bool]] = []
+
+    async def send_websocket_message(self, message: dict[str, Any]) -> dict:
+        start = datetime.fromisoformat(message["start_time"]).timestamp()
+        end = datetime.fromisoformat(message["end_time"]).timestamp()
+        with_start = message.get("include_start_time_state", True)
+        self.windows.append((start, end, with_start))
+        selected = [row for row in self.rows if start < row["lu"] < end]
+        before = [row for row in self.rows if row["lu"] <= start]
+        if with_start and before:
+            selected.insert(0, {"s": before[-1]["s"], "lu": start})
+        return {
+            "success": True,
+            "result": dict.fromkeys(message["entity_ids"], selected),
+        }
+
+
+def _client(recorder: _Recorder) -> SimpleNamespace:
+    return SimpleNamespace(
+        history_cache=HistoryCache(),
+        send_websocket_message=recorder.send_websocket_message,
+    )
+
+
+async def _page(client, start: datetime, end: datetime, **kwargs) -> dict:
+    result = await _fetch_history(
+        client,
+        ["sensor.power"],
+        start,
+        end,
+        True,
+        True,
+        kwargs.pop("limit", 1000),
+        kwargs.pop("offset", 0),
+        100,
+        1000,
+        order="asc",
+        **kwargs,
+    )
+    return result["entities"][0]
+
+
+class TestHistoryWindowCache:
+    async def test_paging_refetches_only_the_open_tail(self):
+        now, epoch = _clock()
+        recorder = _Recorder([{"s": str(i), "lu": epoch + i * 60} for i in range(120)])
+        client = _client(recorder)
+        start = now - timedelta(hours=3)
+
+        first = await _page(client, start, now, limit=50)
+        second = await _page(client, start, now, limit=50, offset=50)
+
+        assert first["total_count"] == second["total_count"] == 120
+        assert [s["state"] for s in second["states"]][:2] == ["50", "51"]
+        assert len(recorder.windows) == 2
+        tail_start, _tail_end, with_start = recorder.windows[1]
+        # Only the unsettled last minute (plus a millisecond overlap) again.
+        assert tail_start > now.timestamp() - 120
+        assert with_start is False
+
+    async def test_later_start_is_sliced_with_the_state_in_force(self):
+        now, epoch = _clock()
+        recorder = _Recorder([{"s": str(i), "lu": epoch + i * 600} for i in range(6)])
+        client = _client(recorder)
+        await _page(client, now - timedelta(hours=3), now)
+
+        later = now - timedelta(hours=2) + timedelta(minutes=15)
+        entity = await _page(client, later, now)
+
+        states = [(s["state"], s["last_updated"]) for s in entity["states"]]
+        assert states[0] == ("1", later.isoformat())
+        assert [s for s, _ in states] == ["1", "2", "3", "4", "5"]
+
+    async def test_closed_window_is_served_without_a_fetch(self):
+        now, epoch = _clock()
+        recorder = _Recorder([{"s": str(i), "lu": epoch + i * 60} for i in range(60)])
+        client = _client(recorder)
+        start, end = now - timedelta(hours=3), now - timedelta(minutes=30)
+        first = await _page(client, start, end)
+        again = await _page(client, start, end)
+        assert again["states"] == first["states"]
+        assert len(recorder.windows) == 1
+
+    async def test_earlier_start_refetches_in_full(self):
+        now, epoch = _clock()
+        recorder = _Recorder([{"s": "1", "lu": epoch}])
+        client = _client(recorder)
+        await _page(client, now - timedelta(hours=1), now)
+        await _page(client, now - timedelta(hours=3), now)
+        assert [w[2] for w in recorder.windows] == [True, True]
+
+    def test_eviction_bounds_cached_rows(self):
+        cache = HistoryCache(max_rows=3)
+        rows = [{"s": "1", "lu": 1.0}, {"s": "2", "lu": 2.0}]
+        cache.store(("a", True, True), 0.0, 10.0, rows)
+        cache.store(("b", True, True), 0.0, 10.0, rows)
+        assert cache.stats()["windows"] == 1
+        assert cache.covered_until(("a", True, True), 0.0) is None
+        assert cache.covered_until(("b", True, True), 0.0) == 10.0
+
+    def test_week_of_a_1hz_sensor_keeps_the_prefix_that_fits(self):
+        week = 7 * 24 * 3600
+        rows = [{"s": "1", "lu": float(t)} for t in range(week)]
+        cache = HistoryCache()
+        cache.store(("sensor.power", True, True), 0.0, float(week), rows)
+
+        assert cache.stats()["windows"] == 1
+        assert cache.stats()["rows"] == MAX_HISTORY_CACHE_ROWS
+        covered = cache.covered_until(("sensor.power", True, True), 0.0)
+        assert covered == float(MAX_HISTORY_CACHE_ROWS)
+
+    async def test_oversized_window_pages_fetch_only_past_the_bound(self):
+        now, epoch = _clock()
+        recorder = _Recorder([{"s": str(i), "lu": epoch + i * 60} for i in range(120)])
+        client = _client(recorder)
+        client.history_cache = HistoryCache(max_rows=50)
+        start = now - timedelta(hours=3)
+
+        first = await _page(client, start, now, limit=50)
+        second = await _page(client, start, now, limit=50, offset=50)
+
+        assert first["total_count"] == second["total_count"] == 120
+        assert [s["state"] for s in second["states"]][:2] == ["50", "51"]
+        tail_start, _tail_end, _with_start = recorder.windows[1]
+        # The cached prefix is rows 0-49; only rows from 50 on are fetched again.
+        assert abs(tail_start - (epoch + 50 * 60)) < 1
+
+
+class TestDownsampling:
+    def test_lttb_keeps_endpoints_and_peaks(self):
+        xs = [float(i) for i in range(1000)]
+        ys = [100.0 if i == 500 else 0.0 for i in range(1000)]
+        kept = _lttb_indices(xs, ys, 50)
+        assert len(kept) == 50
+        assert kept[0] == 0 and kept[-1] == 999
+        assert 500 in kept
+        assert kept == sorted(kept)
+
+    def test_non_numeric_states_are_kept(self):
+        states = [{"s": str(i % 7), "lu": float(i)} for i in range(500)]
+        states[250] = {"s": "unavailable", "lu": 250.0}
+        reduced = _downsample_states(states, 20)
+        assert len(reduced) == 21
+        assert {"s": "unavailable", "lu": 250.0} in reduced
+
+    async def test_downsample_sets_the_page_and_reports_the_source_size(self):
+        now, epoch = _clock()
+        recorder = _Recorder(
+            [{"s": str(i % 13), "lu": epoch + i * 5} for i in range(1200)]
+        )
+        result = await _fetch_history(
+            _client(recorder),
+            ["sensor.power"],
+            now - timedelta(hours=3),
+            now,
+            True,
+            True,
+            None,
+            None,
+            100,
+            1000,
+            downsample=300,
+        )
+        entity = result["entities"][0]
+        assert entity["count"] == entity["total_count"] == 300
+        assert entity["downsampled_from"] == 1200
+        assert result["query_params"]["downsample"] == 300
@@ -0,0 +1,98 @@
+"""Unit tests for the transport JSON codec (ha_mcp.utils.json_codec)."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import logging
+
+import pytest
+
+from ha_mcp.utils import json_codec
+from ha_mcp.utils.config_hash import compute_config_hash
+
+
+@pytest.fixture(params=["auto", "stdlib"])
+def codec(request, monkeypatch):
+    """The codec module under each backend this environment can load."""
+    monkeypatch.setenv("HA_MCP_JSON_CODEC", request.param)
+    module = importlib.reload(json_codec)
+    if request.param == "stdlib":
+        assert module.BACKEND == "stdlib"
+    yield module
+    monkeypatch.delenv("HA_MCP_JSON_CODEC")
+    importlib.reload(json_codec)
+
+
+class TestRoundTrip:
+    def test_ha_shaped_payload(self, codec):
+        payload = {
+            "id": 7,
+            "type": "result",
+            "success": True,
+            "result": [
+                {
+                    "entity_id": "sensor.küche",
+                    "state": "21.5",
+                    "attributes": {"friendly_name": "Küche °C", "ratio": 0.1},
+                }
+            ],
+        }
+        encoded = codec.dumps_bytes(payload)
+        assert b" " not in encoded.replace(b"K\xc3\xbcche \xc2\xb0C", b"")
+        assert codec.loads(encoded) == payload
+        assert codec.loads(encoded.decode()) == payload
+        assert codec.loads(memoryview(encoded)) == payload
+        assert codec.dumps(payload) == encoded.decode()
+
+    def test_values_only_the_stdlib_accepts(self, codec):
+        big = 2**70
+        assert codec.loads(f'{{"n": {big}}}') == {"n": big}
+        assert codec.loads(codec.dumps_bytes({"n": big})) == {"n": big}
+        assert codec.loads(codec.dumps({1: "a"})) == {"1": "a"}
+
+    def test_invalid_json_raises_the_stdlib_error(self, codec):
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b"{not json")
+        with pytest.raises(codec.JSONDecodeError):
+            codec.loads("")
+
+    def test_sort_keys(self, codec):
+        assert codec.dumps({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True) == (
+            '{"a":{"c":3,"d":2},"b":1}'
+        )
+
+
+def test_config_hash_does_not_depend_on_the_backend(codec):
+    # Hashes are persisted and compared by clients; pinned to the encoding
+    # they have always had (stdlib, sorted keys, ASCII-escaped).
+    config = {
+        "alias": "Küche °C",
+        "triggers": [{"trigger": "state", "for": 1.5}],
+        "mode": "single",
+    }
+    assert compute_config_hash(config) == "a6260c52a2c72eef"
+
+
+def test_config_hash_ignores_key_order():
+    first = {"alias": "A", "triggers": [{"trigger": "state"}], "mode": "single"}
+    second = {"mode": "single", "triggers": [{"trigger": "state"}], "alias": "A"}
+    assert compute_config_hash(first) == compute_config_hash(second)
+    assert compute_config_hash(first) != compute_config_hash({**first, "alias": "B"})
+
+
+class TestLogPreview:
+    def test_renders_lazily(self):
+        class Exploding:
+            def __repr__(self):
+                raise AssertionError("formatted at INFO level")
+
+        logger = logging.getLogger("test_json_codec.lazy")
+        logger.setLevel(logging.INFO)
+        logger.debug("payload: %s", json_codec.log_preview({"x": Exploding()}))
+
+    def test_caps_the_size(self):
+        text = str(json_codec.log_preview({"states": ["x" * 100] * 500}))
+        assert len(text) < json_codec.LOG_PREVIEW_CHARS + 40
+        assert text.endswith("chars)")
+        assert str(json_codec.log_preview(b'{"ok":true}')) == '{"ok":true}'
@@ -5,7 +5,7 @@ API(s) so conversation agents (and through them the Assist chat UI and voice)
 can drive ha-mcp. These tests cover the registration lifecycle (exposure
 modes, failure containment), the per-turn tool-list fetch with the server's
 exposure stamp, the tool-search meta-tools (search + call-time enforcement),
-and the loopback transport error mapping — all hermetically: Home Assistant
+the pooled loopback session, and the transport error mapping — all hermetically: Home Assistant
 is stubbed via ``_embedded_stubs`` and the MCP client session is faked at the
 ``_mcp_session`` seam (the SDK itself is exercised by the embedded e2e test).
 """
@@ -47,6 +47,13 @@ def _make_hass() -> MagicMock:
         return func(*args)
 
     hass.async_add_executor_job = AsyncMock(side_effect=_executor)
+
+    def _create_bg_task(coro, name, eager_start=True):
+        # Mirrors HomeAssistant.async_create_background_task: the session
+        # runner must actually run.
+        return asyncio.ensure_future(coro)
+
+    hass.async_create_background_task = MagicMock(side_effect=_create_bg_task)
     return hass
 
 
@@ -94,7 +101,7 @@ def _fake_session(
     init_result = SimpleNamespace(instructions=instructions)
 
     @asynccontextmanager
-    async def fake_mcp_session(url, http_client=None):
+    async def fake_mcp_session(url, http_client=None, message_handler=None):
         session.url = url
         session.http_client = http_client
         if raise_on_open is not None:
@@ -646,6 +653,179 @@ class TestToolCall:
             )
 
 
+class _CountingSessions:
+    """Fake ``_mcp_session`` that opens a distinct session per handshake."""
+
+    def __init__(self, monkeypatch, tools: list[Any] | None = None) -> None:
+        self.opened: list[SimpleNamespace] = []
+        self.closed = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.tools = tools or [_tool_entry("ha_get_state")]
+        self.call_delay = 0.0
+        monkeypatch.setattr(llm_api, "_mcp_session", self._open)
+
+    async def _call_tool(self, name, arguments):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.call_delay)
+        finally:
+            self.in_flight -= 1
+        return MagicMock(name="call_result")
+
+    @asynccontextmanager
+    async def _open(self, url, http_client=None, message_handler=None):
+        session = SimpleNamespace(
+            list_tools=AsyncMock(return_value=SimpleNamespace(tools=self.tools)),
+            call_tool=AsyncMock(side_effect=self._call_tool),
+            send_ping=AsyncMock(),
+            message_handler=message_handler,
+        )
+        self.opened.append(session)
+        try:
+            yield session, SimpleNamespace(instructions="hi")
+        finally:
+            self.closed += 1
+
+
+class TestSessionPool:
+    async def test_turn_reuses_one_session_and_cached_list(self, monkeypatch):
+        # One handshake for the whole turn: list + three calls are four
+        # requests on one session, and the next turn's list comes from cache.
+        sessions = _CountingSessions(monkeypatch)
+        hass = _make_hass()
+        api = _make_api(hass)
+
+        instance = await api.async_get_api_instance(llm_api.llm.LLMContext())
+        for _ in range(3):
+            await instance.tools[0].async_call(
+                hass,
+                llm_api.llm.ToolInput("ha_get_state", {}),
+                llm_api.llm.LLMContext(),
+            )
+        await api.async_get_api_instance(llm_api.llm.LLMContext())
+
+        assert len(sessions.opened) == 1
+        session = sessions.opened[0]
+        assert session.list_tools.await_count == 1
+        assert session.call_tool.await_count == 3
+
+    async def test_tool_list_expires(self, monkeypatch):
+        sessions = _CountingSessions(monkeypatch)
+        monkeypatch.setattr(llm_api, "_TOOL_LIST_MAX_AGE_SECONDS", 0.0)
+        api = _make_api(_make_hass())
+
+        await api.async_get_api_instance(llm_api.llm.LLMContext())
+        await api.async_get_api_instance(llm_api.llm.LLMContext())
+
+        assert sessions.opened[0].list_tools.await_count == 2
+
+    async def test_list_changed_notification_drops_cached_list(self, monkeypatch):
+        sessions = _CountingSessions(monkeypatch)
+        api = _make_api(_make_hass())
+
+        await api.async_get_api_instance(llm_api.llm.LLMContext())
+        await sessions.opened[0].message_handler(
+            SimpleNamespace(
+                root=SimpleNamespace(method="notifications/tools/list_changed")
+            )
+        )
+        await api.async_get_api_instance(llm_api.llm.LLMContext())
+
+        assert sessions.opened[0].list_tools.await_count == 2
+
+    async def test_failed_call_drops_session_and_next_call_reconnects(
+        self, monkeypatch
+    ):
+        sessions = _CountingSessions(monkeypatch)
+        hass = _make_hass()
+        pool = llm_api._session_pool(hass, "http://127.0.0.1:9584/private_x")
+        await pool.call_tool("ha_get_state", {})
+        sessions.opened[0].call_tool.side_effect = OSError("connection reset")
+
+        with pytest.raises(llm_api.HomeAssistantError, match="ha_get_state"):
+            await llm_api._forward_tool_call(
+                hass, "http://127.0.0.1:9584/private_x", "ha_get_state", {}
+            )
+        # The failed call is not retried (it may have written) ...
+        assert sessions.opened[0].call_tool.await_count == 2
+        # ... but the next one runs on a fresh session.
+        await pool.call_tool("ha_get_state", {})
+        assert len(sessions.opened) == 2
+        assert sessions.opened[1].call_tool.await_count == 1
+
+    async def test_stale_session_list_is_retried_once(self, monkeypatch):
+        sessions = _CountingSessions(monkeypatch)
+        monkeypatch.setattr(llm_api, "_TOOL_LIST_MAX_AGE_SECONDS", 0.0)
+        api = _make_api(_make_hass())
+        await api.async_get_api_instance(llm_api.llm.LLMContext())
+        sessions.opened[0].list_tools.side_effect = OSError("connection reset")
+
+        instance = await api.async_get_api_instance(llm_api.llm.LLMContext())
+
+        assert [t.name for t in instance.tools] == ["ha_get_state"]
+        assert len(sessions.opened) == 2
+
+    async def test_idle_session_failing_ping_is_replaced(self, monkeypatch):
+        sessions = _CountingSessions(monkeypatch)
+        monkeypatch.setattr(llm_api, "_POOL_IDLE_PING_SECONDS", 0.0)
+        pool = llm_api._session_pool(_make_hass(), "http://127.0.0.1:9584/x")
+        await pool.call_tool("ha_get_state", {})
+        sessions.opened[0].send_ping.side_effect = OSError("connection reset")
+
+        await pool.call_tool("ha_get_state", {})
+
+        assert sessions.opened[0].call_tool.await_count == 1
+        assert sessions.opened[1].call_tool.await_count == 1
+
+    async def test_concurrency_is_bounded(self, monkeypatch):
+        sessions = _CountingSessions(monkeypatch)
+        sessions.call_delay = 0.01
+        monkeypatch.setattr(llm_api, "_POOL_MAX_CONCURRENCY", 2)
+        pool = llm_api._session_pool(_make_hass(), "http://127.0.0.1:9584/x")
+
+        await asyncio.gather(*(pool.call_tool("ha_get_state", {}) for _ in range(6)))
+
+        assert len(sessions.opened) == 1
+        assert sessions.max_in_flight == 2
+
+    async def test_listing_is_not_starved_by_busy_call_slots(self, monkeypatch):
+        sessions = _CountingSessions(monkeypatch)
+        sessions.call_delay = 10.0
+        monkeypatch.setattr(llm_api, "_POOL_MAX_CONCURRENCY", 1)
+        hass = _make_hass()
+        pool = llm_api._session_pool(hass, "http://127.0.0.1:9584/x")
+        call = asyncio.create_task(pool.call_tool("ha_get_state", {}))
+        await asyncio.sleep(0.05)
+        assert sessions.in_flight == 1
+
+        list_result, _init = await asyncio.wait_for(pool.list_tools(), timeout=1)
+
+        assert list_result.tools == sessions.tools
+        assert hass.async_create_background_task.call_count == 1
+        call.cancel()
+        await asyncio.gather(call, return_exceptions=True)
+        pool.close()
+
+    async def test_unregister_closes_pooled_sessions(self, monkeypatch):
+        sessions = _CountingSessions(monkeypatch)
+        monkeypatch.setattr(llm_api, "_import_mcp_sdk", lambda: None)
+        hass = _make_hass()
+        await llm_api.async_register_llm_api(
+            hass, _make_entry(), port=9584, secret_path="/private_x"
+        )
+        await llm_api._session_pool(hass, "http://127.0.0.1:9584/private_x").call_tool(
+            "ha_get_state", {}
+        )
+
+        llm_api.async_unregister_llm_api(hass)
+        await asyncio.sleep(0)
+
+        assert sessions.closed == 1
+        assert llm_api.DATA_LLM_API_POOLS not in hass.data[DOMAIN]
+
+
 class TestMetaKeyContract:
     def test_component_meta_keys_match_server(self):
         # The stamp keys are duplicated because the component must never
@@ -3,7 +3,7 @@
 import json
 import stat
 import time
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 from urllib.parse import parse_qs, urlparse
 
 import pytest
@@ -1178,7 +1178,7 @@ class TestOAuthProxyClient:
 
         proxy = OAuthProxyClient("http://homeassistant.local:8123")
         assert proxy._ha_url == "http://homeassistant.local:8123"
-        assert proxy._oauth_clients == {}
+        assert len(proxy._oauth_clients) == 0
 
     def test_oauth_proxy_client_strips_trailing_slash(self):
         """Test OAuthProxyClient strips trailing slash from URL."""
@@ -1211,6 +1211,7 @@ class TestOAuthProxyClient:
             mock_ha_client.assert_called_once_with(
                 base_url="http://homeassistant.local:8123",
                 token="test_ha_token_xyz",
+                transport=ANY,
             )
 
             # Verify the client instance was stored
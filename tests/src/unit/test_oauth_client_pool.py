@@ -0,0 +1,144 @@
+"""Unit tests for the OAuth per-token client pool (ha_mcp.client.client_pool)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from ha_mcp.client import client_pool
+from ha_mcp.client.client_pool import HomeAssistantClientPool
+from ha_mcp.telemetry import TelemetryRegistry
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def _pool(clock, **kwargs):
+    return HomeAssistantClientPool(
+        "http://ha.local:8123/", verify_ssl=True, clock=clock, **kwargs
+    )
+
+
+class TestLookup:
+    async def test_hit_miss_and_token_isolation(self, clock):
+        pool = _pool(clock)
+        alice = pool.get("token-alice")
+        assert pool.get("token-alice") is alice
+        bob = pool.get("token-bob")
+        assert bob is not alice
+        assert bob.token == "token-bob"
+        assert bob.base_url == "http://ha.local:8123"
+        assert pool.stats() == {
+            "clients": 2,
+            "hits_total": 1,
+            "misses_total": 2,
+            "evictions_idle_total": 0,
+            "evictions_capacity_total": 0,
+        }
+        assert "token-alice" not in repr(list(pool._entries))
+        await pool.aclose()
+
+    async def test_clients_share_one_connection_pool(self, clock):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json={"state": "on"})
+
+        pool = _pool(clock)
+        await pool._transport.aclose()
+        pool._transport = httpx.MockTransport(handler)
+        pool._shared = client_pool._SharedTransport(pool._transport)
+
+        for token in ("token-a", "token-b"):
+            client = pool.get(token)
+            assert await client._request("GET", "/states/light.x") == {"state": "on"}
+        assert seen == ["Bearer token-a", "Bearer token-b"]
+
+        # Closing one client must not close the transport the others use.
+        await pool.get("token-a").close()
+        assert await pool.get("token-b")._request("GET", "/") == {"state": "on"}
+        await pool.aclose()
+
+
+class TestEviction:
+    async def test_capacity_evicts_least_recently_used(self, clock):
+        pool = _pool(clock, max_size=2, close_grace=0)
+        first = pool.get("one")
+        pool.get("two")
+        pool.get("one")  # "two" is now least recently used
+        pool.get("three")
+        assert len(pool) == 2
+        assert pool.get("one") is first
+        assert pool.stats()["evictions_capacity_total"] == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert not pool._retiring
+        await pool.aclose()
+
+    async def test_idle_clients_expire(self, clock):
+        pool = _pool(clock, idle_ttl=60)
+        stale = pool.get("idle")
+        clock.now += 30
+        pool.get("active")
+        clock.now += 45
+        assert pool.get("active") is not None
+        assert len(pool) == 1
+        assert pool.get("idle") is not stale
+        assert pool.stats()["evictions_idle_total"] == 1
+        await pool.aclose()
+
+    async def test_evicted_client_closes_after_the_grace_period(self, clock):
+        pool = _pool(clock, max_size=1, close_grace=0.05)
+        evicted = pool.get("one")
+        pool.get("two")
+        assert evicted in pool._retiring
+        assert not evicted.httpx_client.is_closed
+        await asyncio.sleep(0.1)
+        assert evicted.httpx_client.is_closed
+        assert evicted not in pool._retiring
+        await pool.aclose()
+
+    async def test_aclose_closes_pooled_and_retiring_clients(self, clock):
+        pool = _pool(clock, max_size=1, close_grace=3600)
+        retiring = pool.get("one")
+        pooled = pool.get("two")
+        await pool.aclose()
+        assert retiring.httpx_client.is_closed
+        assert pooled.httpx_client.is_closed
+        assert not pool._closers
+        assert len(pool) == 0
+
+    def test_eviction_without_a_running_loop_defers_to_aclose(self, clock):
+        pool = _pool(clock, max_size=1)
+        evicted = pool.get("one")
+        pool.get("two")
+        assert pool._retiring == {evicted}
+        asyncio.run(pool.aclose())
+        assert evicted.httpx_client.is_closed
+
+
+def test_stats_are_exported_through_telemetry(clock):
+    registry = TelemetryRegistry()
+    pool = _pool(clock)
+    registry.register_collector("oauth_client_pool", pool.stats)
+    pool.get("a")
+    pool.get("a")
+    assert registry.snapshot()["collectors"]["oauth_client_pool"]["hits_total"] == 1
+    text = registry.render_prometheus()
+    assert "# TYPE ha_mcp_oauth_client_pool_hits_total counter" in text
+    assert "ha_mcp_oauth_client_pool_misses_total 1" in text
+    assert "# TYPE ha_mcp_oauth_client_pool_clients gauge" in text
+    asyncio.run(pool.aclose())
@@ -41,7 +41,7 @@ def _make_operation(
 def _manager_with(*operations: DeviceOperation) -> OperationManager:
     manager = OperationManager()
     for op in operations:
-        manager.operations[op.operation_id] = op
+        manager.track_operation(op)
     return manager
 
 
@@ -170,3 +170,20 @@ class TestCleanupExpiredOperations:
         assert "failed-older" not in manager.operations
         assert "timeout-newer" in manager.operations
         assert "pending-live" in manager.operations
+
+    def test_ttl_pass_pops_only_due_operations(self):
+        manager = OperationManager(max_operations=100_000)
+        for n in range(1000):
+            op = _make_operation(
+                f"op-{n}", OperationStatus.PENDING, 1, timeout_ms=60000
+            )
+            manager.track_operation(op)
+            manager.update_operation_status(op.operation_id, OperationStatus.COMPLETED)
+        manager.operations["op-7"].completion_time = (time.time() - 301) * 1000
+
+        manager.cleanup_expired_operations(force=True)
+
+        assert "op-7" not in manager.operations
+        assert len(manager.operations) == 999
+        # Only the due entry was popped; the rest wait for their deadlines.
+        assert min(manager._removals)[0] > time.time() * 1000
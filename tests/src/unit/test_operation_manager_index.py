@@ -0,0 +1,137 @@
+"""Unit tests for OperationManager's pending-operation index.
+
+``process_state_change`` runs for every ``state_changed`` event, so pending
+operations are indexed by entity and by deadline instead of being found by
+scanning ``operations``. These tests pin that the index answers exactly what
+the scan did, including after operations are settled or dropped outside the
+manager's own methods.
+"""
+
+import time
+
+from ha_mcp.utils.operation_manager import (
+    DeviceOperation,
+    OperationManager,
+    OperationStatus,
+)
+
+
+class _NoScan(dict[str, DeviceOperation]):
+    """``operations`` stand-in that fails any full scan."""
+
+    def values(self):  # type: ignore[override]
+        raise AssertionError("operations was scanned")
+
+    def items(self):  # type: ignore[override]
+        raise AssertionError("operations was scanned")
+
+
+def _create(
+    manager: OperationManager, entity_id: str, timeout_ms: float = 10000
+) -> str:
+    return manager.create_operation(
+        entity_id=entity_id,
+        action="on",
+        service_domain="light",
+        service_name="turn_on",
+        service_data={},
+        expected_state={"state": "on"},
+        timeout_ms=timeout_ms,
+    )
+
+
+class TestStateChangeMatching:
+    def test_untracked_entity_is_a_single_lookup(self):
+        manager = OperationManager()
+        _create(manager, "light.kitchen")
+        manager.operations = _NoScan(manager.operations)
+
+        assert manager.process_state_change("sensor.noise", {"state": "1"}) == []
+
+    def test_completes_only_that_entitys_operations(self):
+        manager = OperationManager()
+        first = _create(manager, "light.kitchen")
+        second = _create(manager, "light.kitchen")
+        other = _create(manager, "light.hall")
+        manager.operations = _NoScan(manager.operations)
+
+        updated = manager.process_state_change("light.kitchen", {"state": "on"})
+
+        assert updated == [first, second]
+        assert manager.operations[other].status == OperationStatus.PENDING
+        assert "light.kitchen" not in manager._pending_by_entity
+        assert list(manager._pending_by_entity["light.hall"]) == [other]
+
+    def test_non_matching_state_keeps_operation_pending(self):
+        manager = OperationManager()
+        op_id = _create(manager, "light.kitchen")
+
+        assert manager.process_state_change("light.kitchen", {"state": "off"}) == []
+        assert manager.get_pending_operations_for_entity("light.kitchen") == [
+            manager.operations[op_id]
+        ]
+
+    def test_expired_operation_is_not_matched(self):
+        manager = OperationManager()
+        op_id = _create(manager, "light.kitchen", timeout_ms=1000)
+        manager.operations[op_id].start_time -= 5000
+
+        assert manager.process_state_change("light.kitchen", {"state": "on"}) == []
+
+    def test_settled_or_dropped_behind_the_managers_back_is_pruned(self):
+        manager = OperationManager()
+        settled = _create(manager, "light.kitchen")
+        dropped = _create(manager, "light.kitchen")
+        manager.operations[settled].status = OperationStatus.FAILED
+        del manager.operations[dropped]
+
+        assert manager.get_pending_operations_for_entity("light.kitchen") == []
+        assert "light.kitchen" not in manager._pending_by_entity
+
+
+class TestDeadlineHeap:
+    def test_sweep_only_pops_expired_deadlines(self):
+        manager = OperationManager()
+        live = [_create(manager, f"light.l{i}", timeout_ms=60000) for i in range(50)]
+        expired = _create(manager, "light.old", timeout_ms=1000)
+        manager.operations[expired].start_time -= 5000
+        # Re-file the backdated deadline as it would have been at creation.
+        manager._deadlines = [
+            (op.start_time + op.timeout_ms, op_id)
+            for op_id, op in manager.operations.items()
+        ]
+        manager._deadlines.sort()
+
+        manager.cleanup_expired_operations(force=True)
+
+        assert manager.operations[expired].status == OperationStatus.TIMEOUT
+        assert "light.old" not in manager._pending_by_entity
+        assert len(manager._deadlines) == len(live)
+        assert all(
+            manager.operations[op_id].status == OperationStatus.PENDING
+            for op_id in live
+        )
+
+    def test_extended_timeout_is_refiled(self):
+        manager = OperationManager()
+        op_id = _create(manager, "light.kitchen", timeout_ms=1)
+        manager.operations[op_id].timeout_ms = 60000
+        time.sleep(0.01)
+
+        manager.cleanup_expired_operations(force=True)
+
+        assert manager.operations[op_id].status == OperationStatus.PENDING
+        assert manager._deadlines == [
+            (manager.operations[op_id].start_time + 60000, op_id)
+        ]
+
+    def test_settled_operation_deadline_is_discarded(self):
+        manager = OperationManager()
+        op_id = _create(manager, "light.kitchen", timeout_ms=1)
+        manager.process_state_change("light.kitchen", {"state": "on"})
+        time.sleep(0.01)
+
+        manager.cleanup_expired_operations(force=True)
+
+        assert manager.operations[op_id].status == OperationStatus.COMPLETED
+        assert manager._deadlines == []
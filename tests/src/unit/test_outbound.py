@@ -0,0 +1,132 @@
+"""Unit tests for the per-call outbound serialization (outbound.py).
+
+Pins that the visibility outbound scan and the secret scrub, chained in
+server registration order, serialize a result's structured content once,
+and that the scrub leaves a secret-free structure untouched.
+"""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ha_mcp import outbound
+from ha_mcp.outbound import OutboundPayload, outbound_payload, structured_text
+from ha_mcp.redaction import (
+    REDACTED_KNOWN,
+    RedactSecretsMiddleware,
+    _clear_known_secret_values,
+    register_known_secret_values,
+)
+from ha_mcp.visibility.enforcement import _serialize_result
+
+
+@pytest.fixture
+def redact_on(monkeypatch):
+    monkeypatch.setattr(
+        "ha_mcp.redaction.get_global_settings",
+        lambda: SimpleNamespace(redact_secrets=True),
+    )
+    _clear_known_secret_values()
+    yield
+    _clear_known_secret_values()
+
+
+@pytest.fixture
+def dumps_calls():
+    calls: list[object] = []
+    real_dumps = json.dumps
+
+    def _counting(obj, **kwargs):
+        # Only the outbound serialization passes ``default=str``; the json
+        # module is shared, so other dumps calls must not be counted.
+        if kwargs.get("default") is str:
+            calls.append(obj)
+        return real_dumps(obj, **kwargs)
+
+    with patch.object(outbound.json, "dumps", _counting):
+        yield calls
+
+
+def _result(structured):
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text=json.dumps(structured))],
+        structured_content=structured,
+    )
+
+
+class TestOutboundPayload:
+    def test_memoized_per_object(self, dumps_calls):
+        payload = OutboundPayload()
+        first = {"a": 1}
+        assert payload.structured_text(first) == '{"a": 1}'
+        assert payload.structured_text(first) == '{"a": 1}'
+        assert len(dumps_calls) == 1
+        # A replaced structure is re-serialized, never served stale.
+        assert payload.structured_text({"a": 2}) == '{"a": 2}'
+        assert len(dumps_calls) == 2
+
+    def test_without_open_payload_serializes_each_time(self, dumps_calls):
+        structured = {"a": 1}
+        structured_text(structured)
+        structured_text(structured)
+        assert len(dumps_calls) == 2
+
+    def test_unserializable_is_none(self):
+        circular: list[object] = []
+        circular.append(circular)
+        assert OutboundPayload().structured_text(circular) is None
+
+    def test_payload_is_scoped_to_the_block(self, dumps_calls):
+        structured = {"a": 1}
+        with outbound_payload():
+            structured_text(structured)
+            structured_text(structured)
+        structured_text(structured)
+        assert len(dumps_calls) == 2
+
+
+class TestSharedAcrossStages:
+    @pytest.mark.asyncio
+    async def test_scan_and_scrub_serialize_once(self, redact_on, dumps_calls):
+        register_known_secret_values(["SECRETVALUE1"])
+        structured = {"v": "SECRETVALUE1", "rows": list(range(100))}
+
+        async def _scanning_call_next(context):
+            # Stands in for the innermost visibility outbound scan.
+            result = _result(structured)
+            _serialize_result(result)
+            return result
+
+        out = await RedactSecretsMiddleware().on_call_tool(
+            MagicMock(), _scanning_call_next
+        )
+        assert out.structured_content["v"] == REDACTED_KNOWN
+        assert dumps_calls == [structured]
+
+    @pytest.mark.asyncio
+    async def test_secret_free_structure_is_not_rebuilt(self, redact_on):
+        register_known_secret_values(["SECRETVALUE1"])
+        structured = {"v": "clean", "nested": [{"k": "also clean"}]}
+
+        async def _call_next(context):
+            return _result(structured)
+
+        with patch("ha_mcp.redaction.scrub_obj") as scrub_obj:
+            out = await RedactSecretsMiddleware().on_call_tool(MagicMock(), _call_next)
+        scrub_obj.assert_not_called()
+        assert out.structured_content is structured
+
+    @pytest.mark.asyncio
+    async def test_escaped_secret_in_a_key_is_still_scrubbed(self, redact_on):
+        secret = 'pass"wörd'
+        register_known_secret_values([secret])
+
+        async def _call_next(context):
+            return _result({secret: "as key"})
+
+        out = await RedactSecretsMiddleware().on_call_tool(MagicMock(), _call_next)
+        assert out.structured_content == {REDACTED_KNOWN: "as key"}
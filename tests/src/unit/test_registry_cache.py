@@ -0,0 +1,219 @@
+"""Unit tests for the event-invalidated registry cache (client/registry_cache.py).
+
+Pins the read-through contract of ``HomeAssistantClient.send_websocket_message``
+for bare registry list commands: the first read fetches and subscribes to the
+``*_registry_updated`` events, repeat reads are served from memory, and any
+registry event, write of our own, TTL expiry or reconnect makes the next read
+go back to Home Assistant.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ha_mcp.client.registry_cache import (
+    REGISTRY_EVENTS,
+    RegistryCache,
+    invalidated_by_command,
+    reset_registry_caches,
+)
+from ha_mcp.client.rest_client import HomeAssistantClient
+from ha_mcp.client.websocket_client import HomeAssistantWebSocketClient
+
+URL = "http://ha.local:8123"
+TOKEN = "tok"
+
+ENTITIES = [
+    {"entity_id": "light.a", "device_id": "dev1"},
+    {"entity_id": "light.b", "device_id": None},
+]
+
+
+def _ws_client() -> HomeAssistantWebSocketClient:
+    ws = HomeAssistantWebSocketClient(URL, TOKEN, verify_ssl=True)
+    ws._state.mark_connected()
+    ws._state.mark_authenticated()
+
+    async def _send_command(command_type, **_kwargs):
+        if command_type == "config/entity_registry/list":
+            return {"success": True, "result": [dict(e) for e in ENTITIES]}
+        if command_type == "config/device_registry/list":
+            return {"success": True, "result": [{"id": "dev1", "area_id": "kitchen"}]}
+        return {"success": True, "result": None}
+
+    ws.send_command = AsyncMock(side_effect=_send_command)  # type: ignore[method-assign]
+    ws.subscribe_events = AsyncMock(return_value=1)  # type: ignore[method-assign]
+    return ws
+
+
+@pytest.fixture
+async def client_and_ws():
+    reset_registry_caches()
+    ws = _ws_client()
+    client = HomeAssistantClient(base_url=URL, token=TOKEN, verify_ssl=True)
+    with patch(
+        "ha_mcp.client.websocket_client.get_websocket_client",
+        AsyncMock(return_value=ws),
+    ):
+        yield client, ws
+    await client.close()
+    reset_registry_caches()
+
+
+def _fetches(ws, command_type: str) -> int:
+    return sum(1 for c in ws.send_command.await_args_list if c.args[0] == command_type)
+
+
+@pytest.mark.asyncio
+async def test_repeat_reads_are_served_from_cache(client_and_ws):
+    client, ws = client_and_ws
+    message = {"type": "config/entity_registry/list"}
+
+    first = await client.send_websocket_message(message)
+    second = await client.send_websocket_message(message)
+
+    assert first["result"] == second["result"] == ENTITIES
+    assert _fetches(ws, "config/entity_registry/list") == 1
+    subscribed = {c.args[0] for c in ws.subscribe_events.await_args_list}
+    assert subscribed == set(REGISTRY_EVENTS)
+
+    # Callers get their own copies.
+    second["result"][0]["entity_id"] = "mutated"
+    third = await client.send_websocket_message(message)
+    assert third["result"][0]["entity_id"] == "light.a"
+
+
+@pytest.mark.asyncio
+async def test_registry_event_invalidates_precisely(client_and_ws):
+    client, ws = client_and_ws
+    await client.send_websocket_message({"type": "config/entity_registry/list"})
+    await client.send_websocket_message({"type": "config/device_registry/list"})
+
+    for handler in ws._state.get_event_handlers("device_registry_updated"):
+        await handler({"event_type": "device_registry_updated", "data": {}})
+
+    await client.send_websocket_message({"type": "config/entity_registry/list"})
+    await client.send_websocket_message({"type": "config/device_registry/list"})
+    assert _fetches(ws, "config/entity_registry/list") == 1
+    assert _fetches(ws, "config/device_registry/list") == 2
+
+
+@pytest.mark.asyncio
+async def test_own_write_invalidates_synchronously(client_and_ws):
+    client, ws = client_and_ws
+    message = {"type": "config/entity_registry/list"}
+    await client.send_websocket_message(message)
+
+    await client.send_websocket_message(
+        {"type": "config/entity_registry/update", "entity_id": "light.a"}
+    )
+    await client.send_websocket_message(message)
+    assert _fetches(ws, "config/entity_registry/list") == 2
+
+
+@pytest.mark.asyncio
+async def test_filtered_list_and_disconnect_bypass_cache(client_and_ws):
+    client, ws = client_and_ws
+    await client.send_websocket_message({"type": "config/entity_registry/list"})
+
+    # A parameterised list is not the bare list and is never cached.
+    await client.send_websocket_message(
+        {"type": "config/entity_registry/list", "device_id": "dev1"}
+    )
+    await client.send_websocket_message(
+        {"type": "config/entity_registry/list", "device_id": "dev1"}
+    )
+    assert _fetches(ws, "config/entity_registry/list") == 3
+
+    ws._state.connected = False
+    assert client.registry_cache.get("config/entity_registry/list") is None
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry_refetches(client_and_ws):
+    client, ws = client_and_ws
+    client.registry_cache.ttl = 0.0
+    await client.send_websocket_message({"type": "config/entity_registry/list"})
+    await client.send_websocket_message({"type": "config/entity_registry/list"})
+    assert _fetches(ws, "config/entity_registry/list") == 2
+
+
+@pytest.mark.asyncio
+async def test_derived_indexes_are_built_once_per_generation(client_and_ws):
+    client, ws = client_and_ws
+    await client.send_websocket_message({"type": "config/entity_registry/list"})
+    await client.send_websocket_message({"type": "config/device_registry/list"})
+    cache = client.registry_cache
+
+    by_id = cache.by_id("config/entity_registry/list")
+    assert by_id["light.a"]["device_id"] == "dev1"
+    assert cache.by_id("config/entity_registry/list") is by_id
+    assert cache.entity_devices() == {"light.a": "dev1"}
+    areas = cache.device_areas()
+    assert areas == {"dev1": "kitchen"}
+
+    for handler in ws._state.get_event_handlers("device_registry_updated"):
+        await handler({"event_type": "device_registry_updated", "data": {}})
+    assert cache.device_areas() is None
+    assert cache.entity_devices() == {"light.a": "dev1"}
+
+    await client.send_websocket_message({"type": "config/device_registry/list"})
+    rebuilt = cache.device_areas()
+    assert rebuilt == areas and rebuilt is not areas
+
+
+@pytest.mark.asyncio
+async def test_device_list_is_served_from_the_id_index(client_and_ws):
+    from ha_mcp.tools.tools_registry import _fetch_device_rows
+
+    client, ws = client_and_ws
+    await client.send_websocket_message({"type": "config/device_registry/list"})
+    with patch(
+        "ha_mcp.tools.tools_registry.fetch_device_list_via_component",
+        AsyncMock(side_effect=AssertionError),
+    ):
+        rows = await _fetch_device_rows(client)
+    assert rows == [{"id": "dev1", "area_id": "kitchen"}]
+    rows[0]["area_id"] = "mutated"
+    assert client.registry_cache.device_areas() == {"dev1": "kitchen"}
+    assert _fetches(ws, "config/device_registry/list") == 1
+
+
+def test_fetch_started_before_invalidation_is_not_stored():
+    cache = RegistryCache()
+    ws = _ws_client()
+    cache._subscribed_client = ws
+    generation = cache.generation("config/area_registry/list")
+    cache.invalidate("config/area_registry/list")
+    cache.store(
+        "config/area_registry/list", {"success": True, "result": []}, generation
+    )
+    assert cache.get("config/area_registry/list") is None
+
+
+@pytest.mark.parametrize(
+    ("command", "expected"),
+    [
+        ("config/entity_registry/update", ("config/entity_registry/list",)),
+        (
+            "config/device_registry/remove_config_entry",
+            ("config/device_registry/list", "config/entity_registry/list"),
+        ),
+        (
+            "config/floor_registry/delete",
+            ("config/floor_registry/list", "config/area_registry/list"),
+        ),
+        (
+            "config_entries/subentries/delete",
+            ("config/device_registry/list", "config/entity_registry/list"),
+        ),
+        ("config/entity_registry/get", ()),
+        ("config_entries/get", ()),
+        ("call_service", ()),
+        ("get_states", ()),
+    ],
+)
+def test_invalidated_by_command(command, expected):
+    assert invalidated_by_command(command) == expected
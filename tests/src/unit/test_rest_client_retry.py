@@ -19,6 +19,7 @@ from ha_mcp.client.rest_client import (
     HomeAssistantAPIError,
     HomeAssistantClient,
 )
+from ha_mcp.client.single_flight import SingleFlight
 
 
 @pytest.fixture
@@ -32,6 +33,8 @@ def client():
         c.verify_ssl = True
         c.httpx_client = MagicMock()
         c._supervised_detected = None
+        c._reads = SingleFlight()
+        c._write_epoch = 0
         return c
 
 
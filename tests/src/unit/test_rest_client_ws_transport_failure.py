@@ -25,6 +25,7 @@ from ha_mcp.client.rest_client import (
     HomeAssistantCommandTimeout,
     HomeAssistantConnectionError,
 )
+from ha_mcp.client.single_flight import SingleFlight
 
 
 @pytest.fixture
@@ -36,6 +37,8 @@ def client() -> HomeAssistantClient:
         c.token = "test-token"
         c.timeout = 30
         c.verify_ssl = True
+        c._reads = SingleFlight()
+        c._write_epoch = 0
         return c
 
 
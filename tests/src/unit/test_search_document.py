@@ -0,0 +1,241 @@
+"""Unit tests for cached config search documents (utils/search_document.py).
+
+``SearchDocument`` replaces the per-(config, query) leaf walk and one-document
+BM25 fit in ``ScoringMixin._search_in_dict``. These tests pin that it scores
+exactly like that walk did, that unchanged configs are served from the
+hash-keyed cache, and (marked slow) that it is measurably faster on a
+realistic automation set.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Any
+
+import pytest
+
+from ha_mcp.utils.fuzzy_search import BM25Scorer, calculate_ratio, tokenize
+from ha_mcp.utils.search_document import (
+    LEAF_SEPARATOR,
+    SearchDocument,
+    SearchDocumentCache,
+    collect_string_leaves,
+    get_search_document,
+    search_document_cache,
+)
+
+# ---------------------------------------------------------------------------
+# Reference: the per-call walk _search_in_dict performed before documents
+# ---------------------------------------------------------------------------
+
+
+def _walk_exact(data: Any, query: str) -> int:
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if query in str(key).lower() or _walk_exact(value, query):
+                return 100
+        return 0
+    if isinstance(data, list):
+        return 100 if any(_walk_exact(item, query) for item in data) else 0
+    if isinstance(data, str):
+        return 100 if query in data.lower() else 0
+    if data is not None:
+        return 100 if query in str(data).lower() else 0
+    return 0
+
+
+def _walk_fuzzy(data: Any, query: str) -> int:
+    leaves: list[str] = []
+    collect_string_leaves(data, leaves)
+    doc_tokens = [token for leaf in leaves for token in tokenize(leaf)]
+    query_tokens = tokenize(query)
+    if not doc_tokens or not query_tokens:
+        return 0
+    scorer = BM25Scorer()
+    scorer.fit([doc_tokens])
+    raw = scorer.score(query_tokens, 0)
+    if raw > 0:
+        return min(100, round(raw / scorer.max_possible_score(query_tokens) * 100))
+    best = 0
+    for qt in query_tokens:
+        for dt in set(doc_tokens):
+            best = max(best, calculate_ratio(qt, dt))
+    return best if best >= 70 else 0
+
+
+def _automation(i: int, rng: random.Random) -> dict[str, Any]:
+    room = rng.choice(["kitchen", "hallway", "bedroom", "garage", "porch", "office"])
+    return {
+        "id": f"{1700000000000 + i}",
+        "alias": f"{room.title()} motion lights {i}",
+        "description": f"Turn on the {room} lights when motion is detected",
+        "mode": rng.choice(["single", "restart", "queued"]),
+        "triggers": [
+            {
+                "trigger": "state",
+                "entity_id": f"binary_sensor.{room}_motion_{i % 7}",
+                "to": "on",
+                "for": {"seconds": rng.randint(0, 30)},
+            },
+            {"trigger": "sun", "event": "sunset", "offset": "-00:30:00"},
+        ],
+        "conditions": [
+            {
+                "condition": "numeric_state",
+                "entity_id": f"sensor.{room}_illuminance",
+                "below": rng.randint(5, 50),
+            },
+            {"condition": "time", "after": "06:00:00", "before": "23:00:00"},
+        ],
+        "actions": [
+            {
+                "action": "light.turn_on",
+                "target": {
+                    "entity_id": [f"light.{room}_ceiling", f"light.{room}_lamp"]
+                },
+                "data": {"brightness_pct": rng.randint(10, 100), "transition": 2},
+            },
+            {"delay": {"minutes": rng.randint(1, 10)}},
+            {
+                "choose": [
+                    {
+                        "conditions": [{"condition": "state", "state": "off"}],
+                        "sequence": [{"action": "light.turn_off"}],
+                    }
+                ],
+                "default": [{"action": "notify.mobile_app", "data": None}],
+            },
+        ],
+    }
+
+
+QUERIES = [
+    "kitchen",
+    "motion lights",
+    "light.turn_on",
+    "sunset",
+    "brightness",
+    "kitchn",
+    "numeric_state below",
+    "notify mobile",
+    "nothing matches this",
+    "30",
+    "",
+]
+
+
+# ---------------------------------------------------------------------------
+# Equivalence
+# ---------------------------------------------------------------------------
+
+
+class TestEquivalence:
+    @pytest.mark.parametrize("exact", [False, True])
+    def test_scores_match_the_walk(self, exact):
+        rng = random.Random(7)
+        configs = [_automation(i, rng) for i in range(25)]
+        configs += [{}, [], {"a": None}, {"": ""}, {"x": [1, 2.5, True]}]
+        scorer = _walk_exact if exact else _walk_fuzzy
+        for config in configs:
+            document = SearchDocument.build(config)
+            for query in QUERIES:
+                q = query.lower()
+                got = document.contains(q) * 100 if exact else document.fuzzy_score(q)
+                assert got == scorer(config, q), (config, query)
+
+    def test_exact_match_does_not_straddle_leaves(self):
+        document = SearchDocument.build({"alias": "hall", "mode": "way"})
+        assert document.contains("hall")
+        assert not document.contains("hallway")
+        assert not document.contains(f"hall{LEAF_SEPARATOR}mode")
+
+    def test_high_term_frequency_caps_at_100(self):
+        document = SearchDocument.build({"a": ["light"] * 50})
+        assert document.fuzzy_score("light") == 100
+
+    def test_non_json_data_is_built_uncached(self):
+        cache = SearchDocumentCache()
+        data = {"when": {1, 2}}
+        assert cache.get(data).config_hash is None
+        assert len(cache) == 0
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class TestCache:
+    def test_unchanged_config_is_a_hit(self):
+        cache = SearchDocumentCache()
+        first = cache.get({"alias": "Porch", "mode": "single"})
+        # Same content, different object and key order.
+        second = cache.get({"mode": "single", "alias": "Porch"})
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_config_is_rebuilt(self):
+        cache = SearchDocumentCache()
+        config = {"alias": "Porch"}
+        first = cache.get(config)
+        config["alias"] = "Garage"
+        second = cache.get(config)
+        assert second is not first
+        assert second.contains("garage")
+
+    def test_lru_bound(self):
+        cache = SearchDocumentCache(max_size=2)
+        a = cache.get({"n": 1})
+        cache.get({"n": 2})
+        cache.get({"n": 1})  # refresh a
+        cache.get({"n": 3})  # evicts n=2
+        assert len(cache) == 2
+        assert cache.get({"n": 1}) is a
+        misses = cache.misses
+        cache.get({"n": 2})
+        assert cache.misses == misses + 1
+
+    def test_module_cache_is_shared(self):
+        config = {"alias": "shared-document-test"}
+        assert get_search_document(config) is get_search_document(dict(config))
+        assert len(search_document_cache()) >= 1
+
+
+# ---------------------------------------------------------------------------
+# Micro-benchmark
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.slow
+def test_benchmark_cached_documents_beat_the_walk():
+    """Score every query against ~1,000 automations, as repeat deep searches do."""
+    rng = random.Random(42)
+    configs = [_automation(i, rng) for i in range(1000)]
+    cache = SearchDocumentCache()
+    queries = ["kitchen", "motion lights", "kitchn", "nothing matches this"]
+
+    def walk() -> None:
+        for query in queries:
+            for config in configs:
+                _walk_exact(config, query)
+                _walk_fuzzy(config, query)
+
+    def documents() -> None:
+        for query in queries:
+            for config in configs:
+                document = cache.get(config)
+                document.contains(query)
+                document.fuzzy_score(query)
+
+    documents()  # warm the cache, as the first search does
+
+    start = time.perf_counter()
+    walk()
+    walk_time = time.perf_counter() - start
+    start = time.perf_counter()
+    documents()
+    document_time = time.perf_counter() - start
+
+    # Measured ~14x locally; assert loosely so a noisy CI box does not flake.
+    assert document_time * 3 < walk_time, (walk_time, document_time)
@@ -612,6 +612,7 @@ class TestAccessibilityMarkup:
         "backups",
         "tool-security-policies",
         "entity-visibility",
+        "performance",
         "accessibility",
     )
 
@@ -0,0 +1,175 @@
+"""Unit tests for read coalescing (ha_mcp.client.single_flight)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from ha_mcp.client.rest_client import HomeAssistantClient
+from ha_mcp.client.single_flight import SingleFlight, is_idempotent_ws_read
+
+
+class _Upstream:
+    """Counts requests and holds each open until released."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def fetch(self):
+        self.calls += 1
+        await self.release.wait()
+        return self.result
+
+
+class TestSingleFlight:
+    async def test_concurrent_callers_share_one_request(self):
+        flights = SingleFlight()
+        upstream = _Upstream([{"entity_id": "light.a", "attributes": {"x": 1}}])
+
+        waiters = [
+            asyncio.create_task(flights.do("states", upstream.fetch)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        upstream.release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert upstream.calls == 1
+        assert (flights.started, flights.joined) == (1, 2)
+        assert len(flights) == 0
+        # Each caller owns its copy, down to nested dicts.
+        results[0][0]["attributes"]["x"] = 99
+        assert results[1][0]["attributes"]["x"] == 1
+        assert upstream.result[0]["attributes"]["x"] == 1
+
+    async def test_lone_caller_gets_the_result_uncopied(self):
+        flights = SingleFlight()
+        upstream = _Upstream({"a": 1})
+        upstream.release.set()
+        assert await flights.do("k", upstream.fetch) is upstream.result
+
+    async def test_later_callers_start_a_new_request(self):
+        flights = SingleFlight()
+        upstream = _Upstream({})
+        upstream.release.set()
+        await flights.do("k", upstream.fetch)
+        await flights.do("k", upstream.fetch)
+        assert upstream.calls == 2
+
+    async def test_errors_reach_every_caller(self):
+        flights = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flights.do("k", fail), flights.do("k", fail), return_exceptions=True
+        )
+        assert [type(r) for r in results] == [ValueError, ValueError]
+
+    async def test_cancelled_caller_does_not_cancel_the_others(self):
+        flights = SingleFlight()
+        upstream = _Upstream("done")
+        first = asyncio.create_task(flights.do("k", upstream.fetch))
+        second = asyncio.create_task(flights.do("k", upstream.fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        upstream.release.set()
+
+        assert await second == "done"
+        assert first.cancelled()
+
+
+def test_idempotent_ws_reads():
+    assert is_idempotent_ws_read({"type": "get_states"})
+    assert is_idempotent_ws_read(
+        {"type": "config/entity_registry/get", "entity_id": "x"}
+    )
+    assert is_idempotent_ws_read({"type": "config/area_registry/list"})
+    assert not is_idempotent_ws_read({"type": "config/entity_registry/update"})
+    assert not is_idempotent_ws_read({"type": "call_service"})
+
+
+@pytest.fixture
+async def client():
+    c = HomeAssistantClient(base_url="http://ha.local:8123", token="t", verify_ssl=True)
+    yield c
+    await c.close()
+
+
+def _held_response(release: asyncio.Event, body: bytes):
+    async def request(method, endpoint, **kwargs):
+        await release.wait()
+        return httpx.Response(200, content=body)
+
+    return AsyncMock(side_effect=request)
+
+
+class TestClientCoalescing:
+    async def test_parallel_get_states_share_one_request(self, client):
+        release = asyncio.Event()
+        client.httpx_client.request = _held_response(
+            release, b'[{"entity_id": "light.a", "state": "on"}]'
+        )
+
+        waiters = [asyncio.create_task(client.get_states()) for _ in range(4)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert client.httpx_client.request.await_count == 1
+        assert all(r == [{"entity_id": "light.a", "state": "on"}] for r in results)
+        assert len({id(r) for r in results}) == 4
+
+    async def test_read_after_our_write_does_not_join_an_older_read(self, client):
+        release = asyncio.Event()
+        client.httpx_client.request = _held_response(release, b"{}")
+
+        before = asyncio.create_task(client.get_services())
+        await asyncio.sleep(0)
+        write = asyncio.create_task(client.call_service("light", "turn_on"))
+        await asyncio.sleep(0)
+        after = asyncio.create_task(client.get_services())
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(before, write, after)
+
+        # The write and both reads each went upstream.
+        assert client.httpx_client.request.await_count == 3
+
+    async def test_parallel_ws_reads_share_one_command(self, client, monkeypatch):
+        release = asyncio.Event()
+
+        async def send_command(command_type, **params):
+            await release.wait()
+            return {"success": True, "result": {"type": command_type, **params}}
+
+        ws_client = MagicMock()
+        ws_client.send_command = AsyncMock(side_effect=send_command)
+        monkeypatch.setattr(
+            "ha_mcp.client.websocket_client.get_websocket_client",
+            AsyncMock(return_value=ws_client),
+        )
+
+        message = {"type": "config/entity_registry/get", "entity_id": "light.a"}
+        waiters = [
+            asyncio.create_task(client.send_websocket_message(dict(message)))
+            for _ in range(3)
+        ]
+        other = asyncio.create_task(
+            client.send_websocket_message({**message, "entity_id": "light.b"})
+        )
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters, other)
+
+        assert ws_client.send_command.await_count == 2
+        assert results[0]["result"]["entity_id"] == "light.a"
+        assert results[3]["result"]["entity_id"] == "light.b"
@@ -878,20 +878,19 @@ class TestIndexSceneRegistryEntry:
     """
 
     @staticmethod
-    def _empty_outputs() -> tuple[dict[str, Any], set[str], dict[str, str]]:
-        return {}, set(), {}
+    def _empty_outputs() -> tuple[set[str], dict[str, str]]:
+        return set(), {}
 
     def test_homeassistant_platform_entry_recorded_as_managed(self) -> None:
         from ha_mcp.tools.smart_search._scenes import SceneSearchMixin
 
-        configs, uids, slug_map = self._empty_outputs()
+        uids, slug_map = self._empty_outputs()
         SceneSearchMixin._index_scene_registry_entry(
             {
                 "entity_id": "scene.movie_night",
                 "unique_id": "movie_night_storage_uid",
                 "platform": "homeassistant",
             },
-            configs,
             uids,
             slug_map,
         )
@@ -905,14 +904,13 @@ class TestIndexSceneRegistryEntry:
         through per-id fetch and 404)."""
         from ha_mcp.tools.smart_search._scenes import SceneSearchMixin
 
-        configs, uids, slug_map = self._empty_outputs()
+        uids, slug_map = self._empty_outputs()
         SceneSearchMixin._index_scene_registry_entry(
             {
                 "entity_id": "scene.hue_movie",
                 "unique_id": "hue_movie_uid",
                 "platform": "hue",
             },
-            configs,
             uids,
             slug_map,
         )
@@ -925,14 +923,13 @@ class TestIndexSceneRegistryEntry:
         "homeassistant"``."""
         from ha_mcp.tools.smart_search._scenes import SceneSearchMixin
 
-        configs, uids, slug_map = self._empty_outputs()
+        uids, slug_map = self._empty_outputs()
         SceneSearchMixin._index_scene_registry_entry(
             {
                 "entity_id": "light.kitchen",
                 "unique_id": "kitchen_light_uid",
                 "platform": "homeassistant",
             },
-            configs,
             uids,
             slug_map,
         )
@@ -944,14 +941,13 @@ class TestIndexSceneRegistryEntry:
         silently ignored — happens on partially-restored registries."""
         from ha_mcp.tools.smart_search._scenes import SceneSearchMixin
 
-        configs, uids, slug_map = self._empty_outputs()
+        uids, slug_map = self._empty_outputs()
         SceneSearchMixin._index_scene_registry_entry(
             {
                 "entity_id": "scene.partial",
                 "unique_id": None,
                 "platform": "homeassistant",
             },
-            configs,
             uids,
             slug_map,
         )
@@ -960,9 +956,9 @@ class TestIndexSceneRegistryEntry:
 
     def test_slug_aliased_to_existing_config_under_storage_key(self) -> None:
         """When a config is already bulk-fetched under its storage key and
-        the entity_id slug differs, the registry walk must add a slug-keyed
-        alias pointing at the same config dict — that's the whole reason
-        Phase 2.5 exists (HA's slugify diverges from `.replace()` chains).
+        the entity_id slug differs, the registry walk's slug map must alias
+        the slug to the same config dict — that's the whole reason the walk
+        exists (HA's slugify diverges from `.replace()` chains).
         """
         from ha_mcp.tools.smart_search._scenes import SceneSearchMixin
 
@@ -980,10 +976,10 @@ class TestIndexSceneRegistryEntry:
                 "unique_id": "ee04b1a2",
                 "platform": "homeassistant",
             },
-            configs,
             uids,
             slug_map,
         )
+        SceneSearchMixin._alias_documents(configs, slug_map)
 
         # Phase-3 lookup via slug now lands on the bulk-fetched config.
         assert configs.get("movie_night") is existing_config
@@ -0,0 +1,184 @@
+"""Unit tests for the opt-in in-memory state mirror (client/state_mirror.py).
+
+Pins the seed/apply/staleness contract: the mirror answers reads only while
+the WebSocket it was seeded over is connected, events that race the seed are
+replayed onto the fresh table, stale (older) events never overwrite newer
+state, and ``HomeAssistantClient`` falls back to REST whenever the mirror
+cannot answer.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from ha_mcp.client.rest_client import HomeAssistantClient
+from ha_mcp.client.state_mirror import StateMirror
+
+URL = "http://ha.local:8123"
+TOKEN = "tok"
+
+
+def _state(entity_id: str, value: str, ts: str = "2026-05-19T15:00:00+00:00"):
+    return {
+        "entity_id": entity_id,
+        "state": value,
+        "attributes": {"friendly_name": entity_id},
+        "last_changed": ts,
+        "last_updated": ts,
+    }
+
+
+def _ws_client(states: list[dict], connected: bool = True) -> MagicMock:
+    ws = MagicMock()
+    ws.is_connected = connected
+    ws.get_states = AsyncMock(return_value={"success": True, "result": states})
+    return ws
+
+
+@pytest.mark.asyncio
+async def test_seed_makes_mirror_fresh_and_serves_copies():
+    mirror = StateMirror(URL, TOKEN)
+    assert not mirror.is_fresh
+
+    assert await mirror.seed(_ws_client([_state("light.a", "on")]))
+    assert mirror.is_fresh
+
+    states = mirror.get_states()
+    assert [s["entity_id"] for s in states] == ["light.a"]
+    # Callers own their copy: mutating it never leaks into the mirror.
+    states[0]["attributes"]["friendly_name"] = "mutated"
+    states[0]["state"] = "off"
+    assert mirror.get_state("light.a")["state"] == "on"
+    assert mirror.get_state("light.a")["attributes"]["friendly_name"] == "light.a"
+
+
+@pytest.mark.asyncio
+async def test_events_apply_incrementally_and_remove_entities():
+    mirror = StateMirror(URL, TOKEN)
+    await mirror.seed(_ws_client([_state("light.a", "on"), _state("light.b", "on")]))
+
+    mirror.apply_event(
+        {
+            "entity_id": "light.a",
+            "new_state": _state("light.a", "off", "2026-05-19T16:00:00+00:00"),
+        }
+    )
+    mirror.apply_event(
+        {
+            "entity_id": "light.b",
+            "new_state": None,
+            "old_state": _state("light.b", "on"),
+        }
+    )
+    mirror.apply_event({"entity_id": "light.c", "new_state": _state("light.c", "on")})
+
+    assert mirror.get_state("light.a")["state"] == "off"
+    assert mirror.get_state("light.b") is None
+    assert mirror.get_state("light.c")["state"] == "on"
+
+
+@pytest.mark.asyncio
+async def test_older_event_never_overwrites_newer_state():
+    mirror = StateMirror(URL, TOKEN)
+    await mirror.seed(
+        _ws_client([_state("light.a", "on", "2026-05-19T16:00:00+00:00")])
+    )
+    mirror.apply_event(
+        {
+            "entity_id": "light.a",
+            "new_state": _state("light.a", "off", "2026-05-19T15:00:00+00:00"),
+        }
+    )
+    assert mirror.get_state("light.a")["state"] == "on"
+
+
+@pytest.mark.asyncio
+async def test_events_racing_the_seed_are_replayed():
+    mirror = StateMirror(URL, TOKEN)
+    ws = _ws_client([])
+
+    async def _get_states():
+        # An event dispatched while the seed reply is being awaited.
+        mirror.apply_event(
+            {
+                "entity_id": "light.a",
+                "new_state": _state("light.a", "off", "2026-05-19T16:00:00+00:00"),
+            }
+        )
+        return {"success": True, "result": [_state("light.a", "on")]}
+
+    ws.get_states = AsyncMock(side_effect=_get_states)
+    await mirror.seed(ws)
+    assert mirror.get_state("light.a")["state"] == "off"
+
+
+@pytest.mark.asyncio
+async def test_disconnect_or_failed_seed_makes_mirror_stale():
+    mirror = StateMirror(URL, TOKEN)
+    ws = _ws_client([_state("light.a", "on")])
+    await mirror.seed(ws)
+    ws.is_connected = False
+    assert not mirror.is_fresh
+
+    failing = MagicMock()
+    failing.get_states = AsyncMock(side_effect=ConnectionError("boom"))
+    assert not await mirror.seed(failing)
+    assert not mirror.is_fresh
+
+
+@pytest.mark.asyncio
+async def test_client_reads_from_fresh_mirror_without_rest():
+    mirror = StateMirror(URL, TOKEN)
+    await mirror.seed(_ws_client([_state("light.a", "on")]))
+    client = HomeAssistantClient(base_url=URL, token=TOKEN, verify_ssl=True)
+    client._request = AsyncMock()  # type: ignore[method-assign]
+
+    with patch("ha_mcp.client.rest_client.get_state_mirror", return_value=mirror):
+        states = await client.get_states()
+        state = await client.get_entity_state("light.a")
+
+    assert [s["entity_id"] for s in states] == ["light.a"]
+    assert state["state"] == "on"
+    client._request.assert_not_called()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_falls_back_to_rest_on_miss_stale_or_foreign_mirror():
+    mirror = StateMirror(URL, TOKEN)
+    await mirror.seed(_ws_client([_state("light.a", "on")]))
+    client = HomeAssistantClient(base_url=URL, token=TOKEN, verify_ssl=True)
+    client._request = AsyncMock(return_value=_state("light.new", "on"))  # type: ignore[method-assign]
+
+    with patch("ha_mcp.client.rest_client.get_state_mirror", return_value=mirror):
+        # Mirror miss: an entity the mirror hasn't seen yet goes to REST.
+        assert (await client.get_entity_state("light.new"))["state"] == "on"
+
+    other = HomeAssistantClient(base_url=URL, token="someone-else", verify_ssl=True)
+    other._request = AsyncMock(return_value=[])  # type: ignore[method-assign]
+    with patch("ha_mcp.client.rest_client.get_state_mirror", return_value=mirror):
+        assert await other.get_states() == []
+    other._request.assert_awaited_once_with("GET", "/states")
+
+    mirror.mark_stale()
+    client._request = AsyncMock(return_value=[])  # type: ignore[method-assign]
+    with (
+        patch("ha_mcp.client.rest_client.get_state_mirror", return_value=mirror),
+        patch.object(mirror, "request_sync") as request_sync,
+    ):
+        assert await client.get_states() == []
+    request_sync.assert_called_once()
+    await client.close()
+    await other.close()
+
+
+def test_mirror_disabled_by_default(monkeypatch):
+    from ha_mcp.client import state_mirror
+    from ha_mcp.config import _reset_global_settings
+
+    monkeypatch.delenv("HAMCP_ENABLE_STATE_MIRROR", raising=False)
+    _reset_global_settings()
+    state_mirror.reset_state_mirror()
+    assert state_mirror.get_state_mirror() is None
@@ -0,0 +1,189 @@
+"""Unit tests for the statistics cache behind ha_get_history(source="statistics")."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from ha_mcp.client.rest_client import HomeAssistantClient
+from ha_mcp.client.statistics_cache import (
+    StatisticsCache,
+    invalidated_statistic_ids,
+    reset_statistics_caches,
+)
+from ha_mcp.tools.tools_history import _fetch_statistics
+
+KEY = ("sensor.energy", "hour", None)
+
+
+def _live_cache(**kwargs: Any) -> StatisticsCache:
+    cache = StatisticsCache(**kwargs)
+    cache._subscribed_client = SimpleNamespace(is_connected=True)
+    return cache
+
+
+def _hour_rows(start: float, hours: int) -> list[dict[str, Any]]:
+    return [{"start": (start + h * 3600) * 1000, "sum": float(h)} for h in range(hours)]
+
+
+class TestStatisticsCache:
+    def test_missing_returns_the_uncovered_parts(self):
+        cache = _live_cache()
+        settled = 100 * 3600.0
+        cache.store(KEY, 0.0, 3600.0 * 10, [], settled=settled, generation=0)
+        cache.store(KEY, 3600.0 * 20, 3600.0 * 30, [], settled=settled, generation=0)
+        assert cache.missing(KEY, 3600.0 * 5, 3600.0 * 40) == [
+            (3600.0 * 10, 3600.0 * 20),
+            (3600.0 * 30, 3600.0 * 40),
+        ]
+        assert cache.missing(KEY, 3600.0, 3600.0 * 9) == []
+
+    def test_unsettled_buckets_are_not_cached(self):
+        cache = _live_cache()
+        rows = _hour_rows(0.0, 10)
+        cache.store(KEY, 0.0, 36000.0, rows, settled=36000.0, generation=0)
+        # The last bucket may still be compiling: it stays a gap.
+        assert cache.missing(KEY, 0.0, 36000.0) == [(32400.0, 36000.0)]
+        assert len(cache.rows(KEY, 0.0, 36000.0)) == 9
+
+    def test_store_after_invalidation_is_dropped(self):
+        cache = _live_cache()
+        generation = cache.generation("sensor.energy")
+        cache.invalidate("sensor.energy")
+        cache.store(KEY, 0.0, 3600.0, [], settled=1e9, generation=generation)
+        assert cache.missing(KEY, 0.0, 3600.0) == [(0.0, 3600.0)]
+
+    def test_not_cached_without_a_live_subscription(self):
+        cache = StatisticsCache()
+        cache.store(KEY, 0.0, 3600.0, [], settled=1e9, generation=0)
+        assert cache.missing(KEY, 0.0, 3600.0) == [(0.0, 3600.0)]
+
+    async def test_statistics_event_drops_metadata_only(self):
+        cache = _live_cache()
+        cache.store(KEY, 0.0, 3600.0, [], settled=1e9, generation=0)
+        cache.store_metadata(
+            [
+                {
+                    "statistic_id": "sensor.energy",
+                    "statistics_unit_of_measurement": "kWh",
+                }
+            ],
+            {"sensor.energy": 0},
+        )
+        await cache._handle_event({"event_type": "recorder_5min_statistics_generated"})
+        assert cache.metadata("sensor.energy") is None
+        assert cache.missing(KEY, 0.0, 3600.0) == []
+
+
+def test_invalidated_statistic_ids():
+    assert invalidated_statistic_ids({"type": "get_states"}) is None
+    assert (
+        invalidated_statistic_ids({"type": "recorder/statistics_during_period"}) is None
+    )
+    assert invalidated_statistic_ids(
+        {"type": "recorder/clear_statistics", "statistic_ids": ["sensor.a"]}
+    ) == ["sensor.a"]
+    assert invalidated_statistic_ids(
+        {"type": "recorder/import_statistics", "metadata": {"statistic_id": "s.b"}}
+    ) == ["s.b"]
+    assert invalidated_statistic_ids({"type": "recorder/purge"}) == []
+
+
+class _Recorder:
+    """Fake recorder answering hourly statistics for every requested id."""
+
+    def __init__(self) -> None:
+        self.windows: list[tuple[float, float]] = []
+        self.metadata_calls = 0
+        self.row_unit: str | None = None
+
+    async def send_websocket_message(self, message: dict[str, Any]) -> dict:
+        if message["type"] == "recorder/get_statistics_metadata":
+            self.metadata_calls += 1
+            return {
+                "success": True,
+                "result": [
+                    {"statistic_id": sid, "statistics_unit_of_measurement": "kWh"}
+                    for sid in message["statistic_ids"]
+                ],
+            }
+        start = datetime.fromisoformat(message["start_time"]).timestamp()
+        end = datetime.fromisoformat(message["end_time"]).timestamp()
+        self.windows.append((start, end))
+        first = -(-start // 3600) * 3600
+        rows = [
+            {"start": t * 1000, "sum": t / 3600}
+            for t in range(int(first), int(end), 3600)
+        ]
+        if self.row_unit:
+            for row in rows:
+                row["unit_of_measurement"] = self.row_unit
+        return {
+            "success": True,
+            "result": dict.fromkeys(message["statistic_ids"], rows),
+        }
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    reset_statistics_caches()
+    c = HomeAssistantClient(base_url="http://ha.local:8123", token="t", verify_ssl=True)
+    recorder = _Recorder()
+    cache = _live_cache()
+
+    async def live_statistics_cache():
+        return cache
+
+    monkeypatch.setattr(c, "live_statistics_cache", live_statistics_cache)
+    monkeypatch.setattr(c, "send_websocket_message", recorder.send_websocket_message)
+    c.recorder = recorder
+    yield c
+    await c.close()
+    reset_statistics_caches()
+
+
+async def _statistics(client, start: datetime, end: datetime, period="hour"):
+    result = await _fetch_statistics(
+        client, ["sensor.energy"], start, end, period, None, 1000, 0
+    )
+    return result["entities"][0]
+
+
+class TestFetchStatisticsCaching:
+    async def test_overlapping_window_fetches_only_what_is_new(self, client):
+        now = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+        day = await _statistics(client, now - timedelta(hours=24), now)
+        week = await _statistics(client, now - timedelta(days=7), now)
+
+        assert week["total_count"] == 7 * 24
+        assert week["statistics"][-24:] == day["statistics"]
+        starts = [s["start"] for s in week["statistics"]]
+        assert starts == sorted(starts)
+        older, tail = client.recorder.windows[1:]
+        assert older[1] == (now - timedelta(hours=24)).timestamp()
+        # The unsettled last hours are fetched again, the rest of the day is not.
+        assert tail[0] >= (now - timedelta(hours=2)).timestamp()
+
+    async def test_unit_comes_from_cached_metadata(self, client):
+        now = datetime.now(UTC)
+        entity = await _statistics(client, now - timedelta(hours=3), now)
+        await _statistics(client, now - timedelta(hours=3), now)
+        assert entity["unit_of_measurement"] == "kWh"
+        assert client.recorder.metadata_calls == 1
+
+    async def test_rows_with_a_unit_skip_the_metadata_lookup(self, client):
+        client.recorder.row_unit = "Wh"
+        now = datetime.now(UTC)
+        entity = await _statistics(client, now - timedelta(hours=3), now)
+        assert entity["unit_of_measurement"] == "Wh"
+        assert client.recorder.metadata_calls == 0
+
+    async def test_day_period_bypasses_the_cache(self, client):
+        now = datetime.now(UTC)
+        for _ in range(2):
+            await _statistics(client, now - timedelta(days=3), now, period="day")
+        assert len(client.recorder.windows) == 2
+        assert client.recorder.windows[0] == client.recorder.windows[1]
@@ -84,6 +84,7 @@ class TestBuildSettingsHandlers:
             "settings_info",
             "get_feature_flags",
             "save_feature_flags",
+            "get_telemetry",
             # Theme / accessibility prefs (#1574 review).
             "get_theme_prefs",
             "save_theme_prefs",
@@ -0,0 +1,253 @@
+"""Unit tests for per-tool telemetry (ha_mcp.telemetry) and the /metrics route."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import random
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastmcp import FastMCP
+
+from ha_mcp import telemetry
+from ha_mcp.browser_landing import register_metrics
+from ha_mcp.telemetry import (
+    CallClock,
+    Histogram,
+    TelemetryMiddleware,
+    TelemetryRegistry,
+    call_in_progress,
+    ha_round_trip,
+)
+
+
+class TestHistogram:
+    def test_small_values_are_exact(self):
+        hist = Histogram()
+        for value in range(1, 51):
+            hist.record(value)
+        assert hist.percentile(0.5) == 25
+        assert hist.percentile(0.99) == 50
+        assert hist.percentile(1.0) == 50
+
+    def test_relative_error_is_bounded(self):
+        rng = random.Random(16)
+        values = [int(rng.lognormvariate(9, 2)) for _ in range(20_000)]
+        hist = Histogram()
+        for value in values:
+            hist.record(value)
+        ordered = sorted(values)
+        for quantile in (0.5, 0.95, 0.99):
+            exact = ordered[math.ceil(quantile * len(values)) - 1]
+            reported = hist.percentile(quantile)
+            assert exact <= reported <= exact * (1 + 1 / 32) + 1, quantile
+
+    def test_bucket_count_grows_with_magnitude_not_calls(self):
+        hist = Histogram()
+        for _ in range(50):
+            for value in (10, 1_000, 100_000, 10_000_000):
+                hist.record(value)
+        assert len(hist._counts) == 4
+        assert hist.count == 200
+        assert hist.max == 10_000_000
+
+    def test_empty(self):
+        assert Histogram().percentile(0.99) == 0
+
+
+class TestRegistry:
+    def test_snapshot_and_prometheus(self):
+        registry = TelemetryRegistry()
+        for ms in (10, 20, 30):
+            registry.record(
+                "ha_get_state", latency_us=ms * 1000, ha_us=4000, ha_requests=1
+            )
+        registry.record("ha_search", latency_us=5000, response_bytes=1200, error=True)
+
+        snapshot = registry.snapshot()
+        first, second = snapshot["tools"]
+        assert first["tool"] == "ha_get_state"
+        assert first["calls"] == 3
+        # Bucket bounds: within 1/32 above the exact value, clamped to the max.
+        assert 20.0 <= first["latency_ms"]["p50"] <= 20.0 * (1 + 1 / 32)
+        assert first["latency_ms"]["p99"] == 30.0
+        assert first["ha_ms_total"] == 12.0
+        assert first["local_ms_total"] == 48.0
+        assert second["errors"] == 1
+        assert second["response_bytes"]["p95"] == 1200
+
+        text = registry.render_prometheus()
+        assert 'ha_mcp_tool_calls_total{tool="ha_get_state"} 3' in text
+        assert 'ha_mcp_tool_errors_total{tool="ha_search"} 1' in text
+        assert (
+            'ha_mcp_tool_duration_seconds{tool="ha_get_state",quantile="0.99"} 0.03'
+            in text
+        )
+        assert 'ha_mcp_tool_duration_seconds_count{tool="ha_get_state"} 3' in text
+        assert 'ha_mcp_tool_ha_seconds_total{tool="ha_get_state"} 0.012' in text
+        assert "# TYPE ha_mcp_tool_response_bytes summary" in text
+
+    def test_ha_time_never_exceeds_latency(self):
+        registry = TelemetryRegistry()
+        registry.record("t", latency_us=100, ha_us=500)
+        assert registry.stats()["t"].local_us == 0
+
+
+class TestRoundTripClock:
+    async def test_overlapping_round_trips_count_once(self):
+        @ha_round_trip
+        async def trip(delay):
+            await asyncio.sleep(delay)
+
+        clock = CallClock()
+        token = telemetry._current_clock.set(clock)
+        try:
+            await asyncio.gather(trip(0.05), trip(0.05), trip(0.05))
+        finally:
+            telemetry._current_clock.reset(token)
+        assert clock.requests == 3
+        assert 0.04e9 < clock.ha_ns < 0.12e9
+
+    async def test_nested_call_charges_the_outer_clock(self):
+        @ha_round_trip
+        async def trip():
+            await asyncio.sleep(0.01)
+
+        outer = CallClock()
+        inner = CallClock(outer)
+        token = telemetry._current_clock.set(inner)
+        try:
+            await trip()
+        finally:
+            telemetry._current_clock.reset(token)
+        assert outer.dispatched
+        assert outer.requests == inner.requests == 1
+        assert outer.ha_ns == inner.ha_ns > 0
+
+    async def test_passthrough_outside_a_call(self):
+        @ha_round_trip
+        async def trip():
+            return "ok"
+
+        assert not call_in_progress()
+        assert await trip() == "ok"
+
+
+def _context(name, arguments=None):
+    return SimpleNamespace(message=SimpleNamespace(name=name, arguments=arguments))
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    fresh = TelemetryRegistry()
+    monkeypatch.setattr(telemetry, "_registry", fresh)
+    logged = []
+    monkeypatch.setattr(
+        telemetry, "log_tool_call", lambda **entry: logged.append(entry)
+    )
+    fresh.logged = logged
+    return fresh
+
+
+class TestMiddleware:
+    async def test_records_latency_size_and_ha_split(self, registry):
+        @ha_round_trip
+        async def fetch():
+            await asyncio.sleep(0.02)
+
+        async def call_next(_):
+            assert call_in_progress()
+            await fetch()
+            return SimpleNamespace(content=[SimpleNamespace(text="héllo")])
+
+        await TelemetryMiddleware().on_call_tool(
+            _context("ha_get_state", {"entity_id": "light.x"}), call_next
+        )
+        stats = registry.stats()["ha_get_state"]
+        assert stats.calls == 1 and stats.errors == 0
+        assert stats.ha_requests == 1
+        assert stats.ha_us >= 15_000
+        assert stats.size.max == len("héllo".encode())
+        (entry,) = registry.logged
+        assert entry["tool_name"] == "ha_get_state"
+        assert entry["success"] is True
+        assert entry["response_size_bytes"] == 6
+        assert not call_in_progress()
+
+    async def test_errors_are_recorded_and_reraised(self, registry):
+        async def call_next(_):
+            raise asyncio.CancelledError
+
+        with pytest.raises(asyncio.CancelledError):
+            await TelemetryMiddleware().on_call_tool(_context("ha_slow"), call_next)
+        assert registry.stats()["ha_slow"].errors == 1
+        assert registry.logged[0]["error_message"] == "CancelledError"
+
+    async def test_proxy_call_is_logged_once_under_the_real_name(self, registry):
+        middleware = TelemetryMiddleware()
+
+        async def inner(_):
+            return SimpleNamespace(content=[])
+
+        async def proxy(_):
+            return await middleware.on_call_tool(_context("ha_get_state"), inner)
+
+        await middleware.on_call_tool(_context("ha_call_read_tool"), proxy)
+        assert set(registry.stats()) == {"ha_get_state", "ha_call_read_tool"}
+        assert [e["tool_name"] for e in registry.logged] == ["ha_get_state"]
+
+    async def test_decorated_tool_defers_to_the_middleware(self, registry, monkeypatch):
+        from ha_mcp.tools import helpers
+
+        direct = []
+        monkeypatch.setattr(
+            helpers, "log_tool_call", lambda **entry: direct.append(entry)
+        )
+
+        @helpers.log_tool_usage
+        async def ha_tool():
+            return "ok"
+
+        async def call_next(_):
+            return await ha_tool()
+
+        await TelemetryMiddleware().on_call_tool(_context("ha_tool"), call_next)
+        assert direct == []
+        assert len(registry.logged) == 1
+        await ha_tool()
+        assert len(direct) == 1
+
+
+class TestMetricsRoute:
+    async def test_serves_prometheus_text(self, registry):
+        registry.record("ha_get_state", latency_us=2500)
+        server = FastMCP("test")
+        assert register_metrics(server) is True
+        assert register_metrics(server) is False
+        app = server.http_app(path="/mcp", stateless_http=True)
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            resp = await client.get("/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'ha_mcp_tool_calls_total{tool="ha_get_state"} 1' in resp.text
+
+
+class TestSettingsEndpoint:
+    async def test_reports_the_registry(self, registry):
+        from ha_mcp.settings_ui._handlers_server import _get_telemetry
+
+        registry.record("ha_get_state", latency_us=1000)
+        body = json.loads((await _get_telemetry(object(), None)).body)
+        assert body["available"] is True
+        assert [t["tool"] for t in body["tools"]] == ["ha_get_state"]
+
+    async def test_sidecar_has_nothing_to_report(self, registry):
+        from ha_mcp.settings_ui._handlers_server import _get_telemetry
+
+        body = json.loads((await _get_telemetry(None, None)).body)
+        assert body == {"available": False, "tools": []}
@@ -19,6 +19,7 @@ from ha_mcp.client.rest_client import (
     HomeAssistantCommandTimeout,
     HomeAssistantConnectionError,
 )
+from ha_mcp.client.single_flight import SingleFlight
 from ha_mcp.tools.tools_system import SystemTools
 
 
@@ -2312,6 +2313,8 @@ class TestHomeAssistantConnectionErrorPropagation:
         client.base_url = "http://ha.local:8123"
         client.token = "tok"
         client.verify_ssl = True
+        client._reads = SingleFlight()
+        client._write_epoch = 0
         # REST still works; only the socket is gone — the case where a
         # degraded detector answer looks most credible.
         client.get_states = AsyncMock(return_value=[])
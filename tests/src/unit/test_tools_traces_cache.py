@@ -0,0 +1,183 @@
+"""Unit tests for the finished-trace cache and the analyze mode of trace tools."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastmcp.exceptions import ToolError
+
+from ha_mcp.client.event_cache import CredentialCaches
+from ha_mcp.client.trace_cache import TraceCache
+from ha_mcp.tools import tools_traces
+from ha_mcp.tools.tools_traces import TraceTools
+
+
+def _trace(run_id, state="stopped", error=None, steps=(), finish=None):
+    """A trace/get result whose steps start at the given seconds past 10:00."""
+    trace = {
+        "run_id": run_id,
+        "state": state,
+        "script_execution": "error" if error else "finished",
+        "timestamp": {
+            "start": "2026-06-01T10:00:00+00:00",
+            "finish": f"2026-06-01T10:00:{finish:02d}+00:00" if finish else None,
+        },
+        "trace": {
+            path: [{"path": path, "timestamp": f"2026-06-01T10:00:{second:02d}+00:00"}]
+            for path, second in steps
+        },
+    }
+    if error:
+        trace["error"] = error
+    return trace
+
+
+class _Traces:
+    """Fake trace WS commands over stored traces, oldest-first per item."""
+
+    def __init__(self, traces):
+        self.traces = traces
+        self.gets: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def send_websocket_message(self, message):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            return self._answer(message)
+        finally:
+            self.in_flight -= 1
+
+    def _answer(self, message):
+        if message["type"] == "config/entity_registry/get":
+            return {"success": False, "error": "not found"}
+        runs = self.traces.get(message["item_id"])
+        if runs is None:
+            return {"success": False, "error": "no such item"}
+        if message["type"] == "trace/list":
+            return {"success": True, "result": runs}
+        self.gets.append(message["run_id"])
+        by_id = {run["run_id"]: run for run in runs}
+        return {"success": True, "result": by_id[message["run_id"]]}
+
+
+def _tools(traces):
+    backend = _Traces(traces)
+    client = AsyncMock()
+    client.send_websocket_message = AsyncMock(
+        side_effect=backend.send_websocket_message
+    )
+    client.trace_cache = TraceCache()
+    return TraceTools(client), backend
+
+
+class TestTraceCache:
+    def test_only_stopped_traces_are_cached(self):
+        cache = TraceCache()
+        cache.store(("automation", "a", "1"), _trace("1", state="running"))
+        cache.store(("automation", "a", "2"), _trace("2"))
+        assert cache.get(("automation", "a", "1")) is None
+        assert cache.get(("automation", "a", "2"))["run_id"] == "2"
+
+    def test_least_recently_used_trace_is_evicted(self):
+        cache = TraceCache(max_entries=2)
+        for run_id in "123":
+            cache.store(("script", "s", run_id), _trace(run_id))
+            cache.get(("script", "s", "1"))
+        assert cache.get(("script", "s", "2")) is None
+        assert cache.stats()["traces"] == 2
+
+    def test_one_cache_per_credential_without_a_detach_hook(self):
+        caches = CredentialCaches(TraceCache, max_size=1)
+        first = caches.get("http://ha.local:8123/", "t")
+        assert caches.get("http://ha.local:8123", "t") is first
+        assert caches.get("http://ha.local:8123", "other") is not first
+        assert len(caches) == 1
+        assert caches.get("http://ha.local:8123", "t") is not first
+
+
+class TestTraceDetailCache:
+    async def test_finished_trace_is_read_once(self):
+        tools, backend = _tools({"a": [_trace("1"), _trace("2", state="running")]})
+        for run_id in ("1", "1", "2", "2"):
+            result = await tools.ha_get_automation_traces("automation.a", run_id=run_id)
+            assert result["run_id"] == run_id
+        assert backend.gets == ["1", "2", "2"]
+
+
+class TestAnalyzeTraces:
+    async def test_summary_per_automation(self):
+        tools, _backend = _tools(
+            {
+                "a": [
+                    _trace(
+                        "1",
+                        error="Boom",
+                        steps=[("trigger/0", 0), ("action/0", 1)],
+                        finish=3,
+                    ),
+                    _trace(
+                        "2",
+                        steps=[("trigger/0", 0), ("action/0", 1), ("action/1", 9)],
+                        finish=10,
+                    ),
+                    _trace("3", error="Boom", finish=1),
+                    _trace("4", state="running"),
+                ],
+                "b": [],
+            }
+        )
+        result = await tools.ha_get_automation_traces(
+            "automation.a, automation.b", analyze=True
+        )
+
+        a, b = result["automations"]
+        assert (a["runs"], a["finished"], a["failures"]) == (4, 3, 2)
+        assert a["failure_rate"] == 0.667
+        assert a["most_common_error"] == {"error": "Boom", "count": 2}
+        assert a["slowest_steps"][0] == {
+            "path": "action/0",
+            "seconds": 8.0,
+            "run_id": "2",
+        }
+        assert [s["path"] for s in a["slowest_steps"]] == [
+            "action/0",
+            "trigger/0",
+            "action/1",
+        ]
+        assert (b["runs"], b["failure_rate"], b["slowest_steps"]) == (0, None, [])
+        assert "most_common_error" not in b
+
+    async def test_latest_runs_only_and_bounded_concurrency(self):
+        traces = {
+            str(n): [_trace(f"{n}.{r}", finish=1) for r in range(20)] for n in range(6)
+        }
+        tools, backend = _tools(traces)
+        ids = ",".join(f"automation.{n}" for n in range(6))
+        with patch.object(tools_traces, "_ANALYZE_CONCURRENCY", 3):
+            result = await tools.ha_get_automation_traces(ids, analyze=True, limit=5)
+
+        assert all(a["runs"] == 5 for a in result["automations"])
+        assert sorted(backend.gets) == sorted(
+            f"{n}.{r}" for n in range(6) for r in range(15, 20)
+        )
+        assert backend.peak <= 3
+
+    async def test_unknown_automation_is_reported_not_raised(self):
+        tools, _backend = _tools({"a": [_trace("1")]})
+        result = await tools.ha_get_automation_traces(
+            "automation.a,automation.gone", analyze=True
+        )
+        assert result["automations"][1] == {
+            "automation_id": "automation.gone",
+            "error": "no such item",
+        }
+
+    async def test_invalid_entity_id_is_a_validation_error(self):
+        tools, _backend = _tools({})
+        with pytest.raises(ToolError, match="Invalid entity_id format"):
+            await tools.ha_get_automation_traces(
+                "automation.a,light.kitchen", analyze=True
+            )
@@ -0,0 +1,132 @@
+"""Unit tests for cursor paging and the closed-range cache of the logbook source."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ha_mcp.client.logbook_cache import LogbookCache
+from ha_mcp.client.rest_client import HomeAssistantConnectionError
+from ha_mcp.tools.tools_utility import UtilityTools
+
+END = datetime(2026, 6, 16, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def _no_real_caps_probe():
+    """Keep the ``ha_mcp_tools/info`` caps probe from opening a real socket."""
+    with patch(
+        "ha_mcp.tools.component_api.get_websocket_client",
+        AsyncMock(side_effect=HomeAssistantConnectionError("no WS in unit tests")),
+    ):
+        yield
+
+
+class _Logbook:
+    """Fake ``/api/logbook`` over a fixed, oldest-first list of entries."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.ranges: list[tuple[float, float]] = []
+
+    async def get_logbook(self, entity_id=None, start_time=None, end_time=None):
+        start = datetime.fromisoformat(start_time).timestamp()
+        end = datetime.fromisoformat(end_time).timestamp()
+        self.ranges.append((start, end))
+        return [
+            entry
+            for entry in self.entries
+            if start <= datetime.fromisoformat(entry["when"]).timestamp() <= end
+            and (entity_id is None or entry["entity_id"] == entity_id)
+        ]
+
+
+def _client(logbook):
+    client = AsyncMock()
+    client.get_logbook = AsyncMock(side_effect=logbook.get_logbook)
+    client.get_config = AsyncMock(return_value={"time_zone": "UTC"})
+    client.logbook_cache = LogbookCache()
+    return client
+
+
+def _entries(minutes, per_minute=1):
+    """Entries over the last ``minutes`` before END, ``per_minute`` sharing a time."""
+    return [
+        {
+            "when": (END - timedelta(minutes=minutes - m)).isoformat(),
+            "entity_id": "light.x",
+            "state": f"{m}.{n}",
+        }
+        for m in range(minutes)
+        for n in range(per_minute)
+    ]
+
+
+async def _page(tools, **kwargs):
+    result = await tools._get_logbook(
+        hours_back=kwargs.pop("hours_back", 24),
+        end_time=END.isoformat(),
+        compact=False,
+        **kwargs,
+    )
+    return result["data"]
+
+
+async def _all_pages(tools, **kwargs):
+    page = await _page(tools, **kwargs)
+    states = [e["state"] for e in page["entries"]]
+    while page.get("next_cursor"):
+        page = await _page(tools, cursor=page["next_cursor"], limit=kwargs["limit"])
+        states += [e["state"] for e in page["entries"]]
+    return states
+
+
+class TestLogbookCursor:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("order", ["newest", "oldest"])
+    async def test_cursor_pages_match_the_full_window(self, order):
+        entries = _entries(120, per_minute=3)
+        tools = UtilityTools(_client(_Logbook(entries)))
+        states = await _all_pages(tools, limit=7, order=order)
+        expected = [e["state"] for e in entries]
+        assert states == (expected[::-1] if order == "newest" else expected)
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_fetches_only_a_slice(self):
+        logbook = _Logbook(_entries(600))
+        tools = UtilityTools(_client(logbook))
+        first = await _page(tools, limit=10)
+        await _page(tools, cursor=first["next_cursor"], limit=10)
+
+        start, end = logbook.ranges[-1]
+        # Ten entries a minute apart: the slice is minutes, not the window.
+        assert end - start < 3600
+        assert (
+            end <= datetime.fromisoformat(first["entries"][-1]["when"]).timestamp() + 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_closed_window_pages_are_served_from_the_cache(self):
+        logbook = _Logbook(_entries(30))
+        tools = UtilityTools(_client(logbook))
+        first = await _page(tools, limit=10)
+        await _page(tools, limit=10, offset=10)
+        await _page(tools, cursor=first["next_cursor"], limit=10)
+        await _page(tools, cursor=first["next_cursor"], limit=10)
+        # The window, then one slice for the cursor page; repeats hit the cache.
+        assert len(logbook.ranges) == 2
+
+    @pytest.mark.asyncio
+    async def test_open_window_is_not_cached(self):
+        client = _client(_Logbook([]))
+        client.get_logbook = AsyncMock(return_value=[])
+        tools = UtilityTools(client)
+        for _ in range(2):
+            await tools._get_logbook(hours_back=1, limit=10)
+        assert tools._client.get_logbook.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_is_a_validation_error(self):
+        tools = UtilityTools(_client(_Logbook([])))
+        with pytest.raises(Exception, match="Invalid logbook cursor"):
+            await _page(tools, cursor="not-a-cursor", limit=10)
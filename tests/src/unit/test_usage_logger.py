@@ -1,6 +1,7 @@
 """Unit tests for the usage logger with ring buffer."""
 
 import asyncio
+import json
 import tempfile
 import threading
 import time
@@ -13,6 +14,7 @@ from ha_mcp.utils.usage_logger import (
     _REDACTED_VALUE,
     AVG_LOG_ENTRIES_PER_TOOL,
     DEFAULT_RING_BUFFER_SIZE,
+    ToolUsageLog,
     UsageLogger,
     _redact_parameters,
     get_recent_logs,
@@ -408,3 +410,67 @@ class TestParameterRedaction:
         assert "lock.front" in content
         entry = json.loads(content.splitlines()[0])
         assert entry["parameters"]["data"]["code"] == _REDACTED_VALUE
+
+
+class TestDiskWriter:
+    """The writer thread batches queued entries and rotates by size."""
+
+    def _log(self, logger, n, name="ha_tool"):
+        for i in range(n):
+            logger.log_tool_usage(
+                tool_name=name,
+                parameters={"i": i},
+                execution_time_ms=1.0,
+                success=True,
+            )
+
+    def test_shutdown_flushes_everything_queued(self, tmp_path):
+        log_path = tmp_path / "usage.jsonl"
+        logger = UsageLogger(str(log_path))
+        self._log(logger, 250)
+        logger.shutdown()
+        lines = log_path.read_text().splitlines()
+        assert len(lines) == 250
+        assert json.loads(lines[-1])["parameters"] == {"i": 249}
+
+    def test_burst_is_written_in_batches(self, tmp_path, monkeypatch):
+        log_path = tmp_path / "usage.jsonl"
+        batches = []
+        real = UsageLogger._write_log_entries
+
+        def _recording(self, entries):
+            batches.append(len(entries))
+            real(self, entries)
+
+        monkeypatch.setattr(UsageLogger, "_write_log_entries", _recording)
+        logger = UsageLogger(str(log_path))
+        # Hold the writer off so the burst is queued before it wakes.
+        logger._log_queue.mutex.acquire()
+        try:
+            for i in range(100):
+                logger._log_queue.queue.append(
+                    ToolUsageLog("t", "ha_tool", {"i": i}, 1.0, True)
+                )
+        finally:
+            logger._log_queue.mutex.release()
+        logger._log_queue.put(None)
+        logger._logger_thread.join(timeout=2.0)
+        assert sum(batches) == 100
+        assert len(batches) < 100
+        assert len(log_path.read_text().splitlines()) == 100
+
+    def test_rotates_at_max_bytes(self, tmp_path):
+        log_path = tmp_path / "usage.jsonl"
+        logger = UsageLogger(str(log_path), max_bytes=2000, backup_count=2)
+        for _ in range(6):
+            self._log(logger, 20)
+            # One batch per round so rotation is checked between them.
+            deadline = time.monotonic() + 3.0
+            while not logger._log_queue.empty() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.05)
+        logger.shutdown()
+        assert log_path.exists()
+        assert (tmp_path / "usage.jsonl.1").exists()
+        assert (tmp_path / "usage.jsonl.2").exists()
+        assert not (tmp_path / "usage.jsonl.3").exists()
@@ -152,3 +152,25 @@ async def test_state_change_handler_ignores_event_missing_new_state(listener_ser
         await listener_service._handle_state_change(event)
 
     mock_update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_state_change_handler_feeds_state_mirror_including_removals(
+    listener_service,
+):
+    """Removal events (``new_state`` None) reach the mirror even though the
+    operation-tracking path ignores them."""
+    from unittest.mock import MagicMock
+
+    mirror = MagicMock()
+    listener_service.state_mirror = mirror
+    event = _make_state_changed_event(entity_id="light.gone")
+    event["data"]["new_state"] = None
+
+    with patch(
+        "ha_mcp.client.websocket_listener.update_pending_operations"
+    ) as mock_update:
+        await listener_service._handle_state_change(event)
+
+    mirror.apply_event.assert_called_once_with(event["data"])
+    mock_update.assert_not_called()
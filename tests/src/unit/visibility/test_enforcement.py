@@ -19,8 +19,8 @@ from ha_mcp.visibility import enforcement, resolver
 from ha_mcp.visibility.enforcement import (
     VisibilityInboundEnforcement,
     VisibilityOutboundEnforcement,
-    _build_hidden_regex,
-    active_hidden_regex,
+    _build_hidden_matcher,
+    active_hidden_matcher,
     scrub_records,
 )
 from ha_mcp.visibility.model import VisibilityConfig
@@ -756,21 +756,21 @@ class TestOutboundScan:
 # ---------------------------------------------------------------------------
 
 
-class TestBoundaryRegex:
+class TestBoundaryMatcher:
     def test_boundary_matching(self):
-        regex = _build_hidden_regex({"sensor.foo"})
-        assert regex is not None
+        matcher = _build_hidden_matcher({"sensor.foo"})
+        assert matcher is not None
         # Must NOT match a longer sibling id or an id with a leading word char.
-        assert regex.search("sensor.foo2") is None
-        assert regex.search("my_sensor.foo") is None
-        assert regex.search("binary_sensor.foo") is None
+        assert matcher.search("sensor.foo2") is None
+        assert matcher.search("my_sensor.foo") is None
+        assert matcher.search("binary_sensor.foo") is None
         # MUST match a bare reference and a dotted-context template reference.
-        assert regex.search("sensor.foo") is not None
-        assert regex.search("states.sensor.foo") is not None
-        assert regex.search("{{ states('sensor.foo') }}") is not None
+        assert matcher.search("sensor.foo") is not None
+        assert matcher.search("states.sensor.foo") is not None
+        assert matcher.search("{{ states('sensor.foo') }}") is not None
 
-    def test_empty_hidden_set_has_no_regex(self):
-        assert _build_hidden_regex(set()) is None
+    def test_empty_hidden_set_has_no_matcher(self):
+        assert _build_hidden_matcher(set()) is None
 
 
 # ---------------------------------------------------------------------------
@@ -1046,7 +1046,7 @@ class TestStrictResolver:
 
 class TestScrubSeam:
     def test_scrub_records_drops_embedded_hidden_id(self):
-        regex = _build_hidden_regex({"input_boolean.hidden_probe"})
+        matcher = _build_hidden_matcher({"input_boolean.hidden_probe"})
         records = [
             {"entity_id": "automation.morning", "config": {"trigger": "sun"}},
             {
@@ -1055,21 +1055,21 @@ class TestScrubSeam:
             },
             {"friendly_name": "Hidden Probe", "id": "input_boolean.hidden_probe"},
         ]
-        kept = scrub_records(records, regex)
+        kept = scrub_records(records, matcher)
         assert [r.get("entity_id", r.get("id")) for r in kept] == ["automation.morning"]
 
     def test_scrub_records_boundary_no_false_positive(self):
-        regex = _build_hidden_regex({"sensor.foo"})
+        matcher = _build_hidden_matcher({"sensor.foo"})
         records = [{"entity_id": "sensor.foo2"}, {"entity_id": "my_sensor.foo"}]
-        assert scrub_records(records, regex) == records
+        assert scrub_records(records, matcher) == records
 
-    async def test_active_hidden_regex_none_when_enforce_off(self, set_config):
+    async def test_active_hidden_matcher_none_when_enforce_off(self, set_config):
         set_config(enabled=True, enforce=False, deny_entity_ids=["sensor.hidden"])
         client = FakeClient()
-        assert await active_hidden_regex(client) is None
+        assert await active_hidden_matcher(client) is None
         assert client.get_states_calls == 0  # inactive: no hidden-set fetch
 
-    async def test_active_hidden_regex_uses_shared_cache(self, set_config):
+    async def test_active_hidden_matcher_uses_shared_cache(self, set_config):
         set_config(enabled=True, enforce=True, deny_entity_ids=["sensor.hidden"])
         client = FakeClient()
         mw = make_mw(get_client=lambda: client)
@@ -1082,23 +1082,23 @@ class TestScrubSeam:
         # refresh is needed. Regression for CI round 3, where the scrub reached
         # a cold cache through a stale server instance's closed client and
         # skipped the scrub entirely.
-        regex = await active_hidden_regex(FakeClient(fail=True))
-        assert regex is not None
-        assert regex.search("states.sensor.hidden reference")
-        assert not regex.search("sensor.hidden2")
+        matcher = await active_hidden_matcher(FakeClient(fail=True))
+        assert matcher is not None
+        assert matcher.search("states.sensor.hidden reference")
+        assert not matcher.search("sensor.hidden2")
         assert client.get_states_calls == 1
 
-    async def test_active_hidden_regex_refreshes_with_caller_client(self, set_config):
+    async def test_active_hidden_matcher_refreshes_with_caller_client(self, set_config):
         # Cold cache: the scrub refreshes using the CALLER's live client.
         set_config(enabled=True, enforce=True, deny_entity_ids=["sensor.hidden"])
         client = FakeClient()
-        regex = await active_hidden_regex(client)
-        assert regex is not None
+        matcher = await active_hidden_matcher(client)
+        assert matcher is not None
         assert client.get_states_calls == 1
 
-    async def test_active_hidden_regex_fail_soft_on_data_error(self, set_config):
+    async def test_active_hidden_matcher_fail_soft_on_data_error(self, set_config):
         set_config(enabled=True, enforce=True, deny_entity_ids=["sensor.hidden"])
-        assert await active_hidden_regex(FakeClient(fail=True)) is None
+        assert await active_hidden_matcher(FakeClient(fail=True)) is None
 
 
 # ---------------------------------------------------------------------------
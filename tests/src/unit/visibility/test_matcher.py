@@ -0,0 +1,143 @@
+"""Unit tests for the hidden-entity matcher (visibility/matcher.py, #2015).
+
+The matcher replaced a boundary-guarded ``|``-alternation regex; these tests
+pin that it finds exactly what that regex found (including the case-folding
+corners of ``re.IGNORECASE``), and (marked slow) that it stays fast with 10k
+hidden ids against a 5 MB payload.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import time
+
+import pytest
+
+from ha_mcp.visibility.matcher import HiddenIdMatcher
+
+
+def _reference(hidden: set[str]) -> re.Pattern[str]:
+    """The alternation the matcher replaced."""
+    alternation = "|".join(re.escape(eid) for eid in sorted(hidden))
+    return re.compile(rf"(?<![a-z0-9_])(?:{alternation})(?![a-z0-9_])", re.IGNORECASE)
+
+
+HIDDEN = {"sensor.foo", "light.kitchen_1", "binary_sensor.door", "switch.a"}
+
+TEXTS = [
+    "sensor.foo",
+    "sensor.foo2",
+    "my_sensor.foo",
+    "binary_sensor.foo",
+    "states.sensor.foo",
+    "states.sensor.foo.state",
+    "{{ states('sensor.foo') }}",
+    "SENSOR.FOO",
+    "light.kitchen_1 and light.kitchen_10",
+    "light.kitchen_10",
+    "..binary_sensor.door..",
+    "x.binary_sensor.door",
+    "binary_sensor.door_x",
+    "switch.a.b",
+    "switch.ab",
+    "a.switch.a",
+    "sensor..foo",
+    "sensor.fooİ",
+    "ſwitch.a",
+    "switch.K",
+    '{"entity_id": "switch.a", "n": 1.5}',
+    "",
+    "no ids here",
+]
+
+
+class TestEquivalence:
+    @pytest.mark.parametrize("text", TEXTS)
+    def test_matches_like_the_alternation(self, text):
+        matcher = HiddenIdMatcher(HIDDEN)
+        expected = _reference(HIDDEN).search(text) is not None
+        assert (matcher.search(text) is not None) is expected
+
+    def test_non_ascii_fold_targets(self):
+        hidden = {"switch.k", "sensor.is"}
+        matcher = HiddenIdMatcher(hidden)
+        reference = _reference(hidden)
+        for text in ("switch.K", "sensor.ıſ", "SENSOR.İS", "sensor.i̇s"):
+            assert (matcher.search(text) is not None) is (
+                reference.search(text) is not None
+            ), text
+
+    def test_irregular_ids_keep_boundary_semantics(self):
+        hidden = {"not_an_entity", "a.b.c", "sensor.foo"}
+        matcher = HiddenIdMatcher(hidden)
+        reference = _reference(hidden)
+        for text in ("not_an_entity", "xnot_an_entity", "a.b.c", "a.b.cd", "z a.b.c"):
+            assert (matcher.search(text) is not None) is (
+                reference.search(text) is not None
+            ), text
+
+    def test_random_texts(self):
+        rng = random.Random(2015)
+        alphabet = "sensorlight._ ab1'\"{}K"
+        hidden = {"sensor.a", "light.b1", "s.o", "a.b"}
+        matcher = HiddenIdMatcher(hidden)
+        reference = _reference(hidden)
+        for _ in range(5000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+            assert (matcher.search(text) is not None) is (
+                reference.search(text) is not None
+            ), text
+
+
+class TestUpdate:
+    def test_unchanged_set_reuses_the_matcher(self):
+        matcher = HiddenIdMatcher(HIDDEN)
+        assert matcher.update(set(HIDDEN)) is matcher
+
+    def test_changed_set_builds_a_new_matcher(self):
+        matcher = HiddenIdMatcher(HIDDEN)
+        updated = matcher.update(HIDDEN | {"sensor.bar"})
+        assert updated is not matcher
+        assert updated.search("sensor.bar") == "sensor.bar"
+        # The old matcher is immutable: scans holding it are unaffected.
+        assert matcher.search("sensor.bar") is None
+
+
+@pytest.mark.slow
+def test_benchmark_10k_hidden_ids_against_5mb_payload():
+    rng = random.Random(0)
+    domains = ["sensor", "light", "switch", "binary_sensor", "climate"]
+    hidden = {
+        f"{rng.choice(domains)}.device_{i}_{rng.choice(['power', 'energy'])}"
+        for i in range(10_000)
+    }
+    entities = [
+        {
+            "entity_id": f"{rng.choice(domains)}.visible_{i}",
+            "state": "on",
+            "attributes": {
+                "friendly_name": f"Visible {i}",
+                "note": "1.5 units via states.sensor.other",
+            },
+        }
+        for i in range(36_000)
+    ]
+    payload = json.dumps({"entities": entities})
+    assert len(payload) > 5_000_000
+
+    start = time.perf_counter()
+    matcher = HiddenIdMatcher(hidden)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    assert matcher.search(payload) is None
+    scan = time.perf_counter() - start
+
+    # Measured ~10 ms to build and ~0.4 s to scan; the alternation took ~1 s
+    # to compile and several minutes to scan the same payload. The bounds are
+    # loose so a loaded CI worker does not flake.
+    assert build < 5.0, build
+    assert scan < 30.0, scan
+    leaked = payload[:-2] + ', "x": "states.' + sorted(hidden)[0] + '"}'
+    assert matcher.search(leaked) == sorted(hidden)[0]
@@ -4,11 +4,12 @@ from pathlib import Path
 
 import pytest
 
-from ha_mcp.visibility import persistence
+from ha_mcp.visibility import persistence, resolver
 from ha_mcp.visibility.model import VisibilityConfig
 from ha_mcp.visibility.persistence import (
     VISIBILITY_FILENAME,
     load_visibility_config,
+    peek_visibility_config,
     save_visibility_config,
 )
 
@@ -122,3 +123,48 @@ def test_changed_mtime_reloads(tmp_path):
 
     assert second.enabled is False  # stale parse not served
     assert second is not first
+
+
+def test_peek_serves_memo_only_while_file_unchanged(tmp_path):
+    assert peek_visibility_config(tmp_path) is None  # never loaded
+    assert load_visibility_config(tmp_path) == VisibilityConfig()
+    # A missing file is memoized too: the default install needs no reload.
+    assert peek_visibility_config(tmp_path) == VisibilityConfig()
+
+    save_visibility_config(tmp_path, VisibilityConfig(enabled=True))
+    assert peek_visibility_config(tmp_path) is None  # saved: must reload
+    loaded = load_visibility_config(tmp_path)
+    assert peek_visibility_config(tmp_path) is loaded
+
+    (tmp_path / VISIBILITY_FILENAME).unlink()
+    assert peek_visibility_config(tmp_path) is None
+
+
+def test_config_is_a_frozen_snapshot(tmp_path):
+    save_visibility_config(tmp_path, VisibilityConfig(enabled=True))
+    config = load_visibility_config(tmp_path)
+    with pytest.raises(ValueError):
+        config.enabled = False  # type: ignore[misc]
+
+
+async def test_current_config_hops_to_a_thread_only_on_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(resolver, "get_data_dir", lambda: tmp_path)
+    save_visibility_config(tmp_path, VisibilityConfig(enabled=True))
+    hops = 0
+    real_to_thread = resolver.asyncio.to_thread
+
+    async def counting_to_thread(func, *args):
+        nonlocal hops
+        hops += 1
+        return await real_to_thread(func, *args)
+
+    monkeypatch.setattr(resolver.asyncio, "to_thread", counting_to_thread)
+
+    first = await resolver.current_visibility_config()
+    for _ in range(5):
+        assert await resolver.current_visibility_config() is first
+    assert hops == 1
+
+    save_visibility_config(tmp_path, VisibilityConfig(enabled=False))
+    assert (await resolver.current_visibility_config()).enabled is False
+    assert hops == 2